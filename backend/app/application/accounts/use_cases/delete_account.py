@@ -2,7 +2,9 @@ from uuid import UUID
 
 from app.domain.accounts.entities.account import Account
 from app.domain.accounts.services.account_service import AccountService
+from app.domain.following.services.following_service import FollowingService
 from app.domain.reviews.services.review_service import ReviewService
+from app.domain.timeline.services.timeline_service import TimelineService
 from app.domain.watchlist.services.watchlist_service import WatchlistService
 
 
@@ -14,14 +16,21 @@ class DeleteAccountUseCase:
         account_service: AccountService,
         review_service: ReviewService,
         watchlist_service: WatchlistService,
+        following_service: FollowingService,
+        timeline_service: TimelineService | None = None,
     ):
         self.account_service = account_service
         self.review_service = review_service
         self.watchlist_service = watchlist_service
+        self.following_service = following_service
+        self.timeline_service = timeline_service
 
     async def execute(self, account_uuid: UUID) -> Account:
         """Delete an account by UUID."""
         account = await self.account_service.get_account_by_uuid(account_uuid)
         await self.review_service.delete_reviews_by_reviewer(account_uuid)
         await self.watchlist_service.delete_all_by_watcher(account_uuid)
+        await self.following_service.delete_graph(account_uuid)
+        if self.timeline_service is not None:
+            await self.timeline_service.delete_for_account(account_uuid, account.username)
         return await self.account_service.delete_account(account)
@@ -1,16 +1,20 @@
 import asyncio
-from dataclasses import dataclass
+import heapq
+from collections.abc import AsyncGenerator
+from dataclasses import dataclass, replace
 from typing import Literal
 from uuid import UUID
 
 from app.domain.accounts.services.account_service import AccountService
 from app.domain.reviews.entities.review import Review
 from app.domain.reviews.services.review_service import ReviewService
+from app.domain.shared.pagination import KeysetCursor, ListVersion
+from app.domain.timeline.services.timeline_service import TimelineService
 from app.domain.users.services.user_service import UserService
 from app.domain.watchlist.services.watchlist_service import WatchlistService
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ActivityFeedItem:
     """An item in the activity feed."""
 
@@ -19,6 +23,57 @@ class ActivityFeedItem:
     reviewer_avatar_url: str | None
     reviewed_user_avatar_url: str | None
 
+    @property
+    def cursor(self) -> KeysetCursor:
+        """Feed position of this item, used as the cursor for the next page."""
+        return KeysetCursor(sort_value=self.review.updated_at, id=self.review.id or "")
+
+
+# Cap on reviews buffered per open stream when merging per-username cursors
+STREAM_BATCH_SIZE = 20
+
+# Timeline entries each feed filter reads: all, own profile only, or others only
+_TIMELINE_OWN: dict[str, bool | None] = {"all": None, "mine": True, "watching": False}
+
+
+@dataclass
+class _StreamHead:
+    """Current head of one review stream, ordered newest-first for heapq."""
+
+    review: Review
+    stream: int
+
+    def __lt__(self, other: "_StreamHead") -> bool:
+        return (self.review.updated_at, self.review.id or "") > (
+            other.review.updated_at,
+            other.review.id or "",
+        )
+
+
+async def merge_newest_first(
+    streams: list[AsyncGenerator[Review, None]],
+) -> AsyncGenerator[Review, None]:
+    """Lazily k-way merge review streams that are each in feed order.
+
+    Holds one head per stream, so consuming n reviews pulls at most
+    n + k reviews from the streams. Closing the merge closes every stream.
+    """
+    heap: list[_StreamHead] = []
+
+    async def advance(index: int) -> None:
+        review = await anext(streams[index], None)
+        if review is not None:
+            heapq.heappush(heap, _StreamHead(review, index))
+
+    try:
+        await asyncio.gather(*(advance(i) for i in range(len(streams))))
+        while heap:
+            head = heapq.heappop(heap)
+            yield head.review
+            await advance(head.stream)
+    finally:
+        await asyncio.gather(*(stream.aclose() for stream in streams))
+
 
 class GetActivityFeedUseCase:
     """Use case for getting the activity feed."""
@@ -30,12 +85,16 @@ class GetActivityFeedUseCase:
         account_service: AccountService,
         user_service: UserService,
         open_draft_profiles: bool,
+        timeline_service: TimelineService | None = None,
+        merge_streams: bool = False,
     ):
         self.watchlist_service = watchlist_service
         self.review_service = review_service
         self.account_service = account_service
         self.user_service = user_service
         self.open_draft_profiles = open_draft_profiles
+        self.timeline_service = timeline_service
+        self.merge_streams = merge_streams
 
     async def execute(
         self,
@@ -43,6 +102,9 @@ class GetActivityFeedUseCase:
         filter_type: Literal["all", "mine", "watching"] = "all",
         limit: int = 50,
         offset: int = 0,
+        cursor: KeysetCursor | None = None,
+        since: KeysetCursor | None = None,
+        scope: tuple[list[str], list[str]] | None = None,
     ) -> list[ActivityFeedItem]:
         """
         Get activity feed with reviews.
@@ -50,24 +112,226 @@ class GetActivityFeedUseCase:
         - "all": Reviews for current user + reviews for watched users
         - "mine": Only reviews the current user received
         - "watching": Only reviews for watched users
+
+        Pages by cursor (see ActivityFeedItem.cursor) when given; offset is deprecated
+        and ignored alongside a cursor. With since, only reviews updated after
+        that position are returned (deletions show up in get_version only).
+        Pass the scope from resolve_scope to avoid resolving it again.
         """
         account = await self.account_service.get_account_by_uuid(account_uuid)
 
-        reviews = await self._fetch_reviews(account_uuid, account.username, filter_type)
+        if self.timeline_service is not None:
+            reviews = await self._read_timeline(
+                self.timeline_service,
+                account_uuid,
+                filter_type,
+                limit,
+                offset,
+                cursor,
+                since,
+            )
+            return await self.enrich_reviews(reviews)
+
+        if scope is None:
+            scope = await self.get_scope(account_uuid, account.username, filter_type)
+        visible, drafts = scope
+        if not visible and not drafts:
+            return []
 
-        # Sort by updated_at descending, then paginate
-        reviews.sort(key=lambda r: r.updated_at, reverse=True)
-        paginated = reviews[offset : offset + limit]
+        # A since fetch is a short range, so one query beats opening k cursors.
+        if self.merge_streams and since is None:
+            reviews = await self._merge_feed(
+                account_uuid, visible, drafts, limit, offset, cursor
+            )
+            return await self.enrich_reviews(reviews)
 
-        return await self._enrich_reviews(paginated)
+        reviews = await self.review_service.get_feed(
+            visible,
+            limit,
+            0 if cursor else offset,
+            draft_usernames=drafts,
+            viewer_uuid=account_uuid,
+            after=cursor,
+            since=since,
+        )
 
-    async def _fetch_reviews(
+        return await self.enrich_reviews(reviews)
+
+    async def get_version(
         self,
         account_uuid: UUID,
-        username: str,
+        filter_type: Literal["all", "mine", "watching"] = "all",
+        scope: tuple[list[str], list[str]] | None = None,
+    ) -> ListVersion:
+        """Get the version of an account's feed without loading or enriching it.
+
+        It changes whenever a review enters, leaves or is updated in the feed,
+        and its newest position is the since cursor for the next refresh.
+        Pass the scope from resolve_scope to avoid resolving it again.
+        """
+        account = await self.account_service.get_account_by_uuid(account_uuid)
+
+        if self.timeline_service is not None:
+            version = await self.timeline_service.get_timeline_version(
+                account_uuid,
+                own=_TIMELINE_OWN[filter_type],
+                include_drafts=self.open_draft_profiles,
+            )
+            if filter_type == "mine":
+                return version
+            watched = await self._watched_fanout_skipped(
+                self.timeline_service, account_uuid
+            )
+            if watched:
+                visible, drafts = await self._partition_usernames(watched)
+                version = version.merge(
+                    await self.review_service.get_feed_version(
+                        visible, draft_usernames=drafts, viewer_uuid=account_uuid
+                    )
+                )
+            return version
+
+        if scope is None:
+            scope = await self.get_scope(account_uuid, account.username, filter_type)
+        visible, drafts = scope
+        version = await self.review_service.get_feed_version(
+            visible, draft_usernames=drafts, viewer_uuid=account_uuid
+        )
+        # Re-scoping (e.g. unwatching) changes the feed even when counts match.
+        scope_tag = ",".join(sorted(u.lower() for u in visible))
+        scope_tag += "/" + ",".join(sorted(u.lower() for u in drafts))
+        return replace(version, scope=scope_tag)
+
+    async def _merge_feed(
+        self,
+        account_uuid: UUID,
+        visible: list[str],
+        drafts: list[str],
+        limit: int,
+        offset: int,
+        cursor: KeysetCursor | None,
+    ) -> list[Review]:
+        """Build a feed page by lazily merging one review cursor per username.
+
+        Deleted profiles never get a cursor and draft profiles only stream
+        the viewer's own reviews, so every merged review is shown and the
+        merge stops after offset + limit of them.
+        """
+        start = 0 if cursor else offset
+        window = start + limit
+        batch_size = min(window, STREAM_BATCH_SIZE)
+        streams = [
+            self.review_service.stream_feed_for_username(
+                username, window, after=cursor, batch_size=batch_size
+            )
+            for username in visible
+        ] + [
+            self.review_service.stream_feed_for_username(
+                username,
+                window,
+                after=cursor,
+                reviewer_uuid=account_uuid,
+                batch_size=batch_size,
+            )
+            for username in drafts
+        ]
+
+        reviews: list[Review] = []
+        merged = merge_newest_first(streams)
+        try:
+            async for review in merged:
+                reviews.append(review)
+                if len(reviews) == window:
+                    break
+        finally:
+            await merged.aclose()
+        return reviews[start:]
+
+    async def _read_timeline(
+        self,
+        timeline_service: TimelineService,
+        account_uuid: UUID,
         filter_type: Literal["all", "mine", "watching"],
+        limit: int,
+        offset: int,
+        cursor: KeysetCursor | None,
+        since: KeysetCursor | None = None,
     ) -> list[Review]:
-        """Fetch and filter reviews based on filter type."""
+        """Read a feed page from the account's materialized timeline.
+
+        Reviews of watched profiles that are not fanned out (too many
+        watchers) are fetched on read and merged in feed order.
+        """
+        start = 0 if cursor else offset
+        reviews = await timeline_service.get_timeline(
+            account_uuid,
+            start + limit,
+            after=cursor,
+            own=_TIMELINE_OWN[filter_type],
+            include_drafts=self.open_draft_profiles,
+            since=since,
+        )
+        if filter_type == "mine":
+            return reviews[start:]
+
+        watched = await self._watched_fanout_skipped(timeline_service, account_uuid)
+        if watched:
+            visible, drafts = await self._partition_usernames(watched)
+            merged = await self.review_service.get_feed(
+                visible,
+                start + limit,
+                draft_usernames=drafts,
+                viewer_uuid=account_uuid,
+                after=cursor,
+                since=since,
+            )
+            # Entries fanned out before a profile crossed the limit appear twice.
+            by_id = {review.id: review for review in [*reviews, *merged]}
+            reviews = sorted(
+                by_id.values(), key=lambda r: (r.updated_at, r.id or ""), reverse=True
+            )
+        return reviews[start : start + limit]
+
+    async def resolve_scope(
+        self,
+        account_uuid: UUID,
+        filter_type: Literal["all", "mine", "watching"] = "all",
+    ) -> tuple[list[str], list[str]] | None:
+        """Resolve a feed's scope once for both get_version and execute.
+
+        None when the feed is read from timelines, which need no scope.
+        """
+        if self.timeline_service is not None:
+            return None
+        account = await self.account_service.get_account_by_uuid(account_uuid)
+        return await self.get_scope(account_uuid, account.username, filter_type)
+
+    async def get_scope(
+        self,
+        account_uuid: UUID,
+        username: str,
+        filter_type: Literal["all", "mine", "watching"],
+    ) -> tuple[list[str], list[str]]:
+        """Get the visible and draft reviewed usernames an account's feed covers."""
+        usernames = await self._feed_usernames(account_uuid, username, filter_type)
+        if not usernames:
+            return [], []
+        return await self._partition_usernames(usernames)
+
+    async def _watched_fanout_skipped(
+        self, timeline_service: TimelineService, account_uuid: UUID
+    ) -> list[str]:
+        """Watched usernames whose reviews are merged in on read."""
+        skipped = await timeline_service.get_fanout_skipped_usernames()
+        return await self.watchlist_service.get_watched_among(account_uuid, skipped)
+
+    async def _feed_usernames(
+        self,
+        account_uuid: UUID,
+        username: str,
+        filter_type: Literal["all", "mine", "watching"],
+    ) -> list[str]:
+        """Collect the reviewed usernames the feed covers."""
         usernames_to_fetch: list[str] = []
 
         if filter_type in ("all", "mine"):
@@ -77,45 +341,35 @@ class GetActivityFeedUseCase:
             watchlist = await self.watchlist_service.get_watchlist(account_uuid)
             usernames_to_fetch.extend(watch.watched_username for watch in watchlist)
 
-        if not usernames_to_fetch:
-            return []
+        # Usernames are matched case-insensitively, so deduplicate the same way.
+        return list({u.lower(): u for u in usernames_to_fetch}.values())
 
-        # Batch fetch reviews for all usernames
-        review_tasks = [
-            self.review_service.get_reviews_for_user(u) for u in usernames_to_fetch
-        ]
-        review_lists = await asyncio.gather(*review_tasks)
-        all_reviews: list[Review] = []
-        for review_list in review_lists:
-            all_reviews.extend(review_list)
-
-        # Batch fetch accounts for filtering
-        reviewed_usernames = list({r.reviewed_username for r in all_reviews})
-        accounts_map = await self.account_service.get_accounts_by_usernames(
-            reviewed_usernames
-        )
+    async def _partition_usernames(
+        self, usernames: list[str]
+    ) -> tuple[list[str], list[str]]:
+        """Split usernames into visible and draft profiles, dropping deleted ones.
 
-        filtered: list[Review] = []
-        for review in all_reviews:
-            reviewed_account = accounts_map.get(review.reviewed_username.lower())
-            is_deleted = (
-                reviewed_account is not None and reviewed_account.deleted_at is not None
-            )
-            is_draft = reviewed_account is None
+        Draft profiles (no account) are only visible to their own reviewers
+        unless open_draft_profiles is set.
+        """
+        accounts_map = await self.account_service.get_account_summaries_by_usernames(
+            usernames
+        )
 
-            if is_deleted:
-                continue
-            if (
-                is_draft
-                and not self.open_draft_profiles
-                and review.reviewer_uuid != account_uuid
-            ):
+        visible: list[str] = []
+        drafts: list[str] = []
+        for username in usernames:
+            reviewed_account = accounts_map.get(username.lower())
+            if reviewed_account is not None and reviewed_account.deleted_at is not None:
                 continue
-            filtered.append(review)
+            if reviewed_account is None and not self.open_draft_profiles:
+                drafts.append(username)
+            else:
+                visible.append(username)
 
-        return filtered
+        return visible, drafts
 
-    async def _enrich_reviews(
+    async def enrich_reviews(
         self,
         reviews: list[Review],
     ) -> list[ActivityFeedItem]:
@@ -125,7 +379,7 @@ class GetActivityFeedUseCase:
 
         # Batch fetch reviewer accounts (skip missing ones gracefully)
         reviewer_uuids = list({r.reviewer_uuid for r in reviews})
-        reviewer_accounts = await self.account_service.get_accounts_by_uuids(
+        reviewer_accounts = await self.account_service.get_account_summaries_by_uuids(
             reviewer_uuids
         )
 
@@ -136,7 +390,7 @@ class GetActivityFeedUseCase:
                 all_usernames.append(acc.username)
 
         # Batch fetch user profiles
-        users_map = await self.user_service.get_users_by_usernames(all_usernames)
+        users_map = await self.user_service.get_user_summaries_by_usernames(all_usernames)
 
         result: list[ActivityFeedItem] = []
         for review in reviews:
@@ -0,0 +1,57 @@
+from typing import Literal
+from uuid import UUID
+
+from app.application.accounts.use_cases.get_activity_feed import (
+    ActivityFeedItem,
+    GetActivityFeedUseCase,
+)
+from app.domain.reviews.services.review_change_hub import (
+    ReviewChangeHub,
+    ReviewSubscription,
+)
+from app.domain.reviews.value_objects.review_change import ReviewChange
+
+
+class StreamActivityFeedUseCase:
+    """Use case for pushing new activity feed items to a connected client.
+
+    The subscription covers the feed's usernames at connect time; clients
+    reconnect (with their last event id) to pick up watchlist changes.
+    """
+
+    def __init__(self, feed_use_case: GetActivityFeedUseCase, hub: ReviewChangeHub):
+        self.feed_use_case = feed_use_case
+        self.hub = hub
+
+    async def subscribe(
+        self,
+        account_uuid: UUID,
+        filter_type: Literal["all", "mine", "watching"] = "all",
+        last_event_id: str | None = None,
+    ) -> ReviewSubscription:
+        """Subscribe to review writes that belong in the account's feed."""
+        account = await self.feed_use_case.account_service.get_account_by_uuid(
+            account_uuid
+        )
+        visible, drafts = await self.feed_use_case.get_scope(
+            account_uuid, account.username, filter_type
+        )
+        return await self.hub.subscribe(
+            visible,
+            account_uuid,
+            viewer_only_usernames=drafts,
+            last_event_id=last_event_id,
+        )
+
+    async def render(self, change: ReviewChange) -> ActivityFeedItem | None:
+        """Enrich a change into a feed item, or None if it is not shown."""
+        # The stream outlives its request: read accounts and users fresh for
+        # each event instead of from what earlier events loaded.
+        self.feed_use_case.account_service.clear_loaded()
+        self.feed_use_case.user_service.clear_loaded()
+        items = await self.feed_use_case.enrich_reviews([change.review])
+        return items[0] if items else None
+
+    def unsubscribe(self, subscription: ReviewSubscription) -> None:
+        """Release a subscription when its client disconnects."""
+        self.hub.unsubscribe(subscription)
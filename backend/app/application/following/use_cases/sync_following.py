@@ -0,0 +1,104 @@
+import logging
+from uuid import UUID
+
+from app.domain.accounts.services.account_service import AccountService
+from app.domain.following.entities.following_graph import (
+    FollowedUser,
+    FollowingGraph,
+    FollowingGraphPage,
+)
+from app.domain.following.services.following_service import FollowingService
+from app.domain.shared.exceptions import GitHubAPIException, GitHubRateLimitException
+from app.infrastructure.github.external.github_client import FollowingPage, GitHubClient
+from app.infrastructure.shared.concurrency.background import spawn_background
+from app.infrastructure.shared.concurrency.single_flight import SingleFlight
+from app.infrastructure.shared.config.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class SyncFollowingGraphUseCase:
+    """Use case for syncing an account's GitHub following list into storage.
+
+    Walks GitHub's ``Link`` pagination. Each page is requested with the ETag
+    stored from the previous sync, so unchanged pages come back as 304s that
+    don't count against the rate limit and are reused as-is.
+    """
+
+    def __init__(
+        self,
+        account_service: AccountService,
+        following_service: FollowingService,
+        github_client: GitHubClient,
+        single_flight: SingleFlight[FollowingGraph | None] | None = None,
+    ):
+        self.account_service = account_service
+        self.following_service = following_service
+        self.github_client = github_client
+        self.single_flight = single_flight or SingleFlight()
+
+    async def execute(self, account_uuid: UUID) -> FollowingGraph | None:
+        """Sync the following graph, joining a sync already running for the account."""
+        return await self.single_flight.do(
+            str(account_uuid), lambda: self._sync(account_uuid)
+        )
+
+    def schedule(self, account_uuid: UUID) -> None:
+        """Sync the following graph in the background."""
+        spawn_background(
+            self.execute(account_uuid), name=f"following-sync:{account_uuid}"
+        )
+
+    async def _sync(self, account_uuid: UUID) -> FollowingGraph | None:
+        account = await self.account_service.get_account_by_uuid(account_uuid)
+        existing = await self.following_service.get_graph(account_uuid)
+        if not account.access_token:
+            return existing
+
+        previous_pages = existing.pages if existing else []
+        pages: list[FollowingGraphPage] = []
+        next_url: str | None = None
+        try:
+            while len(pages) < settings.FOLLOWING_SYNC_MAX_PAGES:
+                previous = (
+                    previous_pages[len(pages)]
+                    if len(pages) < len(previous_pages)
+                    else None
+                )
+                fetched = await self.github_client.fetch_following_page(
+                    account.username,
+                    account.access_token,
+                    url=next_url,
+                    etag=previous.etag if previous else None,
+                )
+                if fetched is not None:
+                    page = self._to_page(fetched)
+                elif previous is not None:
+                    page = previous
+                else:
+                    raise GitHubAPIException("Unexpected 304 for unsynced following page")
+                pages.append(page)
+                next_url = page.next_url
+                if next_url is None:
+                    break
+        except GitHubRateLimitException:
+            logger.info("Following sync for %s deferred: rate limited", account_uuid)
+            return existing
+
+        return await self.following_service.save_pages(account_uuid, pages, existing)
+
+    @staticmethod
+    def _to_page(fetched: FollowingPage) -> FollowingGraphPage:
+        return FollowingGraphPage(
+            users=[
+                FollowedUser(
+                    login=item["login"],
+                    avatar_url=item.get("avatar_url"),
+                    type=item.get("type"),
+                )
+                for item in fetched.items
+                if item.get("login")
+            ],
+            etag=fetched.etag,
+            next_url=fetched.next_url,
+        )
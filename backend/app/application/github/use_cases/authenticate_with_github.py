@@ -1,11 +1,14 @@
+import asyncio
 import logging
 
 from app.domain.accounts.entities.account import Account
 from app.domain.accounts.services.account_service import AccountService
+from app.domain.timeline.services.timeline_service import TimelineService
 from app.domain.users.entities.user import User
 from app.domain.users.services.user_service import UserService
 from app.infrastructure.email.email_service import EmailService
 from app.infrastructure.github.external.github_client import GitHubClient
+from app.infrastructure.shared.concurrency.background import spawn_background
 
 logger = logging.getLogger(__name__)
 
@@ -18,49 +21,57 @@ class AuthenticateWithGitHubUseCase:
         account_service: AccountService,
         user_service: UserService,
         email_service: EmailService,
+        github_client: GitHubClient,
+        timeline_service: TimelineService | None = None,
     ):
         self.account_service = account_service
         self.user_service = user_service
         self.email_service = email_service
+        self.github_client = github_client
+        self.timeline_service = timeline_service
 
     async def execute(self, code: str) -> Account:
         """
         Authenticate with GitHub OAuth code.
         Returns the authenticated or newly created account.
+
+        Only the token exchange, GitHub user lookup and account upsert are on
+        the critical path; the profile upsert, new-account email and clearing
+        of the profile's draft timeline entries run in the background once
+        the account is known.
         """
         # Fetch GitHub user data and access token
-        github_data, access_token = (
-            await GitHubClient.fetch_github_user_data(code)
-        )
+        github_data, access_token = await self.github_client.fetch_github_user_data(code)
 
         username = github_data["username"]
 
         # Get or create account using GitHub username
-        account, is_new = (
-            await self.account_service.get_or_create_account(
-                username=username,
-                access_token=access_token,
-                email=github_data.get("email"),
-            )
+        account, is_new = await self.account_service.get_or_create_account(
+            username=username,
+            access_token=access_token,
+            email=github_data.get("email"),
         )
 
+        spawn_background(
+            self._save_user_profile(github_data), name=f"login-profile:{username}"
+        )
         if is_new:
-            try:
-                self.email_service.send_new_account_notification(
-                    username=username,
-                )
-            except Exception:
-                logger.exception(
-                    "Failed to send new account notification email"
+            spawn_background(
+                self._send_new_account_notification(username),
+                name=f"login-email:{username}",
+            )
+            if self.timeline_service is not None:
+                spawn_background(
+                    self.timeline_service.clear_drafts(username),
+                    name=f"login-timeline:{username}",
                 )
 
-        # Create/update User record with GitHub profile data
-        existing_user = (
-            await self.user_service.get_user_by_username(username)
-        )
+        return account
+
+    async def _save_user_profile(self, github_data: dict) -> None:
+        """Create/update User record with GitHub profile data."""
         user = User(
-            id=existing_user.id if existing_user else None,
-            username=username,
+            username=github_data["username"],
             name=github_data.get("name"),
             bio=github_data.get("bio"),
             avatar_url=github_data.get("avatar_url"),
@@ -68,4 +79,11 @@ class AuthenticateWithGitHubUseCase:
         )
         await self.user_service.save_user(user)
 
-        return account
+    async def _send_new_account_notification(self, username: str) -> None:
+        """Send the new account email without blocking the event loop."""
+        try:
+            await asyncio.to_thread(
+                self.email_service.send_new_account_notification, username=username
+            )
+        except Exception:
+            logger.exception("Failed to send new account notification email")
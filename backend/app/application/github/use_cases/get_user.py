@@ -1,11 +1,25 @@
-from datetime import datetime, timezone
-from uuid import UUID
+import asyncio
+import logging
+import time
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
 
 from app.domain.accounts.entities.account import Account
 from app.domain.accounts.services.account_service import AccountService
+from app.domain.shared.exceptions import GitHubAPIException, GitHubRateLimitException
+from app.domain.shared.repositories.lease_repository import ILeaseRepository
 from app.domain.users.entities.user import User
 from app.domain.users.services.user_service import UserService
 from app.infrastructure.github.external.github_client import GitHubClient
+from app.infrastructure.github.external.rate_limiter import GitHubCallPriority
+from app.infrastructure.shared.concurrency.background import spawn_background
+from app.infrastructure.shared.concurrency.counter_buffer import CounterBuffer
+from app.infrastructure.shared.concurrency.single_flight import SingleFlight
+from app.infrastructure.shared.config.config import settings
+from app.infrastructure.shared.constants import USER_FETCH_LEASE_POLL_INTERVAL_SECONDS
+
+logger = logging.getLogger(__name__)
 
 
 class GetUserUseCase:
@@ -15,15 +29,24 @@ class GetUserUseCase:
         self,
         account_service: AccountService,
         user_service: UserService,
+        github_client: GitHubClient,
+        single_flight: SingleFlight[User] | None = None,
+        lease_repository: ILeaseRepository | None = None,
+        view_counts: CounterBuffer[str] | None = None,
     ):
         self.account_service = account_service
         self.user_service = user_service
+        self.github_client = github_client
+        self.single_flight = single_flight or SingleFlight()
+        self.lease_repository = lease_repository
+        self.view_counts = view_counts
 
     async def execute(
         self,
         username: str,
         current_account_uuid: UUID,
         force_refresh: bool = False,
+        max_staleness: timedelta | None = None,
     ) -> User:
         """
         Fetch a GitHub user by username.
@@ -31,36 +54,170 @@ class GetUserUseCase:
         If force_refresh is False, checks the local cache first.
         If the user is not found or the cache is older than 7 days
         (or force_refresh is True), fetches fresh data from GitHub.
+        With max_staleness set (stale-while-revalidate), an expired cached
+        user younger than max_staleness is returned immediately and
+        refreshed in the background; older entries are refreshed inline.
+        A cached user is revalidated with a conditional request, so an
+        unchanged profile (304) only bumps its updated_at. When the viewer's
+        GitHub budget is exhausted, a stale cached user is served instead.
+
+        Concurrent misses for the same username share a single GitHub fetch
+        (and, with a lease repository, a single fetch across workers).
         """
         cached_user = await self.user_service.get_user_by_username(username)
+        if cached_user is not None and self.view_counts is not None:
+            # View counts only steer background refreshes; they are buffered
+            # and written in one batch by the profile refresh worker.
+            self.view_counts.add(username.lower())
 
         if (
             not force_refresh
             and cached_user is not None
             and not self.user_service.is_cache_expired(cached_user)
         ):
-            target_account = await self.account_service.get_account_by_username(username)
-            if target_account:
-                cached_user.created_at = target_account.created_at
-                cached_user.deleted_at = target_account.deleted_at
-            return cached_user
+            return await self._with_account_lifecycle(cached_user, username)
 
-        account = await self.account_service.get_account_by_uuid(current_account_uuid)
-        github_data = await GitHubClient.fetch_user_by_username(
-            username, account.access_token
+        if (
+            not force_refresh
+            and cached_user is not None
+            and max_staleness is not None
+            and not self.user_service.is_stale_beyond(cached_user, max_staleness)
+        ):
+            self._schedule_background_refresh(username, current_account_uuid, cached_user)
+            return await self._with_account_lifecycle(cached_user, username)
+
+        user = await self.single_flight.do(
+            username.lower(),
+            lambda: self._refresh(username, current_account_uuid, cached_user),
+        )
+        # Waiters share the flight's result; hand each caller its own copy.
+        return replace(user)
+
+    def _schedule_background_refresh(
+        self, username: str, current_account_uuid: UUID, cached_user: User
+    ) -> None:
+        """Refresh a stale user off the request path (coalesced per username)."""
+        spawn_background(
+            self.single_flight.do(
+                username.lower(),
+                lambda: self._refresh(
+                    username,
+                    current_account_uuid,
+                    cached_user,
+                    priority=GitHubCallPriority.BACKGROUND,
+                ),
+            ),
+            name=f"refresh-github-user:{username.lower()}",
         )
 
+    async def _refresh(
+        self,
+        username: str,
+        current_account_uuid: UUID,
+        cached_user: User | None,
+        priority: GitHubCallPriority = GitHubCallPriority.INTERACTIVE,
+    ) -> User:
+        """Refresh a user from GitHub, coordinating with other workers if enabled."""
+        if self.lease_repository is None:
+            return await self._fetch_and_save(
+                username, current_account_uuid, cached_user, priority
+            )
+
+        lease_key = f"github-user:{username.lower()}"
+        owner = uuid4().hex
+        ttl = settings.GITHUB_USER_FETCH_LEASE_SECONDS
+        if not await self.lease_repository.acquire(lease_key, owner, ttl):
+            refreshed = await self._wait_for_peer_refresh(
+                self.lease_repository, username, lease_key, cached_user
+            )
+            if refreshed is not None:
+                return await self._with_account_lifecycle(refreshed, username)
+            return await self._fetch_and_save(
+                username, current_account_uuid, cached_user, priority
+            )
+
+        try:
+            return await self._fetch_and_save(
+                username, current_account_uuid, cached_user, priority
+            )
+        finally:
+            await self.lease_repository.release(lease_key, owner)
+
+    async def _wait_for_peer_refresh(
+        self,
+        lease_repository: ILeaseRepository,
+        username: str,
+        lease_key: str,
+        cached_user: User | None,
+    ) -> User | None:
+        """Wait for another worker's lease, then return its result if it saved one."""
+        deadline = time.monotonic() + settings.GITHUB_USER_FETCH_LEASE_SECONDS
+        while time.monotonic() < deadline:
+            await asyncio.sleep(USER_FETCH_LEASE_POLL_INTERVAL_SECONDS)
+            if not await lease_repository.is_held(lease_key):
+                break
+
+        refreshed = await self.user_service.get_user_by_username(username, reload=True)
+        if refreshed is None or refreshed.updated_at is None:
+            return None
+        if (
+            cached_user is not None
+            and cached_user.updated_at is not None
+            and refreshed.updated_at <= cached_user.updated_at
+        ):
+            return None
+        return refreshed
+
+    async def _fetch_and_save(
+        self,
+        username: str,
+        current_account_uuid: UUID,
+        cached_user: User | None,
+        priority: GitHubCallPriority = GitHubCallPriority.INTERACTIVE,
+    ) -> User:
+        """Fetch a user from GitHub (conditionally if cached) and persist it."""
+        account = await self.account_service.get_account_by_uuid(current_account_uuid)
+        try:
+            github_data = await self.github_client.fetch_user_by_username(
+                username,
+                account.access_token,
+                etag=cached_user.etag if cached_user else None,
+                last_modified=cached_user.last_modified if cached_user else None,
+                priority=priority,
+            )
+        except GitHubRateLimitException:
+            if cached_user is None:
+                raise
+            logger.info("GitHub rate limit reached, serving cached user %s", username)
+            return await self._with_account_lifecycle(cached_user, username)
+
         target_account = await self.account_service.get_account_by_username(username)
 
-        user = self._build_user_from_github_data(github_data, cached_user, target_account)
+        if github_data is None:
+            # 304 Not Modified: validators are only sent for a cached user.
+            if cached_user is None:
+                raise GitHubAPIException("Unexpected 304 for uncached GitHub user")
+            saved_user = await self.user_service.mark_user_fresh(cached_user)
+        else:
+            user = self._build_user_from_github_data(
+                github_data, cached_user, target_account
+            )
+            saved_user = await self.user_service.save_user(user)
 
-        saved_user = await self.user_service.save_user(user)
         if target_account:
             # Ensure response includes account lifecycle fields.
             saved_user.created_at = target_account.created_at
             saved_user.deleted_at = target_account.deleted_at
         return saved_user
 
+    async def _with_account_lifecycle(self, user: User, username: str) -> User:
+        """Attach account lifecycle fields to a cached user."""
+        target_account = await self.account_service.get_account_by_username(username)
+        if target_account:
+            user.created_at = target_account.created_at
+            user.deleted_at = target_account.deleted_at
+        return user
+
     @staticmethod
     def _build_user_from_github_data(
         github_data: dict,
@@ -76,6 +233,8 @@ class GetUserUseCase:
             avatar_url=github_data.get("avatar_url"),
             type=github_data.get("type"),
             updated_at=datetime.now(timezone.utc),
+            etag=github_data.get("etag"),
+            last_modified=github_data.get("last_modified"),
             created_at=(target_account.created_at if target_account else None),
             deleted_at=(target_account.deleted_at if target_account else None),
         )
@@ -0,0 +1,107 @@
+import asyncio
+import logging
+from collections import Counter
+from datetime import timedelta
+from uuid import UUID
+
+from app.application.github.use_cases.refresh_users import RefreshUsersUseCase
+from app.domain.reviews.services.review_service import ReviewService
+from app.domain.shared.exceptions import GitHubRateLimitException
+from app.domain.users.entities.user import User
+from app.domain.users.services.user_service import UserService
+from app.domain.watchlist.services.watchlist_service import WatchlistService
+
+logger = logging.getLogger(__name__)
+
+# Popularity weights: a watcher or a review signals more ongoing interest
+# than a single profile view.
+VIEW_WEIGHT = 1
+WATCHER_WEIGHT = 5
+REVIEW_WEIGHT = 3
+
+# How many expiring users to score for each one that fits in the budget.
+CANDIDATE_SCAN_FACTOR = 4
+
+
+class RefreshExpiringUsersUseCase:
+    """Use case for one background pass refreshing soon-to-expire users.
+
+    Candidates are users whose cache expires within ``lead_time``, ranked by
+    popularity (views, watchers, reviews). The top ``budget`` users are
+    refreshed through bulk GraphQL batches. Progress lives in the users'
+    ``updated_at``, so an interrupted pass simply resumes with whatever is
+    still expiring on the next run.
+    """
+
+    def __init__(
+        self,
+        user_service: UserService,
+        watchlist_service: WatchlistService,
+        review_service: ReviewService,
+        refresh_users: RefreshUsersUseCase,
+    ):
+        self.user_service = user_service
+        self.watchlist_service = watchlist_service
+        self.review_service = review_service
+        self.refresh_users = refresh_users
+
+    async def execute(
+        self,
+        current_account_uuid: UUID,
+        lead_time: timedelta,
+        budget: int,
+        batch_size: int,
+        concurrency: int,
+    ) -> int:
+        """Refresh up to ``budget`` expiring users. Returns how many were saved."""
+        candidates = await self.user_service.get_users_expiring_within(
+            lead_time, limit=budget * CANDIDATE_SCAN_FACTOR
+        )
+        if not candidates:
+            return 0
+
+        ranked = await self._rank_by_popularity(candidates)
+        usernames = [user.username for user in ranked[:budget]]
+        batches = [
+            usernames[start : start + batch_size]
+            for start in range(0, len(usernames), batch_size)
+        ]
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def refresh_batch(batch: list[str]) -> int:
+            async with semaphore:
+                try:
+                    saved = await self.refresh_users.execute(batch, current_account_uuid)
+                except GitHubRateLimitException:
+                    logger.info("Profile refresh batch deferred: rate limited")
+                    return 0
+                return len(saved)
+
+        refreshed = sum(await asyncio.gather(*(refresh_batch(b) for b in batches)))
+        logger.info(
+            "Profile refresh pass: %d/%d candidates refreshed",
+            refreshed,
+            len(candidates),
+        )
+        return refreshed
+
+    async def _rank_by_popularity(self, users: list[User]) -> list[User]:
+        """Sort users by weighted views, watchers and reviews, highest first."""
+        usernames = [user.username for user in users]
+        watcher_counts, review_counts = await asyncio.gather(
+            self.watchlist_service.get_watcher_counts_for_usernames(usernames),
+            self.review_service.get_review_counts_for_usernames(usernames),
+        )
+        watchers = Counter({k.lower(): v for k, v in watcher_counts.items()})
+        reviews = Counter({k.lower(): v for k, v in review_counts.items()})
+
+        def score(user: User) -> int:
+            key = user.username.lower()
+            return (
+                VIEW_WEIGHT * user.view_count
+                + WATCHER_WEIGHT * watchers[key]
+                + REVIEW_WEIGHT * reviews[key]
+            )
+
+        return sorted(users, key=score, reverse=True)
@@ -0,0 +1,82 @@
+import logging
+from datetime import datetime, timezone
+from uuid import UUID
+
+from app.domain.accounts.services.account_service import AccountService
+from app.domain.users.entities.user import User
+from app.domain.users.services.user_service import UserService
+from app.infrastructure.github.external.github_client import GitHubClient
+from app.infrastructure.github.external.rate_limiter import GitHubCallPriority
+
+logger = logging.getLogger(__name__)
+
+
+class RefreshUsersUseCase:
+    """Use case for refreshing many cached GitHub users in bulk.
+
+    Profiles are resolved through the GraphQL API in batches instead of one
+    REST call per user, so hydrating N users costs ~N/100 requests.
+    """
+
+    def __init__(
+        self,
+        account_service: AccountService,
+        user_service: UserService,
+        github_client: GitHubClient,
+    ):
+        self.account_service = account_service
+        self.user_service = user_service
+        self.github_client = github_client
+
+    async def execute(
+        self,
+        usernames: list[str],
+        current_account_uuid: UUID,
+        priority: GitHubCallPriority = GitHubCallPriority.BACKGROUND,
+    ) -> list[User]:
+        """
+        Fetch the given users from GitHub and upsert them into the cache.
+
+        Users are saved in one bulk write. Logins GitHub does not return get
+        their updated_at bumped, so later passes don't keep picking them.
+        Returns the saved users.
+        """
+        if not usernames:
+            return []
+
+        account = await self.account_service.get_account_by_uuid(current_account_uuid)
+        github_users = await self.github_client.fetch_users_by_usernames(
+            usernames, account.access_token, priority=priority
+        )
+        cached_users = await self.user_service.get_users_by_usernames(list(github_users))
+
+        now = datetime.now(timezone.utc)
+        saved = await self.user_service.save_users(
+            [
+                self._build_user(github_data, cached_users.get(key), now)
+                for key, github_data in github_users.items()
+            ]
+        )
+
+        missing = list(
+            {u.lower(): u for u in usernames if u.lower() not in github_users}.values()
+        )
+        if missing:
+            await self.user_service.mark_users_checked(missing)
+            logger.info("Bulk refresh skipped %d unknown GitHub users", len(missing))
+        return saved
+
+    @staticmethod
+    def _build_user(github_data: dict, cached_user: User | None, now: datetime) -> User:
+        """Build a User entity from GraphQL profile data."""
+        # GraphQL responses carry no REST validators, so etag/last_modified
+        # are reset and the next single-user fetch does a full REST request.
+        return User(
+            id=cached_user.id if cached_user else None,
+            username=github_data["username"],
+            name=github_data.get("name"),
+            bio=github_data.get("bio"),
+            avatar_url=github_data.get("avatar_url"),
+            type=github_data.get("type"),
+            updated_at=now,
+        )
@@ -1,21 +1,61 @@
+import re
 from uuid import UUID
 
 from app.domain.accounts.services.account_service import AccountService
-from app.infrastructure.github.external.github_client import GitHubClient
+from app.infrastructure.github.external.github_client import (
+    GitHubClient,
+    UserSearchPage,
+)
+from app.infrastructure.github.external.search_cache import UserSearchCache
+from app.infrastructure.shared.concurrency.single_flight import SingleFlight
+
+# Queries with these characters already use GitHub search syntax
+_SEARCH_SYNTAX = re.compile(r"[\s:\"]")
 
 
 class SearchUsersUseCase:
     """Use case for searching GitHub users."""
 
-    def __init__(self, account_service: AccountService):
+    def __init__(
+        self,
+        account_service: AccountService,
+        github_client: GitHubClient,
+        search_cache: UserSearchCache | None = None,
+        single_flight: SingleFlight[UserSearchPage] | None = None,
+    ):
         self.account_service = account_service
+        self.github_client = github_client
+        self.search_cache = search_cache
+        self.single_flight = single_flight or SingleFlight()
 
     async def execute(self, query: str, current_account_uuid: UUID) -> list[dict]:
         """
         Search GitHub users by query.
 
-        Uses the authenticated user's access token to search GitHub users.
+        A bare term is searched as a login prefix (``<term> in:login``), so
+        typeahead keystrokes can be narrowed from a cached shorter term.
+        Serves cached results when available; otherwise uses the authenticated
+        user's access token to search GitHub users and caches the page.
         Returns a list of users with their login and avatar_url.
         """
+        key = UserSearchCache.normalize(_login_query(query))
+        if self.search_cache is not None:
+            cached = self.search_cache.get(key)
+            if cached is not None:
+                return cached
+
         account = await self.account_service.get_account_by_uuid(current_account_uuid)
-        return await GitHubClient.search_users(query, account.access_token)
+        page = await self.single_flight.do(
+            key, lambda: self.github_client.search_users(key, account.access_token)
+        )
+        if self.search_cache is not None:
+            self.search_cache.put(key, page)
+        return list(page.items)
+
+
+def _login_query(query: str) -> str:
+    """Restrict a bare search term to logins; leave search syntax alone."""
+    term = query.strip()
+    if not term or _SEARCH_SYNTAX.search(term):
+        return query
+    return f"{term} in:login"
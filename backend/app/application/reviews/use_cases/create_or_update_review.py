@@ -6,8 +6,10 @@ from app.domain.reviews.entities.review import ReviewStatus
 from app.domain.reviews.services.review_enrichment_service import ReviewEnrichmentService
 from app.domain.reviews.services.review_service import ReviewService
 from app.domain.reviews.value_objects.review_with_username import ReviewWithUsername
+from app.domain.timeline.services.timeline_service import TimelineService
 from app.domain.watchlist.services.watchlist_service import WatchlistService
 from app.infrastructure.email.email_service import EmailService
+from app.infrastructure.shared.concurrency.background import spawn_background
 
 logger = logging.getLogger(__name__)
 
@@ -22,12 +24,14 @@ class CreateOrUpdateReviewUseCase:
         enrichment_service: ReviewEnrichmentService,
         watchlist_service: WatchlistService,
         email_service: EmailService,
+        timeline_service: TimelineService | None = None,
     ):
         self.review_service = review_service
         self.account_service = account_service
         self.enrichment_service = enrichment_service
         self.watchlist_service = watchlist_service
         self.email_service = email_service
+        self.timeline_service = timeline_service
 
     async def execute(
         self,
@@ -48,9 +52,7 @@ class CreateOrUpdateReviewUseCase:
 
         if is_new:
             try:
-                reviewer = await self.account_service.get_account_by_uuid(
-                    reviewer_uuid
-                )
+                reviewer = await self.account_service.get_account_by_uuid(reviewer_uuid)
                 self.email_service.send_new_review_notification(
                     reviewer_username=reviewer.username,
                     reviewed_username=reviewed_username,
@@ -59,14 +61,19 @@ class CreateOrUpdateReviewUseCase:
                     anonymous=anonymous,
                 )
             except Exception:
-                logger.exception(
-                    "Failed to send new review notification email"
-                )
+                logger.exception("Failed to send new review notification email")
 
         try:
             await self.watchlist_service.watch(reviewer_uuid, reviewed_username)
         except Exception:
             logger.exception("Failed to auto-watch user after review submission")
 
+        if self.timeline_service is not None:
+            # After the auto-watch, so the reviewer's own timeline is included.
+            spawn_background(
+                self.timeline_service.publish(review),
+                name=f"timeline-publish:{review.id}",
+            )
+
         enriched = await self.enrichment_service.enrich_reviews([review])
         return enriched[0]
@@ -1,14 +1,22 @@
 from uuid import UUID
 
 from app.domain.reviews.services.review_service import ReviewService
+from app.domain.timeline.services.timeline_service import TimelineService
 
 
 class DeleteReviewUseCase:
     """Use case for deleting a review."""
 
-    def __init__(self, review_service: ReviewService):
+    def __init__(
+        self,
+        review_service: ReviewService,
+        timeline_service: TimelineService | None = None,
+    ):
         self.review_service = review_service
+        self.timeline_service = timeline_service
 
     async def execute(self, reviewer_uuid: UUID, reviewed_username: str) -> None:
         """Delete a review for a given user."""
-        await self.review_service.delete_review(reviewer_uuid, reviewed_username)
+        review = await self.review_service.delete_review(reviewer_uuid, reviewed_username)
+        if self.timeline_service is not None and review is not None and review.id:
+            await self.timeline_service.retract(review.id)
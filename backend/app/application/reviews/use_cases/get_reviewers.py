@@ -3,6 +3,7 @@ from uuid import UUID
 from app.domain.accounts.services.account_service import AccountService
 from app.domain.reviews.services.review_enrichment_service import ReviewEnrichmentService
 from app.domain.reviews.services.review_service import ReviewService
+from app.domain.reviews.value_objects.review_summary import ReviewSummary
 from app.domain.reviews.value_objects.review_with_username import ReviewWithUsername
 from app.domain.shared.constants import MAX_REVIEWERS
 from app.domain.users.services.user_service import UserService
@@ -27,8 +28,11 @@ class GetReviewersUseCase:
 
     async def execute(
         self, reviewed_username: str, viewer_uuid: UUID
-    ) -> list[ReviewWithUsername]:
-        """Get all reviewers for a user with resolved usernames and avatars."""
+    ) -> list[ReviewWithUsername[ReviewSummary]]:
+        """Get all reviewers for a user with resolved usernames and avatars.
+
+        Only the summary fields the sidebar shows are read, never comments.
+        """
         target_account = await self.account_service.get_account_by_username(
             reviewed_username
         )
@@ -37,13 +41,12 @@ class GetReviewersUseCase:
             if user is None:
                 return []
 
-        reviews = await self.review_service.get_reviews_for_user(
-            reviewed_username, limit=MAX_REVIEWERS, offset=0
+        # Draft profiles only show the viewer's own review
+        only_viewer = target_account is None and not self.open_draft_profiles
+        reviews = await self.review_service.get_review_summaries_for_user(
+            reviewed_username,
+            limit=MAX_REVIEWERS,
+            reviewer_uuid=viewer_uuid if only_viewer else None,
         )
 
-        if target_account is None and not self.open_draft_profiles:
-            reviews = [
-                review for review in reviews if review.reviewer_uuid == viewer_uuid
-            ]
-
         return await self.enrichment_service.enrich_reviews(reviews)
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from uuid import UUID
 
 from app.domain.accounts.services.account_service import AccountService
@@ -6,6 +6,7 @@ from app.domain.reviews.services.review_enrichment_service import ReviewEnrichme
 from app.domain.reviews.services.review_service import ReviewService
 from app.domain.reviews.value_objects.review_with_username import ReviewWithUsername
 from app.domain.shared.constants import DEFAULT_PAGE_SIZE
+from app.domain.shared.pagination import KeysetCursor, ListVersion
 from app.infrastructure.shared.config.config import settings
 
 # Re-export for backwards compatibility
@@ -20,6 +21,7 @@ class PaginatedReviewsResult:
     has_more: bool
     is_page_owner: bool
     is_moderator: bool
+    next_cursor: KeysetCursor | None = None
 
 
 class GetReviewsUseCase:
@@ -44,42 +46,92 @@ class GetReviewsUseCase:
         limit: int = DEFAULT_PAGE_SIZE,
         offset: int = 0,
         status: str | None = None,
+        since: KeysetCursor | None = None,
+        cursor: KeysetCursor | None = None,
     ) -> PaginatedReviewsResult:
-        """Get paginated reviews with reviewer usernames resolved."""
-        current_account = await self.account_service.get_account_by_uuid(viewer_uuid)
-        is_page_owner = (
-            current_account is not None
-            and current_account.username.lower() == reviewed_username.lower()
-        )
-        is_moderator = (
-            current_account is not None
-            and current_account.username in settings.MODERATOR_USERNAMES
+        """Get paginated reviews with reviewer usernames resolved.
+
+        Pages by cursor (the previous result's next_cursor) when given; offset
+        is deprecated and ignored alongside a cursor. With since, only reviews
+        updated after that position are returned.
+        """
+        if cursor is not None:
+            offset = 0
+        is_page_owner, is_moderator = await self._viewer_roles(
+            reviewed_username, viewer_uuid
         )
 
         target_account = await self.account_service.get_account_by_username(
             reviewed_username
         )
-        is_draft = target_account is None
+        # Draft profiles only show the viewer's own review unless they are open.
+        viewer_only = target_account is None and not self.open_draft_profiles
 
-        if is_draft and not self.open_draft_profiles:
-            reviews = await self.review_service.get_reviews_for_user(
-                reviewed_username, limit=0, offset=0, status=status
-            )
-            reviews = [r for r in reviews if r.reviewer_uuid == viewer_uuid]
-            has_more = len(reviews) > offset + limit
-            reviews = reviews[offset : offset + limit]
-        else:
-            reviews = await self.review_service.get_reviews_for_user(
-                reviewed_username, limit + 1, offset, status=status
-            )
-            has_more = len(reviews) > limit
-            reviews = reviews[:limit]
+        reviews = await self.review_service.get_reviews_for_user(
+            reviewed_username,
+            limit + 1,
+            offset,
+            status=status,
+            since=since,
+            after=cursor,
+            reviewer_uuid=viewer_uuid if viewer_only else None,
+        )
+        has_more = len(reviews) > limit
+        reviews = reviews[:limit]
 
         results = await self.enrichment_service.enrich_reviews(reviews)
+        # From the last fetched review, which enrichment may have dropped
+        next_cursor = (
+            KeysetCursor(sort_value=reviews[-1].created_at, id=reviews[-1].id or "")
+            if has_more and reviews
+            else None
+        )
 
         return PaginatedReviewsResult(
             items=results,
             has_more=has_more,
             is_page_owner=is_page_owner,
             is_moderator=is_moderator,
+            next_cursor=next_cursor,
+        )
+
+    async def get_version(
+        self,
+        reviewed_username: str,
+        viewer_uuid: UUID,
+        status: str | None = None,
+    ) -> ListVersion:
+        """Get the version of the reviews execute() lists, without loading them.
+
+        The page is rendered for its viewer (own drafts, owner and moderator
+        controls), so the version also covers who is viewing it.
+        """
+        is_page_owner, is_moderator = await self._viewer_roles(
+            reviewed_username, viewer_uuid
+        )
+        target_account = await self.account_service.get_account_by_username(
+            reviewed_username
         )
+        if target_account is None and not self.open_draft_profiles:
+            version = await self.review_service.get_feed_version(
+                [],
+                draft_usernames=[reviewed_username],
+                viewer_uuid=viewer_uuid,
+                status=status,
+            )
+        else:
+            version = await self.review_service.get_feed_version(
+                [reviewed_username], status=status
+            )
+        return replace(
+            version, scope=f"{viewer_uuid}:{int(is_page_owner)}{int(is_moderator)}"
+        )
+
+    async def _viewer_roles(
+        self, reviewed_username: str, viewer_uuid: UUID
+    ) -> tuple[bool, bool]:
+        """Whether the viewer owns the page and whether they are a moderator."""
+        current_account = await self.account_service.get_account_by_uuid(viewer_uuid)
+        is_page_owner = current_account.username.lower() == reviewed_username.lower()
+        is_moderator = current_account.username in settings.MODERATOR_USERNAMES
+        return is_page_owner, is_moderator
@@ -1,26 +1,45 @@
 import asyncio
+import logging
 import random
+from datetime import timedelta
 from uuid import UUID
 
+from app.application.following.use_cases.sync_following import (
+    SyncFollowingGraphUseCase,
+)
 from app.domain.accounts.services.account_service import AccountService
+from app.domain.following.entities.following_graph import FollowingGraph
+from app.domain.following.services.following_service import FollowingService
 from app.domain.reviews.services.review_service import ReviewService
 from app.domain.shared.exceptions import AccessTokenMissingException
 from app.domain.watchlist.services.watchlist_service import WatchlistService
-from app.infrastructure.github.external.github_client import GitHubClient
+from app.infrastructure.shared.config.config import settings
+
+logger = logging.getLogger(__name__)
 
 
 class GetSuggestionsUseCase:
-    """Use case for suggesting accounts based on GitHub following list."""
+    """Use case for suggesting accounts based on GitHub following list.
+
+    Reads the following graph stored by SyncFollowingGraphUseCase, so no
+    GitHub call is made on the request path once a graph is stored. An
+    outdated graph is re-synced in the background; before the first sync
+    the request waits up to FOLLOWING_SYNC_WAIT_SECONDS for it.
+    """
 
     def __init__(
         self,
         account_service: AccountService,
         watchlist_service: WatchlistService,
         review_service: ReviewService,
+        following_service: FollowingService,
+        sync_following: SyncFollowingGraphUseCase,
     ) -> None:
         self.account_service = account_service
         self.watchlist_service = watchlist_service
         self.review_service = review_service
+        self.following_service = following_service
+        self.sync_following = sync_following
 
     async def execute(self, account_uuid: UUID, limit: int = 4) -> list[dict]:
         """Get suggestions to review."""
@@ -28,15 +47,25 @@ class GetSuggestionsUseCase:
         if not account.access_token:
             raise AccessTokenMissingException()
 
-        # Fetch GitHub following, watching, and user's reviews in parallel
-        following, watching, reviewer_reviews = await asyncio.gather(
-            GitHubClient.fetch_following_sample(account.username, account.access_token),
+        # Load stored following, watching, and user's reviews in parallel
+        graph, watching, reviewer_reviews = await asyncio.gather(
+            self.following_service.get_graph(account_uuid),
             self.watchlist_service.get_watchlist(account_uuid, limit=500, offset=0),
             self.review_service.get_reviews_by_reviewer(
                 account_uuid, limit=500, offset=0
             ),
         )
 
+        sync_interval = timedelta(minutes=settings.FOLLOWING_SYNC_INTERVAL_MINUTES)
+        if graph is None:
+            graph = await self._wait_for_first_sync(account_uuid)
+        elif self.following_service.needs_sync(graph, sync_interval):
+            self.sync_following.schedule(account_uuid)
+
+        following = [
+            {"login": user.login, "avatar_url": user.avatar_url, "type": user.type}
+            for user in (graph.following if graph else [])
+        ]
         candidates = self._build_candidates(
             following, watching, reviewer_reviews, account.username
         )
@@ -48,7 +77,7 @@ class GetSuggestionsUseCase:
 
         # Batch DB queries: 2 queries instead of up to 2*N
         accounts_map, review_counts = await asyncio.gather(
-            self.account_service.get_accounts_by_usernames(usernames),
+            self.account_service.get_account_summaries_by_usernames(usernames),
             self.review_service.get_review_counts_for_usernames(usernames),
         )
 
@@ -73,6 +102,23 @@ class GetSuggestionsUseCase:
 
         return self._score_and_sort(suggestions, limit)
 
+    async def _wait_for_first_sync(self, account_uuid: UUID) -> FollowingGraph | None:
+        """Join the account's first following sync, up to the configured wait.
+
+        The sync is shared through the single flight, so it keeps running
+        for later requests when this one stops waiting.
+        """
+        try:
+            return await asyncio.wait_for(
+                self.sync_following.execute(account_uuid),
+                timeout=settings.FOLLOWING_SYNC_WAIT_SECONDS,
+            )
+        except TimeoutError:
+            return None
+        except Exception:
+            logger.warning("Initial following sync failed", exc_info=True)
+            return None
+
     @staticmethod
     def _build_candidates(
         following: list[dict],
@@ -0,0 +1,79 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from app.domain.accounts.services.account_service import AccountService
+from app.domain.reviews.services.review_change_hub import (
+    ReviewChangeHub,
+    ReviewSubscription,
+)
+from app.domain.reviews.services.review_enrichment_service import ReviewEnrichmentService
+from app.domain.reviews.value_objects.review_change import ReviewChange
+from app.domain.reviews.value_objects.review_with_username import ReviewWithUsername
+from app.infrastructure.shared.config.config import settings
+
+
+@dataclass
+class ReviewStream:
+    """A live review subscription with the viewer's page permissions."""
+
+    subscription: ReviewSubscription
+    is_page_owner: bool
+    is_moderator: bool
+
+
+class StreamReviewsUseCase:
+    """Use case for pushing new reviews of a profile to a connected client."""
+
+    def __init__(
+        self,
+        account_service: AccountService,
+        enrichment_service: ReviewEnrichmentService,
+        hub: ReviewChangeHub,
+        open_draft_profiles: bool,
+    ):
+        self.account_service = account_service
+        self.enrichment_service = enrichment_service
+        self.hub = hub
+        self.open_draft_profiles = open_draft_profiles
+
+    async def subscribe(
+        self,
+        reviewed_username: str,
+        viewer_uuid: UUID,
+        last_event_id: str | None = None,
+    ) -> ReviewStream:
+        """Subscribe to review writes shown on a profile page.
+
+        Draft profiles only stream the viewer's own review unless
+        open_draft_profiles is set, matching GetReviewsUseCase.
+        """
+        current_account = await self.account_service.get_account_by_uuid(viewer_uuid)
+        target_account = await self.account_service.get_account_by_username(
+            reviewed_username
+        )
+        viewer_only = target_account is None and not self.open_draft_profiles
+
+        subscription = await self.hub.subscribe(
+            [] if viewer_only else [reviewed_username],
+            viewer_uuid,
+            viewer_only_usernames=[reviewed_username] if viewer_only else [],
+            last_event_id=last_event_id,
+        )
+        return ReviewStream(
+            subscription=subscription,
+            is_page_owner=current_account.username.lower() == reviewed_username.lower(),
+            is_moderator=current_account.username in settings.MODERATOR_USERNAMES,
+        )
+
+    async def render(self, change: ReviewChange) -> ReviewWithUsername | None:
+        """Resolve the reviewer of a change, or None if it is not shown."""
+        # The stream outlives its request: read reviewers fresh for each event
+        # instead of from what earlier events loaded.
+        self.enrichment_service.account_service.clear_loaded()
+        self.enrichment_service.user_service.clear_loaded()
+        results = await self.enrichment_service.enrich_reviews([change.review])
+        return results[0] if results else None
+
+    def unsubscribe(self, stream: ReviewStream) -> None:
+        """Release a stream's subscription when its client disconnects."""
+        self.hub.unsubscribe(stream.subscription)
@@ -9,6 +9,8 @@ from app.domain.shared.exceptions import (
     ReviewNotFoundException,
     UnauthorizedActionException,
 )
+from app.domain.timeline.services.timeline_service import TimelineService
+from app.infrastructure.shared.concurrency.background import spawn_background
 from app.infrastructure.shared.config.config import settings
 
 
@@ -29,10 +31,12 @@ class ToggleCommentHiddenUseCase:
         review_service: ReviewService,
         account_service: AccountService,
         enrichment_service: ReviewEnrichmentService,
+        timeline_service: TimelineService | None = None,
     ):
         self.review_service = review_service
         self.account_service = account_service
         self.enrichment_service = enrichment_service
+        self.timeline_service = timeline_service
 
     async def execute(
         self, review_id: str, current_account_uuid: UUID, hidden: bool
@@ -77,6 +81,11 @@ class ToggleCommentHiddenUseCase:
 
         review.set_comment_hidden(hidden, hidden_by)
         updated_review = await self.review_service.update_review(review)
+        if self.timeline_service is not None:
+            spawn_background(
+                self.timeline_service.publish(updated_review),
+                name=f"timeline-publish:{updated_review.id}",
+            )
         enriched = await self.enrichment_service.enrich_reviews([updated_review])
 
         return ToggleCommentHiddenResult(
@@ -1,14 +1,22 @@
 from uuid import UUID
 
+from app.domain.timeline.services.timeline_service import TimelineService
 from app.domain.watchlist.services.watchlist_service import WatchlistService
 
 
 class UnwatchUseCase:
     """Use case for unwatching a user."""
 
-    def __init__(self, watchlist_service: WatchlistService):
+    def __init__(
+        self,
+        watchlist_service: WatchlistService,
+        timeline_service: TimelineService | None = None,
+    ):
         self.watchlist_service = watchlist_service
+        self.timeline_service = timeline_service
 
     async def execute(self, watcher_uuid: UUID, watched_username: str) -> None:
         """Unwatch a user."""
         await self.watchlist_service.unwatch(watcher_uuid, watched_username)
+        if self.timeline_service is not None:
+            await self.timeline_service.forget(watcher_uuid, watched_username)
@@ -1,15 +1,28 @@
 from uuid import UUID
 
+from app.domain.timeline.services.timeline_service import TimelineService
 from app.domain.watchlist.entities.watch import Watch
 from app.domain.watchlist.services.watchlist_service import WatchlistService
+from app.infrastructure.shared.concurrency.background import spawn_background
 
 
 class WatchUseCase:
     """Use case for watching a user."""
 
-    def __init__(self, watchlist_service: WatchlistService):
+    def __init__(
+        self,
+        watchlist_service: WatchlistService,
+        timeline_service: TimelineService | None = None,
+    ):
         self.watchlist_service = watchlist_service
+        self.timeline_service = timeline_service
 
     async def execute(self, watcher_uuid: UUID, watched_username: str) -> Watch:
         """Watch a user."""
-        return await self.watchlist_service.watch(watcher_uuid, watched_username)
+        watch = await self.watchlist_service.watch(watcher_uuid, watched_username)
+        if self.timeline_service is not None:
+            spawn_background(
+                self.timeline_service.backfill(watcher_uuid, watched_username),
+                name=f"timeline-backfill:{watcher_uuid}:{watched_username.lower()}",
+            )
+        return watch
@@ -3,7 +3,7 @@ from datetime import datetime, timezone
 from uuid import UUID
 
 
-@dataclass
+@dataclass(slots=True)
 class Account:
     """Pure domain entity for Account (no infrastructure dependencies)."""
 
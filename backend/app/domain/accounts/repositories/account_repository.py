@@ -1,7 +1,9 @@
+from collections.abc import Collection
 from typing import Protocol
 from uuid import UUID
 
 from app.domain.accounts.entities.account import Account
+from app.domain.accounts.value_objects.account_summary import AccountSummary
 
 
 class IAccountRepository(Protocol):
@@ -23,6 +25,15 @@ class IAccountRepository(Protocol):
         """Update an existing account."""
         ...
 
+    async def upsert_by_username(
+        self, account: Account, update_fields: Collection[str]
+    ) -> tuple[Account, Account | None]:
+        """Update fields of the account with the same username, or create account.
+
+        Returns (stored account, replaced account or None if created).
+        """
+        ...
+
     async def get_by_uuids(self, uuids: list[UUID]) -> list[Account]:
         """Find accounts by a list of UUIDs."""
         ...
@@ -31,6 +42,16 @@ class IAccountRepository(Protocol):
         """Find accounts by a list of usernames."""
         ...
 
+    async def get_summaries_by_uuids(self, uuids: list[UUID]) -> list[AccountSummary]:
+        """Find account summaries by a list of UUIDs."""
+        ...
+
+    async def get_summaries_by_usernames(
+        self, usernames: list[str]
+    ) -> list[AccountSummary]:
+        """Find account summaries by a list of usernames."""
+        ...
+
     async def save(self, account: Account) -> Account:
         """Save an account (create or update)."""
         ...
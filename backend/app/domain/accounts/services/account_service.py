@@ -1,22 +1,54 @@
+from copy import copy
 from uuid import UUID, uuid4
 
 from app.domain.accounts.entities.account import Account
 from app.domain.accounts.repositories.account_repository import IAccountRepository
+from app.domain.accounts.value_objects.account_summary import AccountSummary
+from app.domain.shared.batch_loader import BatchLoader
 from app.domain.shared.exceptions import AccountNotFoundException
 
 
+def _username_key(username: str) -> str:
+    return username.lower()
+
+
 class AccountService:
-    """Domain service for account business logic."""
+    """Domain service for account business logic.
+
+    Created per request: account reads go through request-scoped loaders, so
+    lookups made in the same event-loop tick share one query and an account
+    is read at most once per request. Writes prime the loaders.
+    """
 
     def __init__(self, account_repository: IAccountRepository):
         self.account_repository = account_repository
+        self._by_uuid: BatchLoader[UUID, Account] = BatchLoader(
+            account_repository.get_by_uuids,
+            key_of=lambda account: account.uuid,
+            load_one=account_repository.get_by_uuid,
+        )
+        self._by_username: BatchLoader[str, Account] = BatchLoader(
+            account_repository.get_by_usernames,
+            key_of=lambda account: account.username,
+            load_one=account_repository.get_by_username,
+            normalize=_username_key,
+        )
+        self._summaries_by_uuid: BatchLoader[UUID, AccountSummary] = BatchLoader(
+            account_repository.get_summaries_by_uuids,
+            key_of=lambda summary: summary.uuid,
+        )
+        self._summaries_by_username: BatchLoader[str, AccountSummary] = BatchLoader(
+            account_repository.get_summaries_by_usernames,
+            key_of=lambda summary: summary.username,
+            normalize=_username_key,
+        )
 
     async def get_account_by_uuid(self, uuid: UUID) -> Account:
         """Get an account by UUID, raise exception if not found."""
-        account = await self.account_repository.get_by_uuid(uuid)
+        account = await self._by_uuid.load(uuid)
         if account is None:
             raise AccountNotFoundException(str(uuid))
-        return account
+        return self._remember(account)
 
     async def get_active_account_by_uuid(self, uuid: UUID) -> Account:
         """Get an active account by UUID, raise exception if not found or inactive."""
@@ -27,30 +59,43 @@ class AccountService:
 
     async def get_account_by_username(self, username: str) -> Account | None:
         """Get an account by username."""
-        return await self.account_repository.get_by_username(username)
+        account = await self._by_username.load(username)
+        return self._remember(account) if account is not None else None
 
     async def get_accounts_by_uuids(self, uuids: list[UUID]) -> dict[UUID, Account]:
         """Get accounts by UUIDs, returned as a dict keyed by UUID."""
-        accounts = await self.account_repository.get_by_uuids(uuids)
-        return {a.uuid: a for a in accounts}
+        accounts = await self._by_uuid.load_many(uuids)
+        return {uuid: self._remember(account) for uuid, account in accounts.items()}
 
     async def get_accounts_by_usernames(self, usernames: list[str]) -> dict[str, Account]:
         """Get accounts by usernames, returned as a dict keyed by lowercase username."""
-        accounts = await self.account_repository.get_by_usernames(usernames)
-        return {a.username.lower(): a for a in accounts}
+        accounts = await self._by_username.load_many(usernames)
+        return {key: self._remember(account) for key, account in accounts.items()}
+
+    async def get_account_summaries_by_uuids(
+        self, uuids: list[UUID]
+    ) -> dict[UUID, AccountSummary]:
+        """Get account summaries by UUIDs, returned as a dict keyed by UUID."""
+        return await self._summaries_by_uuid.load_many(uuids)
+
+    async def get_account_summaries_by_usernames(
+        self, usernames: list[str]
+    ) -> dict[str, AccountSummary]:
+        """Get account summaries by usernames, keyed by lowercase username."""
+        return await self._summaries_by_username.load_many(usernames)
 
     async def create_account(self, account: Account) -> Account:
         """Create a new account."""
-        return await self.account_repository.create(account)
+        return self._remember(await self.account_repository.create(account))
 
     async def update_account(self, account: Account) -> Account:
         """Update an existing account."""
-        return await self.account_repository.update(account)
+        return self._remember(await self.account_repository.update(account))
 
     async def delete_account(self, account: Account) -> Account:
         """Delete an account."""
         account.delete()
-        return await self.account_repository.update(account)
+        return self._remember(await self.account_repository.update(account))
 
     async def get_or_create_account(
         self,
@@ -63,31 +108,46 @@ class AccountService:
         Returns a tuple of (account, is_new) where is_new indicates
         whether a new account was created.
         """
-        existing_account = await self.get_account_by_username(username)
-        if existing_account:
-            needs_update = False
-
-            if existing_account.deleted_at:
-                existing_account.activate()
-                needs_update = True
-
-            if access_token:
-                existing_account.access_token = access_token
-                needs_update = True
-
-            if email and existing_account.email != email:
-                existing_account.email = email
-                needs_update = True
-
-            if needs_update:
-                return await self.update_account(existing_account), False
-            return existing_account, False
-
-        new_account = Account(
+        account = Account(
             id=None,
             uuid=uuid4(),
             username=username,
             access_token=access_token,
             email=email,
         )
-        return await self.create_account(new_account), True
+        # Signing in reactivates a deleted account
+        update_fields = ["deleted_at"]
+        if access_token:
+            update_fields.append("access_token")
+        if email:
+            update_fields.append("email")
+        saved, previous = await self.account_repository.upsert_by_username(
+            account, update_fields
+        )
+        return self._remember(saved), previous is None
+
+    def clear_loaded(self) -> None:
+        """Forget every account loaded so far, so later reads see fresh data.
+
+        For callers that outlive a request, such as live streams.
+        """
+        self._by_uuid.clear_all()
+        self._by_username.clear_all()
+        self._summaries_by_uuid.clear_all()
+        self._summaries_by_username.clear_all()
+
+    def _remember(self, account: Account) -> Account:
+        """Prime every loader with an account read or written in this request.
+
+        The loaders keep their own copy and each caller gets another, so a
+        caller mutating its account does not change what later reads return.
+        """
+        cached = copy(account)
+        self._by_uuid.prime(cached)
+        self._by_username.prime(cached)
+        summary = AccountSummary(
+            uuid=account.uuid, username=account.username, deleted_at=account.deleted_at
+        )
+        self._summaries_by_uuid.prime(summary)
+        self._summaries_by_username.prime(summary)
+        return copy(account)
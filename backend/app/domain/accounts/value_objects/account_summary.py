@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass(frozen=True, slots=True)
+class AccountSummary:
+    """Read model of an account's identity, without its credentials."""
+
+    uuid: UUID
+    username: str
+    deleted_at: datetime | None = None
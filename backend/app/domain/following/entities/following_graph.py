@@ -0,0 +1,36 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass
+class FollowedUser:
+    """A GitHub account followed by an account owner."""
+
+    login: str
+    avatar_url: str | None = None
+    type: str | None = None
+
+
+@dataclass
+class FollowingGraphPage:
+    """One synced page of a following list, kept for conditional re-fetching."""
+
+    users: list[FollowedUser]
+    etag: str | None = None
+    next_url: str | None = None
+
+
+@dataclass
+class FollowingGraph:
+    """Pure domain entity for an account's synced GitHub following list."""
+
+    id: str | None
+    account_uuid: UUID
+    pages: list[FollowingGraphPage] = field(default_factory=list)
+    synced_at: datetime | None = None
+
+    @property
+    def following(self) -> list[FollowedUser]:
+        """All followed users across pages, in GitHub order."""
+        return [user for page in self.pages for user in page.users]
@@ -0,0 +1,20 @@
+from typing import Protocol
+from uuid import UUID
+
+from app.domain.following.entities.following_graph import FollowingGraph
+
+
+class IFollowingRepository(Protocol):
+    """Interface for FollowingGraph repository (dependency inversion)."""
+
+    async def get_by_account_uuid(self, account_uuid: UUID) -> FollowingGraph | None:
+        """Find the stored following graph of an account."""
+        ...
+
+    async def save(self, graph: FollowingGraph) -> FollowingGraph:
+        """Save a following graph (create if new, update if exists)."""
+        ...
+
+    async def delete_by_account_uuid(self, account_uuid: UUID) -> None:
+        """Delete the stored following graph of an account."""
+        ...
@@ -0,0 +1,47 @@
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from app.domain.following.entities.following_graph import (
+    FollowingGraph,
+    FollowingGraphPage,
+)
+from app.domain.following.repositories.following_repository import (
+    IFollowingRepository,
+)
+
+
+class FollowingService:
+    """Domain service for following graph business logic."""
+
+    def __init__(self, following_repository: IFollowingRepository):
+        self.following_repository = following_repository
+
+    async def get_graph(self, account_uuid: UUID) -> FollowingGraph | None:
+        """Get the stored following graph of an account."""
+        return await self.following_repository.get_by_account_uuid(account_uuid)
+
+    async def save_pages(
+        self,
+        account_uuid: UUID,
+        pages: list[FollowingGraphPage],
+        existing: FollowingGraph | None = None,
+    ) -> FollowingGraph:
+        """Replace an account's graph with freshly synced pages."""
+        graph = FollowingGraph(
+            id=existing.id if existing else None,
+            account_uuid=account_uuid,
+            pages=pages,
+            synced_at=datetime.now(timezone.utc),
+        )
+        return await self.following_repository.save(graph)
+
+    async def delete_graph(self, account_uuid: UUID) -> None:
+        """Delete the stored following graph of an account."""
+        await self.following_repository.delete_by_account_uuid(account_uuid)
+
+    def needs_sync(self, graph: FollowingGraph | None, interval: timedelta) -> bool:
+        """Check if a graph is missing or was last synced longer ago than interval."""
+        if graph is None or graph.synced_at is None:
+            return True
+        synced_at = graph.synced_at.replace(tzinfo=timezone.utc)
+        return datetime.now(timezone.utc) > synced_at + interval
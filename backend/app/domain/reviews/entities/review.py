@@ -15,7 +15,7 @@ class Role(str, Enum):
     MODERATOR = "moderator"
 
 
-@dataclass
+@dataclass(slots=True)
 class Review:
     """Pure domain entity for Review (no infrastructure dependencies)."""
 
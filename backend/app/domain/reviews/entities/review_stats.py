@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+
+from app.domain.reviews.entities.review import ReviewStatus
+
+
+@dataclass
+class ReviewStats:
+    """Denormalized review counters of one reviewed profile."""
+
+    username: str
+    total: int = 0
+    approve: int = 0
+    request_change: int = 0
+    comment: int = 0
+
+    def count_for(self, status: ReviewStatus) -> int:
+        """Get the number of reviews with a given status."""
+        return int(getattr(self, status.value))
@@ -0,0 +1,21 @@
+from collections.abc import AsyncGenerator
+from typing import Protocol
+
+from app.domain.reviews.value_objects.review_change import ReviewChange
+
+
+class IReviewChangeStream(Protocol):
+    """Interface for the ordered stream of review writes (dependency inversion)."""
+
+    def watch(
+        self, resume_token: str | None = None
+    ) -> AsyncGenerator[ReviewChange, None]:
+        """Stream review inserts and updates as they happen, after resume_token."""
+        ...
+
+    async def changes_since(self, token: str, limit: int) -> list[ReviewChange] | None:
+        """Get up to limit already-recorded changes after token.
+
+        Returns None when the stream can no longer resume from token.
+        """
+        ...
@@ -1,7 +1,10 @@
+from collections.abc import AsyncGenerator
 from typing import Protocol
 from uuid import UUID
 
-from app.domain.reviews.entities.review import Review
+from app.domain.reviews.entities.review import Review, ReviewStatus
+from app.domain.reviews.value_objects.review_summary import ReviewSummary
+from app.domain.shared.pagination import KeysetCursor, ListVersion
 
 
 class IReviewRepository(Protocol):
@@ -23,8 +26,79 @@ class IReviewRepository(Protocol):
         limit: int = 100,
         offset: int = 0,
         status: str | None = None,
+        since: KeysetCursor | None = None,
+        after: KeysetCursor | None = None,
+        reviewer_uuid: UUID | None = None,
+        raw: bool = False,
     ) -> list[Review]:
-        """Find all reviews for a given username, optionally filtered by status."""
+        """Find all reviews for a given username, newest first by creation.
+
+        With ``after``, only reviews ordered after that (created_at, id)
+        position are returned; with ``since``, only reviews updated after
+        that (updated_at, id) position. With ``reviewer_uuid``, only that
+        reviewer's reviews. With ``raw``, stored rows are trusted and decoded
+        without model validation.
+        """
+        ...
+
+    async def get_summaries_for_username(
+        self,
+        reviewed_username: str,
+        limit: int = 100,
+        reviewer_uuid: UUID | None = None,
+        raw: bool = False,
+    ) -> list[ReviewSummary]:
+        """Find review summaries for a given username, newest first by creation.
+
+        Reads only the summary fields. With ``reviewer_uuid``, only that
+        reviewer's reviews. With ``raw``, decoded without model validation.
+        """
+        ...
+
+    async def get_feed(
+        self,
+        usernames: list[str],
+        limit: int,
+        offset: int = 0,
+        draft_usernames: list[str] | None = None,
+        viewer_uuid: UUID | None = None,
+        after: KeysetCursor | None = None,
+        since: KeysetCursor | None = None,
+        raw: bool = False,
+    ) -> list[Review]:
+        """Find reviews for usernames, newest update first.
+
+        Reviews of draft_usernames are included only when written by
+        viewer_uuid. With ``after``, only reviews ordered after that
+        (updated_at, id) position are returned; with ``since``, only
+        reviews updated after it. With ``raw``, decoded without model
+        validation.
+        """
+        ...
+
+    async def get_feed_version(
+        self,
+        usernames: list[str],
+        draft_usernames: list[str] | None = None,
+        viewer_uuid: UUID | None = None,
+        status: str | None = None,
+    ) -> ListVersion:
+        """Get the count and newest position of the reviews get_feed covers."""
+        ...
+
+    def stream_feed_for_username(
+        self,
+        username: str,
+        limit: int,
+        after: KeysetCursor | None = None,
+        reviewer_uuid: UUID | None = None,
+        batch_size: int | None = None,
+    ) -> AsyncGenerator[Review, None]:
+        """Stream one username's reviews in feed order from an open cursor.
+
+        With ``reviewer_uuid`` only that reviewer's reviews are streamed.
+        At most batch_size documents are buffered per round trip.
+        """
         ...
 
     async def get_all_by_reviewer_uuid(
@@ -33,14 +107,16 @@ class IReviewRepository(Protocol):
         """Find all reviews made by a given reviewer."""
         ...
 
-    async def get_review_count_for_username(self, reviewed_username: str) -> int:
-        """Get review count for a given username."""
-        ...
-
     async def get_review_counts_for_usernames(
         self, usernames: list[str]
     ) -> dict[str, int]:
-        """Get review counts for multiple usernames at once."""
+        """Count reviews per username, keyed by lowercased username."""
+        ...
+
+    async def get_status_counts_by_reviewer_uuid(
+        self, reviewer_uuid: UUID
+    ) -> dict[str, dict[ReviewStatus, int]]:
+        """Count a reviewer's reviews per lowercased reviewed username and status."""
         ...
 
     async def create(self, review: Review) -> Review:
@@ -51,8 +127,18 @@ class IReviewRepository(Protocol):
         """Update an existing review."""
         ...
 
-    async def delete(self, review_id: str) -> None:
-        """Delete a review by ID."""
+    async def upsert(self, review: Review) -> tuple[Review, Review | None]:
+        """Create a review, or update the reviewer's review of the same username.
+
+        An existing review gets the new status, comment and updated_at.
+        Returns (stored review, replaced review or None if created). Raises
+        AnonymousFieldImmutableException if the existing review's anonymous
+        flag differs.
+        """
+        ...
+
+    async def delete(self, review_id: str) -> bool:
+        """Delete a review by ID. Returns whether a review was deleted."""
         ...
 
     async def delete_all_by_reviewer_uuid(self, reviewer_uuid: UUID) -> int:
@@ -0,0 +1,35 @@
+from collections.abc import Mapping
+from typing import Protocol
+
+from app.domain.reviews.entities.review import ReviewStatus
+from app.domain.reviews.entities.review_stats import ReviewStats
+
+
+class IReviewStatsRepository(Protocol):
+    """Interface for per-profile review counters (dependency inversion).
+
+    Stats are keyed by the lowercased reviewed username.
+    """
+
+    async def get_by_usernames(self, usernames: list[str]) -> dict[str, ReviewStats]:
+        """Get stats for usernames, keyed by lowercased username.
+
+        Usernames without any reviews are missing from the result.
+        """
+        ...
+
+    async def increment(self, deltas: Mapping[str, Mapping[ReviewStatus, int]]) -> None:
+        """Atomically add per-status deltas (and their sum to the total)."""
+        ...
+
+    async def rebuild(self) -> int:
+        """Recount every profile's stats from the reviews collection.
+
+        Records that the stats were built. Returns the number of profiles
+        with stats.
+        """
+        ...
+
+    async def is_built(self) -> bool:
+        """Check whether a rebuild has completed, so the stats can be read."""
+        ...
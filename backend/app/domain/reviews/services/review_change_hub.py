@@ -0,0 +1,176 @@
+import asyncio
+import logging
+from collections import defaultdict, deque
+from collections.abc import Iterable
+from uuid import UUID
+
+from app.domain.reviews.entities.review import Review
+from app.domain.reviews.repositories.review_change_stream import IReviewChangeStream
+from app.domain.reviews.value_objects.review_change import ReviewChange
+
+logger = logging.getLogger(__name__)
+
+
+class ReviewSubscription:
+    """One client's filtered view of the shared review change stream.
+
+    Changes of the subscribed usernames are queued as they are dispatched.
+    Viewer-only usernames (draft profiles) only deliver the viewer's own
+    reviews. A client that falls queue_size changes behind loses its queue
+    and is flagged for reset, so it refetches instead of stalling the hub.
+    """
+
+    def __init__(
+        self,
+        usernames: Iterable[str],
+        viewer_uuid: UUID,
+        viewer_only_usernames: Iterable[str] = (),
+        queue_size: int = 100,
+    ):
+        self.viewer_uuid = viewer_uuid
+        self.viewer_only_usernames = {u.lower() for u in viewer_only_usernames}
+        self.usernames = {u.lower() for u in usernames} | self.viewer_only_usernames
+        self._queue: asyncio.Queue[ReviewChange] = asyncio.Queue(maxsize=queue_size)
+        self._replay: deque[ReviewChange] = deque()
+        self._replayed_tokens: set[str] = set()
+        self._reset = False
+
+    def matches(self, review: Review) -> bool:
+        """Check whether a review belongs in this subscription."""
+        username = review.reviewed_username.lower()
+        if username not in self.usernames:
+            return False
+        return (
+            username not in self.viewer_only_usernames
+            or review.reviewer_uuid == self.viewer_uuid
+        )
+
+    def offer(self, change: ReviewChange) -> None:
+        """Queue a live change without blocking the dispatcher."""
+        if self._reset or not self.matches(change.review):
+            return
+        try:
+            self._queue.put_nowait(change)
+        except asyncio.QueueFull:
+            self.request_reset()
+
+    def replay(self, changes: Iterable[ReviewChange]) -> None:
+        """Deliver changes missed while disconnected before any live ones."""
+        for change in changes:
+            if self.matches(change.review):
+                self._replay.append(change)
+                self._replayed_tokens.add(change.token)
+
+    def request_reset(self) -> None:
+        """Drop pending changes and tell the client to refetch."""
+        self._reset = True
+        self._replay.clear()
+        self._replayed_tokens.clear()
+        while not self._queue.empty():
+            self._queue.get_nowait()
+
+    def take_reset(self) -> bool:
+        """Return whether a reset is pending, clearing it."""
+        reset, self._reset = self._reset, False
+        return reset
+
+    async def next(self, timeout: float) -> ReviewChange | None:
+        """Wait for the next change, or None after timeout seconds without one."""
+        if self._replay:
+            return self._replay.popleft()
+        while True:
+            try:
+                change = await asyncio.wait_for(self._queue.get(), timeout)
+            except TimeoutError:
+                return None
+            # Live changes that raced the catch-up were already replayed.
+            if change.token not in self._replayed_tokens:
+                return change
+
+
+class ReviewChangeHub:
+    """Shares one review change stream among every subscriber in the process.
+
+    Changes are routed by reviewed username. The last replay_size changes are
+    kept in memory so reconnecting clients resume from their last event id
+    without a database round trip; older positions are caught up from the
+    change stream itself, and positions it no longer holds trigger a reset.
+    """
+
+    def __init__(
+        self,
+        change_stream: IReviewChangeStream,
+        replay_size: int = 1000,
+        queue_size: int = 100,
+        retry_delay_seconds: float = 1.0,
+    ):
+        self.change_stream = change_stream
+        self.replay_size = replay_size
+        self.queue_size = queue_size
+        self.retry_delay_seconds = retry_delay_seconds
+        self._subscriptions: dict[str, set[ReviewSubscription]] = defaultdict(set)
+        self._recent: deque[ReviewChange] = deque(maxlen=replay_size)
+        self._resume_token: str | None = None
+
+    async def run(self) -> None:
+        """Consume the change stream until cancelled, resuming after failures."""
+        while True:
+            try:
+                async for change in self.change_stream.watch(self._resume_token):
+                    self.dispatch(change)
+            except Exception:
+                logger.exception("Review change stream failed, resuming")
+            await asyncio.sleep(self.retry_delay_seconds)
+
+    def dispatch(self, change: ReviewChange) -> None:
+        """Route a change to the subscriptions of its reviewed username."""
+        self._resume_token = change.token
+        self._recent.append(change)
+        username = change.review.reviewed_username.lower()
+        for subscription in list(self._subscriptions.get(username, ())):
+            subscription.offer(change)
+
+    async def subscribe(
+        self,
+        usernames: Iterable[str],
+        viewer_uuid: UUID,
+        viewer_only_usernames: Iterable[str] = (),
+        last_event_id: str | None = None,
+    ) -> ReviewSubscription:
+        """Subscribe to changes of usernames, resuming after last_event_id."""
+        subscription = ReviewSubscription(
+            usernames, viewer_uuid, viewer_only_usernames, self.queue_size
+        )
+        # Register first so nothing dispatched during the catch-up is missed.
+        for username in subscription.usernames:
+            self._subscriptions[username].add(subscription)
+        if last_event_id is not None:
+            await self._catch_up(subscription, last_event_id)
+        return subscription
+
+    def unsubscribe(self, subscription: ReviewSubscription) -> None:
+        """Stop routing changes to a subscription."""
+        for username in subscription.usernames:
+            subscribers = self._subscriptions.get(username)
+            if subscribers is None:
+                continue
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscriptions[username]
+
+    async def _catch_up(self, subscription: ReviewSubscription, token: str) -> None:
+        recent = list(self._recent)
+        tokens = [change.token for change in recent]
+        if token in tokens:
+            subscription.replay(recent[tokens.index(token) + 1 :])
+            return
+
+        try:
+            missed = await self.change_stream.changes_since(token, self.replay_size + 1)
+        except Exception:
+            logger.warning("Could not resume review changes after %s", token)
+            missed = None
+        if missed is None or len(missed) > self.replay_size:
+            subscription.request_reset()
+        else:
+            subscription.replay(missed)
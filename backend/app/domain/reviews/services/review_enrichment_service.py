@@ -1,6 +1,10 @@
+from collections.abc import Sequence
+
 from app.domain.accounts.services.account_service import AccountService
-from app.domain.reviews.entities.review import Review
-from app.domain.reviews.value_objects.review_with_username import ReviewWithUsername
+from app.domain.reviews.value_objects.review_with_username import (
+    ReviewWithUsername,
+    TReview,
+)
 from app.domain.users.services.user_service import UserService
 
 
@@ -11,13 +15,18 @@ class ReviewEnrichmentService:
         self.account_service = account_service
         self.user_service = user_service
 
-    async def enrich_reviews(self, reviews: list[Review]) -> list[ReviewWithUsername]:
-        """Batch-resolve reviewer accounts and user profiles for a list of reviews."""
+    async def enrich_reviews(
+        self, reviews: Sequence[TReview]
+    ) -> list[ReviewWithUsername[TReview]]:
+        """Batch-resolve reviewer accounts and user profiles for a list of reviews.
+
+        Only the account and profile fields shown are read.
+        """
         if not reviews:
             return []
 
         reviewer_uuids = list({r.reviewer_uuid for r in reviews})
-        accounts_by_uuid = await self.account_service.get_accounts_by_uuids(
+        accounts_by_uuid = await self.account_service.get_account_summaries_by_uuids(
             reviewer_uuids
         )
 
@@ -26,9 +35,11 @@ class ReviewEnrichmentService:
         }
 
         usernames = list({acc.username for acc in active_accounts.values()})
-        users_by_username = await self.user_service.get_users_by_usernames(usernames)
+        users_by_username = await self.user_service.get_user_summaries_by_usernames(
+            usernames
+        )
 
-        results: list[ReviewWithUsername] = []
+        results: list[ReviewWithUsername[TReview]] = []
         for review in reviews:
             account = active_accounts.get(review.reviewer_uuid)
             if account is None:
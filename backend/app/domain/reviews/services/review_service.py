@@ -1,16 +1,21 @@
+from collections.abc import AsyncGenerator
 from datetime import datetime, timezone
 from uuid import UUID
 
 from app.domain.accounts.repositories.account_repository import IAccountRepository
 from app.domain.reviews.entities.review import Review, ReviewStatus
 from app.domain.reviews.repositories.review_repository import IReviewRepository
+from app.domain.reviews.repositories.review_stats_repository import (
+    IReviewStatsRepository,
+)
 from app.domain.reviews.services.comment_sanitizer import sanitize_comment
+from app.domain.reviews.value_objects.review_summary import ReviewSummary
 from app.domain.shared.constants import MAX_COMMENT_LENGTH
 from app.domain.shared.exceptions import (
-    AnonymousFieldImmutableException,
     ReviewValidationException,
     SelfReviewException,
 )
+from app.domain.shared.pagination import KeysetCursor, ListVersion
 from app.domain.shared.services.validators import (
     check_not_self_action,
     check_target_is_user_type,
@@ -26,10 +31,12 @@ class ReviewService:
         review_repository: IReviewRepository,
         account_repository: IAccountRepository,
         user_repository: IUserRepository,
+        review_stats_repository: IReviewStatsRepository,
     ):
         self.review_repository = review_repository
         self.account_repository = account_repository
         self.user_repository = user_repository
+        self.review_stats_repository = review_stats_repository
 
     def _validate_comment(self, status: ReviewStatus, comment: str | None) -> None:
         """Validate that comment is provided when status is COMMENT."""
@@ -62,33 +69,86 @@ class ReviewService:
         )
         await check_target_is_user_type(self.user_repository, reviewed_username)
 
-        # Check for existing review
-        existing_review = await self.review_repository.get_by_reviewer_and_username(
-            reviewer_uuid, reviewed_username
-        )
-
         now = datetime.now(timezone.utc)
+        review = Review(
+            id=None,
+            reviewer_uuid=reviewer_uuid,
+            reviewed_username=reviewed_username,
+            status=status,
+            comment=comment,
+            anonymous=anonymous,
+            created_at=now,
+            updated_at=now,
+        )
+        # Atomic, so concurrent submits cannot both create; the anonymous
+        # field of an existing review cannot change
+        saved, previous = await self.review_repository.upsert(review)
 
-        if existing_review:
-            # Block changing anonymous field
-            if existing_review.anonymous != anonymous:
-                raise AnonymousFieldImmutableException()
-            # Update existing review
-            existing_review.update_status(status, comment)
-            return await self.review_repository.update(existing_review), False
-        else:
-            # Create new review
-            new_review = Review(
-                id=None,
-                reviewer_uuid=reviewer_uuid,
-                reviewed_username=reviewed_username,
-                status=status,
-                comment=comment,
-                anonymous=anonymous,
-                created_at=now,
-                updated_at=now,
+        if previous is None:
+            await self.review_stats_repository.increment({reviewed_username: {status: 1}})
+            return saved, True
+        if previous.status != status:
+            await self.review_stats_repository.increment(
+                {reviewed_username: {previous.status: -1, status: 1}}
             )
-            return await self.review_repository.create(new_review), True
+        return saved, False
+
+    async def get_feed(
+        self,
+        usernames: list[str],
+        limit: int,
+        offset: int = 0,
+        draft_usernames: list[str] | None = None,
+        viewer_uuid: UUID | None = None,
+        after: KeysetCursor | None = None,
+        since: KeysetCursor | None = None,
+    ) -> list[Review]:
+        """Get reviews for usernames, newest update first, in a single query.
+
+        Feed pages are read on the raw fast path, skipping model validation.
+        """
+        return await self.review_repository.get_feed(
+            usernames,
+            limit,
+            offset,
+            draft_usernames=draft_usernames,
+            viewer_uuid=viewer_uuid,
+            after=after,
+            since=since,
+            raw=True,
+        )
+
+    async def get_feed_version(
+        self,
+        usernames: list[str],
+        draft_usernames: list[str] | None = None,
+        viewer_uuid: UUID | None = None,
+        status: str | None = None,
+    ) -> ListVersion:
+        """Get the version of the reviews get_feed covers, for change detection."""
+        return await self.review_repository.get_feed_version(
+            usernames,
+            draft_usernames=draft_usernames,
+            viewer_uuid=viewer_uuid,
+            status=status,
+        )
+
+    def stream_feed_for_username(
+        self,
+        username: str,
+        limit: int,
+        after: KeysetCursor | None = None,
+        reviewer_uuid: UUID | None = None,
+        batch_size: int | None = None,
+    ) -> AsyncGenerator[Review, None]:
+        """Stream one username's reviews, newest update first."""
+        return self.review_repository.stream_feed_for_username(
+            username,
+            limit,
+            after=after,
+            reviewer_uuid=reviewer_uuid,
+            batch_size=batch_size,
+        )
 
     async def get_reviews_for_user(
         self,
@@ -96,10 +156,33 @@ class ReviewService:
         limit: int = 100,
         offset: int = 0,
         status: str | None = None,
+        since: KeysetCursor | None = None,
+        after: KeysetCursor | None = None,
+        reviewer_uuid: UUID | None = None,
     ) -> list[Review]:
         """Get all reviews for a given username, optionally filtered by status."""
         return await self.review_repository.get_all_for_username(
-            reviewed_username, limit, offset, status=status
+            reviewed_username,
+            limit,
+            offset,
+            status=status,
+            since=since,
+            after=after,
+            reviewer_uuid=reviewer_uuid,
+        )
+
+    async def get_review_summaries_for_user(
+        self,
+        reviewed_username: str,
+        limit: int = 100,
+        reviewer_uuid: UUID | None = None,
+    ) -> list[ReviewSummary]:
+        """Get review summaries (no comments) for a given username.
+
+        Read on the raw fast path, skipping model validation.
+        """
+        return await self.review_repository.get_summaries_for_username(
+            reviewed_username, limit, reviewer_uuid=reviewer_uuid, raw=True
         )
 
     async def get_reviews_by_reviewer(
@@ -112,27 +195,58 @@ class ReviewService:
 
     async def get_review_count_for_username(self, reviewed_username: str) -> int:
         """Get review count for a given username."""
-        return await self.review_repository.get_review_count_for_username(
-            reviewed_username
-        )
+        counts = await self.get_review_counts_for_usernames([reviewed_username])
+        return counts.get(reviewed_username.lower(), 0)
 
     async def get_review_counts_for_usernames(
         self, usernames: list[str]
     ) -> dict[str, int]:
-        """Get review counts for multiple usernames at once."""
-        return await self.review_repository.get_review_counts_for_usernames(usernames)
+        """Get review counts for multiple usernames, keyed by lowercased username.
+
+        Until review stats have been built, reviews are counted directly.
+        """
+        if not await self.review_stats_repository.is_built():
+            return await self.review_repository.get_review_counts_for_usernames(usernames)
+        stats = await self.review_stats_repository.get_by_usernames(usernames)
+        return {username: item.total for username, item in stats.items()}
+
+    async def rebuild_review_stats(self) -> int:
+        """Recount all review stats from scratch. Returns the profile count."""
+        return await self.review_stats_repository.rebuild()
 
-    async def delete_review(self, reviewer_uuid: UUID, reviewed_username: str) -> None:
-        """Delete a review by reviewer UUID and reviewed username."""
+    async def delete_review(
+        self, reviewer_uuid: UUID, reviewed_username: str
+    ) -> Review | None:
+        """Delete a review by reviewer UUID and reviewed username.
+
+        Returns the deleted review, or None if there was none.
+        """
         existing_review = await self.review_repository.get_by_reviewer_and_username(
             reviewer_uuid, reviewed_username
         )
         if existing_review and existing_review.id:
-            await self.review_repository.delete(existing_review.id)
+            # Only the request that actually deleted it may decrement the stats.
+            if await self.review_repository.delete(existing_review.id):
+                await self.review_stats_repository.increment(
+                    {reviewed_username: {existing_review.status: -1}}
+                )
+            return existing_review
+        return None
 
     async def delete_reviews_by_reviewer(self, reviewer_uuid: UUID) -> int:
         """Delete all reviews made by a given reviewer. Returns count deleted."""
-        return await self.review_repository.delete_all_by_reviewer_uuid(reviewer_uuid)
+        counts = await self.review_repository.get_status_counts_by_reviewer_uuid(
+            reviewer_uuid
+        )
+        deleted = await self.review_repository.delete_all_by_reviewer_uuid(reviewer_uuid)
+        if deleted:
+            await self.review_stats_repository.increment(
+                {
+                    username: {status: -count for status, count in statuses.items()}
+                    for username, statuses in counts.items()
+                }
+            )
+        return deleted
 
     async def get_review_by_id(self, review_id: str) -> Review | None:
         """Get a review by its ID."""
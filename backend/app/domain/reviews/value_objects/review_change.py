@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+
+from app.domain.reviews.entities.review import Review
+
+
+@dataclass(frozen=True)
+class ReviewChange:
+    """A review insert or update, with the stream position it was observed at."""
+
+    token: str
+    review: Review
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from app.domain.reviews.entities.review import ReviewStatus
+
+
+@dataclass(frozen=True, slots=True)
+class ReviewSummary:
+    """Read model of a review without its comment, for reviewer lists."""
+
+    id: str
+    reviewer_uuid: UUID
+    reviewed_username: str
+    status: ReviewStatus
+    anonymous: bool
+    updated_at: datetime
@@ -1,12 +1,16 @@
 from dataclasses import dataclass
+from typing import Generic, TypeVar
 
 from app.domain.reviews.entities.review import Review
+from app.domain.reviews.value_objects.review_summary import ReviewSummary
 
+TReview = TypeVar("TReview", Review, ReviewSummary)
 
-@dataclass
-class ReviewWithUsername:
-    """Review with resolved reviewer username and avatar."""
 
-    review: Review
+@dataclass(frozen=True, slots=True)
+class ReviewWithUsername(Generic[TReview]):
+    """Review (or review summary) with resolved reviewer username and avatar."""
+
+    review: TReview
     reviewer_username: str
     reviewer_avatar_url: str | None
@@ -0,0 +1,119 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    """Request-scoped loader that batches and memoizes lookups by key.
+
+    Keys requested in the same event-loop tick are fetched together with one
+    ``load_many`` call (or ``load_one`` when only one key is pending, so a
+    lone lookup stays a point query). Every result, including a miss, is
+    memoized for the loader's lifetime; writers ``prime`` the loader with
+    what they stored. Failed fetches are not memoized. Create one loader per
+    request, or ``clear_all`` it between units of work in long-lived callers:
+    it never notices writes made elsewhere.
+    """
+
+    def __init__(
+        self,
+        load_many: Callable[[list[K]], Awaitable[Iterable[V]]],
+        key_of: Callable[[V], K],
+        load_one: Callable[[K], Awaitable[V | None]] | None = None,
+        normalize: Callable[[K], K] | None = None,
+    ) -> None:
+        self._load_many = load_many
+        self._load_one = load_one
+        self._key_of = key_of
+        self._normalize = normalize or (lambda key: key)
+        self._futures: dict[K, asyncio.Future[V | None]] = {}
+        self._pending: list[tuple[K, asyncio.Future[V | None]]] = []
+        # Strong references keep dispatched fetches alive until they finish.
+        self._fetches: set[asyncio.Task[None]] = set()
+
+    async def load(self, key: K) -> V | None:
+        """Load the value for key, or None if there is none."""
+        return await asyncio.shield(self._future(self._normalize(key)))
+
+    async def load_many(self, keys: Iterable[K]) -> dict[K, V]:
+        """Load values for keys, keyed by normalized key; misses are omitted."""
+        normalized = list(dict.fromkeys(self._normalize(key) for key in keys))
+        futures = [self._future(key) for key in normalized]
+        values = await asyncio.shield(asyncio.gather(*futures))
+        return {
+            key: value
+            for key, value in zip(normalized, values, strict=True)
+            if value is not None
+        }
+
+    def prime(self, value: V) -> None:
+        """Remember value for its key, replacing anything loaded before."""
+        key = self._normalize(self._key_of(value))
+        future = asyncio.get_running_loop().create_future()
+        future.set_result(value)
+        self._futures[key] = future
+
+    def clear(self, key: K) -> None:
+        """Forget key, so the next load fetches it again."""
+        self._futures.pop(self._normalize(key), None)
+
+    def clear_all(self) -> None:
+        """Forget every key; loads already in flight still complete."""
+        self._futures.clear()
+
+    def _future(self, key: K) -> "asyncio.Future[V | None]":
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._futures[key] = future
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+            self._pending.append((key, future))
+        return future
+
+    def _dispatch(self) -> None:
+        pending, self._pending = self._pending, []
+        fetch = asyncio.ensure_future(self._fetch(pending))
+        self._fetches.add(fetch)
+        fetch.add_done_callback(self._fetches.discard)
+
+    async def _fetch(self, pending: list[tuple[K, "asyncio.Future[V | None]"]]) -> None:
+        keys = [key for key, _ in pending]
+        try:
+            found: dict[K, V] = {}
+            if len(keys) == 1 and self._load_one is not None:
+                value = await self._load_one(keys[0])
+                if value is not None:
+                    found[keys[0]] = value
+            else:
+                for value in await self._load_many(keys):
+                    found[self._normalize(self._key_of(value))] = value
+        except asyncio.CancelledError:
+            self._fail(pending, None)
+            raise
+        except Exception as exc:
+            self._fail(pending, exc)
+            return
+        for key, future in pending:
+            if not future.done():
+                future.set_result(found.get(key))
+
+    def _fail(
+        self, pending: list[tuple[K, "asyncio.Future[V | None]"]], exc: Exception | None
+    ) -> None:
+        """Reject pending loads (cancel them without exc) and forget their keys."""
+        for key, future in pending:
+            if self._futures.get(key) is future:
+                del self._futures[key]
+            if future.done():
+                continue
+            if exc is None:
+                future.cancel()
+            else:
+                future.set_exception(exc)
+                # Mark it retrieved even if every caller went away.
+                future.exception()
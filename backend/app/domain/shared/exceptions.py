@@ -132,3 +132,32 @@ class AccessRestrictedException(DomainException):
 
     def __init__(self) -> None:
         super().__init__("Access restricted. Your account is not authorized.")
+
+
+class GitHubRateLimitException(DomainException):
+    """Raised when a GitHub call is refused to protect the token's rate limit."""
+
+    status_code = 429
+
+    def __init__(self, bucket: str, retry_at: float | None = None):
+        self.bucket = bucket
+        self.retry_at = retry_at
+        super().__init__(f"GitHub {bucket} rate limit exhausted, try again later")
+
+
+class InvalidCursorException(DomainException):
+    """Raised when a pagination cursor cannot be decoded."""
+
+    status_code = 400
+
+    def __init__(self) -> None:
+        super().__init__("Invalid pagination cursor")
+
+
+class RealtimeUpdatesUnavailableException(DomainException):
+    """Raised when a live update stream is requested but not enabled."""
+
+    status_code = 503
+
+    def __init__(self) -> None:
+        super().__init__("Real-time updates are not available")
@@ -0,0 +1,62 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.domain.shared.exceptions import InvalidCursorException
+
+
+@dataclass(frozen=True)
+class KeysetCursor:
+    """Position in a list ordered by (sort_value desc, id desc).
+
+    Encoded as an opaque URL-safe token so clients can't depend on its shape.
+    """
+
+    sort_value: datetime
+    id: str
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque token."""
+        payload = json.dumps({"v": self.sort_value.isoformat(), "id": self.id})
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "KeysetCursor":
+        """Decode a token produced by encode()."""
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded))
+            return cls(
+                sort_value=datetime.fromisoformat(payload["v"]), id=str(payload["id"])
+            )
+        except (binascii.Error, ValueError, KeyError, TypeError):
+            raise InvalidCursorException() from None
+
+
+@dataclass(frozen=True)
+class ListVersion:
+    """Cheap fingerprint of a list: its size and newest (updated_at, id) position.
+
+    Inserts and deletes change the count and updates move the newest position,
+    so a matching version means the list is unchanged without loading it.
+    scope identifies what the list covers (e.g. a feed's usernames).
+    """
+
+    count: int
+    newest: KeysetCursor | None
+    scope: str = ""
+
+    def merge(self, other: "ListVersion") -> "ListVersion":
+        """Version of the union of two disjoint lists."""
+        candidates = [c for c in (self.newest, other.newest) if c is not None]
+        newest = max(candidates, key=lambda c: (c.sort_value, c.id), default=None)
+        scope = "|".join(s for s in (self.scope, other.scope) if s)
+        return ListVersion(self.count + other.count, newest, scope)
+
+    @property
+    def tag(self) -> str:
+        """Stable string that changes whenever the list does."""
+        newest = self.newest.encode() if self.newest is not None else ""
+        return f"{self.count}:{newest}:{self.scope}"
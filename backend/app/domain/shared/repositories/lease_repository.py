@@ -0,0 +1,17 @@
+from typing import Protocol
+
+
+class ILeaseRepository(Protocol):
+    """Interface for short-lived, cross-process leases (dependency inversion)."""
+
+    async def acquire(self, key: str, owner: str, ttl_seconds: float) -> bool:
+        """Try to take the lease for key. Returns False if another owner holds it."""
+        ...
+
+    async def release(self, key: str, owner: str) -> None:
+        """Release the lease for key if it is still held by owner."""
+        ...
+
+    async def is_held(self, key: str) -> bool:
+        """Check whether an unexpired lease exists for key."""
+        ...
@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from app.domain.reviews.entities.review import Review
+
+
+@dataclass
+class TimelineEntry:
+    """A review materialized into one account's activity feed timeline."""
+
+    id: str | None
+    owner_uuid: UUID  # The account whose feed shows the review
+    review: Review  # Snapshot of the review as of its last fan-out
+    own: bool  # The review is about the owner's own profile
+    draft: bool  # The reviewed profile had no account when fanned out
@@ -0,0 +1,84 @@
+from typing import Protocol
+from uuid import UUID
+
+from app.domain.shared.pagination import KeysetCursor, ListVersion
+from app.domain.timeline.entities.timeline_entry import TimelineEntry
+
+
+class ITimelineRepository(Protocol):
+    """Interface for TimelineEntry repository (dependency inversion)."""
+
+    async def get_page(
+        self,
+        owner_uuid: UUID,
+        limit: int,
+        offset: int = 0,
+        after: KeysetCursor | None = None,
+        own: bool | None = None,
+        include_drafts: bool = True,
+        since: KeysetCursor | None = None,
+    ) -> list[TimelineEntry]:
+        """Find an owner's timeline entries, newest review update first.
+
+        ``own`` restricts entries to (or excludes) the owner's own profile.
+        Without ``include_drafts``, draft entries are kept only when the owner
+        wrote the review. With ``since``, only reviews updated after that
+        position are returned.
+        """
+        ...
+
+    async def get_version(
+        self,
+        owner_uuid: UUID,
+        own: bool | None = None,
+        include_drafts: bool = True,
+    ) -> ListVersion:
+        """Get the count and newest position of the entries get_page covers."""
+        ...
+
+    async def upsert_many(self, entries: list[TimelineEntry]) -> None:
+        """Insert or refresh entries keyed by (owner, review) in one bulk write.
+
+        A stored entry is left alone when its review snapshot is newer than
+        the incoming one.
+        """
+        ...
+
+    async def clear_drafts(self, username: str) -> int:
+        """Mark entries for a reviewed username as no longer drafts.
+
+        Returns count updated.
+        """
+        ...
+
+    async def trim(self, owner_uuid: UUID, max_entries: int) -> int:
+        """Delete entries past the newest max_entries. Returns count deleted."""
+        ...
+
+    async def delete_by_review_id(self, review_id: str) -> int:
+        """Delete a review from every timeline. Returns count deleted."""
+        ...
+
+    async def delete_by_owner_and_username(self, owner_uuid: UUID, username: str) -> int:
+        """Delete an owner's entries for a reviewed username. Returns count deleted."""
+        ...
+
+    async def delete_for_account(self, account_uuid: UUID, username: str) -> int:
+        """Delete an account's timeline and its reviews in other timelines.
+
+        Covers entries owned by, written by or about the account.
+        Returns count deleted.
+        """
+        ...
+
+    async def mark_fanout_skipped(self, username: str) -> None:
+        """Record that reviews of username are merged at read time instead."""
+        ...
+
+    async def clear_fanout_skipped(self, username: str) -> bool:
+        """Resume fan-out for username. Returns whether it was marked."""
+        ...
+
+    async def get_fanout_skipped_usernames(self) -> list[str]:
+        """Get usernames whose reviews are not fanned out."""
+        ...
@@ -0,0 +1,198 @@
+from uuid import UUID
+
+from app.domain.accounts.repositories.account_repository import IAccountRepository
+from app.domain.reviews.entities.review import Review
+from app.domain.reviews.repositories.review_repository import IReviewRepository
+from app.domain.shared.pagination import KeysetCursor, ListVersion
+from app.domain.timeline.entities.timeline_entry import TimelineEntry
+from app.domain.timeline.repositories.timeline_repository import ITimelineRepository
+from app.domain.watchlist.repositories.watchlist_repository import (
+    IWatchlistRepository,
+)
+
+# Reviews copied into a timeline when its owner starts watching someone
+BACKFILL_LIMIT = 50
+
+
+class TimelineService:
+    """Domain service for fan-out-on-write activity feed timelines.
+
+    Every review write is copied into the timeline of the reviewed account and
+    of each watcher, so reading a feed is one range scan over the owner's
+    timeline. Profiles with more than fanout_max_watchers watchers are not
+    fanned out; readers merge their reviews in from the reviews collection.
+    """
+
+    def __init__(
+        self,
+        timeline_repository: ITimelineRepository,
+        watchlist_repository: IWatchlistRepository,
+        account_repository: IAccountRepository,
+        review_repository: IReviewRepository,
+        max_entries: int,
+        fanout_max_watchers: int,
+        trim_every: int = 10,
+    ):
+        self.timeline_repository = timeline_repository
+        self.watchlist_repository = watchlist_repository
+        self.account_repository = account_repository
+        self.review_repository = review_repository
+        self.max_entries = max_entries
+        self.fanout_max_watchers = fanout_max_watchers
+        # Trimming skips max_entries index keys, so each timeline is trimmed
+        # on ~1 in trim_every writes and may overshoot the cap by that much.
+        self.trim_every = trim_every
+
+    async def publish(self, review: Review) -> int:
+        """Fan a created or updated review out to timelines.
+
+        Entries are only replaced by snapshots at least as new, so publishes
+        may run in any order. Returns the number of entries written.
+        """
+        reviewed_account = await self.account_repository.get_by_username(
+            review.reviewed_username
+        )
+        if reviewed_account is not None and reviewed_account.deleted_at is not None:
+            return 0
+
+        entries: list[TimelineEntry] = []
+        if reviewed_account is not None:
+            entries.append(
+                self._entry(reviewed_account.uuid, review, own=True, draft=False)
+            )
+
+        watcher_uuids = await self.watchlist_repository.get_watcher_uuids(
+            review.reviewed_username, limit=self.fanout_max_watchers + 1
+        )
+        draft = reviewed_account is None
+        if len(watcher_uuids) > self.fanout_max_watchers:
+            await self.timeline_repository.mark_fanout_skipped(review.reviewed_username)
+        else:
+            reviews = [review]
+            if await self.timeline_repository.clear_fanout_skipped(
+                review.reviewed_username
+            ):
+                # Back under the limit: watchers' timelines lack the reviews
+                # that were merged in at read time until now.
+                earlier = await self.review_repository.get_feed(
+                    [review.reviewed_username], BACKFILL_LIMIT
+                )
+                reviews.extend(r for r in earlier if r.id != review.id)
+            entries.extend(
+                self._entry(watcher_uuid, r, own=False, draft=draft)
+                for watcher_uuid in watcher_uuids
+                for r in reviews
+            )
+
+        await self._write(entries)
+        if (
+            entries
+            and review.id
+            and await self.review_repository.get_by_id(review.id) is None
+        ):
+            # Deleted while publishing; its retract may have run before this write.
+            await self.retract(review.id)
+            return 0
+        if (
+            draft
+            and entries
+            and await self.account_repository.get_by_username(review.reviewed_username)
+            is not None
+        ):
+            # Account created while publishing; its clear_drafts may have run first.
+            await self.clear_drafts(review.reviewed_username)
+        return len(entries)
+
+    async def clear_drafts(self, username: str) -> int:
+        """Stop treating a username's entries as drafts once it has an account.
+
+        Returns the number of entries updated.
+        """
+        return await self.timeline_repository.clear_drafts(username)
+
+    async def retract(self, review_id: str) -> None:
+        """Remove a deleted review from every timeline."""
+        await self.timeline_repository.delete_by_review_id(review_id)
+
+    async def backfill(self, owner_uuid: UUID, username: str) -> int:
+        """Copy recent reviews of a newly watched username into a timeline.
+
+        Returns the number of entries written.
+        """
+        skipped = await self.timeline_repository.get_fanout_skipped_usernames()
+        if username.lower() in {u.lower() for u in skipped}:
+            return 0
+
+        reviewed_account = await self.account_repository.get_by_username(username)
+        if reviewed_account is not None and reviewed_account.deleted_at is not None:
+            return 0
+
+        reviews = await self.review_repository.get_feed([username], BACKFILL_LIMIT)
+        entries = [
+            self._entry(owner_uuid, review, own=False, draft=reviewed_account is None)
+            for review in reviews
+        ]
+        await self._write(entries)
+        return len(entries)
+
+    async def forget(self, owner_uuid: UUID, username: str) -> None:
+        """Remove an unwatched username's reviews from a timeline."""
+        await self.timeline_repository.delete_by_owner_and_username(owner_uuid, username)
+
+    async def get_timeline(
+        self,
+        owner_uuid: UUID,
+        limit: int,
+        offset: int = 0,
+        after: KeysetCursor | None = None,
+        own: bool | None = None,
+        include_drafts: bool = True,
+        since: KeysetCursor | None = None,
+    ) -> list[Review]:
+        """Get the reviews in an owner's timeline, newest update first."""
+        entries = await self.timeline_repository.get_page(
+            owner_uuid,
+            limit,
+            offset,
+            after=after,
+            own=own,
+            include_drafts=include_drafts,
+            since=since,
+        )
+        return [entry.review for entry in entries]
+
+    async def get_timeline_version(
+        self, owner_uuid: UUID, own: bool | None = None, include_drafts: bool = True
+    ) -> ListVersion:
+        """Get the version of an owner's timeline, for change detection."""
+        return await self.timeline_repository.get_version(
+            owner_uuid, own=own, include_drafts=include_drafts
+        )
+
+    async def get_fanout_skipped_usernames(self) -> list[str]:
+        """Get usernames whose reviews must be merged in at read time."""
+        return await self.timeline_repository.get_fanout_skipped_usernames()
+
+    async def delete_for_account(self, account_uuid: UUID, username: str) -> int:
+        """Delete everything timelines hold for a deleted account."""
+        return await self.timeline_repository.delete_for_account(account_uuid, username)
+
+    async def _write(self, entries: list[TimelineEntry]) -> None:
+        if not entries:
+            return
+        await self.timeline_repository.upsert_many(entries)
+        for entry in entries:
+            if self._due_for_trim(entry):
+                await self.timeline_repository.trim(entry.owner_uuid, self.max_entries)
+
+    def _due_for_trim(self, entry: TimelineEntry) -> bool:
+        # ObjectIds end in an incrementing counter; offsetting it by the owner
+        # spreads the trims of one fan-out across later writes.
+        counter = int(entry.review.id or "0", 16)
+        return (counter + entry.owner_uuid.int) % self.trim_every == 0
+
+    @staticmethod
+    def _entry(owner_uuid: UUID, review: Review, own: bool, draft: bool) -> TimelineEntry:
+        return TimelineEntry(
+            id=None, owner_uuid=owner_uuid, review=review, own=own, draft=draft
+        )
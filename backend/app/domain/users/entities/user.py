@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """Domain entity representing a GitHub user."""
 
@@ -15,6 +15,9 @@ class User:
     updated_at: datetime | None = None
     created_at: datetime | None = None
     deleted_at: datetime | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    view_count: int = 0
 
     @property
     def is_user_type(self) -> bool:
@@ -1,6 +1,8 @@
+from datetime import datetime
 from typing import Protocol
 
 from app.domain.users.entities.user import User
+from app.domain.users.value_objects.user_summary import UserSummary
 
 
 class IUserRepository(Protocol):
@@ -14,6 +16,20 @@ class IUserRepository(Protocol):
         """Find users by a list of usernames."""
         ...
 
+    async def get_summaries_by_usernames(self, usernames: list[str]) -> list[UserSummary]:
+        """Find user summaries by a list of usernames."""
+        ...
+
+    async def get_refresh_candidates(
+        self, updated_before: datetime, limit: int
+    ) -> list[User]:
+        """Find users cached before a cutoff, most viewed first."""
+        ...
+
+    async def increment_view_counts(self, counts: dict[str, int]) -> None:
+        """Atomically add profile views, keyed by username."""
+        ...
+
     async def create(self, user: User) -> User:
         """Create a new user."""
         ...
@@ -22,6 +38,18 @@ class IUserRepository(Protocol):
         """Update an existing user."""
         ...
 
+    async def upsert(self, user: User) -> User:
+        """Create or replace the user with the same username, keeping its view count."""
+        ...
+
+    async def upsert_many(self, users: list[User]) -> None:
+        """Create or replace many users by username in one bulk write."""
+        ...
+
+    async def touch_many(self, usernames: list[str], updated_at: datetime) -> None:
+        """Set updated_at on the cached users with these usernames."""
+        ...
+
     async def save(self, user: User) -> User:
         """Save a user (create or update)."""
         ...
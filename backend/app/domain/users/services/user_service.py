@@ -1,28 +1,100 @@
+from copy import copy
 from datetime import datetime, timedelta, timezone
 
+from app.domain.shared.batch_loader import BatchLoader
 from app.domain.shared.constants import CACHE_EXPIRY_DAYS
 from app.domain.users.entities.user import User
 from app.domain.users.repositories.user_repository import IUserRepository
+from app.domain.users.value_objects.user_summary import UserSummary
+
+
+def _username_key(username: str) -> str:
+    return username.lower()
 
 
 class UserService:
-    """Domain service for user business logic."""
+    """Domain service for user business logic.
+
+    Created per request: user reads go through request-scoped loaders, so
+    lookups made in the same event-loop tick share one query and a user is
+    read at most once per request. Writes prime the loaders.
+    """
 
     def __init__(self, user_repository: IUserRepository):
         self.user_repository = user_repository
+        self._by_username: BatchLoader[str, User] = BatchLoader(
+            user_repository.get_by_usernames,
+            key_of=lambda user: user.username,
+            load_one=user_repository.get_by_username,
+            normalize=_username_key,
+        )
+        self._summaries_by_username: BatchLoader[str, UserSummary] = BatchLoader(
+            user_repository.get_summaries_by_usernames,
+            key_of=lambda summary: summary.username,
+            normalize=_username_key,
+        )
+
+    async def get_user_by_username(
+        self, username: str, reload: bool = False
+    ) -> User | None:
+        """Get a user by username from the repository.
 
-    async def get_user_by_username(self, username: str) -> User | None:
-        """Get a user by username from the repository."""
-        return await self.user_repository.get_by_username(username)
+        With ``reload``, the user is read again even if this request already
+        loaded it, to see writes made by other workers.
+        """
+        if reload:
+            self._by_username.clear(username)
+        user = await self._by_username.load(username)
+        return self._remember(user) if user is not None else None
 
     async def get_users_by_usernames(self, usernames: list[str]) -> dict[str, User]:
         """Get users by usernames, returned as a dict keyed by lowercase username."""
-        users = await self.user_repository.get_by_usernames(usernames)
-        return {u.username.lower(): u for u in users}
+        users = await self._by_username.load_many(usernames)
+        return {key: self._remember(user) for key, user in users.items()}
+
+    async def get_user_summaries_by_usernames(
+        self, usernames: list[str]
+    ) -> dict[str, UserSummary]:
+        """Get user summaries by usernames, keyed by lowercase username."""
+        return await self._summaries_by_username.load_many(usernames)
 
     async def save_user(self, user: User) -> User:
-        """Save a user to the repository."""
-        return await self.user_repository.save(user)
+        """Save a user to the repository, replacing any with the same username."""
+        return self._remember(await self.user_repository.upsert(user))
+
+    async def save_users(self, users: list[User]) -> list[User]:
+        """Save many users in one bulk write, replacing any with the same username."""
+        await self.user_repository.upsert_many(users)
+        return [self._remember(user) for user in users]
+
+    async def mark_users_checked(self, usernames: list[str]) -> None:
+        """Bump updated_at for cached users GitHub returned nothing for.
+
+        Keeps refresh passes from picking the same unresolvable users again
+        until their cache expires once more.
+        """
+        now = datetime.now(timezone.utc)
+        for username in usernames:
+            self._by_username.clear(username)
+        await self.user_repository.touch_many(usernames, now)
+
+    async def mark_user_fresh(self, user: User) -> User:
+        """Bump a cached user's updated_at after GitHub confirmed it is unchanged."""
+        user.updated_at = datetime.now(timezone.utc)
+        return self._remember(await self.user_repository.save(user))
+
+    async def record_views(self, counts: dict[str, int]) -> None:
+        """Add profile view counts, used to prioritize background refreshes."""
+        await self.user_repository.increment_view_counts(counts)
+
+    async def get_users_expiring_within(
+        self, lead_time: timedelta, limit: int
+    ) -> list[User]:
+        """Get users whose cache expires within lead_time, most viewed first."""
+        cutoff = (
+            datetime.now(timezone.utc) - timedelta(days=CACHE_EXPIRY_DAYS) + lead_time
+        )
+        return await self.user_repository.get_refresh_candidates(cutoff, limit)
 
     def is_cache_expired(self, user: User) -> bool:
         """Check if the user cache is expired (older than 7 days)."""
@@ -32,3 +104,30 @@ class UserService:
             days=CACHE_EXPIRY_DAYS
         )
         return datetime.now(timezone.utc) > expiry_date
+
+    def is_stale_beyond(self, user: User, max_staleness: timedelta) -> bool:
+        """Check if the user cache is older than a hard staleness bound."""
+        if user.updated_at is None:
+            return True
+        updated_at = user.updated_at.replace(tzinfo=timezone.utc)
+        return datetime.now(timezone.utc) > updated_at + max_staleness
+
+    def clear_loaded(self) -> None:
+        """Forget every user loaded so far, including misses.
+
+        For callers that outlive a request, such as live streams.
+        """
+        self._by_username.clear_all()
+        self._summaries_by_username.clear_all()
+
+    def _remember(self, user: User) -> User:
+        """Prime the loaders with a user read or written in this request.
+
+        The loaders keep their own copy and each caller gets another, so a
+        caller mutating its user does not change what later reads return.
+        """
+        self._by_username.prime(copy(user))
+        self._summaries_by_username.prime(
+            UserSummary(username=user.username, avatar_url=user.avatar_url)
+        )
+        return copy(user)
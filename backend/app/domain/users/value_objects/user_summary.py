@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class UserSummary:
+    """Read model of a cached GitHub user, for rendering avatars."""
+
+    username: str
+    avatar_url: str | None = None
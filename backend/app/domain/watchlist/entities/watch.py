@@ -3,7 +3,7 @@ from datetime import datetime
 from uuid import UUID
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Watch:
     """Pure domain entity for Watch (no infrastructure dependencies)."""
 
@@ -19,14 +19,39 @@ class IWatchlistRepository(Protocol):
         """Get all watching for a user."""
         ...
 
+    async def get_all_by_watcher_and_usernames(
+        self, watcher_uuid: UUID, usernames: list[str]
+    ) -> list[Watch]:
+        """Get a watcher's watches among the given usernames."""
+        ...
+
+    async def get_watcher_uuids(
+        self, watched_username: str, limit: int | None = None
+    ) -> list[UUID]:
+        """Get the UUIDs of accounts watching a username."""
+        ...
+
     async def get_watcher_count(self, watched_username: str) -> int:
         """Get the number of watchers for a username."""
         ...
 
+    async def get_watcher_counts_for_usernames(
+        self, usernames: list[str]
+    ) -> dict[str, int]:
+        """Get watcher counts for multiple usernames, keyed by lowercased username."""
+        ...
+
     async def create(self, watch: Watch) -> Watch:
         """Create a new watch."""
         ...
 
+    async def get_or_create(self, watch: Watch) -> Watch:
+        """Create a watch unless the watcher already watches the username.
+
+        Returns the stored watch.
+        """
+        ...
+
     async def delete(self, watcher_uuid: UUID, watched_username: str) -> None:
         """Delete a watch."""
         ...
@@ -37,19 +37,13 @@ class WatchlistService:
         )
         await check_target_is_user_type(self.user_repository, watched_username)
 
-        existing = await self.watchlist_repository.get_by_watcher_and_username(
-            watcher_uuid, watched_username
-        )
-        if existing:
-            return existing
-
         watch = Watch(
             id=None,
             watcher_uuid=watcher_uuid,
             watched_username=watched_username,
             created_at=datetime.now(timezone.utc),
         )
-        return await self.watchlist_repository.create(watch)
+        return await self.watchlist_repository.get_or_create(watch)
 
     async def unwatch(self, watcher_uuid: UUID, watched_username: str) -> None:
         """Unwatch a user."""
@@ -63,6 +57,23 @@ class WatchlistService:
             watcher_uuid, limit, offset
         )
 
+    async def get_watched_among(
+        self, watcher_uuid: UUID, usernames: list[str]
+    ) -> list[str]:
+        """Get which of the given usernames a watcher is watching."""
+        if not usernames:
+            return []
+        watches = await self.watchlist_repository.get_all_by_watcher_and_usernames(
+            watcher_uuid, usernames
+        )
+        return [watch.watched_username for watch in watches]
+
+    async def get_watcher_counts_for_usernames(
+        self, usernames: list[str]
+    ) -> dict[str, int]:
+        """Get watcher counts for multiple usernames at once."""
+        return await self.watchlist_repository.get_watcher_counts_for_usernames(usernames)
+
     async def is_watching(self, watcher_uuid: UUID, watched_username: str) -> bool:
         """Check if a watcher is watching another user."""
         watch = await self.watchlist_repository.get_by_watcher_and_username(
@@ -1,7 +1,12 @@
 from app.domain.accounts.entities.account import Account
+from app.domain.accounts.value_objects.account_summary import AccountSummary
 from app.infrastructure.accounts.database.models.account_model import AccountDocument
+from app.infrastructure.accounts.database.models.account_projections import (
+    AccountSummaryView,
+)
 from app.infrastructure.shared.database.mappers.base_mapper import (
     document_id_to_str,
+    normalize_username,
     str_to_document_id,
 )
 
@@ -30,6 +35,7 @@ class AccountMapper:
         doc = AccountDocument(
             uuid=entity.uuid,
             username=entity.username,
+            username_lc=normalize_username(entity.username),
             access_token=entity.access_token,
             email=entity.email,
             deleted_at=entity.deleted_at,
@@ -41,13 +47,8 @@ class AccountMapper:
         return doc
 
     @staticmethod
-    def update_document_from_entity(
-        document: AccountDocument, entity: Account
-    ) -> AccountDocument:
-        """Update an AccountDocument with values from an Account entity."""
-        document.uuid = entity.uuid
-        document.username = entity.username
-        document.access_token = entity.access_token
-        document.email = entity.email
-        document.deleted_at = entity.deleted_at
-        return document
+    def to_summary(view: AccountSummaryView) -> AccountSummary:
+        """Convert an AccountSummaryView projection to an AccountSummary read model."""
+        return AccountSummary(
+            uuid=view.uuid, username=view.username, deleted_at=view.deleted_at
+        )
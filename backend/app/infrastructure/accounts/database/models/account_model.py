@@ -4,6 +4,7 @@ from uuid import UUID, uuid4
 
 from beanie import Document, Indexed
 from pydantic import Field
+from pymongo import IndexModel
 
 
 class AccountDocument(Document):
@@ -11,6 +12,8 @@ class AccountDocument(Document):
 
     uuid: Annotated[UUID, Field(default_factory=uuid4), Indexed(unique=True)]
     username: Annotated[str, Indexed(unique=True)]
+    # Normalized username, maintained by AccountMapper
+    username_lc: str | None = None
     access_token: str
     email: str | None = None
     deleted_at: datetime | None = None
@@ -18,3 +21,13 @@ class AccountDocument(Document):
 
     class Settings:
         name = "accounts"
+        indexes = [
+            # Unique among backfilled documents, so upserts cannot race into
+            # case-variant duplicates
+            IndexModel(
+                [("username_lc", 1)],
+                name="username_lc_unique",
+                unique=True,
+                partialFilterExpression={"username_lc": {"$exists": True}},
+            ),
+        ]
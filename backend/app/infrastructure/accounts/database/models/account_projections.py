@@ -0,0 +1,12 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class AccountSummaryView(BaseModel):
+    """Projection of an AccountDocument onto the fields of an AccountSummary."""
+
+    uuid: UUID
+    username: str
+    deleted_at: datetime | None = None
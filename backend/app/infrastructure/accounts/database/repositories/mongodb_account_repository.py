@@ -1,10 +1,18 @@
+from collections.abc import Collection
 from uuid import UUID
 
 from app.domain.accounts.entities.account import Account
+from app.domain.accounts.value_objects.account_summary import AccountSummary
 from app.infrastructure.accounts.database.mappers.account_mapper import AccountMapper
 from app.infrastructure.accounts.database.models.account_model import AccountDocument
-from app.infrastructure.shared.database.constants import CASE_INSENSITIVE
-from app.infrastructure.shared.database.repositories.base_repository import BaseRepository
+from app.infrastructure.accounts.database.models.account_projections import (
+    AccountSummaryView,
+)
+from app.infrastructure.shared.database.mappers.base_mapper import normalize_username
+from app.infrastructure.shared.database.repositories.base_repository import (
+    BaseRepository,
+    username_filter,
+)
 
 
 class MongoDBAccountRepository(BaseRepository[Account, AccountDocument]):
@@ -12,22 +20,36 @@ class MongoDBAccountRepository(BaseRepository[Account, AccountDocument]):
 
     document_class = AccountDocument
     mapper = AccountMapper
+    insert_only_fields = frozenset({"created_at"})
 
     async def get_by_username(self, username: str) -> Account | None:
         """Find an account by username (case-insensitive)."""
         document = await AccountDocument.find_one(
-            {"username": username}, collation=CASE_INSENSITIVE
+            {"username_lc": normalize_username(username)}
         )
         if document is None:
             return None
-        return AccountMapper.to_entity(document)
+        return self._track(document)
 
     async def get_by_uuid(self, uuid: UUID) -> Account | None:
         """Find an account by UUID."""
         document = await AccountDocument.find_one({"uuid": uuid})
         if document is None:
             return None
-        return AccountMapper.to_entity(document)
+        return self._track(document)
+
+    async def upsert_by_username(
+        self, account: Account, update_fields: Collection[str]
+    ) -> tuple[Account, Account | None]:
+        """Update fields of the account with the same username, or create account.
+
+        One atomic round trip (case-insensitive). Returns the stored account
+        and the one it replaced, which is None when the account was created.
+        """
+        query = username_filter("username_lc", "username", account.username)
+        # Sets the key on a legacy document matched without it
+        update_fields = [*update_fields, "username_lc"]
+        return await self.upsert_one(query, account, update_fields)
 
     async def get_by_uuids(self, uuids: list[UUID]) -> list[Account]:
         """Find accounts by a list of UUIDs."""
@@ -36,7 +58,27 @@ class MongoDBAccountRepository(BaseRepository[Account, AccountDocument]):
 
     async def get_by_usernames(self, usernames: list[str]) -> list[Account]:
         """Find accounts by a list of usernames (case-insensitive)."""
-        documents = await AccountDocument.find(
-            {"username": {"$in": usernames}}, collation=CASE_INSENSITIVE
-        ).to_list()
+        keys = [normalize_username(username) for username in usernames]
+        documents = await AccountDocument.find({"username_lc": {"$in": keys}}).to_list()
         return [AccountMapper.to_entity(doc) for doc in documents]
+
+    async def get_summaries_by_uuids(self, uuids: list[UUID]) -> list[AccountSummary]:
+        """Find account summaries by a list of UUIDs, without credentials."""
+        views = (
+            await AccountDocument.find({"uuid": {"$in": uuids}})
+            .project(AccountSummaryView)
+            .to_list()
+        )
+        return [AccountMapper.to_summary(view) for view in views]
+
+    async def get_summaries_by_usernames(
+        self, usernames: list[str]
+    ) -> list[AccountSummary]:
+        """Find account summaries by usernames (case-insensitive), without credentials."""
+        keys = [normalize_username(username) for username in usernames]
+        views = (
+            await AccountDocument.find({"username_lc": {"$in": keys}})
+            .project(AccountSummaryView)
+            .to_list()
+        )
+        return [AccountMapper.to_summary(view) for view in views]
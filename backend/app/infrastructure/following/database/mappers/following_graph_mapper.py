@@ -0,0 +1,70 @@
+from app.domain.following.entities.following_graph import (
+    FollowedUser,
+    FollowingGraph,
+    FollowingGraphPage,
+)
+from app.infrastructure.following.database.models.following_graph_model import (
+    FollowedUserModel,
+    FollowingGraphDocument,
+    FollowingPageModel,
+)
+from app.infrastructure.shared.database.mappers.base_mapper import (
+    document_id_to_str,
+    str_to_document_id,
+)
+
+
+class FollowingGraphMapper:
+    """Mapper to convert between FollowingGraph entity and FollowingGraphDocument."""
+
+    @staticmethod
+    def to_entity(document: FollowingGraphDocument) -> FollowingGraph:
+        """Convert FollowingGraphDocument (MongoDB) to FollowingGraph entity (domain)."""
+        return FollowingGraph(
+            id=document_id_to_str(document),
+            account_uuid=document.account_uuid,
+            pages=[
+                FollowingGraphPage(
+                    users=[
+                        FollowedUser(
+                            login=user.login,
+                            avatar_url=user.avatar_url,
+                            type=user.type,
+                        )
+                        for user in page.users
+                    ],
+                    etag=page.etag,
+                    next_url=page.next_url,
+                )
+                for page in document.pages
+            ],
+            synced_at=document.synced_at,
+        )
+
+    @staticmethod
+    def to_document(entity: FollowingGraph) -> FollowingGraphDocument:
+        """Convert FollowingGraph entity (domain) to FollowingGraphDocument (MongoDB)."""
+        doc = FollowingGraphDocument(
+            account_uuid=entity.account_uuid,
+            pages=FollowingGraphMapper._pages_to_models(entity.pages),
+            synced_at=entity.synced_at,
+        )
+        if entity.id:
+            doc.id = str_to_document_id(entity.id)
+        return doc
+
+    @staticmethod
+    def _pages_to_models(pages: list[FollowingGraphPage]) -> list[FollowingPageModel]:
+        return [
+            FollowingPageModel(
+                users=[
+                    FollowedUserModel(
+                        login=user.login, avatar_url=user.avatar_url, type=user.type
+                    )
+                    for user in page.users
+                ],
+                etag=page.etag,
+                next_url=page.next_url,
+            )
+            for page in pages
+        ]
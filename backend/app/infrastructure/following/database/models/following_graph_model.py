@@ -0,0 +1,33 @@
+from datetime import datetime
+from typing import Annotated
+from uuid import UUID
+
+from beanie import Document, Indexed
+from pydantic import BaseModel
+
+
+class FollowedUserModel(BaseModel):
+    """Embedded followed user."""
+
+    login: str
+    avatar_url: str | None = None
+    type: str | None = None
+
+
+class FollowingPageModel(BaseModel):
+    """Embedded page of a following list with its GitHub paging metadata."""
+
+    users: list[FollowedUserModel] = []
+    etag: str | None = None
+    next_url: str | None = None
+
+
+class FollowingGraphDocument(Document):
+    """MongoDB document model for FollowingGraph (infrastructure layer)."""
+
+    account_uuid: Annotated[UUID, Indexed(unique=True)]
+    pages: list[FollowingPageModel] = []
+    synced_at: datetime | None = None
+
+    class Settings:
+        name = "following_graphs"
@@ -0,0 +1,28 @@
+from uuid import UUID
+
+from app.domain.following.entities.following_graph import FollowingGraph
+from app.infrastructure.following.database.mappers.following_graph_mapper import (
+    FollowingGraphMapper,
+)
+from app.infrastructure.following.database.models.following_graph_model import (
+    FollowingGraphDocument,
+)
+from app.infrastructure.shared.database.repositories.base_repository import BaseRepository
+
+
+class MongoDBFollowingRepository(BaseRepository[FollowingGraph, FollowingGraphDocument]):
+    """MongoDB implementation of IFollowingRepository interface."""
+
+    document_class = FollowingGraphDocument
+    mapper = FollowingGraphMapper
+
+    async def get_by_account_uuid(self, account_uuid: UUID) -> FollowingGraph | None:
+        """Find the stored following graph of an account."""
+        document = await FollowingGraphDocument.find_one({"account_uuid": account_uuid})
+        if document is None:
+            return None
+        return FollowingGraphMapper.to_entity(document)
+
+    async def delete_by_account_uuid(self, account_uuid: UUID) -> None:
+        """Delete the stored following graph of an account."""
+        await FollowingGraphDocument.find({"account_uuid": account_uuid}).delete()
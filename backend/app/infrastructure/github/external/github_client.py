@@ -1,8 +1,17 @@
+import asyncio
 import logging
+from dataclasses import dataclass
 
 import httpx
 
 from app.domain.shared.exceptions import GitHubAPIException, UserNotFoundException
+from app.infrastructure.github.external.rate_limiter import (
+    CORE_BUCKET,
+    GRAPHQL_BUCKET,
+    SEARCH_BUCKET,
+    GitHubCallPriority,
+    GitHubRateLimiter,
+)
 from app.infrastructure.shared.config.config import settings
 from app.infrastructure.shared.constants import GITHUB_API_TIMEOUT_SECONDS
 
@@ -10,93 +19,196 @@ logger = logging.getLogger(__name__)
 
 GITHUB_TIMEOUT = httpx.Timeout(GITHUB_API_TIMEOUT_SECONDS)
 
+# GitHub caps GraphQL queries by node count; 100 aliased owners stays well under it.
+GRAPHQL_USERS_BATCH_SIZE = 100
+
+_GRAPHQL_OWNER_FIELDS = (
+    "__typename login avatarUrl "
+    "... on User { name bio } "
+    "... on Organization { name description }"
+)
+
+SEARCH_USERS_PER_PAGE = 30
+FOLLOWING_PER_PAGE = 100
+
+
+@dataclass
+class UserSearchPage:
+    """First page of a GitHub user search.
+
+    ``complete`` is True when the page holds every match GitHub found.
+    """
+
+    items: list[dict]
+    complete: bool
+
+
+@dataclass
+class FollowingPage:
+    """One page of a GitHub following list, with its paging and cache metadata."""
+
+    items: list[dict]
+    etag: str | None
+    next_url: str | None
+
 
 class GitHubClient:
-    """Client for interacting with GitHub API and OAuth."""
+    """Client for interacting with GitHub API and OAuth.
+
+    Holds a single pooled ``httpx.AsyncClient`` so keep-alive connections
+    (and HTTP/2 streams) to GitHub are reused across requests. One instance
+    is created per process in the application lifespan. Token-authenticated
+    calls go through a GitHubRateLimiter that tracks each token's budget.
+    """
 
     GITHUB_API_URL = "https://api.github.com"
     GITHUB_OAUTH_URL = "https://github.com/login/oauth/access_token"
 
-    @staticmethod
-    async def exchange_code_for_token(code: str) -> str | None:
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient,
+        rate_limiter: GitHubRateLimiter | None = None,
+    ):
+        self._http = http_client
+        self.rate_limiter = rate_limiter or GitHubRateLimiter()
+
+    @classmethod
+    def from_settings(cls) -> "GitHubClient":
+        """Create a client with connection pooling configured from settings."""
+        limits = httpx.Limits(
+            max_connections=settings.GITHUB_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.GITHUB_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.GITHUB_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        )
+        return cls(
+            httpx.AsyncClient(
+                timeout=GITHUB_TIMEOUT,
+                limits=limits,
+                http2=settings.GITHUB_HTTP2_ENABLED,
+            ),
+            GitHubRateLimiter(
+                max_concurrency_per_token=(
+                    settings.GITHUB_RATE_LIMIT_MAX_CONCURRENCY_PER_TOKEN
+                ),
+                background_reserve_ratio=(
+                    settings.GITHUB_RATE_LIMIT_BACKGROUND_RESERVE_RATIO
+                ),
+            ),
+        )
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._http.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        access_token: str,
+        bucket: str = CORE_BUCKET,
+        priority: GitHubCallPriority = GitHubCallPriority.INTERACTIVE,
+        params: dict | None = None,
+        headers: dict[str, str] | None = None,
+        json: dict | None = None,
+    ) -> httpx.Response:
+        """Issue an authenticated request through the per-token rate limiter."""
+        request_headers = {
+            "Accept": "application/vnd.github+json",
+            "Authorization": f"Bearer {access_token}",
+            **(headers or {}),
+        }
+        async with self.rate_limiter.slot(access_token, bucket, priority):
+            response = await self._http.request(
+                method, url, params=params, headers=request_headers, json=json
+            )
+            self.rate_limiter.record(
+                access_token, bucket, response.status_code, response.headers
+            )
+        return response
+
+    async def _get(
+        self,
+        url: str,
+        access_token: str,
+        bucket: str = CORE_BUCKET,
+        priority: GitHubCallPriority = GitHubCallPriority.INTERACTIVE,
+        params: dict | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        """Issue an authenticated GET through the per-token rate limiter."""
+        return await self._request(
+            "GET",
+            url,
+            access_token,
+            bucket=bucket,
+            priority=priority,
+            params=params,
+            headers=headers,
+        )
+
+    async def exchange_code_for_token(self, code: str) -> str | None:
         """Exchange OAuth authorization code for access token."""
         redirect_uri = f"{settings.SSO_CALLBACK_HOSTNAME}/oauth/callback"
-        async with httpx.AsyncClient(timeout=GITHUB_TIMEOUT) as client:
-            response = await client.post(
-                GitHubClient.GITHUB_OAUTH_URL,
-                data={
-                    "client_id": settings.GITHUB_CLIENT_ID,
-                    "client_secret": settings.GITHUB_CLIENT_SECRET,
-                    "code": code,
-                    "redirect_uri": redirect_uri,
-                },
-                headers={"Accept": "application/json"},
-            )
-            if response.status_code == 200:
-                data = response.json()
-                return data.get("access_token")
+        response = await self._http.post(
+            self.GITHUB_OAUTH_URL,
+            data={
+                "client_id": settings.GITHUB_CLIENT_ID,
+                "client_secret": settings.GITHUB_CLIENT_SECRET,
+                "code": code,
+                "redirect_uri": redirect_uri,
+            },
+            headers={"Accept": "application/json"},
+        )
+        if response.status_code == 200:
+            data = response.json()
+            return data.get("access_token")
         logger.warning(
             "Failed to exchange code for token: status=%d",
             response.status_code,
         )
         return None
 
-    @staticmethod
-    async def fetch_authenticated_user(access_token: str) -> dict | None:
+    async def fetch_authenticated_user(self, access_token: str) -> dict | None:
         """Fetch authenticated user data from GitHub."""
-        async with httpx.AsyncClient(timeout=GITHUB_TIMEOUT) as client:
-            response = await client.get(
-                f"{GitHubClient.GITHUB_API_URL}/user",
-                headers={
-                    "Authorization": f"Bearer {access_token}",
-                    "Accept": "application/vnd.github+json",
-                },
-            )
-            if response.status_code == 200:
-                return response.json()
+        response = await self._get(f"{self.GITHUB_API_URL}/user", access_token)
+        if response.status_code == 200:
+            return response.json()
         logger.warning(
             "Failed to fetch authenticated user: status=%d",
             response.status_code,
         )
         return None
 
-    @staticmethod
-    async def fetch_user_emails(access_token: str) -> str | None:
+    async def fetch_user_emails(self, access_token: str) -> str | None:
         """Fetch the primary verified email for the authenticated user."""
-        async with httpx.AsyncClient(timeout=GITHUB_TIMEOUT) as client:
-            response = await client.get(
-                f"{GitHubClient.GITHUB_API_URL}/user/emails",
-                headers={
-                    "Authorization": f"Bearer {access_token}",
-                    "Accept": "application/vnd.github+json",
-                },
-            )
-            if response.status_code == 200:
-                for entry in response.json():
-                    if entry.get("primary") and entry.get("verified"):
-                        return entry.get("email")
+        response = await self._get(f"{self.GITHUB_API_URL}/user/emails", access_token)
+        if response.status_code == 200:
+            for entry in response.json():
+                if entry.get("primary") and entry.get("verified"):
+                    return entry.get("email")
         logger.warning(
             "Failed to fetch user emails: status=%d",
             response.status_code,
         )
         return None
 
-    @staticmethod
-    async def fetch_github_user_data(code: str) -> tuple[dict, str]:
+    async def fetch_github_user_data(self, code: str) -> tuple[dict, str]:
         """
         Complete OAuth flow: exchange code for token and fetch user data.
         Returns a tuple of (user_data dict, access_token).
         """
-        access_token = await GitHubClient.exchange_code_for_token(code)
+        access_token = await self.exchange_code_for_token(code)
         if not access_token:
             raise GitHubAPIException("Failed to get access token from GitHub.")
 
-        user_data = await GitHubClient.fetch_authenticated_user(access_token)
+        # Both calls only need the token, so run them concurrently.
+        user_data, email = await asyncio.gather(
+            self.fetch_authenticated_user(access_token),
+            self.fetch_user_emails(access_token),
+        )
         if user_data is None:
             raise GitHubAPIException("Failed to fetch user data from GitHub.")
 
-        email = await GitHubClient.fetch_user_emails(access_token)
-
         return {
             "username": user_data["login"],
             "name": user_data.get("name"),
@@ -106,17 +218,34 @@ class GitHubClient:
             "email": email,
         }, access_token
 
-    @staticmethod
-    async def fetch_user_by_username(username: str, access_token: str) -> dict:
-        """Fetch GitHub user by username."""
-        async with httpx.AsyncClient(timeout=GITHUB_TIMEOUT) as client:
-            response = await client.get(
-                f"{GitHubClient.GITHUB_API_URL}/users/{username}",
-                headers={
-                    "Accept": "application/vnd.github+json",
-                    "Authorization": f"Bearer {access_token}",
-                },
-            )
+    async def fetch_user_by_username(
+        self,
+        username: str,
+        access_token: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        priority: GitHubCallPriority = GitHubCallPriority.INTERACTIVE,
+    ) -> dict | None:
+        """Fetch GitHub user by username.
+
+        When cache validators from a previous response are given, the request
+        is made conditional and None is returned on 304 Not Modified.
+        """
+        headers: dict[str, str] = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        response = await self._get(
+            f"{self.GITHUB_API_URL}/users/{username}",
+            access_token,
+            priority=priority,
+            headers=headers,
+        )
+
+        if response.status_code == 304:
+            return None
 
         if response.status_code == 404:
             raise UserNotFoundException(username)
@@ -136,20 +265,84 @@ class GitHubClient:
             "bio": data.get("bio"),
             "avatar_url": data.get("avatar_url"),
             "type": data.get("type"),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
         }
 
-    @staticmethod
-    async def search_users(query: str, access_token: str) -> list[dict]:
-        """Search GitHub users by query."""
-        async with httpx.AsyncClient(timeout=GITHUB_TIMEOUT) as client:
-            response = await client.get(
-                f"{GitHubClient.GITHUB_API_URL}/search/users",
-                params={"q": f"type:user {query}"},
-                headers={
-                    "Accept": "application/vnd.github+json",
-                    "Authorization": f"Bearer {access_token}",
-                },
+    async def fetch_users_by_usernames(
+        self,
+        usernames: list[str],
+        access_token: str,
+        priority: GitHubCallPriority = GitHubCallPriority.BACKGROUND,
+    ) -> dict[str, dict]:
+        """Bulk-fetch GitHub profiles via GraphQL, keyed by lowercase username.
+
+        Resolves up to GRAPHQL_USERS_BATCH_SIZE logins per request. Values have
+        the same shape as fetch_user_by_username; unknown logins are omitted.
+        """
+        unique = list(dict.fromkeys(u for u in usernames if u))
+        results: dict[str, dict] = {}
+        for start in range(0, len(unique), GRAPHQL_USERS_BATCH_SIZE):
+            batch = unique[start : start + GRAPHQL_USERS_BATCH_SIZE]
+            results.update(await self._fetch_users_batch(batch, access_token, priority))
+        return results
+
+    async def _fetch_users_batch(
+        self,
+        usernames: list[str],
+        access_token: str,
+        priority: GitHubCallPriority,
+    ) -> dict[str, dict]:
+        """Resolve one batch of logins with a single aliased GraphQL query."""
+        variables = {f"l{i}": username for i, username in enumerate(usernames)}
+        declarations = ", ".join(f"${name}: String!" for name in variables)
+        selections = " ".join(
+            f"u{i}: repositoryOwner(login: $l{i}) {{ {_GRAPHQL_OWNER_FIELDS} }}"
+            for i in range(len(usernames))
+        )
+        response = await self._request(
+            "POST",
+            f"{self.GITHUB_API_URL}/graphql",
+            access_token,
+            bucket=GRAPHQL_BUCKET,
+            priority=priority,
+            json={
+                "query": f"query({declarations}) {{ {selections} }}",
+                "variables": variables,
+            },
+        )
+
+        payload = response.json() if response.status_code == 200 else {}
+        data = payload.get("data")
+        if data is None:
+            logger.error(
+                "GitHub GraphQL error fetching %d users: status=%d",
+                len(usernames),
+                response.status_code,
             )
+            raise GitHubAPIException("Failed to fetch GitHub users")
+
+        results: dict[str, dict] = {}
+        for node in data.values():
+            if not node or not node.get("login"):
+                continue
+            results[node["login"].lower()] = {
+                "username": node["login"],
+                "name": node.get("name"),
+                "bio": node.get("bio", node.get("description")),
+                "avatar_url": node.get("avatarUrl"),
+                "type": node.get("__typename"),
+            }
+        return results
+
+    async def search_users(self, query: str, access_token: str) -> UserSearchPage:
+        """Search GitHub users by query."""
+        response = await self._get(
+            f"{self.GITHUB_API_URL}/search/users",
+            access_token,
+            bucket=SEARCH_BUCKET,
+            params={"q": f"type:user {query}", "per_page": SEARCH_USERS_PER_PAGE},
+        )
 
         if response.status_code != 200:
             logger.error(
@@ -159,7 +352,7 @@ class GitHubClient:
             raise GitHubAPIException("Failed to search GitHub users")
 
         data = response.json()
-        return [
+        items = [
             {
                 "login": item["login"],
                 "avatar_url": item["avatar_url"],
@@ -167,22 +360,38 @@ class GitHubClient:
             }
             for item in data.get("items", [])
         ]
+        return UserSearchPage(
+            items=items,
+            complete=(
+                not data.get("incomplete_results", False)
+                and data.get("total_count", 0) <= len(items)
+            ),
+        )
 
-    @staticmethod
-    async def fetch_following_sample(
-        username: str, access_token: str, per_page: int = 100
-    ) -> list[dict]:
-        """Fetch a single-page sample of GitHub users the given username is following."""
-        async with httpx.AsyncClient(timeout=GITHUB_TIMEOUT) as client:
-            response = await client.get(
-                f"{GitHubClient.GITHUB_API_URL}/users/{username}/following",
-                params={"per_page": per_page},
-                headers={
-                    "Accept": "application/vnd.github+json",
-                    "Authorization": f"Bearer {access_token}",
-                },
-            )
+    async def fetch_following_page(
+        self,
+        username: str,
+        access_token: str,
+        url: str | None = None,
+        etag: str | None = None,
+        priority: GitHubCallPriority = GitHubCallPriority.BACKGROUND,
+    ) -> FollowingPage | None:
+        """Fetch one page of the users the given username is following.
+
+        ``url`` is a ``next`` link from a previous page; the first page is
+        fetched when omitted. Returns None on 304 Not Modified when ``etag``
+        still matches, which does not count against the rate limit.
+        """
+        response = await self._get(
+            url or f"{self.GITHUB_API_URL}/users/{username}/following",
+            access_token,
+            priority=priority,
+            params=None if url else {"per_page": FOLLOWING_PER_PAGE},
+            headers={"If-None-Match": etag} if etag else None,
+        )
 
+        if response.status_code == 304:
+            return None
         if response.status_code != 200:
             logger.error(
                 "GitHub API error fetching following for %s: status=%d",
@@ -191,12 +400,15 @@ class GitHubClient:
             )
             raise GitHubAPIException("Failed to fetch GitHub following list")
 
-        data = response.json()
-        return [
-            {
-                "login": item.get("login"),
-                "avatar_url": item.get("avatar_url"),
-                "type": item.get("type"),
-            }
-            for item in data
-        ]
+        return FollowingPage(
+            items=[
+                {
+                    "login": item.get("login"),
+                    "avatar_url": item.get("avatar_url"),
+                    "type": item.get("type"),
+                }
+                for item in response.json()
+            ],
+            etag=response.headers.get("ETag"),
+            next_url=response.links.get("next", {}).get("url"),
+        )
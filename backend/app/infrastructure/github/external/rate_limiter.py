@@ -0,0 +1,277 @@
+import asyncio
+import hashlib
+import heapq
+import itertools
+import logging
+import time
+import weakref
+from collections.abc import AsyncIterator, Iterable, Mapping
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+
+from opentelemetry import metrics
+from opentelemetry.metrics import CallbackOptions, Observation
+
+from app.domain.shared.exceptions import GitHubRateLimitException
+
+logger = logging.getLogger(__name__)
+
+meter = metrics.get_meter(__name__)
+
+CORE_BUCKET = "core"
+SEARCH_BUCKET = "search"
+GRAPHQL_BUCKET = "graphql"
+
+# Cap on tracked token budgets before expired entries are pruned.
+MAX_TRACKED_BUDGETS = 10_000
+
+
+class GitHubCallPriority(IntEnum):
+    """Scheduling priority of a GitHub call (lower value runs first)."""
+
+    INTERACTIVE = 0
+    BACKGROUND = 1
+
+
+@dataclass
+class RateLimitBudget:
+    """Last known GitHub rate-limit state for one token and bucket."""
+
+    limit: int | None = None
+    remaining: int | None = None
+    reset_at: float = 0.0
+    blocked_until: float = 0.0
+
+    def is_exhausted(self, now: float) -> bool:
+        """Whether no call can succeed before the window resets."""
+        if now < self.blocked_until:
+            return True
+        return self.remaining is not None and self.remaining <= 0 and now < self.reset_at
+
+    def is_low(self, now: float, reserve_ratio: float) -> bool:
+        """Whether the budget is inside the reserve kept for interactive calls."""
+        if self.remaining is None or self.limit is None or now >= self.reset_at:
+            return False
+        return self.remaining <= self.limit * reserve_ratio
+
+    def retry_at(self) -> float:
+        """Earliest epoch time at which the bucket is expected to recover."""
+        return max(self.reset_at, self.blocked_until)
+
+
+class _TokenGate:
+    """Bounded concurrency per token with a priority-ordered wait queue."""
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max_concurrency
+        self.in_flight = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    async def acquire(self, priority: GitHubCallPriority) -> None:
+        if self.in_flight < self.max_concurrency and not self.queue_depth:
+            self.in_flight += 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (int(priority), next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot was handed over right before cancellation; pass it on.
+                self.release()
+            raise
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                self.in_flight += 1
+                future.set_result(None)
+                return
+
+
+def _token_key(access_token: str) -> str:
+    """Stable, non-reversible key so raw tokens are never kept in memory maps."""
+    return hashlib.sha256(access_token.encode()).hexdigest()[:16]
+
+
+def _parse_retry_after(value: str, now: float) -> float | None:
+    """Parse a Retry-After header (delta seconds or HTTP date) into epoch time."""
+    if value.isdigit():
+        return now + int(value)
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+class GitHubRateLimiter:
+    """Per-token GitHub rate-limit tracker and call scheduler.
+
+    Budgets are learned from ``X-RateLimit-*`` and ``Retry-After`` response
+    headers, separately for the core, search and GraphQL buckets. Calls for the same
+    token share a bounded number of concurrent slots; queued interactive
+    calls are always served before background ones. Background calls are
+    shed once the budget drops into the reserve, and every call is refused
+    while the bucket is exhausted, so callers can fall back to cached data.
+    """
+
+    def __init__(
+        self,
+        max_concurrency_per_token: int = 8,
+        background_reserve_ratio: float = 0.2,
+    ):
+        self.max_concurrency_per_token = max_concurrency_per_token
+        self.background_reserve_ratio = background_reserve_ratio
+        self._budgets: dict[tuple[str, str], RateLimitBudget] = {}
+        self._gates: dict[str, _TokenGate] = {}
+        self.throttled_count = 0
+        _live_limiters.add(self)
+
+    def budget(self, access_token: str, bucket: str = CORE_BUCKET) -> RateLimitBudget:
+        """Return the tracked budget for a token and bucket."""
+        key = (_token_key(access_token), bucket)
+        budget = self._budgets.get(key)
+        if budget is None:
+            budget = self._budgets[key] = RateLimitBudget()
+        return budget
+
+    @property
+    def queue_depth(self) -> int:
+        """Total number of calls currently waiting for a slot."""
+        return sum(gate.queue_depth for gate in self._gates.values())
+
+    @asynccontextmanager
+    async def slot(
+        self,
+        access_token: str,
+        bucket: str = CORE_BUCKET,
+        priority: GitHubCallPriority = GitHubCallPriority.INTERACTIVE,
+    ) -> AsyncIterator[None]:
+        """Reserve a call slot, raising GitHubRateLimitException if refused."""
+        self._check_budget(access_token, bucket, priority)
+        gate = self._gate(access_token)
+        await gate.acquire(priority)
+        try:
+            # The budget may have been updated while this call was queued.
+            self._check_budget(access_token, bucket, priority)
+            yield
+        finally:
+            gate.release()
+
+    def record(
+        self,
+        access_token: str,
+        bucket: str,
+        status_code: int,
+        headers: Mapping[str, str],
+    ) -> None:
+        """Update the budget from a GitHub response."""
+        now = time.time()
+        bucket = headers.get("X-RateLimit-Resource", bucket)
+        budget = self.budget(access_token, bucket)
+
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is not None and remaining.isdigit():
+            budget.remaining = int(remaining)
+        limit = headers.get("X-RateLimit-Limit")
+        if limit is not None and limit.isdigit():
+            budget.limit = int(limit)
+        reset = headers.get("X-RateLimit-Reset")
+        if reset is not None and reset.isdigit():
+            budget.reset_at = float(reset)
+
+        if status_code in (403, 429):
+            retry_after = headers.get("Retry-After")
+            blocked_until = _parse_retry_after(retry_after, now) if retry_after else None
+            if blocked_until is None and budget.remaining == 0:
+                blocked_until = budget.reset_at
+            if blocked_until is not None:
+                budget.blocked_until = blocked_until
+                logger.warning(
+                    "GitHub %s rate limit hit: blocked for %.0fs",
+                    bucket,
+                    max(blocked_until - now, 0),
+                )
+
+        if len(self._budgets) > MAX_TRACKED_BUDGETS:
+            self._prune(now)
+
+    def _check_budget(
+        self, access_token: str, bucket: str, priority: GitHubCallPriority
+    ) -> None:
+        now = time.time()
+        budget = self.budget(access_token, bucket)
+        refuse = budget.is_exhausted(now) or (
+            priority is GitHubCallPriority.BACKGROUND
+            and budget.is_low(now, self.background_reserve_ratio)
+        )
+        if refuse:
+            self.throttled_count += 1
+            _throttled_calls.add(1, {"bucket": bucket, "priority": priority.name.lower()})
+            raise GitHubRateLimitException(bucket, budget.retry_at())
+
+    def _gate(self, access_token: str) -> _TokenGate:
+        key = _token_key(access_token)
+        gate = self._gates.get(key)
+        if gate is None:
+            gate = self._gates[key] = _TokenGate(self.max_concurrency_per_token)
+        return gate
+
+    def _prune(self, now: float) -> None:
+        expired = [
+            key for key, budget in self._budgets.items() if now >= budget.retry_at()
+        ]
+        for key in expired:
+            del self._budgets[key]
+        idle = [
+            token_key
+            for token_key, gate in self._gates.items()
+            if gate.in_flight == 0 and not gate.queue_depth
+        ]
+        for token_key in idle:
+            del self._gates[token_key]
+
+
+_live_limiters: "weakref.WeakSet[GitHubRateLimiter]" = weakref.WeakSet()
+
+
+def _observe_remaining(options: CallbackOptions) -> Iterable[Observation]:
+    lowest: dict[str, int] = {}
+    for limiter in list(_live_limiters):
+        for (_, bucket), budget in limiter._budgets.items():
+            if budget.remaining is None:
+                continue
+            lowest[bucket] = min(lowest.get(bucket, budget.remaining), budget.remaining)
+    return [
+        Observation(remaining, {"bucket": bucket}) for bucket, remaining in lowest.items()
+    ]
+
+
+def _observe_queue_depth(options: CallbackOptions) -> Iterable[Observation]:
+    return [Observation(sum(limiter.queue_depth for limiter in list(_live_limiters)))]
+
+
+_throttled_calls = meter.create_counter(
+    "github.rate_limit.throttled_calls",
+    description="GitHub calls refused or shed by the rate limiter",
+)
+meter.create_observable_gauge(
+    "github.rate_limit.remaining",
+    callbacks=[_observe_remaining],
+    description="Lowest known remaining GitHub budget per bucket",
+)
+meter.create_observable_gauge(
+    "github.rate_limit.queue_depth",
+    callbacks=[_observe_queue_depth],
+    description="GitHub calls waiting for a per-token slot",
+)
@@ -0,0 +1,101 @@
+import re
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from app.infrastructure.github.external.github_client import UserSearchPage
+
+_WHITESPACE = re.compile(r"\s+")
+# Terms with these characters use GitHub search syntax and can't be narrowed
+# locally by substring matching.
+_NON_PREFIXABLE = re.compile(r"[\s:\"]")
+# A bare term also matches names and emails, which results don't carry, so
+# only login-restricted queries can be narrowed by filtering on login.
+_LOGIN_QUALIFIER = "in:login"
+
+
+@dataclass
+class _Entry:
+    page: UserSearchPage
+    expires_at: float
+
+
+class UserSearchCache:
+    """In-process TTL cache for GitHub user search results.
+
+    Results don't depend on who searches, so entries are shared across
+    accounts. A login-restricted query (``<term> in:login``) that extends a
+    cached shorter one whose result was complete is answered locally by
+    filtering that result on login, which covers typeahead keystrokes
+    without touching the search bucket.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self.hits = 0
+        self.prefix_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        """Normalize a search query into its cache key."""
+        normalized = _WHITESPACE.sub(" ", query).strip().lower()
+        term = _login_term(normalized)
+        return f"{term} {_LOGIN_QUALIFIER}" if term is not None else normalized
+
+    def get(self, query: str) -> list[dict] | None:
+        """Return cached results for a normalized query, or None on a miss."""
+        page = self._lookup(query)
+        if page is not None:
+            self.hits += 1
+            return list(page.items)
+
+        term = _login_term(query)
+        if term is not None:
+            for end in range(len(term) - 1, 0, -1):
+                prefix_page = self._lookup(f"{term[:end]} {_LOGIN_QUALIFIER}")
+                if prefix_page is not None and prefix_page.complete:
+                    self.prefix_hits += 1
+                    return [
+                        item
+                        for item in prefix_page.items
+                        if term in item["login"].lower()
+                    ]
+
+        self.misses += 1
+        return None
+
+    def put(self, query: str, page: UserSearchPage) -> None:
+        """Store results for a normalized query, evicting the oldest if full."""
+        self._entries[query] = _Entry(page, self._clock() + self.ttl_seconds)
+        self._entries.move_to_end(query)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _lookup(self, query: str) -> UserSearchPage | None:
+        entry = self._entries.get(query)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            del self._entries[query]
+            return None
+        self._entries.move_to_end(query)
+        return entry.page
+
+
+def _login_term(query: str) -> str | None:
+    """The term of a normalized ``<term> in:login`` query, if it has one."""
+    tokens = query.split(" ")
+    if len(tokens) != 2 or _LOGIN_QUALIFIER not in tokens:
+        return None
+    term = tokens[0] if tokens[1] == _LOGIN_QUALIFIER else tokens[1]
+    return None if _NON_PREFIXABLE.search(term) else term
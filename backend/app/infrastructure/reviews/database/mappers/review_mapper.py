@@ -1,7 +1,16 @@
-from app.domain.reviews.entities.review import Review
+from collections.abc import Mapping
+from typing import Any
+
+from app.domain.reviews.entities.review import Review, ReviewStatus
+from app.domain.reviews.value_objects.review_summary import ReviewSummary
 from app.infrastructure.reviews.database.models.review_model import ReviewDocument
+from app.infrastructure.reviews.database.models.review_projections import (
+    ReviewSummaryView,
+)
 from app.infrastructure.shared.database.mappers.base_mapper import (
     document_id_to_str,
+    intern_str,
+    normalize_username,
     str_to_document_id,
 )
 
@@ -15,7 +24,7 @@ class ReviewMapper:
         return Review(
             id=document_id_to_str(document),
             reviewer_uuid=document.reviewer_uuid,
-            reviewed_username=document.reviewed_username,
+            reviewed_username=intern_str(document.reviewed_username),
             status=document.status,
             comment=document.comment,
             anonymous=document.anonymous,
@@ -31,6 +40,7 @@ class ReviewMapper:
         doc = ReviewDocument(
             reviewer_uuid=entity.reviewer_uuid,
             reviewed_username=entity.reviewed_username,
+            reviewed_username_lc=normalize_username(entity.reviewed_username),
             status=entity.status,
             comment=entity.comment,
             anonymous=entity.anonymous,
@@ -45,17 +55,45 @@ class ReviewMapper:
         return doc
 
     @staticmethod
-    def update_document_from_entity(
-        document: ReviewDocument, entity: Review
-    ) -> ReviewDocument:
-        """Update a ReviewDocument with values from a Review entity."""
-        document.reviewer_uuid = entity.reviewer_uuid
-        document.reviewed_username = entity.reviewed_username
-        document.status = entity.status
-        document.comment = entity.comment
-        document.anonymous = entity.anonymous
-        document.created_at = entity.created_at
-        document.updated_at = entity.updated_at
-        document.comment_hidden = entity.comment_hidden
-        document.comment_hidden_by = entity.comment_hidden_by
-        return document
+    def to_summary(view: ReviewSummaryView) -> ReviewSummary:
+        """Convert a ReviewSummaryView projection to a ReviewSummary read model."""
+        return ReviewSummary(
+            id=str(view.id),
+            reviewer_uuid=view.reviewer_uuid,
+            reviewed_username=intern_str(view.reviewed_username),
+            status=view.status,
+            anonymous=view.anonymous,
+            updated_at=view.updated_at,
+        )
+
+    @staticmethod
+    def from_raw(raw: Mapping[str, Any]) -> Review:
+        """Convert a raw reviews row to a Review entity, without validation.
+
+        Expects UUIDs already decoded, as ``BaseRepository.find_raw`` does.
+        Defaults match ReviewDocument's for fields older rows may lack.
+        """
+        return Review(
+            id=str(raw["_id"]),
+            reviewer_uuid=raw["reviewer_uuid"],
+            reviewed_username=intern_str(raw["reviewed_username"]),
+            status=ReviewStatus(raw["status"]),
+            comment=raw.get("comment"),
+            anonymous=raw.get("anonymous", False),
+            created_at=raw["created_at"],
+            updated_at=raw["updated_at"],
+            comment_hidden=raw.get("comment_hidden", False),
+            comment_hidden_by=raw.get("comment_hidden_by"),
+        )
+
+    @staticmethod
+    def summary_from_raw(raw: Mapping[str, Any]) -> ReviewSummary:
+        """Convert a raw ReviewSummaryView row to a ReviewSummary, without validation."""
+        return ReviewSummary(
+            id=str(raw["_id"]),
+            reviewer_uuid=raw["reviewer_uuid"],
+            reviewed_username=intern_str(raw["reviewed_username"]),
+            status=ReviewStatus(raw["status"]),
+            anonymous=raw.get("anonymous", False),
+            updated_at=raw["updated_at"],
+        )
@@ -0,0 +1,19 @@
+from app.domain.reviews.entities.review_stats import ReviewStats
+from app.infrastructure.reviews.database.models.review_stats_model import (
+    ReviewStatsDocument,
+)
+
+
+class ReviewStatsMapper:
+    """Mapper to convert ReviewStatsDocument models to ReviewStats entities."""
+
+    @staticmethod
+    def to_entity(document: ReviewStatsDocument) -> ReviewStats:
+        """Convert ReviewStatsDocument (MongoDB) to ReviewStats entity (domain)."""
+        return ReviewStats(
+            username=document.username,
+            total=document.total,
+            approve=document.approve,
+            request_change=document.request_change,
+            comment=document.comment,
+        )
@@ -13,7 +13,9 @@ class ReviewDocument(Document):
     """MongoDB document model for Review (infrastructure layer)."""
 
     reviewer_uuid: Annotated[UUID, Indexed()]
-    reviewed_username: Annotated[str, Indexed()]
+    reviewed_username: str
+    # Normalized reviewed_username, maintained by ReviewMapper
+    reviewed_username_lc: str | None = None
     status: ReviewStatus
     comment: str | None = Field(default=None, max_length=1024)
     anonymous: bool = False
@@ -29,7 +31,33 @@ class ReviewDocument(Document):
                 [("reviewer_uuid", 1), ("reviewed_username", 1)],
                 unique=True,
             ),
+            # Unique among backfilled documents, so upserts cannot race into
+            # case-variant duplicates
             IndexModel(
-                [("reviewed_username", 1), ("created_at", -1)],
+                [("reviewer_uuid", 1), ("reviewed_username_lc", 1)],
+                name="reviewer_uuid_reviewed_username_lc_unique",
+                unique=True,
+                partialFilterExpression={"reviewed_username_lc": {"$exists": True}},
+            ),
+            # Profile pages: (created_at, _id) is the keyset cursor order, with
+            # a status variant so filtered pages are bounded index ranges too.
+            IndexModel(
+                [("reviewed_username_lc", 1), ("created_at", -1), ("_id", -1)],
+                name="reviewed_username_lc_created_at_id_desc",
+            ),
+            IndexModel(
+                [
+                    ("reviewed_username_lc", 1),
+                    ("status", 1),
+                    ("created_at", -1),
+                    ("_id", -1),
+                ],
+                name="reviewed_username_lc_status_created_at_id_desc",
+            ),
+            # Activity feed: $in over usernames merged by (updated_at, _id),
+            # which is also the keyset cursor order.
+            IndexModel(
+                [("reviewed_username_lc", 1), ("updated_at", -1), ("_id", -1)],
+                name="reviewed_username_lc_updated_at_id_desc",
             ),
         ]
@@ -0,0 +1,18 @@
+from datetime import datetime
+from uuid import UUID
+
+from beanie import PydanticObjectId
+from pydantic import BaseModel, Field
+
+from app.domain.reviews.entities.review import ReviewStatus
+
+
+class ReviewSummaryView(BaseModel):
+    """Projection of a ReviewDocument onto the fields of a ReviewSummary."""
+
+    id: PydanticObjectId = Field(alias="_id")
+    reviewer_uuid: UUID
+    reviewed_username: str
+    status: ReviewStatus
+    anonymous: bool = False
+    updated_at: datetime
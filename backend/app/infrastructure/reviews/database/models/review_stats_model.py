@@ -0,0 +1,22 @@
+from beanie import Document
+from pymongo import IndexModel
+
+
+class ReviewStatsDocument(Document):
+    """MongoDB document model for ReviewStats (infrastructure layer).
+
+    ``username`` is stored lowercased, so point reads need no collation.
+    Per-status fields are named after the ReviewStatus values.
+    """
+
+    username: str
+    total: int = 0
+    approve: int = 0
+    request_change: int = 0
+    comment: int = 0
+
+    class Settings:
+        name = "review_stats"
+        indexes = [
+            IndexModel([("username", 1)], name="username_unique", unique=True),
+        ]
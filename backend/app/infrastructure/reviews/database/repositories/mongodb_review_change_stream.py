@@ -0,0 +1,73 @@
+from collections.abc import AsyncGenerator, Mapping
+from typing import Any
+
+from pymongo.errors import OperationFailure
+
+from app.domain.reviews.value_objects.review_change import ReviewChange
+from app.infrastructure.reviews.database.mappers.review_mapper import ReviewMapper
+from app.infrastructure.reviews.database.models.review_model import ReviewDocument
+
+# Deletes have no post-image and are not pushed to clients
+_CHANGE_PIPELINE = [
+    {"$match": {"operationType": {"$in": ["insert", "update", "replace"]}}}
+]
+
+
+class MongoDBReviewChangeStream:
+    """MongoDB change stream implementation of IReviewChangeStream interface.
+
+    Requires a replica set (or sharded cluster). Tokens are the ``_data``
+    string of the change stream resume token.
+    """
+
+    async def watch(
+        self, resume_token: str | None = None
+    ) -> AsyncGenerator[ReviewChange, None]:
+        """Stream review inserts and updates with their current document."""
+        collection = ReviewDocument.get_pymongo_collection()
+        async with await collection.watch(
+            _CHANGE_PIPELINE,
+            full_document="updateLookup",
+            resume_after=self._resume_after(resume_token),
+        ) as stream:
+            async for event in stream:
+                change = self._to_change(event)
+                if change is not None:
+                    yield change
+
+    async def changes_since(self, token: str, limit: int) -> list[ReviewChange] | None:
+        """Read up to limit changes already recorded after token.
+
+        Returns None when token is malformed or has left the oplog.
+        """
+        collection = ReviewDocument.get_pymongo_collection()
+        changes: list[ReviewChange] = []
+        try:
+            async with await collection.watch(
+                _CHANGE_PIPELINE,
+                full_document="updateLookup",
+                resume_after=self._resume_after(token),
+            ) as stream:
+                while len(changes) < limit:
+                    event = await stream.try_next()
+                    if event is None:
+                        break
+                    change = self._to_change(event)
+                    if change is not None:
+                        changes.append(change)
+        except OperationFailure:
+            return None
+        return changes
+
+    @staticmethod
+    def _resume_after(token: str | None) -> Mapping[str, Any] | None:
+        return {"_data": token} if token is not None else None
+
+    @staticmethod
+    def _to_change(event: Mapping[str, Any]) -> ReviewChange | None:
+        document = event.get("fullDocument")
+        if document is None:
+            # Deleted again before the post-image was looked up
+            return None
+        review = ReviewMapper.to_entity(ReviewDocument.model_validate(document))
+        return ReviewChange(token=event["_id"]["_data"], review=review)
@@ -1,12 +1,41 @@
+from collections.abc import AsyncGenerator
 from uuid import UUID
 
 from beanie import PydanticObjectId, SortDirection
+from beanie.odm.utils.projection import get_projection
+from bson import Binary
+from pymongo.errors import DuplicateKeyError
 
-from app.domain.reviews.entities.review import Review
+from app.domain.reviews.entities.review import Review, ReviewStatus
+from app.domain.reviews.value_objects.review_summary import ReviewSummary
+from app.domain.shared.exceptions import (
+    AnonymousFieldImmutableException,
+    InvalidCursorException,
+)
+from app.domain.shared.pagination import KeysetCursor, ListVersion
 from app.infrastructure.reviews.database.mappers.review_mapper import ReviewMapper
 from app.infrastructure.reviews.database.models.review_model import ReviewDocument
-from app.infrastructure.shared.database.constants import CASE_INSENSITIVE
-from app.infrastructure.shared.database.repositories.base_repository import BaseRepository
+from app.infrastructure.reviews.database.models.review_projections import (
+    ReviewSummaryView,
+)
+from app.infrastructure.shared.database.mappers.base_mapper import normalize_username
+from app.infrastructure.shared.database.repositories.base_repository import (
+    BaseRepository,
+    username_filter,
+)
+
+_PROFILE_ORDER = [
+    ("created_at", SortDirection.DESCENDING),
+    ("_id", SortDirection.DESCENDING),
+]
+_FEED_ORDER = [
+    ("updated_at", SortDirection.DESCENDING),
+    ("_id", SortDirection.DESCENDING),
+]
+
+
+def _username_keys(usernames: list[str]) -> list[str]:
+    return [normalize_username(username) for username in usernames]
 
 
 class MongoDBReviewRepository(BaseRepository[Review, ReviewDocument]):
@@ -20,19 +49,49 @@ class MongoDBReviewRepository(BaseRepository[Review, ReviewDocument]):
         document = await ReviewDocument.get(PydanticObjectId(review_id))
         if document is None:
             return None
-        return ReviewMapper.to_entity(document)
+        return self._track(document)
 
     async def get_by_reviewer_and_username(
         self, reviewer_uuid: UUID, reviewed_username: str
     ) -> Review | None:
         """Find a review by reviewer UUID and reviewed username (case-insensitive)."""
         document = await ReviewDocument.find_one(
-            {"reviewer_uuid": reviewer_uuid, "reviewed_username": reviewed_username},
-            collation=CASE_INSENSITIVE,
+            {
+                "reviewer_uuid": reviewer_uuid,
+                "reviewed_username_lc": normalize_username(reviewed_username),
+            }
         )
         if document is None:
             return None
-        return ReviewMapper.to_entity(document)
+        return self._track(document)
+
+    async def upsert(self, review: Review) -> tuple[Review, Review | None]:
+        """Create a review, or update the reviewer's review of the same username.
+
+        One atomic round trip: an existing review (case-insensitive) gets the
+        new status, comment and updated_at. Returns the stored review and the
+        one it replaced, which is None when the review was created.
+        """
+        username_match = username_filter(
+            "reviewed_username_lc", "reviewed_username", review.reviewed_username
+        )
+        reviewer_match = {"reviewer_uuid": Binary.from_uuid(review.reviewer_uuid)}
+        query = {**reviewer_match, **username_match, "anonymous": review.anonymous}
+        try:
+            return await self.upsert_one(
+                query,
+                review,
+                # The key is set on a legacy review matched without it
+                update_fields=("status", "comment", "updated_at", "reviewed_username_lc"),
+            )
+        except DuplicateKeyError:
+            existing = await ReviewDocument.get_pymongo_collection().find_one(
+                {**reviewer_match, **username_match},
+                projection={"anonymous": 1},
+            )
+            if existing is not None and existing["anonymous"] != review.anonymous:
+                raise AnonymousFieldImmutableException() from None
+            raise
 
     async def get_all_for_username(
         self,
@@ -40,23 +99,172 @@ class MongoDBReviewRepository(BaseRepository[Review, ReviewDocument]):
         limit: int = 100,
         offset: int = 0,
         status: str | None = None,
+        since: KeysetCursor | None = None,
+        after: KeysetCursor | None = None,
+        reviewer_uuid: UUID | None = None,
+        raw: bool = False,
     ) -> list[Review]:
-        """Find all reviews for a username (case-insensitive), ordered by created_at."""
-        query: dict = {"reviewed_username": reviewed_username}
+        """Find all reviews for a username (case-insensitive), newest created first.
+
+        Served by the (reviewed_username_lc[, status], created_at, _id)
+        indexes; with ``after`` the scan starts at the cursor, so every page
+        costs the same however deep it is. With ``reviewer_uuid`` the
+        (reviewer_uuid, reviewed_username_lc) index bounds the scan instead.
+        With ``raw`` the rows skip Document validation (see ``find_raw``).
+        """
+        query: dict = {"reviewed_username_lc": normalize_username(reviewed_username)}
+        if reviewer_uuid is not None:
+            query["reviewer_uuid"] = reviewer_uuid
         if status is not None:
             query["status"] = status
+        conditions = [query]
+        if after is not None:
+            conditions.append(self._before_position(after, "created_at"))
+        if since is not None:
+            conditions.append(self._since_position(since))
+        if len(conditions) > 1:
+            query = {"$and": conditions}
+        if raw:
+            rows = await self.find_raw(
+                query, sort=_PROFILE_ORDER, skip=offset, limit=limit
+            )
+            return [ReviewMapper.from_raw(row) for row in rows]
         documents = (
-            await ReviewDocument.find(
+            await ReviewDocument.find(query)
+            .sort(_PROFILE_ORDER)
+            .skip(offset)
+            .limit(limit)
+            .to_list()
+        )
+        return [ReviewMapper.to_entity(doc) for doc in documents]
+
+    async def get_summaries_for_username(
+        self,
+        reviewed_username: str,
+        limit: int = 100,
+        reviewer_uuid: UUID | None = None,
+        raw: bool = False,
+    ) -> list[ReviewSummary]:
+        """Find review summaries for a username (case-insensitive), newest first.
+
+        Same order and indexes as get_all_for_username, but only the summary
+        fields are read, so comments are never sent or validated. With
+        ``raw`` the rows skip projection model validation too.
+        """
+        query: dict = {"reviewed_username_lc": normalize_username(reviewed_username)}
+        if reviewer_uuid is not None:
+            query["reviewer_uuid"] = reviewer_uuid
+        if raw:
+            rows = await self.find_raw(
                 query,
-                collation=CASE_INSENSITIVE,
+                sort=_PROFILE_ORDER,
+                limit=limit,
+                projection=get_projection(ReviewSummaryView),
             )
-            .sort([("created_at", SortDirection.DESCENDING)])
+            return [ReviewMapper.summary_from_raw(row) for row in rows]
+        views = (
+            await ReviewDocument.find(query)
+            .sort(_PROFILE_ORDER)
+            .limit(limit)
+            .project(ReviewSummaryView)
+            .to_list()
+        )
+        return [ReviewMapper.to_summary(view) for view in views]
+
+    async def get_feed(
+        self,
+        usernames: list[str],
+        limit: int,
+        offset: int = 0,
+        draft_usernames: list[str] | None = None,
+        viewer_uuid: UUID | None = None,
+        after: KeysetCursor | None = None,
+        since: KeysetCursor | None = None,
+        raw: bool = False,
+    ) -> list[Review]:
+        """Find reviews for usernames (case-insensitive), newest update first.
+
+        Served by the (reviewed_username_lc, updated_at, _id) index:
+        each ``$in`` branch is an index range already in feed order, so
+        MongoDB merges them and stops after offset + limit documents. With
+        ``after`` the ranges start at the cursor, so every page costs the same;
+        ``since`` ends them at the client's newest known update. With ``raw``
+        the rows skip Document validation (see ``find_raw``).
+        """
+        query = self._feed_query(usernames, draft_usernames, viewer_uuid)
+        if query is None:
+            return []
+        conditions = [query]
+        if after is not None:
+            conditions.append(self._before_position(after))
+        if since is not None:
+            conditions.append(self._since_position(since))
+        if len(conditions) > 1:
+            query = {"$and": conditions}
+        if raw:
+            rows = await self.find_raw(query, sort=_FEED_ORDER, skip=offset, limit=limit)
+            return [ReviewMapper.from_raw(row) for row in rows]
+        documents = (
+            await ReviewDocument.find(query)
+            .sort(_FEED_ORDER)
             .skip(offset)
             .limit(limit)
             .to_list()
         )
         return [ReviewMapper.to_entity(doc) for doc in documents]
 
+    async def get_feed_version(
+        self,
+        usernames: list[str],
+        draft_usernames: list[str] | None = None,
+        viewer_uuid: UUID | None = None,
+        status: str | None = None,
+    ) -> ListVersion:
+        """Count the reviews get_feed covers and find the newest, without loading them.
+
+        Both are answered from the (reviewed_username_lc, updated_at, _id) index.
+        """
+        query = self._feed_query(usernames, draft_usernames, viewer_uuid)
+        if query is None:
+            return ListVersion(count=0, newest=None)
+        if status is not None:
+            query = {"$and": [query, {"status": status}]}
+        count = await ReviewDocument.find(query).count()
+        newest = await ReviewDocument.find(query).sort(_FEED_ORDER).limit(1).to_list()
+        if not newest:
+            return ListVersion(count=count, newest=None)
+        return ListVersion(
+            count=count,
+            newest=KeysetCursor(sort_value=newest[0].updated_at, id=str(newest[0].id)),
+        )
+
+    async def stream_feed_for_username(
+        self,
+        username: str,
+        limit: int,
+        after: KeysetCursor | None = None,
+        reviewer_uuid: UUID | None = None,
+        batch_size: int | None = None,
+    ) -> AsyncGenerator[Review, None]:
+        """Stream one username's reviews (case-insensitive) in feed order.
+
+        Walks the same (reviewed_username_lc, updated_at, _id) index as get_feed,
+        fetching batch_size documents per round trip as the stream is consumed.
+        """
+        query: dict = {"reviewed_username_lc": normalize_username(username)}
+        if reviewer_uuid is not None:
+            query["reviewer_uuid"] = reviewer_uuid
+        if after is not None:
+            query = {"$and": [query, self._before_position(after)]}
+        documents = (
+            # batch_size 0 leaves batching to the server
+            ReviewDocument.find(query, batch_size=batch_size or 0)
+            .sort(_FEED_ORDER)
+            .limit(limit)
+        )
+        async for document in documents:
+            yield ReviewMapper.to_entity(document)
+
     async def get_all_by_reviewer_uuid(
         self, reviewer_uuid: UUID, limit: int = 100, offset: int = 0
     ) -> list[Review]:
@@ -70,34 +278,98 @@ class MongoDBReviewRepository(BaseRepository[Review, ReviewDocument]):
         )
         return [ReviewMapper.to_entity(doc) for doc in documents]
 
-    async def get_review_count_for_username(self, reviewed_username: str) -> int:
-        """Get review count for a given username (case-insensitive)."""
-        collection = ReviewDocument.get_pymongo_collection()
-        return await collection.count_documents(
-            {"reviewed_username": reviewed_username},
-            collation=CASE_INSENSITIVE,
-        )
-
     async def get_review_counts_for_usernames(
         self, usernames: list[str]
     ) -> dict[str, int]:
-        """Get review counts for multiple usernames at once (case-insensitive)."""
+        """Count reviews per username, keyed by lowercased username."""
+        keys = list({normalize_username(username) for username in usernames})
+        if not keys:
+            return {}
         pipeline = [
-            {"$match": {"reviewed_username": {"$in": usernames}}},
-            {"$group": {"_id": "$reviewed_username", "count": {"$sum": 1}}},
+            {"$match": {"reviewed_username_lc": {"$in": keys}}},
+            {"$group": {"_id": "$reviewed_username_lc", "count": {"$sum": 1}}},
         ]
-        results = await ReviewDocument.aggregate(
-            pipeline, collation=CASE_INSENSITIVE
-        ).to_list()
+        results = await ReviewDocument.aggregate(pipeline).to_list()
         return {item["_id"]: item["count"] for item in results}
 
-    async def delete(self, review_id: str) -> None:
-        """Delete a review by ID."""
-        document = await ReviewDocument.get(PydanticObjectId(review_id))
-        if document:
-            await document.delete()
+    async def get_status_counts_by_reviewer_uuid(
+        self, reviewer_uuid: UUID
+    ) -> dict[str, dict[ReviewStatus, int]]:
+        """Count a reviewer's reviews per lowercased reviewed username and status."""
+        pipeline = [
+            {"$match": {"reviewer_uuid": reviewer_uuid}},
+            {
+                "$group": {
+                    "_id": {
+                        "username": "$reviewed_username_lc",
+                        "status": "$status",
+                    },
+                    "count": {"$sum": 1},
+                }
+            },
+        ]
+        results = await ReviewDocument.aggregate(pipeline).to_list()
+        counts: dict[str, dict[ReviewStatus, int]] = {}
+        for item in results:
+            group = item["_id"]
+            status = ReviewStatus(group["status"])
+            counts.setdefault(group["username"], {})[status] = item["count"]
+        return counts
+
+    async def delete(self, review_id: str) -> bool:
+        """Delete a review by ID. Returns whether a review was deleted."""
+        collection = ReviewDocument.get_pymongo_collection()
+        result = await collection.delete_one({"_id": PydanticObjectId(review_id)})
+        return result.deleted_count == 1
 
     async def delete_all_by_reviewer_uuid(self, reviewer_uuid: UUID) -> int:
         """Delete all reviews made by a given reviewer. Returns count deleted."""
         result = await ReviewDocument.find({"reviewer_uuid": reviewer_uuid}).delete()
         return result.deleted_count if result else 0
+
+    @staticmethod
+    def _feed_query(
+        usernames: list[str],
+        draft_usernames: list[str] | None,
+        viewer_uuid: UUID | None,
+    ) -> dict | None:
+        """Filter for a feed's reviews, or None when it covers no usernames."""
+        branches: list[dict] = []
+        if usernames:
+            branches.append({"reviewed_username_lc": {"$in": _username_keys(usernames)}})
+        if draft_usernames and viewer_uuid is not None:
+            branches.append(
+                {
+                    "reviewed_username_lc": {"$in": _username_keys(draft_usernames)},
+                    "reviewer_uuid": viewer_uuid,
+                }
+            )
+        if not branches:
+            return None
+        return branches[0] if len(branches) == 1 else {"$or": branches}
+
+    @staticmethod
+    def _before_position(cursor: KeysetCursor, field: str = "updated_at") -> dict:
+        """Filter for documents after a cursor in (field, _id) desc order."""
+        if not PydanticObjectId.is_valid(cursor.id):
+            raise InvalidCursorException()
+        cursor_id = PydanticObjectId(cursor.id)
+        return {
+            "$or": [
+                {field: {"$lt": cursor.sort_value}},
+                {field: cursor.sort_value, "_id": {"$lt": cursor_id}},
+            ]
+        }
+
+    @staticmethod
+    def _since_position(cursor: KeysetCursor) -> dict:
+        """Filter for documents updated after a cursor's (updated_at, _id)."""
+        if not PydanticObjectId.is_valid(cursor.id):
+            raise InvalidCursorException()
+        cursor_id = PydanticObjectId(cursor.id)
+        return {
+            "$or": [
+                {"updated_at": {"$gt": cursor.sort_value}},
+                {"updated_at": cursor.sort_value, "_id": {"$gt": cursor_id}},
+            ]
+        }
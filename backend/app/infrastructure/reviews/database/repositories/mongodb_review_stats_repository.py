@@ -0,0 +1,105 @@
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from typing import ClassVar
+
+from pymongo import UpdateOne
+
+from app.domain.reviews.entities.review import ReviewStatus
+from app.domain.reviews.entities.review_stats import ReviewStats
+from app.infrastructure.reviews.database.mappers.review_stats_mapper import (
+    ReviewStatsMapper,
+)
+from app.infrastructure.reviews.database.models.review_model import ReviewDocument
+from app.infrastructure.reviews.database.models.review_stats_model import (
+    ReviewStatsDocument,
+)
+from app.infrastructure.shared.database.mappers.base_mapper import normalize_username
+from app.infrastructure.shared.database.models.migration_model import (
+    MigrationDocument,
+)
+
+REVIEW_STATS_MIGRATION_ID = "review_stats"
+
+
+class MongoDBReviewStatsRepository:
+    """MongoDB implementation of IReviewStatsRepository interface."""
+
+    # A completed build never becomes incomplete, so it is looked up until seen
+    _built: ClassVar[bool] = False
+
+    async def get_by_usernames(self, usernames: list[str]) -> dict[str, ReviewStats]:
+        """Get stats for usernames with one point lookup on the username index."""
+        keys = list({normalize_username(username) for username in usernames})
+        if not keys:
+            return {}
+        documents = await ReviewStatsDocument.find({"username": {"$in": keys}}).to_list()
+        return {doc.username: ReviewStatsMapper.to_entity(doc) for doc in documents}
+
+    async def increment(self, deltas: Mapping[str, Mapping[ReviewStatus, int]]) -> None:
+        """Apply per-status deltas with one upserting ``$inc`` per profile."""
+        operations = []
+        for username, status_deltas in deltas.items():
+            inc = {
+                status.value: delta for status, delta in status_deltas.items() if delta
+            }
+            if not inc:
+                continue
+            inc["total"] = sum(inc.values())
+            key = normalize_username(username)
+            operations.append(UpdateOne({"username": key}, {"$inc": inc}, upsert=True))
+        if operations:
+            collection = ReviewStatsDocument.get_pymongo_collection()
+            await collection.bulk_write(operations, ordered=False)
+
+    async def rebuild(self) -> int:
+        """Recount all stats from reviews and swap them in with ``$out``.
+
+        ``$out`` replaces the collection atomically and keeps its indexes, but
+        increments applied while the aggregation runs are lost, so run this
+        when review writes are quiet. Completion is recorded in the
+        migrations collection.
+        """
+        pipeline = [
+            {
+                "$group": {
+                    "_id": {
+                        "username": "$reviewed_username_lc",
+                        "status": "$status",
+                    },
+                    "count": {"$sum": 1},
+                }
+            },
+            {
+                "$group": {
+                    "_id": "$_id.username",
+                    "total": {"$sum": "$count"},
+                    "counts": {"$push": {"k": "$_id.status", "v": "$count"}},
+                }
+            },
+            {
+                "$replaceWith": {
+                    "$mergeObjects": [
+                        {"username": "$_id", "total": "$total"},
+                        {status.value: 0 for status in ReviewStatus},
+                        {"$arrayToObject": "$counts"},
+                    ]
+                }
+            },
+            {"$out": ReviewStatsDocument.get_collection_name()},
+        ]
+        await ReviewDocument.aggregate(pipeline).to_list()
+        await MigrationDocument.get_pymongo_collection().update_one(
+            {"_id": REVIEW_STATS_MIGRATION_ID},
+            {"$set": {"updated_at": datetime.now(timezone.utc)}},
+            upsert=True,
+        )
+        return await ReviewStatsDocument.count()
+
+    async def is_built(self) -> bool:
+        """Check whether a rebuild has completed (remembered once it has)."""
+        if not MongoDBReviewStatsRepository._built:
+            MongoDBReviewStatsRepository._built = (
+                await MigrationDocument.find_one({"_id": REVIEW_STATS_MIGRATION_ID})
+                is not None
+            )
+        return MongoDBReviewStatsRepository._built
@@ -0,0 +1,35 @@
+import asyncio
+import logging
+from collections.abc import Coroutine
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Strong references keep fire-and-forget tasks alive until they finish.
+_background_tasks: set[asyncio.Task[Any]] = set()
+
+
+def spawn_background(coro: Coroutine[Any, Any, Any], name: str) -> asyncio.Task[Any]:
+    """Run a coroutine detached from the current request, logging failures."""
+    task = asyncio.ensure_future(coro)
+    task.set_name(name)
+    _background_tasks.add(task)
+    task.add_done_callback(_on_done)
+    return task
+
+
+async def cancel_background_tasks() -> None:
+    """Cancel and await outstanding background tasks (used on shutdown)."""
+    tasks = list(_background_tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _on_done(task: asyncio.Task[Any]) -> None:
+    _background_tasks.discard(task)
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.error("Background task %s failed", task.get_name(), exc_info=exc)
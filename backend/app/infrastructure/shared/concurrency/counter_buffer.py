@@ -0,0 +1,29 @@
+from collections import Counter
+from collections.abc import Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class CounterBuffer(Generic[K]):
+    """In-process counts per key, accumulated until drained.
+
+    Lets a hot path count events without a write each; a periodic job drains
+    the totals and persists them in one batch. Counts not yet drained are
+    lost if the process exits, so it only suits approximate counters.
+    """
+
+    def __init__(self) -> None:
+        self._counts: Counter[K] = Counter()
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def add(self, key: K, amount: int = 1) -> None:
+        """Count amount more for key."""
+        self._counts[key] += amount
+
+    def drain(self) -> dict[K, int]:
+        """Take the counts accumulated so far and start again from zero."""
+        counts, self._counts = self._counts, Counter()
+        return dict(counts)
@@ -0,0 +1,38 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Coalesce concurrent calls for the same key into one in-process execution.
+
+    The first caller starts the work as a task; callers arriving while it is
+    in flight await the same task and share its result or exception. The
+    task is shielded, so a cancelled caller does not cancel the others.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: dict[str, asyncio.Task[T]] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """Number of keys currently being executed."""
+        return len(self._in_flight)
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run fn for key, or join the execution already in flight."""
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task[T]) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every caller went away.
+            task.exception()
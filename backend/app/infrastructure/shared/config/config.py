@@ -38,6 +38,53 @@ class Settings(BaseSettings):
     GITHUB_CLIENT_ID: str | None = None
     GITHUB_CLIENT_SECRET: str | None = None
     SSO_CALLBACK_HOSTNAME: str | None = None
+    GITHUB_HTTP2_ENABLED: bool = True
+    GITHUB_HTTP_MAX_CONNECTIONS: int = 100
+    GITHUB_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    GITHUB_HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    GITHUB_RATE_LIMIT_MAX_CONCURRENCY_PER_TOKEN: int = 8
+    GITHUB_RATE_LIMIT_BACKGROUND_RESERVE_RATIO: float = 0.2
+    # Coalesce profile fetches across workers with a Mongo lease
+    GITHUB_USER_FETCH_LEASE_ENABLED: bool = False
+    GITHUB_USER_FETCH_LEASE_SECONDS: float = 10.0
+    # Routes serving expired profiles while refreshing in the background,
+    # mapped to the hard max staleness (days) after which they block instead
+    USER_CACHE_SWR_MAX_STALENESS_DAYS: dict[str, int] = {"get_user": 30}
+    # Process-wide cache of /users/search results, shared across accounts
+    USER_SEARCH_CACHE_TTL_SECONDS: float = 300.0
+    USER_SEARCH_CACHE_MAX_ENTRIES: int = 1000
+    # Stored GitHub following graphs used for suggestions
+    FOLLOWING_SYNC_INTERVAL_MINUTES: int = 360
+    FOLLOWING_SYNC_MAX_PAGES: int = 50
+    # How long a first suggestions request waits for the initial sync
+    FOLLOWING_SYNC_WAIT_SECONDS: float = 3.0
+    # Background refresh of cached profiles nearing expiry, run with the
+    # GitHub token of PROFILE_REFRESH_ACCOUNT_USERNAME
+    PROFILE_REFRESH_ENABLED: bool = False
+    PROFILE_REFRESH_ACCOUNT_USERNAME: str = ""
+    PROFILE_REFRESH_INTERVAL_SECONDS: float = 300.0
+    PROFILE_REFRESH_LEAD_HOURS: int = 24
+    PROFILE_REFRESH_BUDGET_PER_CYCLE: int = 500
+    PROFILE_REFRESH_BATCH_SIZE: int = 100
+    PROFILE_REFRESH_CONCURRENCY: int = 2
+    # Build computed feeds by lazily merging one cursor per watched profile
+    # instead of a single $in query
+    ACTIVITY_FEED_MERGE_STREAMS: bool = False
+    # Fan-out-on-write activity feed timelines (feeds are computed on read when
+    # disabled); profiles with more watchers than the limit are merged on read
+    ACTIVITY_FEED_TIMELINES_ENABLED: bool = False
+    ACTIVITY_FEED_TIMELINE_MAX_ENTRIES: int = 1000
+    ACTIVITY_FEED_FANOUT_MAX_WATCHERS: int = 5000
+    # Push review writes to SSE clients from one change stream per worker
+    # (needs a replica set); recent changes are kept for reconnecting clients
+    REVIEW_CHANGE_STREAM_ENABLED: bool = False
+    REVIEW_CHANGE_STREAM_REPLAY_SIZE: int = 1000
+    REVIEW_CHANGE_STREAM_QUEUE_SIZE: int = 100
+    REVIEW_CHANGE_STREAM_HEARTBEAT_SECONDS: float = 15.0
+    # Upserts also match the legacy username fields of documents an older app
+    # version wrote without their *_lc key. That branch is unindexed, so only
+    # enable it for a rollout window with older versions still running
+    USERNAME_KEY_LEGACY_FALLBACK: bool = False
     MODERATOR_USERNAMES: set[str] = set()
     POSTHOG_HOST: str = "https://us.i.posthog.com"
     POSTHOG_API_KEY: str | None = None
@@ -2,8 +2,22 @@ from beanie import init_beanie
 from pymongo import AsyncMongoClient
 
 from app.infrastructure.accounts.database.models.account_model import AccountDocument
+from app.infrastructure.following.database.models.following_graph_model import (
+    FollowingGraphDocument,
+)
 from app.infrastructure.reviews.database.models.review_model import ReviewDocument
+from app.infrastructure.reviews.database.models.review_stats_model import (
+    ReviewStatsDocument,
+)
 from app.infrastructure.shared.config.config import settings
+from app.infrastructure.shared.database.models.lease_model import LeaseDocument
+from app.infrastructure.shared.database.models.migration_model import (
+    MigrationDocument,
+)
+from app.infrastructure.timeline.database.models.timeline_entry_model import (
+    TimelineEntryDocument,
+    TimelineFanoutSkipDocument,
+)
 from app.infrastructure.users.database.models.user_model import UserDocument
 from app.infrastructure.watchlist.database.models.watch_model import (
     WatchDocument,
@@ -17,7 +31,13 @@ async def init_database(client: AsyncMongoClient) -> None:
         document_models=[
             AccountDocument,
             ReviewDocument,
+            ReviewStatsDocument,
             WatchDocument,
             UserDocument,
+            LeaseDocument,
+            MigrationDocument,
+            FollowingGraphDocument,
+            TimelineEntryDocument,
+            TimelineFanoutSkipDocument,
         ],
     )
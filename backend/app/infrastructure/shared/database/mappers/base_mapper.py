@@ -1,5 +1,10 @@
+import sys
+from typing import TypeVar
+
 from beanie import PydanticObjectId
 
+TStr = TypeVar("TStr", str, str | None)
+
 
 def document_id_to_str(document: object) -> str | None:
     """Convert a Beanie document's ObjectId to a string."""
@@ -9,3 +14,21 @@ def document_id_to_str(document: object) -> str | None:
 def str_to_document_id(id_str: str | None) -> PydanticObjectId | None:
     """Convert a string ID to a PydanticObjectId."""
     return PydanticObjectId(id_str) if id_str else None
+
+
+def normalize_username(username: str) -> str:
+    """Normalize a username for the stored ``*_lc`` lookup keys.
+
+    GitHub logins are ASCII, so this matches both the ``CASE_INSENSITIVE``
+    collation and MongoDB's ``$toLower`` used by the backfill.
+    """
+    return username.lower()
+
+
+def intern_str(value: TStr) -> TStr:
+    """Intern a low-cardinality string, such as a reviewed username in a feed.
+
+    Rows decoded from one query each carry their own copy of a repeated
+    value; interning makes the entities share a single string.
+    """
+    return sys.intern(value) if value else value
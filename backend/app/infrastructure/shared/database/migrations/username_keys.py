@@ -0,0 +1,122 @@
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from beanie import Document
+from pymongo.errors import DuplicateKeyError
+
+from app.infrastructure.accounts.database.models.account_model import AccountDocument
+from app.infrastructure.reviews.database.models.review_model import ReviewDocument
+from app.infrastructure.shared.database.models.migration_model import (
+    MigrationDocument,
+)
+from app.infrastructure.timeline.database.models.timeline_entry_model import (
+    TimelineEntryDocument,
+    TimelineFanoutSkipDocument,
+)
+from app.infrastructure.users.database.models.user_model import UserDocument
+from app.infrastructure.watchlist.database.models.watch_model import WatchDocument
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LowercaseKey:
+    """A stored lowercase copy of a document's username field."""
+
+    document_class: type[Document]
+    source: str
+    target: str
+
+    @property
+    def migration_id(self) -> str:
+        collection = self.document_class.get_collection_name()
+        return f"lowercase_key:{collection}.{self.target}"
+
+
+USERNAME_KEYS = (
+    LowercaseKey(AccountDocument, "username", "username_lc"),
+    LowercaseKey(UserDocument, "username", "username_lc"),
+    LowercaseKey(ReviewDocument, "reviewed_username", "reviewed_username_lc"),
+    LowercaseKey(WatchDocument, "watched_username", "watched_username_lc"),
+    LowercaseKey(
+        TimelineEntryDocument, "review.reviewed_username", "review.reviewed_username_lc"
+    ),
+    LowercaseKey(TimelineFanoutSkipDocument, "username", "username_lc"),
+)
+
+
+async def backfill_lowercase_key(key: LowercaseKey, batch_size: int = 1000) -> int:
+    """Set key.target from key.source on every document that lacks it.
+
+    Selects documents by the missing key rather than resuming from an _id
+    checkpoint, since ObjectIds from different processes are not ordered
+    and a document inserted during a rollout could land behind it. Each
+    batch is one idempotent pipeline update, so the backfill runs alongside
+    live traffic. A document whose key would duplicate another's (an
+    existing case-variant duplicate) is logged and left without the key.
+    The run's outcome is recorded in the migrations collection. Returns
+    the number of documents changed.
+    """
+    collection = key.document_class.get_pymongo_collection()
+    missing = {key.target: {"$exists": False}}
+    changed = 0
+    skipped = 0
+    cursor = collection.find(missing, projection={"_id": 1}, batch_size=batch_size)
+    ids: list[Any] = []
+    async for document in cursor:
+        ids.append(document["_id"])
+        if len(ids) == batch_size:
+            batch_changed, batch_skipped = await _set_key(key, ids)
+            changed, skipped = changed + batch_changed, skipped + batch_skipped
+            ids = []
+    if ids:
+        batch_changed, batch_skipped = await _set_key(key, ids)
+        changed, skipped = changed + batch_changed, skipped + batch_skipped
+
+    await MigrationDocument.get_pymongo_collection().update_one(
+        {"_id": key.migration_id},
+        {"$set": {"skipped": skipped, "updated_at": datetime.now(timezone.utc)}},
+        upsert=True,
+    )
+    return changed
+
+
+async def _set_key(key: LowercaseKey, ids: list[Any]) -> tuple[int, int]:
+    """Set the key on a batch of documents. Returns (changed, skipped)."""
+    collection = key.document_class.get_pymongo_collection()
+    update = [{"$set": {key.target: {"$toLower": f"${key.source}"}}}]
+    missing = {key.target: {"$exists": False}}
+    try:
+        result = await collection.update_many({"_id": {"$in": ids}, **missing}, update)
+        return result.modified_count, 0
+    except DuplicateKeyError:
+        pass
+    # Some document collides on the unique key: retry one by one to skip it.
+    changed = 0
+    skipped = 0
+    for document_id in ids:
+        try:
+            result = await collection.update_one({"_id": document_id, **missing}, update)
+            changed += result.modified_count
+        except DuplicateKeyError:
+            skipped += 1
+            document = await collection.find_one(
+                {"_id": document_id}, projection={key.source: 1}
+            )
+            logger.warning(
+                "Skipped %s backfill of %s %r: its key duplicates another document",
+                key.migration_id,
+                document_id,
+                document.get(key.source) if document else None,
+            )
+    return changed, skipped
+
+
+async def backfill_username_keys(batch_size: int = 1000) -> dict[str, int]:
+    """Backfill every ``*_lc`` username key. Returns changes per migration."""
+    return {
+        key.migration_id: await backfill_lowercase_key(key, batch_size)
+        for key in USERNAME_KEYS
+    }
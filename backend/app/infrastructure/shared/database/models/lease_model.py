@@ -0,0 +1,19 @@
+from datetime import datetime
+
+from beanie import Document
+from pymongo import IndexModel
+
+
+class LeaseDocument(Document):
+    """MongoDB document model for a short-lived lease (infrastructure layer)."""
+
+    id: str  # type: ignore[assignment]
+    owner: str
+    expires_at: datetime
+
+    class Settings:
+        name = "leases"
+        indexes = [
+            # Expired leases are removed by MongoDB's TTL monitor.
+            IndexModel([("expires_at", 1)], expireAfterSeconds=0),
+        ]
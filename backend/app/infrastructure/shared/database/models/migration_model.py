@@ -0,0 +1,15 @@
+from datetime import datetime
+
+from beanie import Document
+
+
+class MigrationDocument(Document):
+    """MongoDB document model for the outcome of a data migration's last run."""
+
+    id: str  # type: ignore[assignment]
+    # Documents the last run could not migrate and left as they were
+    skipped: int = 0
+    updated_at: datetime
+
+    class Settings:
+        name = "migrations"
@@ -1,36 +1,94 @@
-from typing import Any, Generic, TypeVar
+from collections import OrderedDict
+from collections.abc import Collection, Mapping, Sequence
+from typing import Any, ClassVar, Generic, TypeVar
 
 from beanie import Document, PydanticObjectId
+from beanie.odm.utils.dump import get_dict
+from bson import CodecOptions, UuidRepresentation
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from app.infrastructure.shared.config.config import settings
+from app.infrastructure.shared.database.mappers.base_mapper import normalize_username
 
 TEntity = TypeVar("TEntity")
 TDocument = TypeVar("TDocument", bound=Document)
 
+# Loaded document states remembered per repository instance for dirty tracking
+_TRACKED_LIMIT = 1000
+
+# Raw reads decode UUIDs (stored as standard binary) straight to uuid.UUID
+_RAW_CODEC_OPTIONS: CodecOptions = CodecOptions(
+    uuid_representation=UuidRepresentation.STANDARD
+)
+
+
+def username_filter(key_field: str, legacy_field: str, username: str) -> dict[str, Any]:
+    """Filter matching a username on its stored ``*_lc`` key.
+
+    With USERNAME_KEY_LEGACY_FALLBACK, documents still missing the key also
+    match on the legacy field, in a second uncollated branch. That branch
+    has no index, so the fallback is only for a rollout window.
+    """
+    key = normalize_username(username)
+    key_match = {key_field: key}
+    if not settings.USERNAME_KEY_LEGACY_FALLBACK:
+        return key_match
+    legacy_match = {
+        key_field: {"$exists": False},
+        legacy_field: {"$in": list(dict.fromkeys([username, key]))},
+    }
+    return {"$or": [key_match, legacy_match]}
+
 
 class BaseRepository(Generic[TEntity, TDocument]):
-    """Base repository with shared CRUD operations."""
+    """Base repository with shared CRUD operations.
+
+    Writes are single round trips: ``update`` and ``upsert_one`` send partial
+    ``$set``/``$setOnInsert`` updates instead of reading and replacing the
+    document. Entities loaded through ``_track`` remember their loaded state,
+    so a later ``update`` writes only the fields that changed.
+
+    Hot list reads can take the ``find_raw`` fast path, which reads rows
+    through the driver and leaves decoding to the mapper's ``from_raw``,
+    skipping the per-row Document validation.
+    """
 
     document_class: type[TDocument]
     mapper: Any
+    # Fields written when a document is inserted and never by update
+    insert_only_fields: ClassVar[frozenset[str]] = frozenset()
+
+    def __init__(self) -> None:
+        self._loaded: OrderedDict[str, dict[str, Any]] = OrderedDict()
 
     async def create(self, entity: TEntity) -> TEntity:
         """Create a new entity."""
         document = self.mapper.to_document(entity)
         created_document = await document.create()
-        return self.mapper.to_entity(created_document)
+        return self._track(created_document)
 
     async def update(self, entity: TEntity) -> TEntity:
-        """Update an existing entity."""
+        """Update an existing entity, writing only the fields that changed.
+
+        Entities not loaded through this repository have all their fields
+        written.
+        """
         entity_id = getattr(entity, "id", None)
         if entity_id is None:
             raise ValueError("Cannot update entity without an id")
 
-        document = await self.document_class.get(PydanticObjectId(entity_id))
-        if document is None:
+        changes = self._changes(entity_id, entity)
+        if not changes:
+            return entity
+        # The stored state is remembered only once the write succeeded
+        updated = await self.find_one_and_update(
+            {"_id": PydanticObjectId(entity_id)}, {"$set": changes}
+        )
+        if updated is None:
             raise ValueError(f"Document with id {entity_id} not found")
-
-        self.mapper.update_document_from_entity(document, entity)
-        await document.save()
-        return self.mapper.to_entity(document)
+        return updated
 
     async def save(self, entity: TEntity) -> TEntity:
         """Save an entity (create if new, update if exists)."""
@@ -38,3 +96,152 @@ class BaseRepository(Generic[TEntity, TDocument]):
             return await self.create(entity)
         else:
             return await self.update(entity)
+
+    async def find_one_and_update(
+        self,
+        query: Mapping[str, Any],
+        update: Mapping[str, Any],
+        upsert: bool = False,
+        return_before: bool = False,
+    ) -> TEntity | None:
+        """Atomically apply a raw update to one document and return it.
+
+        Returns the document as it is after the update, or as it was before
+        with ``return_before`` (None when the upsert inserted it).
+        """
+        collection = self.document_class.get_pymongo_collection()
+        raw = await collection.find_one_and_update(
+            query,
+            update,
+            upsert=upsert,
+            return_document=(
+                ReturnDocument.BEFORE if return_before else ReturnDocument.AFTER
+            ),
+        )
+        if raw is None:
+            return None
+        return self._track(self.document_class.model_validate(raw))
+
+    async def upsert_one(
+        self,
+        query: Mapping[str, Any],
+        entity: TEntity,
+        update_fields: Collection[str] | None = None,
+    ) -> tuple[TEntity, TEntity | None]:
+        """Atomically update the document matching query, or insert entity.
+
+        ``update_fields`` (by default every field but ``insert_only_fields``)
+        are ``$set`` either way; the rest only on insert. Returns the stored
+        entity and the one it replaced, which is None when it was inserted.
+        An insert that loses a race on a unique index is retried once, and
+        then matches the winner's document.
+        """
+        update = self._upsert_update(entity, update_fields)
+        updates = update.get("$set", {})
+        on_insert = update["$setOnInsert"]
+
+        collection = self.document_class.get_pymongo_collection()
+        try:
+            before = await collection.find_one_and_update(query, update, upsert=True)
+        except DuplicateKeyError:
+            before = await collection.find_one_and_update(query, update, upsert=True)
+        stored = {**(before or on_insert), **updates}
+        saved = self._track(self.document_class.model_validate(stored))
+        if before is None:
+            return saved, None
+        return saved, self.mapper.to_entity(self.document_class.model_validate(before))
+
+    async def bulk_upsert(
+        self, items: Sequence[tuple[Mapping[str, Any], TEntity]]
+    ) -> None:
+        """Upsert each (query, entity) pair like ``upsert_one``, in one bulk write.
+
+        Nothing is read back, so the stored entities are not returned. A
+        write that loses an insert race is retried once, as in ``upsert_one``;
+        the retry is idempotent for the operations that already applied.
+        """
+        if not items:
+            return
+        operations = [
+            UpdateOne(query, self._upsert_update(entity), upsert=True)
+            for query, entity in items
+        ]
+        collection = self.document_class.get_pymongo_collection()
+        try:
+            await collection.bulk_write(operations, ordered=False)
+        except BulkWriteError as error:
+            if any(e.get("code") != 11000 for e in error.details["writeErrors"]):
+                raise
+            await collection.bulk_write(operations, ordered=False)
+
+    async def find_raw(
+        self,
+        query: Mapping[str, Any],
+        sort: Sequence[tuple[str, int]] | None = None,
+        skip: int = 0,
+        limit: int = 0,
+        projection: Mapping[str, Any] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Read matching documents as raw dicts, without model validation.
+
+        Query values are encoded by the driver, so UUIDs may be passed as is.
+        """
+        cursor = self._raw_collection().find(
+            query, projection, sort=sort, skip=skip, limit=limit
+        )
+        return await cursor.to_list()
+
+    def _raw_collection(self) -> AsyncCollection:
+        return self.document_class.get_pymongo_collection().with_options(
+            codec_options=_RAW_CODEC_OPTIONS
+        )
+
+    def _track(self, document: TDocument) -> TEntity:
+        """Map a loaded document and remember its state for dirty tracking."""
+        self._remember(str(document.id), self._encode(document))
+        return self.mapper.to_entity(document)
+
+    def _remember(self, entity_id: str, fields: dict[str, Any]) -> None:
+        self._loaded[entity_id] = fields
+        self._loaded.move_to_end(entity_id)
+        if len(self._loaded) > _TRACKED_LIMIT:
+            self._loaded.popitem(last=False)
+
+    def _changes(self, entity_id: str, entity: TEntity) -> dict[str, Any]:
+        """Encoded fields of entity that differ from its loaded state."""
+        fields = self._fields(entity)
+        before = self._loaded.get(entity_id)
+        changes = {
+            name: value
+            for name, value in fields.items()
+            if before is None or name not in before or before[name] != value
+        }
+        for name in self.insert_only_fields:
+            changes.pop(name, None)
+        return changes
+
+    def _upsert_update(
+        self, entity: TEntity, update_fields: Collection[str] | None = None
+    ) -> dict[str, Any]:
+        """Build the ``$set``/``$setOnInsert`` update that upserts entity."""
+        fields = self._fields(entity)
+        if update_fields is None:
+            update_fields = [
+                name for name in fields if name not in self.insert_only_fields
+            ]
+        updates = {name: fields[name] for name in update_fields}
+        on_insert = {name: value for name, value in fields.items() if name not in updates}
+        # Chosen here so the inserted entity's id is known without a read
+        on_insert["_id"] = PydanticObjectId()
+        update: dict[str, Any] = {"$setOnInsert": on_insert}
+        if updates:
+            update["$set"] = updates
+        return update
+
+    def _fields(self, entity: TEntity) -> dict[str, Any]:
+        """Encode an entity's mapped document fields for a MongoDB update."""
+        return self._encode(self.mapper.to_document(entity))
+
+    @staticmethod
+    def _encode(document: Document) -> dict[str, Any]:
+        return get_dict(document, to_db=True, exclude={"_id"})
@@ -0,0 +1,43 @@
+from datetime import datetime, timedelta, timezone
+
+from pymongo.errors import DuplicateKeyError
+
+from app.infrastructure.shared.database.models.lease_model import LeaseDocument
+
+
+class MongoDBLeaseRepository:
+    """MongoDB implementation of ILeaseRepository interface."""
+
+    async def acquire(self, key: str, owner: str, ttl_seconds: float) -> bool:
+        """Take the lease if it is free or expired (single atomic upsert)."""
+        now = datetime.now(timezone.utc)
+        collection = LeaseDocument.get_pymongo_collection()
+        try:
+            await collection.update_one(
+                {"_id": key, "expires_at": {"$lte": now}},
+                {
+                    "$set": {
+                        "owner": owner,
+                        "expires_at": now + timedelta(seconds=ttl_seconds),
+                    }
+                },
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            # An unexpired lease exists, so the upsert tried to insert a duplicate _id.
+            return False
+        return True
+
+    async def release(self, key: str, owner: str) -> None:
+        """Release the lease if it is still held by owner."""
+        collection = LeaseDocument.get_pymongo_collection()
+        await collection.delete_one({"_id": key, "owner": owner})
+
+    async def is_held(self, key: str) -> bool:
+        """Check whether an unexpired lease exists for key."""
+        collection = LeaseDocument.get_pymongo_collection()
+        document = await collection.find_one(
+            {"_id": key, "expires_at": {"$gt": datetime.now(timezone.utc)}},
+            projection={"_id": 1},
+        )
+        return document is not None
@@ -0,0 +1,58 @@
+from app.domain.reviews.entities.review import Review
+from app.domain.timeline.entities.timeline_entry import TimelineEntry
+from app.infrastructure.shared.database.mappers.base_mapper import (
+    document_id_to_str,
+    normalize_username,
+    str_to_document_id,
+)
+from app.infrastructure.timeline.database.models.timeline_entry_model import (
+    TimelineEntryDocument,
+    TimelineReviewModel,
+)
+
+
+class TimelineEntryMapper:
+    """Mapper to convert between TimelineEntry entity and TimelineEntryDocument."""
+
+    @staticmethod
+    def to_entity(document: TimelineEntryDocument) -> TimelineEntry:
+        """Convert TimelineEntryDocument (MongoDB) to TimelineEntry entity (domain)."""
+        review = document.review
+        return TimelineEntry(
+            id=document_id_to_str(document),
+            owner_uuid=document.owner_uuid,
+            review=Review(
+                id=str(review.review_id),
+                reviewer_uuid=review.reviewer_uuid,
+                reviewed_username=review.reviewed_username,
+                status=review.status,
+                comment=review.comment,
+                anonymous=review.anonymous,
+                created_at=review.created_at,
+                updated_at=review.updated_at,
+                comment_hidden=review.comment_hidden,
+                comment_hidden_by=review.comment_hidden_by,
+            ),
+            own=document.own,
+            draft=document.draft,
+        )
+
+    @staticmethod
+    def to_review_model(review: Review) -> TimelineReviewModel:
+        """Convert a Review entity (domain) to its embedded timeline snapshot."""
+        review_id = str_to_document_id(review.id)
+        if review_id is None:
+            raise ValueError("Cannot add a review without an id to a timeline")
+        return TimelineReviewModel(
+            review_id=review_id,
+            reviewer_uuid=review.reviewer_uuid,
+            reviewed_username=review.reviewed_username,
+            reviewed_username_lc=normalize_username(review.reviewed_username),
+            status=review.status,
+            comment=review.comment,
+            anonymous=review.anonymous,
+            created_at=review.created_at,
+            updated_at=review.updated_at,
+            comment_hidden=review.comment_hidden,
+            comment_hidden_by=review.comment_hidden_by,
+        )
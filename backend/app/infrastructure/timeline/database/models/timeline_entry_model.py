@@ -0,0 +1,81 @@
+from datetime import datetime
+from uuid import UUID
+
+from beanie import Document, PydanticObjectId
+from pydantic import BaseModel
+from pymongo import IndexModel
+
+from app.domain.reviews.entities.review import ReviewStatus
+
+
+class TimelineReviewModel(BaseModel):
+    """Embedded snapshot of a review, so feed reads need no join."""
+
+    review_id: PydanticObjectId
+    reviewer_uuid: UUID
+    reviewed_username: str
+    # Normalized reviewed_username, maintained by TimelineEntryMapper
+    reviewed_username_lc: str | None = None
+    status: ReviewStatus
+    comment: str | None = None
+    anonymous: bool = False
+    created_at: datetime
+    updated_at: datetime
+    comment_hidden: bool = False
+    comment_hidden_by: str | None = None
+
+
+class TimelineEntryDocument(Document):
+    """MongoDB document model for TimelineEntry (infrastructure layer)."""
+
+    owner_uuid: UUID
+    review: TimelineReviewModel
+    own: bool = False
+    draft: bool = False
+
+    class Settings:
+        name = "timeline_entries"
+        indexes = [
+            # Feed page: one range scan per owner, already in keyset order.
+            IndexModel(
+                [
+                    ("owner_uuid", 1),
+                    ("review.updated_at", -1),
+                    ("review.review_id", -1),
+                ],
+                name="owner_uuid_updated_at_review_id_desc",
+            ),
+            IndexModel(
+                [("owner_uuid", 1), ("review.review_id", 1)],
+                name="owner_uuid_review_id_unique",
+                unique=True,
+            ),
+            IndexModel([("review.review_id", 1)], name="review_id"),
+            IndexModel(
+                [("owner_uuid", 1), ("review.reviewed_username_lc", 1)],
+                name="owner_uuid_reviewed_username_lc",
+            ),
+            # Account deletion removes the account's reviews from every timeline
+            IndexModel([("review.reviewer_uuid", 1)], name="reviewer_uuid"),
+            IndexModel([("review.reviewed_username_lc", 1)], name="reviewed_username_lc"),
+        ]
+
+
+class TimelineFanoutSkipDocument(Document):
+    """A username whose reviews are merged into feeds at read time."""
+
+    username: str
+    # Normalized username, set by MongoDBTimelineRepository.mark_fanout_skipped
+    username_lc: str | None = None
+    marked_at: datetime
+
+    class Settings:
+        name = "timeline_fanout_skips"
+        indexes = [
+            IndexModel(
+                [("username_lc", 1)],
+                name="username_lc_unique",
+                unique=True,
+                partialFilterExpression={"username_lc": {"$exists": True}},
+            ),
+        ]
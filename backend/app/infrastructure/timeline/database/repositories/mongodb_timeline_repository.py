@@ -0,0 +1,263 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+from beanie import PydanticObjectId, SortDirection
+from beanie.odm.utils.encoder import Encoder
+from bson import Binary
+from pymongo import UpdateOne
+
+from app.domain.shared.exceptions import InvalidCursorException
+from app.domain.shared.pagination import KeysetCursor, ListVersion
+from app.domain.timeline.entities.timeline_entry import TimelineEntry
+from app.infrastructure.shared.database.mappers.base_mapper import normalize_username
+from app.infrastructure.shared.database.repositories.base_repository import (
+    username_filter,
+)
+from app.infrastructure.timeline.database.mappers.timeline_entry_mapper import (
+    TimelineEntryMapper,
+)
+from app.infrastructure.timeline.database.models.timeline_entry_model import (
+    TimelineEntryDocument,
+    TimelineFanoutSkipDocument,
+)
+
+_TIMELINE_ORDER = [
+    ("review.updated_at", SortDirection.DESCENDING),
+    ("review.review_id", SortDirection.DESCENDING),
+]
+
+
+def _reviewed_username_filter(username: str) -> dict:
+    return username_filter(
+        "review.reviewed_username_lc", "review.reviewed_username", username
+    )
+
+
+class MongoDBTimelineRepository:
+    """MongoDB implementation of ITimelineRepository interface."""
+
+    async def get_page(
+        self,
+        owner_uuid: UUID,
+        limit: int,
+        offset: int = 0,
+        after: KeysetCursor | None = None,
+        own: bool | None = None,
+        include_drafts: bool = True,
+        since: KeysetCursor | None = None,
+    ) -> list[TimelineEntry]:
+        """Find an owner's timeline entries, newest review update first.
+
+        Served by the (owner_uuid, review.updated_at, review.review_id) index;
+        own/draft conditions are residual filters on that single range scan.
+        """
+        conditions = [self._owner_query(owner_uuid, own, include_drafts)]
+        if after is not None:
+            conditions.append(self._position_filter(after, "$lt"))
+        if since is not None:
+            conditions.append(self._since_filter(since))
+        query = conditions[0] if len(conditions) == 1 else {"$and": conditions}
+        documents = (
+            await TimelineEntryDocument.find(query)
+            .sort(_TIMELINE_ORDER)
+            .skip(offset)
+            .limit(limit)
+            .to_list()
+        )
+        return [TimelineEntryMapper.to_entity(doc) for doc in documents]
+
+    async def get_version(
+        self,
+        owner_uuid: UUID,
+        own: bool | None = None,
+        include_drafts: bool = True,
+    ) -> ListVersion:
+        """Count the entries get_page covers and find the newest, without loading them."""
+        query = self._owner_query(owner_uuid, own, include_drafts)
+        count = await TimelineEntryDocument.find(query).count()
+        newest = (
+            await TimelineEntryDocument.find(query)
+            .sort(_TIMELINE_ORDER)
+            .limit(1)
+            .to_list()
+        )
+        if not newest:
+            return ListVersion(count=count, newest=None)
+        review = newest[0].review
+        return ListVersion(
+            count=count,
+            newest=KeysetCursor(sort_value=review.updated_at, id=str(review.review_id)),
+        )
+
+    async def upsert_many(self, entries: list[TimelineEntry]) -> None:
+        """Insert or refresh entries keyed by (owner, review) in one bulk write.
+
+        A pipeline update keeps a stored snapshot that is newer than the
+        incoming one, so a late publish cannot roll an entry back.
+        """
+        if not entries:
+            return
+        encoder = Encoder()
+        operations = []
+        for entry in entries:
+            review = encoder.encode(TimelineEntryMapper.to_review_model(entry.review))
+            owner = Binary.from_uuid(entry.owner_uuid)
+            # A missing updated_at (new entry) sorts before any date.
+            newer = {"$lte": ["$review.updated_at", {"$literal": review["updated_at"]}]}
+            operations.append(
+                UpdateOne(
+                    {"owner_uuid": owner, "review.review_id": review["review_id"]},
+                    [
+                        {
+                            "$set": {
+                                "review": {
+                                    "$cond": [newer, {"$literal": review}, "$review"]
+                                },
+                                "own": {"$cond": [newer, entry.own, "$own"]},
+                                "draft": {"$cond": [newer, entry.draft, "$draft"]},
+                            }
+                        }
+                    ],
+                    upsert=True,
+                )
+            )
+        collection = TimelineEntryDocument.get_pymongo_collection()
+        await collection.bulk_write(operations, ordered=False)
+
+    async def clear_drafts(self, username: str) -> int:
+        """Mark entries for a reviewed username as no longer drafts."""
+        collection = TimelineEntryDocument.get_pymongo_collection()
+        result = await collection.update_many(
+            {**_reviewed_username_filter(username), "draft": True},
+            {"$set": {"draft": False}},
+        )
+        return result.modified_count
+
+    async def trim(self, owner_uuid: UUID, max_entries: int) -> int:
+        """Delete entries past the newest max_entries. Returns count deleted."""
+        boundary = (
+            await TimelineEntryDocument.find({"owner_uuid": owner_uuid})
+            .sort(_TIMELINE_ORDER)
+            .skip(max_entries)
+            .limit(1)
+            .to_list()
+        )
+        if not boundary:
+            return 0
+        oldest_kept = KeysetCursor(
+            sort_value=boundary[0].review.updated_at,
+            id=str(boundary[0].review.review_id),
+        )
+        result = await TimelineEntryDocument.find(
+            {
+                "$and": [
+                    {"owner_uuid": owner_uuid},
+                    self._position_filter(oldest_kept, "$lte"),
+                ]
+            }
+        ).delete()
+        return result.deleted_count if result else 0
+
+    async def delete_by_review_id(self, review_id: str) -> int:
+        """Delete a review from every timeline. Returns count deleted."""
+        result = await TimelineEntryDocument.find(
+            {"review.review_id": PydanticObjectId(review_id)}
+        ).delete()
+        return result.deleted_count if result else 0
+
+    async def delete_by_owner_and_username(self, owner_uuid: UUID, username: str) -> int:
+        """Delete an owner's entries for a reviewed username (case-insensitive)."""
+        collection = TimelineEntryDocument.get_pymongo_collection()
+        result = await collection.delete_many(
+            {
+                "owner_uuid": Binary.from_uuid(owner_uuid),
+                **_reviewed_username_filter(username),
+            }
+        )
+        return result.deleted_count
+
+    async def delete_for_account(self, account_uuid: UUID, username: str) -> int:
+        """Delete an account's timeline and its reviews in other timelines.
+
+        One delete per condition, so each is served by its own index.
+        """
+        account = Binary.from_uuid(account_uuid)
+        collection = TimelineEntryDocument.get_pymongo_collection()
+        deleted = 0
+        for query in (
+            {"owner_uuid": account},
+            {"review.reviewer_uuid": account},
+            _reviewed_username_filter(username),
+        ):
+            result = await collection.delete_many(query)
+            deleted += result.deleted_count
+        return deleted
+
+    async def mark_fanout_skipped(self, username: str) -> None:
+        """Record that reviews of username are merged at read time instead."""
+        collection = TimelineFanoutSkipDocument.get_pymongo_collection()
+        await collection.update_one(
+            username_filter("username_lc", "username", username),
+            {
+                "$setOnInsert": {
+                    "username": username,
+                    "username_lc": normalize_username(username),
+                    "marked_at": datetime.now(timezone.utc),
+                }
+            },
+            upsert=True,
+        )
+
+    async def clear_fanout_skipped(self, username: str) -> bool:
+        """Resume fan-out for username. Returns whether it was marked."""
+        collection = TimelineFanoutSkipDocument.get_pymongo_collection()
+        result = await collection.delete_one(
+            username_filter("username_lc", "username", username)
+        )
+        return result.deleted_count > 0
+
+    async def get_fanout_skipped_usernames(self) -> list[str]:
+        """Get usernames whose reviews are not fanned out."""
+        documents = await TimelineFanoutSkipDocument.find_all().to_list()
+        return [doc.username for doc in documents]
+
+    @staticmethod
+    def _owner_query(owner_uuid: UUID, own: bool | None, include_drafts: bool) -> dict:
+        query: dict = {"owner_uuid": owner_uuid}
+        if own is not None:
+            query["own"] = own
+        if not include_drafts:
+            query["$or"] = [{"draft": False}, {"review.reviewer_uuid": owner_uuid}]
+        return query
+
+    @staticmethod
+    def _position_filter(cursor: KeysetCursor, id_operator: str) -> dict:
+        """Filter for entries after (``$lt``) or at/after (``$lte``) a position."""
+        if not PydanticObjectId.is_valid(cursor.id):
+            raise InvalidCursorException()
+        review_id = PydanticObjectId(cursor.id)
+        return {
+            "$or": [
+                {"review.updated_at": {"$lt": cursor.sort_value}},
+                {
+                    "review.updated_at": cursor.sort_value,
+                    "review.review_id": {id_operator: review_id},
+                },
+            ]
+        }
+
+    @staticmethod
+    def _since_filter(cursor: KeysetCursor) -> dict:
+        """Filter for entries whose review was updated after a position."""
+        if not PydanticObjectId.is_valid(cursor.id):
+            raise InvalidCursorException()
+        review_id = PydanticObjectId(cursor.id)
+        return {
+            "$or": [
+                {"review.updated_at": {"$gt": cursor.sort_value}},
+                {
+                    "review.updated_at": cursor.sort_value,
+                    "review.review_id": {"$gt": review_id},
+                },
+            ]
+        }
@@ -1,9 +1,13 @@
 from app.domain.users.entities.user import User
+from app.domain.users.value_objects.user_summary import UserSummary
 from app.infrastructure.shared.database.mappers.base_mapper import (
     document_id_to_str,
+    intern_str,
+    normalize_username,
     str_to_document_id,
 )
 from app.infrastructure.users.database.models.user_model import UserDocument
+from app.infrastructure.users.database.models.user_projections import UserSummaryView
 
 
 class UserMapper:
@@ -18,8 +22,11 @@ class UserMapper:
             name=document.name,
             bio=document.bio,
             avatar_url=document.avatar_url,
-            type=document.type,
+            type=intern_str(document.type),
             updated_at=document.updated_at,
+            etag=document.etag,
+            last_modified=document.last_modified,
+            view_count=document.view_count,
         )
 
     @staticmethod
@@ -27,10 +34,14 @@ class UserMapper:
         """Convert User entity (domain) to UserDocument (MongoDB)."""
         doc = UserDocument(
             username=entity.username,
+            username_lc=normalize_username(entity.username),
             name=entity.name,
             bio=entity.bio,
             avatar_url=entity.avatar_url,
             type=entity.type,
+            etag=entity.etag,
+            last_modified=entity.last_modified,
+            view_count=entity.view_count,
         )
         if entity.id:
             doc.id = str_to_document_id(entity.id)
@@ -39,13 +50,6 @@ class UserMapper:
         return doc
 
     @staticmethod
-    def update_document_from_entity(document: UserDocument, entity: User) -> UserDocument:
-        """Update a UserDocument with values from a User entity."""
-        document.username = entity.username
-        document.name = entity.name
-        document.bio = entity.bio
-        document.avatar_url = entity.avatar_url
-        document.type = entity.type
-        if entity.updated_at:
-            document.updated_at = entity.updated_at
-        return document
+    def to_summary(view: UserSummaryView) -> UserSummary:
+        """Convert a UserSummaryView projection to a UserSummary read model."""
+        return UserSummary(username=view.username, avatar_url=view.avatar_url)
@@ -3,17 +3,36 @@ from typing import Annotated
 
 from beanie import Document, Indexed
 from pydantic import Field
+from pymongo import IndexModel
 
 
 class UserDocument(Document):
     """MongoDB document model for User (infrastructure layer)."""
 
     username: Annotated[str, Indexed(unique=True)]
+    # Normalized username, maintained by UserMapper
+    username_lc: str | None = None
     name: str | None = None
     bio: str | None = None
     avatar_url: str | None = None
     type: str | None = None
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    # GitHub cache validators for conditional requests (If-None-Match / -Modified-Since)
+    etag: str | None = None
+    last_modified: str | None = None
+    # Profile views, used to prioritize background refreshes
+    view_count: int = 0
 
     class Settings:
         name = "users"
+        indexes = [
+            # Unique among backfilled documents, so upserts cannot race into
+            # case-variant duplicates
+            IndexModel(
+                [("username_lc", 1)],
+                name="username_lc_unique",
+                unique=True,
+                partialFilterExpression={"username_lc": {"$exists": True}},
+            ),
+            IndexModel([("view_count", -1), ("updated_at", 1)]),
+        ]
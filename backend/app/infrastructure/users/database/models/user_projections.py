@@ -0,0 +1,8 @@
+from pydantic import BaseModel
+
+
+class UserSummaryView(BaseModel):
+    """Projection of a UserDocument onto the fields of a UserSummary."""
+
+    username: str
+    avatar_url: str | None = None
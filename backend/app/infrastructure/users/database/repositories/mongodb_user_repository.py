@@ -1,8 +1,18 @@
+from datetime import datetime
+
+from beanie import SortDirection
+from pymongo import UpdateOne
+
 from app.domain.users.entities.user import User
-from app.infrastructure.shared.database.constants import CASE_INSENSITIVE
-from app.infrastructure.shared.database.repositories.base_repository import BaseRepository
+from app.domain.users.value_objects.user_summary import UserSummary
+from app.infrastructure.shared.database.mappers.base_mapper import normalize_username
+from app.infrastructure.shared.database.repositories.base_repository import (
+    BaseRepository,
+    username_filter,
+)
 from app.infrastructure.users.database.mappers.user_mapper import UserMapper
 from app.infrastructure.users.database.models.user_model import UserDocument
+from app.infrastructure.users.database.models.user_projections import UserSummaryView
 
 
 class MongoDBUserRepository(BaseRepository[User, UserDocument]):
@@ -10,19 +20,92 @@ class MongoDBUserRepository(BaseRepository[User, UserDocument]):
 
     document_class = UserDocument
     mapper = UserMapper
+    # Counted atomically by increment_view_counts
+    insert_only_fields = frozenset({"view_count"})
 
     async def get_by_username(self, username: str) -> User | None:
         """Find a user by username (case-insensitive)."""
         document = await UserDocument.find_one(
-            {"username": username}, collation=CASE_INSENSITIVE
+            {"username_lc": normalize_username(username)}
         )
         if document is None:
             return None
-        return UserMapper.to_entity(document)
+        return self._track(document)
+
+    async def upsert(self, user: User) -> User:
+        """Create or replace the cached user with the same username.
+
+        One atomic round trip (case-insensitive); the view count is kept.
+        """
+        query = username_filter("username_lc", "username", user.username)
+        saved, _ = await self.upsert_one(query, user)
+        return saved
+
+    async def upsert_many(self, users: list[User]) -> None:
+        """Create or replace cached users by username in one bulk write.
+
+        View counts are kept, as in ``upsert``.
+        """
+        await self.bulk_upsert(
+            [
+                (username_filter("username_lc", "username", user.username), user)
+                for user in users
+            ]
+        )
+
+    async def touch_many(self, usernames: list[str], updated_at: datetime) -> None:
+        """Set updated_at on cached users (case-insensitive) in one update."""
+        if not usernames:
+            return
+        keys = [normalize_username(username) for username in usernames]
+        await UserDocument.get_pymongo_collection().update_many(
+            {"username_lc": {"$in": keys}}, {"$set": {"updated_at": updated_at}}
+        )
 
     async def get_by_usernames(self, usernames: list[str]) -> list[User]:
         """Find users by a list of usernames (case-insensitive)."""
-        documents = await UserDocument.find(
-            {"username": {"$in": usernames}}, collation=CASE_INSENSITIVE
-        ).to_list()
+        keys = [normalize_username(username) for username in usernames]
+        documents = await UserDocument.find({"username_lc": {"$in": keys}}).to_list()
+        return [UserMapper.to_entity(doc) for doc in documents]
+
+    async def get_summaries_by_usernames(self, usernames: list[str]) -> list[UserSummary]:
+        """Find user summaries by a list of usernames (case-insensitive)."""
+        keys = [normalize_username(username) for username in usernames]
+        views = (
+            await UserDocument.find({"username_lc": {"$in": keys}})
+            .project(UserSummaryView)
+            .to_list()
+        )
+        return [UserMapper.to_summary(view) for view in views]
+
+    async def get_refresh_candidates(
+        self, updated_before: datetime, limit: int
+    ) -> list[User]:
+        """Find users cached before a cutoff, most viewed first."""
+        documents = (
+            await UserDocument.find({"updated_at": {"$lt": updated_before}})
+            .sort(
+                [
+                    ("view_count", SortDirection.DESCENDING),
+                    ("updated_at", SortDirection.ASCENDING),
+                ]
+            )
+            .limit(limit)
+            .to_list()
+        )
         return [UserMapper.to_entity(doc) for doc in documents]
+
+    async def increment_view_counts(self, counts: dict[str, int]) -> None:
+        """Atomically add profile views (case-insensitive) in one bulk write."""
+        if not counts:
+            return
+        await UserDocument.get_pymongo_collection().bulk_write(
+            [
+                UpdateOne(
+                    {"username_lc": normalize_username(username)},
+                    {"$inc": {"view_count": count}},
+                )
+                for username, count in counts.items()
+            ],
+            ordered=False,
+        )
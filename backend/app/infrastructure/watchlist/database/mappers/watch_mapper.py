@@ -1,6 +1,7 @@
 from app.domain.watchlist.entities.watch import Watch
 from app.infrastructure.shared.database.mappers.base_mapper import (
     document_id_to_str,
+    normalize_username,
     str_to_document_id,
 )
 from app.infrastructure.watchlist.database.models.watch_model import (
@@ -27,6 +28,7 @@ class WatchMapper:
         doc = WatchDocument(
             watcher_uuid=entity.watcher_uuid,
             watched_username=entity.watched_username,
+            watched_username_lc=normalize_username(entity.watched_username),
             created_at=entity.created_at,
         )
         if entity.id:
@@ -10,7 +10,9 @@ class WatchDocument(Document):
     """MongoDB document model for Watch (infrastructure layer)."""
 
     watcher_uuid: Annotated[UUID, Indexed()]
-    watched_username: Annotated[str, Indexed()]
+    watched_username: str
+    # Normalized watched_username, maintained by WatchMapper
+    watched_username_lc: str | None = None
     created_at: datetime
 
     class Settings:
@@ -20,5 +22,13 @@ class WatchDocument(Document):
                 [("watcher_uuid", 1), ("watched_username", 1)],
                 unique=True,
             ),
-            IndexModel([("watched_username", 1)]),
+            # Unique among backfilled documents, so upserts cannot race into
+            # case-variant duplicates
+            IndexModel(
+                [("watcher_uuid", 1), ("watched_username_lc", 1)],
+                name="watcher_uuid_watched_username_lc_unique",
+                unique=True,
+                partialFilterExpression={"watched_username_lc": {"$exists": True}},
+            ),
+            IndexModel([("watched_username_lc", 1)], name="watched_username_lc"),
         ]
@@ -1,10 +1,14 @@
 from uuid import UUID
 
 from beanie import SortDirection
+from bson import Binary
 
 from app.domain.watchlist.entities.watch import Watch
-from app.infrastructure.shared.database.constants import CASE_INSENSITIVE
-from app.infrastructure.shared.database.repositories.base_repository import BaseRepository
+from app.infrastructure.shared.database.mappers.base_mapper import normalize_username
+from app.infrastructure.shared.database.repositories.base_repository import (
+    BaseRepository,
+    username_filter,
+)
 from app.infrastructure.watchlist.database.mappers.watch_mapper import (
     WatchMapper,
 )
@@ -22,18 +26,32 @@ class MongoDBWatchlistRepository(BaseRepository[Watch, WatchDocument]):
     async def get_by_watcher_and_username(
         self, watcher_uuid: UUID, watched_username: str
     ) -> Watch | None:
-        """Find a watch by watcher UUID and watched username."""
+        """Find a watch by watcher UUID and watched username (case-insensitive)."""
         document = await WatchDocument.find_one(
             {
                 "watcher_uuid": watcher_uuid,
-                "watched_username": watched_username,
-            },
-            collation=CASE_INSENSITIVE,
+                "watched_username_lc": normalize_username(watched_username),
+            }
         )
         if document is None:
             return None
         return WatchMapper.to_entity(document)
 
+    async def get_or_create(self, watch: Watch) -> Watch:
+        """Create a watch unless the watcher already watches the username.
+
+        One atomic round trip (case-insensitive); returns the stored watch.
+        """
+        username_match = username_filter(
+            "watched_username_lc", "watched_username", watch.watched_username
+        )
+        query = {"watcher_uuid": Binary.from_uuid(watch.watcher_uuid), **username_match}
+        # Sets the key on a legacy document matched without it
+        saved, _ = await self.upsert_one(
+            query, watch, update_fields=("watched_username_lc",)
+        )
+        return saved
+
     async def get_all_by_watcher(
         self, watcher_uuid: UUID, limit: int = 100, offset: int = 0
     ) -> list[Watch]:
@@ -47,21 +65,53 @@ class MongoDBWatchlistRepository(BaseRepository[Watch, WatchDocument]):
         )
         return [WatchMapper.to_entity(doc) for doc in documents]
 
+    async def get_all_by_watcher_and_usernames(
+        self, watcher_uuid: UUID, usernames: list[str]
+    ) -> list[Watch]:
+        """Get a watcher's watches among the given usernames (case-insensitive)."""
+        keys = [normalize_username(username) for username in usernames]
+        documents = await WatchDocument.find(
+            {"watcher_uuid": watcher_uuid, "watched_username_lc": {"$in": keys}}
+        ).to_list()
+        return [WatchMapper.to_entity(doc) for doc in documents]
+
+    async def get_watcher_uuids(
+        self, watched_username: str, limit: int | None = None
+    ) -> list[UUID]:
+        """Get the UUIDs of accounts watching a username (case-insensitive)."""
+        query = WatchDocument.find(
+            {"watched_username_lc": normalize_username(watched_username)}
+        )
+        if limit is not None:
+            query = query.limit(limit)
+        documents = await query.to_list()
+        return [doc.watcher_uuid for doc in documents]
+
     async def get_watcher_count(self, watched_username: str) -> int:
-        """Get the number of watchers for a username."""
+        """Get the number of watchers for a username (case-insensitive)."""
         return await WatchDocument.find(
-            {"watched_username": watched_username},
-            collation=CASE_INSENSITIVE,
+            {"watched_username_lc": normalize_username(watched_username)}
         ).count()
 
+    async def get_watcher_counts_for_usernames(
+        self, usernames: list[str]
+    ) -> dict[str, int]:
+        """Get watcher counts for usernames, keyed by lowercased username."""
+        keys = [normalize_username(username) for username in usernames]
+        pipeline = [
+            {"$match": {"watched_username_lc": {"$in": keys}}},
+            {"$group": {"_id": "$watched_username_lc", "count": {"$sum": 1}}},
+        ]
+        results = await WatchDocument.aggregate(pipeline).to_list()
+        return {item["_id"]: item["count"] for item in results}
+
     async def delete(self, watcher_uuid: UUID, watched_username: str) -> None:
-        """Delete a watch."""
+        """Delete a watch (case-insensitive)."""
         document = await WatchDocument.find_one(
             {
                 "watcher_uuid": watcher_uuid,
-                "watched_username": watched_username,
-            },
-            collation=CASE_INSENSITIVE,
+                "watched_username_lc": normalize_username(watched_username),
+            }
         )
         if document:
             await document.delete()
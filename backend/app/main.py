@@ -12,12 +12,25 @@ from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
 from starlette.responses import Response
 
+from app.domain.reviews.services.review_change_hub import ReviewChangeHub
+from app.infrastructure.github.external.github_client import GitHubClient
+from app.infrastructure.reviews.database.repositories.mongodb_review_change_stream import (  # noqa: E501
+    MongoDBReviewChangeStream,
+)
+from app.infrastructure.shared.concurrency.background import (
+    cancel_background_tasks,
+    spawn_background,
+)
 from app.infrastructure.shared.config.config import settings
 from app.infrastructure.shared.database.connection import init_database
 from app.infrastructure.shared.observability.logging import setup_loggers
 from app.infrastructure.shared.observability.telemetry import setup_telemetry
 from app.presentation.api.exception_handlers import register_exception_handlers
 from app.presentation.api.routes import api_router
+from app.presentation.workers.profile_refresh_worker import run_profile_refresh_worker
+from app.presentation.workers.username_key_backfill_worker import (
+    run_username_key_backfill,
+)
 
 setup_loggers()
 
@@ -51,9 +64,36 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     await init_database(app.state.client)
     logger.info("Database connection established")
 
+    # Keys existing documents are backfilled by the pre-deploy migration; this
+    # pass picks up documents older app versions wrote during the rollout
+    spawn_background(run_username_key_backfill(), name="username-key-backfill")
+
+    # Setup shared GitHub HTTP client (pooled keep-alive connections)
+    app.state.github_client = GitHubClient.from_settings()
+
+    if settings.PROFILE_REFRESH_ENABLED:
+        spawn_background(
+            run_profile_refresh_worker(app.state.github_client),
+            name="profile-refresh-worker",
+        )
+        logger.info("Profile refresh worker started")
+
+    app.state.review_change_hub = None
+    if settings.REVIEW_CHANGE_STREAM_ENABLED:
+        app.state.review_change_hub = ReviewChangeHub(
+            MongoDBReviewChangeStream(),
+            replay_size=settings.REVIEW_CHANGE_STREAM_REPLAY_SIZE,
+            queue_size=settings.REVIEW_CHANGE_STREAM_QUEUE_SIZE,
+        )
+        spawn_background(app.state.review_change_hub.run(), name="review-change-stream")
+        logger.info("Review change stream started")
+
     yield
 
     # Graceful shutdown
+    await cancel_background_tasks()
+    await app.state.github_client.aclose()
+    logger.info("GitHub client closed")
     app.state.client.close()
     if app.state.posthog is not None:
         try:
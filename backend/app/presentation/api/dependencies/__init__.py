@@ -3,35 +3,50 @@ from .accounts import (
     get_current_account_use_case,
     get_delete_account_use_case,
     get_my_reviews_use_case,
+    get_stream_activity_feed_use_case,
 )
 from .auth import get_current_account_uuid
 from .github import (
     get_authenticate_with_github_use_case,
+    get_github_client,
     get_search_users_use_case,
+    get_sync_following_use_case,
     get_user_use_case,
 )
 from .repositories import (
     AccountRepositoryDep,
+    FollowingRepositoryDep,
+    LeaseRepositoryDep,
     ReviewRepositoryDep,
+    ReviewStatsRepositoryDep,
+    TimelineRepositoryDep,
     UserRepositoryDep,
     WatchlistRepositoryDep,
     get_account_repository,
+    get_following_repository,
+    get_lease_repository,
     get_review_repository,
+    get_review_stats_repository,
+    get_timeline_repository,
     get_user_repository,
     get_watchlist_repository,
 )
 from .reviews import (
     get_create_or_update_review_use_case,
     get_delete_review_use_case,
+    get_review_change_hub,
     get_reviewers_use_case,
     get_reviews_use_case,
+    get_stream_reviews_use_case,
     get_suggestions_use_case,
     get_toggle_comment_hidden_use_case,
 )
 from .services import (
     get_account_service,
+    get_following_service,
     get_review_enrichment_service,
     get_review_service,
+    get_timeline_service,
     get_user_service,
     get_watchlist_service,
 )
@@ -47,29 +62,44 @@ __all__ = [
     "ReviewRepositoryDep",
     "WatchlistRepositoryDep",
     "UserRepositoryDep",
+    "LeaseRepositoryDep",
+    "FollowingRepositoryDep",
+    "TimelineRepositoryDep",
+    "ReviewStatsRepositoryDep",
     "get_account_repository",
     "get_review_repository",
     "get_watchlist_repository",
     "get_user_repository",
+    "get_lease_repository",
+    "get_following_repository",
+    "get_timeline_repository",
+    "get_review_stats_repository",
     "get_account_service",
     "get_review_service",
     "get_user_service",
     "get_watchlist_service",
     "get_review_enrichment_service",
+    "get_following_service",
+    "get_timeline_service",
     "get_current_account_uuid",
     "get_current_account_use_case",
     "get_delete_account_use_case",
     "get_my_reviews_use_case",
     "get_activity_feed_use_case",
+    "get_stream_activity_feed_use_case",
+    "get_github_client",
     "get_authenticate_with_github_use_case",
     "get_user_use_case",
     "get_search_users_use_case",
+    "get_sync_following_use_case",
     "get_create_or_update_review_use_case",
     "get_reviews_use_case",
     "get_reviewers_use_case",
     "get_suggestions_use_case",
     "get_delete_review_use_case",
     "get_toggle_comment_hidden_use_case",
+    "get_review_change_hub",
+    "get_stream_reviews_use_case",
     "get_watch_use_case",
     "get_unwatch_use_case",
     "get_all_by_watcher_use_case",
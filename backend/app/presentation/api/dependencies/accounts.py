@@ -7,18 +7,28 @@ from app.application.accounts.use_cases.get_activity_feed import (
 from app.application.accounts.use_cases.get_current_account import (
     GetCurrentAccountUseCase,
 )
+from app.application.accounts.use_cases.stream_activity_feed import (
+    StreamActivityFeedUseCase,
+)
 from app.application.reviews.use_cases.get_my_reviews import GetMyReviewsUseCase
 from app.domain.accounts.services.account_service import AccountService
+from app.domain.following.services.following_service import FollowingService
+from app.domain.reviews.services.review_change_hub import ReviewChangeHub
 from app.domain.reviews.services.review_enrichment_service import ReviewEnrichmentService
 from app.domain.reviews.services.review_service import ReviewService
+from app.domain.timeline.services.timeline_service import TimelineService
 from app.domain.users.services.user_service import UserService
 from app.domain.watchlist.services.watchlist_service import WatchlistService
+from app.infrastructure.shared.config.config import settings
 
 from .feature_flags import FeatureFlags, get_feature_flags
+from .reviews import get_review_change_hub
 from .services import (
     get_account_service,
+    get_following_service,
     get_review_enrichment_service,
     get_review_service,
+    get_timeline_service,
     get_user_service,
     get_watchlist_service,
 )
@@ -35,9 +45,17 @@ def get_delete_account_use_case(
     account_service: AccountService = Depends(get_account_service),
     review_service: ReviewService = Depends(get_review_service),
     watchlist_service: WatchlistService = Depends(get_watchlist_service),
+    following_service: FollowingService = Depends(get_following_service),
+    timeline_service: TimelineService | None = Depends(get_timeline_service),
 ) -> DeleteAccountUseCase:
     """Get delete account use case instance."""
-    return DeleteAccountUseCase(account_service, review_service, watchlist_service)
+    return DeleteAccountUseCase(
+        account_service,
+        review_service,
+        watchlist_service,
+        following_service,
+        timeline_service,
+    )
 
 
 def get_my_reviews_use_case(
@@ -54,6 +72,7 @@ def get_activity_feed_use_case(
     account_service: AccountService = Depends(get_account_service),
     user_service: UserService = Depends(get_user_service),
     feature_flags: FeatureFlags = Depends(get_feature_flags),
+    timeline_service: TimelineService | None = Depends(get_timeline_service),
 ) -> GetActivityFeedUseCase:
     """Get activity feed use case instance."""
     return GetActivityFeedUseCase(
@@ -62,4 +81,14 @@ def get_activity_feed_use_case(
         account_service,
         user_service,
         open_draft_profiles=feature_flags.open_draft_profiles,
+        timeline_service=timeline_service,
+        merge_streams=settings.ACTIVITY_FEED_MERGE_STREAMS,
     )
+
+
+def get_stream_activity_feed_use_case(
+    feed_use_case: GetActivityFeedUseCase = Depends(get_activity_feed_use_case),
+    hub: ReviewChangeHub = Depends(get_review_change_hub),
+) -> StreamActivityFeedUseCase:
+    """Get stream activity feed use case instance."""
+    return StreamActivityFeedUseCase(feed_use_case, hub)
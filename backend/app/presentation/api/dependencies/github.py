@@ -1,42 +1,110 @@
-from fastapi import Depends
+from fastapi import Depends, Request
 
+from app.application.following.use_cases.sync_following import (
+    SyncFollowingGraphUseCase,
+)
 from app.application.github.use_cases.authenticate_with_github import (
     AuthenticateWithGitHubUseCase,
 )
 from app.application.github.use_cases.get_user import GetUserUseCase
 from app.application.github.use_cases.search_users import SearchUsersUseCase
 from app.domain.accounts.services.account_service import AccountService
+from app.domain.following.entities.following_graph import FollowingGraph
+from app.domain.following.services.following_service import FollowingService
+from app.domain.timeline.services.timeline_service import TimelineService
+from app.domain.users.entities.user import User
 from app.domain.users.services.user_service import UserService
 from app.infrastructure.email.email_service import EmailService
+from app.infrastructure.github.external.github_client import (
+    GitHubClient,
+    UserSearchPage,
+)
+from app.infrastructure.github.external.search_cache import UserSearchCache
+from app.infrastructure.shared.concurrency.counter_buffer import CounterBuffer
+from app.infrastructure.shared.concurrency.single_flight import SingleFlight
+from app.infrastructure.shared.config.config import settings
 
+from .repositories import LeaseRepositoryDep
 from .services import (
     get_account_service,
     get_email_service,
+    get_following_service,
+    get_timeline_service,
     get_user_service,
 )
 
+# Process-wide, so concurrent requests for the same profile share one fetch.
+user_fetch_flight: SingleFlight[User] = SingleFlight()
+user_search_flight: SingleFlight[UserSearchPage] = SingleFlight()
+following_sync_flight: SingleFlight[FollowingGraph | None] = SingleFlight()
+# Profile views since the last flush by the profile refresh worker.
+user_view_counts: CounterBuffer[str] = CounterBuffer()
+user_search_cache = UserSearchCache(
+    ttl_seconds=settings.USER_SEARCH_CACHE_TTL_SECONDS,
+    max_entries=settings.USER_SEARCH_CACHE_MAX_ENTRIES,
+)
+
+
+def get_github_client(request: Request) -> GitHubClient:
+    """Get the shared GitHub client created in the application lifespan."""
+    return request.app.state.github_client
+
 
 def get_authenticate_with_github_use_case(
     account_service: AccountService = Depends(get_account_service),
     user_service: UserService = Depends(get_user_service),
     email_service: EmailService = Depends(get_email_service),
+    github_client: GitHubClient = Depends(get_github_client),
+    timeline_service: TimelineService | None = Depends(get_timeline_service),
 ) -> AuthenticateWithGitHubUseCase:
     """Get authenticate with GitHub use case instance."""
     return AuthenticateWithGitHubUseCase(
-        account_service, user_service, email_service
+        account_service, user_service, email_service, github_client, timeline_service
     )
 
 
 def get_user_use_case(
+    lease_repository: LeaseRepositoryDep,
     account_service: AccountService = Depends(get_account_service),
     user_service: UserService = Depends(get_user_service),
+    github_client: GitHubClient = Depends(get_github_client),
 ) -> GetUserUseCase:
     """Get user use case instance."""
-    return GetUserUseCase(account_service, user_service)
+    return GetUserUseCase(
+        account_service,
+        user_service,
+        github_client,
+        single_flight=user_fetch_flight,
+        lease_repository=(
+            lease_repository if settings.GITHUB_USER_FETCH_LEASE_ENABLED else None
+        ),
+        # Views only rank refresh candidates, so skip counting without the worker.
+        view_counts=user_view_counts if settings.PROFILE_REFRESH_ENABLED else None,
+    )
 
 
 def get_search_users_use_case(
     account_service: AccountService = Depends(get_account_service),
+    github_client: GitHubClient = Depends(get_github_client),
 ) -> SearchUsersUseCase:
     """Get search users use case instance."""
-    return SearchUsersUseCase(account_service)
+    return SearchUsersUseCase(
+        account_service,
+        github_client,
+        search_cache=user_search_cache,
+        single_flight=user_search_flight,
+    )
+
+
+def get_sync_following_use_case(
+    account_service: AccountService = Depends(get_account_service),
+    following_service: FollowingService = Depends(get_following_service),
+    github_client: GitHubClient = Depends(get_github_client),
+) -> SyncFollowingGraphUseCase:
+    """Get sync following graph use case instance."""
+    return SyncFollowingGraphUseCase(
+        account_service,
+        following_service,
+        github_client,
+        single_flight=following_sync_flight,
+    )
@@ -3,7 +3,15 @@ from typing import Annotated
 from fastapi import Depends
 
 from app.domain.accounts.repositories.account_repository import IAccountRepository
+from app.domain.following.repositories.following_repository import (
+    IFollowingRepository,
+)
 from app.domain.reviews.repositories.review_repository import IReviewRepository
+from app.domain.reviews.repositories.review_stats_repository import (
+    IReviewStatsRepository,
+)
+from app.domain.shared.repositories.lease_repository import ILeaseRepository
+from app.domain.timeline.repositories.timeline_repository import ITimelineRepository
 from app.domain.users.repositories.user_repository import IUserRepository
 from app.domain.watchlist.repositories.watchlist_repository import (
     IWatchlistRepository,
@@ -11,14 +19,26 @@ from app.domain.watchlist.repositories.watchlist_repository import (
 from app.infrastructure.accounts.database.repositories.mongodb_account_repository import (
     MongoDBAccountRepository,
 )
+from app.infrastructure.following.database.repositories.mongodb_following_repository import (  # noqa: E501
+    MongoDBFollowingRepository,
+)
 from app.infrastructure.reviews.database.repositories.mongodb_review_repository import (
     MongoDBReviewRepository,
 )
+from app.infrastructure.reviews.database.repositories.mongodb_review_stats_repository import (  # noqa: E501
+    MongoDBReviewStatsRepository,
+)
+from app.infrastructure.shared.database.repositories.mongodb_lease_repository import (
+    MongoDBLeaseRepository,
+)
+from app.infrastructure.timeline.database.repositories.mongodb_timeline_repository import (  # noqa: E501
+    MongoDBTimelineRepository,
+)
 from app.infrastructure.users.database.repositories.mongodb_user_repository import (
     MongoDBUserRepository,
 )
-from app.infrastructure.watchlist.database.repositories import (
-    mongodb_watchlist_repository,
+from app.infrastructure.watchlist.database.repositories.mongodb_watchlist_repository import (  # noqa: E501
+    MongoDBWatchlistRepository,
 )
 
 
@@ -32,6 +52,11 @@ def get_review_repository() -> IReviewRepository:
     return MongoDBReviewRepository()
 
 
+def get_review_stats_repository() -> IReviewStatsRepository:
+    """Get review stats repository instance."""
+    return MongoDBReviewStatsRepository()
+
+
 def get_user_repository() -> IUserRepository:
     """Get user repository instance."""
     return MongoDBUserRepository()
@@ -39,12 +64,35 @@ def get_user_repository() -> IUserRepository:
 
 def get_watchlist_repository() -> IWatchlistRepository:
     """Get watch repository instance."""
-    return mongodb_watchlist_repository.MongoDBWatchlistRepository()
+    return MongoDBWatchlistRepository()
+
+
+def get_following_repository() -> IFollowingRepository:
+    """Get following graph repository instance."""
+    return MongoDBFollowingRepository()
+
+
+def get_timeline_repository() -> ITimelineRepository:
+    """Get timeline repository instance."""
+    return MongoDBTimelineRepository()
+
+
+def get_lease_repository() -> ILeaseRepository:
+    """Get lease repository instance."""
+    return MongoDBLeaseRepository()
 
 
 AccountRepositoryDep = Annotated[IAccountRepository, Depends(get_account_repository)]
 ReviewRepositoryDep = Annotated[IReviewRepository, Depends(get_review_repository)]
+ReviewStatsRepositoryDep = Annotated[
+    IReviewStatsRepository, Depends(get_review_stats_repository)
+]
 UserRepositoryDep = Annotated[IUserRepository, Depends(get_user_repository)]
 WatchlistRepositoryDep = Annotated[
     IWatchlistRepository, Depends(get_watchlist_repository)
 ]
+FollowingRepositoryDep = Annotated[
+    IFollowingRepository, Depends(get_following_repository)
+]
+TimelineRepositoryDep = Annotated[ITimelineRepository, Depends(get_timeline_repository)]
+LeaseRepositoryDep = Annotated[ILeaseRepository, Depends(get_lease_repository)]
@@ -1,5 +1,8 @@
-from fastapi import Depends
+from fastapi import Depends, Request
 
+from app.application.following.use_cases.sync_following import (
+    SyncFollowingGraphUseCase,
+)
 from app.application.reviews.use_cases.create_or_update_review import (
     CreateOrUpdateReviewUseCase,
 )
@@ -7,38 +10,59 @@ from app.application.reviews.use_cases.delete_review import DeleteReviewUseCase
 from app.application.reviews.use_cases.get_reviewers import GetReviewersUseCase
 from app.application.reviews.use_cases.get_reviews import GetReviewsUseCase
 from app.application.reviews.use_cases.get_suggestions import GetSuggestionsUseCase
+from app.application.reviews.use_cases.stream_reviews import StreamReviewsUseCase
 from app.application.reviews.use_cases.toggle_comment_hidden import (
     ToggleCommentHiddenUseCase,
 )
 from app.domain.accounts.services.account_service import AccountService
+from app.domain.following.services.following_service import FollowingService
+from app.domain.reviews.services.review_change_hub import ReviewChangeHub
 from app.domain.reviews.services.review_enrichment_service import ReviewEnrichmentService
 from app.domain.reviews.services.review_service import ReviewService
+from app.domain.shared.exceptions import RealtimeUpdatesUnavailableException
+from app.domain.timeline.services.timeline_service import TimelineService
 from app.domain.users.services.user_service import UserService
 from app.domain.watchlist.services.watchlist_service import WatchlistService
 from app.infrastructure.email.email_service import EmailService
 
 from .feature_flags import FeatureFlags, get_feature_flags
+from .github import get_sync_following_use_case
 from .services import (
     get_account_service,
     get_email_service,
+    get_following_service,
     get_review_enrichment_service,
     get_review_service,
+    get_timeline_service,
     get_user_service,
     get_watchlist_service,
 )
 
 
+def get_review_change_hub(request: Request) -> ReviewChangeHub:
+    """Get the shared review change hub started in the application lifespan."""
+    hub: ReviewChangeHub | None = getattr(request.app.state, "review_change_hub", None)
+    if hub is None:
+        raise RealtimeUpdatesUnavailableException()
+    return hub
+
+
 def get_create_or_update_review_use_case(
     review_service: ReviewService = Depends(get_review_service),
     account_service: AccountService = Depends(get_account_service),
     enrichment_service: ReviewEnrichmentService = Depends(get_review_enrichment_service),
     watchlist_service: WatchlistService = Depends(get_watchlist_service),
     email_service: EmailService = Depends(get_email_service),
+    timeline_service: TimelineService | None = Depends(get_timeline_service),
 ) -> CreateOrUpdateReviewUseCase:
     """Get create or update review use case instance."""
     return CreateOrUpdateReviewUseCase(
-        review_service, account_service, enrichment_service, watchlist_service,
+        review_service,
+        account_service,
+        enrichment_service,
+        watchlist_service,
         email_service,
+        timeline_service,
     )
 
 
@@ -50,7 +74,24 @@ def get_reviews_use_case(
 ) -> GetReviewsUseCase:
     """Get reviews use case instance."""
     return GetReviewsUseCase(
-        review_service, account_service, enrichment_service,
+        review_service,
+        account_service,
+        enrichment_service,
+        open_draft_profiles=feature_flags.open_draft_profiles,
+    )
+
+
+def get_stream_reviews_use_case(
+    account_service: AccountService = Depends(get_account_service),
+    enrichment_service: ReviewEnrichmentService = Depends(get_review_enrichment_service),
+    hub: ReviewChangeHub = Depends(get_review_change_hub),
+    feature_flags: FeatureFlags = Depends(get_feature_flags),
+) -> StreamReviewsUseCase:
+    """Get stream reviews use case instance."""
+    return StreamReviewsUseCase(
+        account_service,
+        enrichment_service,
+        hub,
         open_draft_profiles=feature_flags.open_draft_profiles,
     )
 
@@ -64,31 +105,46 @@ def get_reviewers_use_case(
 ) -> GetReviewersUseCase:
     """Get reviewers use case instance."""
     return GetReviewersUseCase(
-        review_service, account_service, user_service, enrichment_service,
+        review_service,
+        account_service,
+        user_service,
+        enrichment_service,
         open_draft_profiles=feature_flags.open_draft_profiles,
     )
 
 
 def get_delete_review_use_case(
     review_service: ReviewService = Depends(get_review_service),
+    timeline_service: TimelineService | None = Depends(get_timeline_service),
 ) -> DeleteReviewUseCase:
     """Get delete review use case instance."""
-    return DeleteReviewUseCase(review_service)
+    return DeleteReviewUseCase(review_service, timeline_service)
 
 
 def get_toggle_comment_hidden_use_case(
     review_service: ReviewService = Depends(get_review_service),
     account_service: AccountService = Depends(get_account_service),
     enrichment_service: ReviewEnrichmentService = Depends(get_review_enrichment_service),
+    timeline_service: TimelineService | None = Depends(get_timeline_service),
 ) -> ToggleCommentHiddenUseCase:
     """Get toggle comment hidden use case instance."""
-    return ToggleCommentHiddenUseCase(review_service, account_service, enrichment_service)
+    return ToggleCommentHiddenUseCase(
+        review_service, account_service, enrichment_service, timeline_service
+    )
 
 
 def get_suggestions_use_case(
     watchlist_service: WatchlistService = Depends(get_watchlist_service),
     review_service: ReviewService = Depends(get_review_service),
     account_service: AccountService = Depends(get_account_service),
+    following_service: FollowingService = Depends(get_following_service),
+    sync_following: SyncFollowingGraphUseCase = Depends(get_sync_following_use_case),
 ) -> GetSuggestionsUseCase:
     """Get suggestions use case instance."""
-    return GetSuggestionsUseCase(account_service, watchlist_service, review_service)
+    return GetSuggestionsUseCase(
+        account_service,
+        watchlist_service,
+        review_service,
+        following_service,
+        sync_following,
+    )
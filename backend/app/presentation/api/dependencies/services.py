@@ -1,15 +1,21 @@
 from fastapi import Depends
 
 from app.domain.accounts.services.account_service import AccountService
+from app.domain.following.services.following_service import FollowingService
 from app.domain.reviews.services.review_enrichment_service import ReviewEnrichmentService
 from app.domain.reviews.services.review_service import ReviewService
+from app.domain.timeline.services.timeline_service import TimelineService
 from app.domain.users.services.user_service import UserService
 from app.domain.watchlist.services.watchlist_service import WatchlistService
 from app.infrastructure.email.email_service import EmailService
+from app.infrastructure.shared.config.config import settings
 
 from .repositories import (
     AccountRepositoryDep,
+    FollowingRepositoryDep,
     ReviewRepositoryDep,
+    ReviewStatsRepositoryDep,
+    TimelineRepositoryDep,
     UserRepositoryDep,
     WatchlistRepositoryDep,
 )
@@ -26,9 +32,12 @@ def get_review_service(
     review_repository: ReviewRepositoryDep,
     account_repository: AccountRepositoryDep,
     user_repository: UserRepositoryDep,
+    review_stats_repository: ReviewStatsRepositoryDep,
 ) -> ReviewService:
     """Get review service instance."""
-    return ReviewService(review_repository, account_repository, user_repository)
+    return ReviewService(
+        review_repository, account_repository, user_repository, review_stats_repository
+    )
 
 
 def get_user_service(
@@ -47,6 +56,32 @@ def get_watchlist_service(
     return WatchlistService(watchlist_repository, account_repository, user_repository)
 
 
+def get_following_service(
+    following_repository: FollowingRepositoryDep,
+) -> FollowingService:
+    """Get following service instance."""
+    return FollowingService(following_repository)
+
+
+def get_timeline_service(
+    timeline_repository: TimelineRepositoryDep,
+    watchlist_repository: WatchlistRepositoryDep,
+    account_repository: AccountRepositoryDep,
+    review_repository: ReviewRepositoryDep,
+) -> TimelineService | None:
+    """Get timeline service instance, or None unless timelines are enabled."""
+    if not settings.ACTIVITY_FEED_TIMELINES_ENABLED:
+        return None
+    return TimelineService(
+        timeline_repository,
+        watchlist_repository,
+        account_repository,
+        review_repository,
+        max_entries=settings.ACTIVITY_FEED_TIMELINE_MAX_ENTRIES,
+        fanout_max_watchers=settings.ACTIVITY_FEED_FANOUT_MAX_WATCHERS,
+    )
+
+
 def get_review_enrichment_service(
     account_service: AccountService = Depends(get_account_service),
     user_service: UserService = Depends(get_user_service),
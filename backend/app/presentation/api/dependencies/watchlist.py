@@ -8,10 +8,12 @@ from app.application.watchlist.use_cases.get_watchlist import (
 )
 from app.application.watchlist.use_cases.unwatch import UnwatchUseCase
 from app.application.watchlist.use_cases.watch import WatchUseCase
+from app.domain.timeline.services.timeline_service import TimelineService
 from app.domain.users.services.user_service import UserService
 from app.domain.watchlist.services.watchlist_service import WatchlistService
 
 from .services import (
+    get_timeline_service,
     get_user_service,
     get_watchlist_service,
 )
@@ -19,16 +21,18 @@ from .services import (
 
 def get_watch_use_case(
     watchlist_service: WatchlistService = Depends(get_watchlist_service),
+    timeline_service: TimelineService | None = Depends(get_timeline_service),
 ) -> WatchUseCase:
     """Get watch use case instance."""
-    return WatchUseCase(watchlist_service)
+    return WatchUseCase(watchlist_service, timeline_service)
 
 
 def get_unwatch_use_case(
     watchlist_service: WatchlistService = Depends(get_watchlist_service),
+    timeline_service: TimelineService | None = Depends(get_timeline_service),
 ) -> UnwatchUseCase:
     """Get unwatch use case instance."""
-    return UnwatchUseCase(watchlist_service)
+    return UnwatchUseCase(watchlist_service, timeline_service)
 
 
 def get_all_by_watcher_use_case(
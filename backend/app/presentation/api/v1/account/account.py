@@ -1,7 +1,8 @@
 from typing import Literal
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
 from app.application.accounts.use_cases.delete_account import DeleteAccountUseCase
 from app.application.accounts.use_cases.get_activity_feed import (
@@ -10,12 +11,19 @@ from app.application.accounts.use_cases.get_activity_feed import (
 from app.application.accounts.use_cases.get_current_account import (
     GetCurrentAccountUseCase,
 )
+from app.application.accounts.use_cases.stream_activity_feed import (
+    StreamActivityFeedUseCase,
+)
 from app.application.reviews.use_cases.get_my_reviews import GetMyReviewsUseCase
+from app.domain.reviews.value_objects.review_change import ReviewChange
+from app.domain.shared.pagination import KeysetCursor
+from app.infrastructure.shared.config.config import settings
 from app.presentation.api.dependencies.accounts import (
     get_activity_feed_use_case,
     get_current_account_use_case,
     get_delete_account_use_case,
     get_my_reviews_use_case,
+    get_stream_activity_feed_use_case,
 )
 from app.presentation.api.dependencies.auth import get_current_account_uuid
 from app.presentation.api.v1.account.schemas.response import (
@@ -24,6 +32,12 @@ from app.presentation.api.v1.account.schemas.response import (
     PaginatedActivityFeedResponse,
 )
 from app.presentation.api.v1.review.schemas.response import ReviewResponse
+from app.presentation.api.v1.shared.etag import etag_matches, make_etag, not_modified
+from app.presentation.api.v1.shared.sse import (
+    SSE_HEADERS,
+    SSE_MEDIA_TYPE,
+    stream_review_changes,
+)
 
 router = APIRouter()
 
@@ -63,19 +77,75 @@ async def get_my_reviews(
 
 @router.get("/feed", response_model=PaginatedActivityFeedResponse)
 async def get_activity_feed(
+    request: Request,
+    response: Response,
     account_uuid: UUID = Depends(get_current_account_uuid),
     use_case: GetActivityFeedUseCase = Depends(get_activity_feed_use_case),
     filter: Literal["all", "mine", "watching"] = Query("all"),
     limit: int = Query(16, ge=1, le=100),
-    offset: int = Query(0, ge=0),
-) -> PaginatedActivityFeedResponse:
-    """Get activity feed with reviews."""
-    items = await use_case.execute(account_uuid, filter, limit + 1, offset)
+    cursor: str | None = Query(None),
+    since: str | None = Query(None),
+    offset: int = Query(0, ge=0, deprecated=True),
+    if_none_match: str | None = Header(None),
+) -> PaginatedActivityFeedResponse | Response:
+    """Get activity feed with reviews.
+
+    Pass the returned next_cursor as cursor to fetch the following page, and
+    since_cursor as since to fetch only reviews updated after this response.
+    Answers 304 Not Modified when If-None-Match matches the feed's ETag.
+    """
+    keyset = KeysetCursor.decode(cursor) if cursor else None
+    since_keyset = KeysetCursor.decode(since) if since else None
+    scope = await use_case.resolve_scope(account_uuid, filter)
+    version = await use_case.get_version(account_uuid, filter, scope=scope)
+    etag = make_etag(version, request)
+    if etag_matches(etag, if_none_match):
+        return not_modified(etag)
+
+    items = await use_case.execute(
+        account_uuid, filter, limit + 1, offset, keyset, since_keyset, scope=scope
+    )
     has_more = len(items) > limit
     paginated_items = items[:limit]
+    response.headers["ETag"] = etag
     return PaginatedActivityFeedResponse(
         items=[
             ActivityFeedItemResponse.from_activity_item(item) for item in paginated_items
         ],
+        next_cursor=paginated_items[-1].cursor.encode() if has_more else None,
+        since_cursor=version.newest.encode() if version.newest else since,
         has_more=has_more,
     )
+
+
+@router.get("/feed/stream", response_class=StreamingResponse)
+async def stream_activity_feed(
+    account_uuid: UUID = Depends(get_current_account_uuid),
+    use_case: StreamActivityFeedUseCase = Depends(get_stream_activity_feed_use_case),
+    filter: Literal["all", "mine", "watching"] = Query("all"),
+    last_event_id: str | None = Header(None),
+) -> StreamingResponse:
+    """Stream new and updated activity feed items as Server-Sent Events.
+
+    Each ``review`` event carries an activity feed item. Reconnecting with
+    Last-Event-ID resumes after that event; a ``reset`` event means the
+    client missed items and should refetch the feed.
+    """
+    subscription = await use_case.subscribe(account_uuid, filter, last_event_id)
+
+    async def render(change: ReviewChange) -> str | None:
+        item = await use_case.render(change)
+        if item is None:
+            return None
+        return ActivityFeedItemResponse.from_activity_item(item).model_dump_json()
+
+    return StreamingResponse(
+        stream_review_changes(
+            subscription,
+            render,
+            lambda: use_case.unsubscribe(subscription),
+            settings.REVIEW_CHANGE_STREAM_HEARTBEAT_SECONDS,
+        ),
+        media_type=SSE_MEDIA_TYPE,
+        headers=SSE_HEADERS,
+    )
@@ -7,4 +7,8 @@ class PaginatedActivityFeedResponse(BaseResponse):
     """Paginated response for activity feed."""
 
     items: list[ActivityFeedItemResponse]
+    next_cursor: str | None = None
+    # Pass as since on the next refresh to fetch only reviews updated after it.
+    since_cursor: str | None = None
+    # Deprecated: use next_cursor; kept while clients migrate off offset paging.
     has_more: bool
@@ -1,6 +1,7 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query, Request
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
@@ -11,10 +12,14 @@ from app.application.reviews.use_cases.delete_review import DeleteReviewUseCase
 from app.application.reviews.use_cases.get_reviewers import GetReviewersUseCase
 from app.application.reviews.use_cases.get_reviews import GetReviewsUseCase
 from app.application.reviews.use_cases.get_suggestions import GetSuggestionsUseCase
+from app.application.reviews.use_cases.stream_reviews import StreamReviewsUseCase
 from app.application.reviews.use_cases.toggle_comment_hidden import (
     ToggleCommentHiddenUseCase,
 )
+from app.domain.reviews.value_objects.review_change import ReviewChange
 from app.domain.shared.constants import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from app.domain.shared.pagination import KeysetCursor
+from app.infrastructure.shared.config.config import settings
 from app.infrastructure.shared.constants import RATE_LIMIT_REVIEW_WRITE
 from app.presentation.api.dependencies.auth import get_current_account_uuid
 from app.presentation.api.dependencies.reviews import (
@@ -22,6 +27,7 @@ from app.presentation.api.dependencies.reviews import (
     get_delete_review_use_case,
     get_reviewers_use_case,
     get_reviews_use_case,
+    get_stream_reviews_use_case,
     get_suggestions_use_case,
     get_toggle_comment_hidden_use_case,
 )
@@ -35,6 +41,12 @@ from app.presentation.api.v1.review.schemas.response import (
     ReviewResponse,
     ReviewSuggestionResponse,
 )
+from app.presentation.api.v1.shared.etag import etag_matches, make_etag, not_modified
+from app.presentation.api.v1.shared.sse import (
+    SSE_HEADERS,
+    SSE_MEDIA_TYPE,
+    stream_review_changes,
+)
 
 router = APIRouter()
 limiter = Limiter(key_func=get_remote_address)
@@ -90,22 +102,76 @@ async def get_reviewers(
     ]
 
 
+@router.get("/{username}/stream", response_class=StreamingResponse)
+async def stream_reviews(
+    username: str,
+    account_uuid: UUID = Depends(get_current_account_uuid),
+    use_case: StreamReviewsUseCase = Depends(get_stream_reviews_use_case),
+    last_event_id: str | None = Header(None),
+) -> StreamingResponse:
+    """Stream new and updated reviews of a user as Server-Sent Events.
+
+    Each ``review`` event carries a review. Reconnecting with Last-Event-ID
+    resumes after that event; a ``reset`` event means the client missed
+    reviews and should refetch the page.
+    """
+    stream = await use_case.subscribe(username, account_uuid, last_event_id)
+
+    async def render(change: ReviewChange) -> str | None:
+        result = await use_case.render(change)
+        if result is None:
+            return None
+        return ReviewResponse.from_review_with_username(
+            result, is_page_owner=stream.is_page_owner, is_moderator=stream.is_moderator
+        ).model_dump_json()
+
+    return StreamingResponse(
+        stream_review_changes(
+            stream.subscription,
+            render,
+            lambda: use_case.unsubscribe(stream),
+            settings.REVIEW_CHANGE_STREAM_HEARTBEAT_SECONDS,
+        ),
+        media_type=SSE_MEDIA_TYPE,
+        headers=SSE_HEADERS,
+    )
+
+
 @router.get("/{username}", response_model=PaginatedReviewResponse)
 async def get_reviews(
+    request: Request,
+    response: Response,
     username: str,
     limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
-    offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None),
+    offset: int = Query(0, ge=0, deprecated=True),
     status: str | None = Query(None),
+    since: str | None = Query(None),
+    if_none_match: str | None = Header(None),
     account_uuid: UUID = Depends(get_current_account_uuid),
     use_case: GetReviewsUseCase = Depends(get_reviews_use_case),
-) -> PaginatedReviewResponse:
-    """Get paginated reviews for a user."""
+) -> PaginatedReviewResponse | Response:
+    """Get paginated reviews for a user.
+
+    Pass the returned next_cursor as cursor to fetch the following page, and
+    since_cursor as since to fetch only reviews updated after this response.
+    Answers 304 Not Modified when If-None-Match matches the ETag.
+    """
+    keyset = KeysetCursor.decode(cursor) if cursor else None
+    since_keyset = KeysetCursor.decode(since) if since else None
+    version = await use_case.get_version(username, account_uuid, status=status)
+    etag = make_etag(version, request)
+    if etag_matches(etag, if_none_match):
+        return not_modified(etag)
+
     result = await use_case.execute(
         username,
         viewer_uuid=account_uuid,
         limit=limit,
         offset=offset,
         status=status,
+        since=since_keyset,
+        cursor=keyset,
     )
 
     items = [
@@ -115,9 +181,12 @@ async def get_reviews(
         for r in result.items
     ]
 
+    response.headers["ETag"] = etag
     return PaginatedReviewResponse(
         items=items,
+        next_cursor=result.next_cursor.encode() if result.next_cursor else None,
         has_more=result.has_more,
+        since_cursor=version.newest.encode() if version.newest else since,
     )
 
 
@@ -6,4 +6,8 @@ class PaginatedReviewResponse(BaseResponse):
     """Response schema for paginated review results."""
 
     items: list[ReviewResponse]
+    next_cursor: str | None = None
+    # Deprecated: use next_cursor; kept while clients migrate off offset paging.
     has_more: bool
+    # Pass as since on the next refresh to fetch only reviews updated after it.
+    since_cursor: str | None = None
@@ -0,0 +1,24 @@
+import hashlib
+
+from fastapi import Request, Response
+
+from app.domain.shared.pagination import ListVersion
+
+
+def make_etag(version: ListVersion, request: Request) -> str:
+    """Strong ETag for a list response from its version and query parameters."""
+    digest = hashlib.sha256(f"{version.tag}?{request.url.query}".encode())
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def etag_matches(etag: str, if_none_match: str | None) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if if_none_match is None:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response that keeps the client's cached copy."""
+    return Response(status_code=304, headers={"ETag": etag})
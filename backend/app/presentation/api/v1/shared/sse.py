@@ -0,0 +1,43 @@
+from collections.abc import AsyncGenerator, Awaitable, Callable
+
+from app.domain.reviews.services.review_change_hub import ReviewSubscription
+from app.domain.reviews.value_objects.review_change import ReviewChange
+
+SSE_MEDIA_TYPE = "text/event-stream"
+# Disable proxy buffering so events are flushed as they are written
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+SSE_KEEP_ALIVE = ": keep-alive\n\n"
+
+
+def format_event(event: str, data: str, event_id: str | None = None) -> str:
+    """Format one Server-Sent Event; data must not contain newlines."""
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    lines += [f"event: {event}", f"data: {data}"]
+    return "\n".join(lines) + "\n\n"
+
+
+async def stream_review_changes(
+    subscription: ReviewSubscription,
+    render: Callable[[ReviewChange], Awaitable[str | None]],
+    close: Callable[[], None],
+    heartbeat_seconds: float,
+) -> AsyncGenerator[str, None]:
+    """Write a subscription's changes as ``review`` events until disconnect.
+
+    Each event id is the change's resume token, which the browser sends back
+    as Last-Event-ID on reconnect. A ``reset`` event tells the client it
+    missed changes and must refetch.
+    """
+    try:
+        while True:
+            if subscription.take_reset():
+                yield format_event("reset", "{}")
+            change = await subscription.next(heartbeat_seconds)
+            if change is None:
+                yield SSE_KEEP_ALIVE
+                continue
+            data = await render(change)
+            if data is not None:
+                yield format_event("review", data, event_id=change.token)
+    finally:
+        close()
@@ -1,4 +1,5 @@
 import logging
+from datetime import timedelta
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Request
@@ -43,6 +44,12 @@ logger = logging.getLogger(__name__)
 limiter = Limiter(key_func=get_remote_address)
 
 
+def _swr_max_staleness(route: str) -> timedelta | None:
+    """Stale-while-revalidate bound configured for a route, if enabled."""
+    days = settings.USER_CACHE_SWR_MAX_STALENESS_DAYS.get(route)
+    return timedelta(days=days) if days is not None else None
+
+
 @router.get("/auth", response_model=OAuthUrlResponse)
 async def github_auth() -> OAuthUrlResponse:
     """Get GitHub OAuth login URL."""
@@ -104,7 +111,9 @@ async def get_user(
     use_case: GetUserUseCase = Depends(get_user_use_case),
 ) -> UserResponse:
     """Get a GitHub user by username."""
-    user = await use_case.execute(username, account_uuid)
+    user = await use_case.execute(
+        username, account_uuid, max_staleness=_swr_max_staleness("get_user")
+    )
     return UserResponse.from_entity(user)
 
 
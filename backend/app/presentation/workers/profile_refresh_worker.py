@@ -0,0 +1,106 @@
+import asyncio
+import logging
+from datetime import timedelta
+from uuid import uuid4
+
+from app.application.github.use_cases.refresh_expiring_users import (
+    RefreshExpiringUsersUseCase,
+)
+from app.application.github.use_cases.refresh_users import RefreshUsersUseCase
+from app.infrastructure.github.external.github_client import GitHubClient
+from app.infrastructure.shared.config.config import settings
+from app.presentation.api.dependencies.github import user_view_counts
+from app.presentation.api.dependencies.repositories import (
+    get_account_repository,
+    get_lease_repository,
+    get_review_repository,
+    get_review_stats_repository,
+    get_user_repository,
+    get_watchlist_repository,
+)
+from app.presentation.api.dependencies.services import (
+    get_account_service,
+    get_review_service,
+    get_user_service,
+    get_watchlist_service,
+)
+
+logger = logging.getLogger(__name__)
+
+PROFILE_REFRESH_LEASE_KEY = "worker:profile-refresh"
+
+
+async def run_profile_refresh_worker(github_client: GitHubClient) -> None:
+    """Run profile refresh passes until cancelled on shutdown.
+
+    A Mongo lease held for one interval ensures a single pass per interval
+    across all app processes. Every process flushes its buffered profile
+    views each interval, before the pass ranks candidates by them.
+    """
+    owner = uuid4().hex
+    interval = settings.PROFILE_REFRESH_INTERVAL_SECONDS
+    lease_repository = get_lease_repository()
+    while True:
+        try:
+            await flush_view_counts()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Profile view flush failed")
+        try:
+            # Slightly shorter than the interval so this owner can take it again.
+            if await lease_repository.acquire(
+                PROFILE_REFRESH_LEASE_KEY, owner, interval * 0.9
+            ):
+                await run_profile_refresh_pass(github_client)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Profile refresh pass failed")
+        await asyncio.sleep(interval)
+
+
+async def flush_view_counts() -> int:
+    """Write the profile views buffered in this process. Returns users counted."""
+    counts = user_view_counts.drain()
+    if counts:
+        await get_user_service(get_user_repository()).record_views(counts)
+    return len(counts)
+
+
+async def run_profile_refresh_pass(github_client: GitHubClient) -> int:
+    """Run one refresh pass with the configured account's GitHub token."""
+    account_repository = get_account_repository()
+    user_repository = get_user_repository()
+    account_service = get_account_service(account_repository)
+    account = await account_service.get_account_by_username(
+        settings.PROFILE_REFRESH_ACCOUNT_USERNAME
+    )
+    if account is None or not account.access_token:
+        logger.warning(
+            "Profile refresh skipped: no GitHub token for account %r",
+            settings.PROFILE_REFRESH_ACCOUNT_USERNAME,
+        )
+        return 0
+
+    user_service = get_user_service(user_repository)
+    use_case = RefreshExpiringUsersUseCase(
+        user_service,
+        get_watchlist_service(
+            get_watchlist_repository(), account_repository, user_repository
+        ),
+        get_review_service(
+            get_review_repository(),
+            account_repository,
+            user_repository,
+            get_review_stats_repository(),
+        ),
+        RefreshUsersUseCase(account_service, user_service, github_client),
+    )
+    return await use_case.execute(
+        account.uuid,
+        lead_time=timedelta(hours=settings.PROFILE_REFRESH_LEAD_HOURS),
+        budget=settings.PROFILE_REFRESH_BUDGET_PER_CYCLE,
+        batch_size=settings.PROFILE_REFRESH_BATCH_SIZE,
+        concurrency=settings.PROFILE_REFRESH_CONCURRENCY,
+    )
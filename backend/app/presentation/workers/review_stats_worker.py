@@ -0,0 +1,73 @@
+import asyncio
+import logging
+from uuid import uuid4
+
+from pymongo import AsyncMongoClient
+
+from app.domain.reviews.services.review_service import ReviewService
+from app.infrastructure.shared.config.config import settings
+from app.infrastructure.shared.database.connection import init_database
+from app.infrastructure.shared.observability.logging import setup_loggers
+from app.presentation.api.dependencies.repositories import (
+    get_account_repository,
+    get_lease_repository,
+    get_review_repository,
+    get_review_stats_repository,
+    get_user_repository,
+)
+from app.presentation.api.dependencies.services import get_review_service
+
+logger = logging.getLogger(__name__)
+
+REVIEW_STATS_REBUILD_LEASE_KEY = "worker:review-stats-rebuild"
+REVIEW_STATS_REBUILD_LEASE_SECONDS = 600.0
+
+
+def _review_service() -> ReviewService:
+    return get_review_service(
+        get_review_repository(),
+        get_account_repository(),
+        get_user_repository(),
+        get_review_stats_repository(),
+    )
+
+
+async def rebuild_review_stats() -> int | None:
+    """Rebuild the review stats collection from the reviews collection.
+
+    A Mongo lease keeps concurrent processes from rebuilding at the same time.
+    Returns the number of profiles with stats, or None when nothing was rebuilt.
+    """
+    review_service = _review_service()
+    lease_repository = get_lease_repository()
+    owner = uuid4().hex
+    if not await lease_repository.acquire(
+        REVIEW_STATS_REBUILD_LEASE_KEY, owner, REVIEW_STATS_REBUILD_LEASE_SECONDS
+    ):
+        logger.info("Review stats rebuild skipped: already running elsewhere")
+        return None
+    try:
+        count = await review_service.rebuild_review_stats()
+    finally:
+        await lease_repository.release(REVIEW_STATS_REBUILD_LEASE_KEY, owner)
+    logger.info("Review stats rebuilt for %d profiles", count)
+    return count
+
+
+async def main() -> None:
+    """Pre-deploy migration and repair job.
+
+    Run ``python -m app.presentation.workers.review_stats_worker`` while review
+    writes are quiet. Review counts are read from reviews until it completes.
+    """
+    setup_loggers()
+    client: AsyncMongoClient = AsyncMongoClient(settings.MONGO_URI)
+    try:
+        await init_database(client)
+        await rebuild_review_stats()
+    finally:
+        await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
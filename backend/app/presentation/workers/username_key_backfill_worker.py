@@ -0,0 +1,63 @@
+import asyncio
+import logging
+from uuid import uuid4
+
+from pymongo import AsyncMongoClient
+
+from app.infrastructure.shared.config.config import settings
+from app.infrastructure.shared.database.connection import init_database
+from app.infrastructure.shared.database.migrations.username_keys import (
+    backfill_username_keys,
+)
+from app.infrastructure.shared.observability.logging import setup_loggers
+from app.presentation.api.dependencies.repositories import get_lease_repository
+
+logger = logging.getLogger(__name__)
+
+USERNAME_KEY_BACKFILL_LEASE_KEY = "worker:username-key-backfill"
+USERNAME_KEY_BACKFILL_LEASE_SECONDS = 600.0
+
+
+async def run_username_key_backfill() -> dict[str, int]:
+    """Backfill the normalized ``*_lc`` username keys of existing documents.
+
+    Runs online and resumably: each pass only visits documents still
+    missing a key. It is the pre-deploy migration step (see ``main``) and
+    also runs in the background on app start, to pick up documents older
+    app versions inserted during a rollout. A Mongo lease keeps processes
+    from walking the same documents at once; a process that finds it held
+    skips its pass. Returns changes per migration.
+    """
+    lease_repository = get_lease_repository()
+    owner = uuid4().hex
+    if not await lease_repository.acquire(
+        USERNAME_KEY_BACKFILL_LEASE_KEY, owner, USERNAME_KEY_BACKFILL_LEASE_SECONDS
+    ):
+        logger.info("Username key backfill running elsewhere, skipping it")
+        return {}
+    try:
+        changed = await backfill_username_keys()
+    finally:
+        await lease_repository.release(USERNAME_KEY_BACKFILL_LEASE_KEY, owner)
+    logger.info("Username key backfill finished: %s", changed)
+    return changed
+
+
+async def main() -> None:
+    """Migration: ``python -m app.presentation.workers.username_key_backfill_worker``.
+
+    Run against the live database before deploying code that reads the
+    keys, since lookups miss documents without them; older app versions
+    ignore the extra fields.
+    """
+    setup_loggers()
+    client: AsyncMongoClient = AsyncMongoClient(settings.MONGO_URI)
+    try:
+        await init_database(client)
+        await run_username_key_backfill()
+    finally:
+        await client.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
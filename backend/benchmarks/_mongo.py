@@ -0,0 +1,21 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from pymongo import AsyncMongoClient
+from testcontainers.mongodb import MongoDbContainer
+
+from app.infrastructure.shared.config.config import settings
+from app.infrastructure.shared.database.connection import init_database
+
+
+@asynccontextmanager
+async def benchmark_database() -> AsyncIterator[AsyncMongoClient]:
+    """Start a throwaway MongoDB container and initialize Beanie against it."""
+    with MongoDbContainer("mongo:7.0") as mongo:
+        client: AsyncMongoClient = AsyncMongoClient(mongo.get_connection_url())
+        settings.MONGO_DB = "peerhub_benchmark"
+        await init_database(client)
+        try:
+            yield client
+        finally:
+            await client.close()
@@ -0,0 +1,130 @@
+"""Activity feed latency versus watchlist size.
+
+Compares the single merged feed query (ReviewRepository.get_feed) against
+the previous per-username fan-out, which ran one query per watched user and
+sorted the union in Python, and against the lazy k-way merge of one cursor
+per watched user (ACTIVITY_FEED_MERGE_STREAMS). Peak Python memory per
+request is reported alongside latency. Requires Docker (Testcontainers).
+
+    uv run python -m benchmarks.activity_feed
+"""
+
+import asyncio
+import random
+import statistics
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from uuid import uuid4
+
+from app.application.accounts.use_cases.get_activity_feed import (
+    STREAM_BATCH_SIZE,
+    merge_newest_first,
+)
+from app.domain.reviews.entities.review import Review, ReviewStatus
+from app.infrastructure.reviews.database.models.review_model import ReviewDocument
+from app.infrastructure.reviews.database.repositories.mongodb_review_repository import (
+    MongoDBReviewRepository,
+)
+from benchmarks._mongo import benchmark_database
+
+WATCHLIST_SIZES = [10, 50, 200, 500, 1000]
+REVIEWS_PER_USER = 20
+PAGE_SIZE = 50
+RUNS = 20
+
+
+async def _seed(max_users: int) -> list[str]:
+    now = datetime.now(timezone.utc)
+    usernames = [f"user{i}" for i in range(max_users)]
+    documents = []
+    for username in usernames:
+        for _ in range(REVIEWS_PER_USER):
+            timestamp = now - timedelta(minutes=random.randint(0, 525_600))  # noqa: S311
+            documents.append(
+                ReviewDocument(
+                    reviewer_uuid=uuid4(),
+                    reviewed_username=username,
+                    reviewed_username_lc=username,
+                    status=ReviewStatus.APPROVE,
+                    created_at=timestamp,
+                    updated_at=timestamp,
+                )
+            )
+    await ReviewDocument.insert_many(documents)
+    return usernames
+
+
+async def _fan_out(repo: MongoDBReviewRepository, usernames: list[str]) -> list[Review]:
+    lists = await asyncio.gather(*(repo.get_all_for_username(u) for u in usernames))
+    reviews = [review for reviews in lists for review in reviews]
+    reviews.sort(key=lambda r: r.updated_at, reverse=True)
+    return reviews[:PAGE_SIZE]
+
+
+async def _k_way_merge(
+    repo: MongoDBReviewRepository, usernames: list[str]
+) -> list[Review]:
+    batch_size = min(PAGE_SIZE, STREAM_BATCH_SIZE)
+    merged = merge_newest_first(
+        [
+            repo.stream_feed_for_username(u, PAGE_SIZE, batch_size=batch_size)
+            for u in usernames
+        ]
+    )
+    reviews: list[Review] = []
+    try:
+        async for review in merged:
+            reviews.append(review)
+            if len(reviews) == PAGE_SIZE:
+                break
+    finally:
+        await merged.aclose()
+    return reviews
+
+
+async def _peak_kib(fn: Callable[[], Awaitable[object]]) -> float:
+    tracemalloc.start()
+    try:
+        await fn()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+async def _median_ms(fn: Callable[[], Awaitable[object]]) -> float:
+    await fn()  # warm-up
+    samples = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+async def main() -> None:
+    async with benchmark_database():
+        usernames = await _seed(max(WATCHLIST_SIZES))
+        repo = MongoDBReviewRepository()
+
+        strategies: dict[str, Callable[[list[str]], Awaitable[object]]] = {
+            "merged query": partial(repo.get_feed, limit=PAGE_SIZE),
+            "fan-out": partial(_fan_out, repo),
+            "k-way merge": partial(_k_way_merge, repo),
+        }
+        print(f"{'watched':>8} " + " ".join(f"{name:>26}" for name in strategies))
+        for size in WATCHLIST_SIZES:
+            subset = usernames[:size]
+            cells = []
+            for fn in strategies.values():
+                run = partial(fn, subset)
+                ms = await _median_ms(run)
+                kib = await _peak_kib(run)
+                cells.append(f"{ms:>10.2f} ms {kib:>9.0f} KiB")
+            print(f"{size:>8} " + " ".join(cells))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,158 @@
+"""Memory and GC cost of domain entities over a synthetic 100k-review load.
+
+Decodes 100k BSON review rows the way the raw read path does, maps them to
+Review entities and wraps each in an ActivityFeedItem, then reports the
+memory the loaded items retain, the time to build them and the time of a
+full garbage collection while they are alive. The slotted entities (with
+interned reviewed usernames) are compared against the same classes with a
+per-instance ``__dict__``. Runs without MongoDB.
+
+    uv run python -m benchmarks.entity_memory
+"""
+
+import gc
+import random
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import fields, make_dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from uuid import uuid4
+
+import bson
+from bson import CodecOptions, ObjectId, UuidRepresentation
+
+from app.application.accounts.use_cases.get_activity_feed import ActivityFeedItem
+from app.domain.reviews.entities.review import Review, ReviewStatus
+from app.infrastructure.reviews.database.mappers.review_mapper import ReviewMapper
+
+REVIEWS = 100_000
+REVIEWED_USERS = 1_000
+REVIEWERS = 5_000
+RUNS = 5
+
+_CODEC_OPTIONS: CodecOptions = CodecOptions(
+    uuid_representation=UuidRepresentation.STANDARD
+)
+
+
+def _with_dict(cls: type) -> type:
+    """The same dataclass fields laid out with a per-instance __dict__."""
+    return make_dataclass(f"{cls.__name__}Dict", [(f.name, f.type) for f in fields(cls)])
+
+
+_DictReview = _with_dict(Review)
+_DictActivityFeedItem = _with_dict(ActivityFeedItem)
+
+
+def _encoded_rows() -> list[bytes]:
+    now = datetime.now(timezone.utc)
+    statuses = [status.value for status in ReviewStatus]
+    rows = []
+    for _ in range(REVIEWS):
+        timestamp = now - timedelta(minutes=random.randint(0, 525_600))  # noqa: S311
+        rows.append(
+            bson.encode(
+                {
+                    "_id": ObjectId(),
+                    "reviewer_uuid": bson.Binary.from_uuid(uuid4()),
+                    "reviewed_username": f"user{random.randrange(REVIEWED_USERS)}",  # noqa: S311
+                    "status": random.choice(statuses),  # noqa: S311
+                    "comment": None,
+                    "anonymous": False,
+                    "created_at": timestamp,
+                    "updated_at": timestamp,
+                    "comment_hidden": False,
+                    "comment_hidden_by": None,
+                }
+            )
+        )
+    return rows
+
+
+def _slotted(raw: dict[str, Any], reviewer: str) -> object:
+    return ActivityFeedItem(
+        review=ReviewMapper.from_raw(raw),
+        reviewer_username=reviewer,
+        reviewer_avatar_url=None,
+        reviewed_user_avatar_url=None,
+    )
+
+
+def _with_dicts(raw: dict[str, Any], reviewer: str) -> object:
+    return _DictActivityFeedItem(
+        review=_DictReview(
+            id=str(raw["_id"]),
+            reviewer_uuid=raw["reviewer_uuid"],
+            reviewed_username=raw["reviewed_username"],
+            status=ReviewStatus(raw["status"]),
+            comment=raw["comment"],
+            anonymous=raw["anonymous"],
+            created_at=raw["created_at"],
+            updated_at=raw["updated_at"],
+            comment_hidden=raw["comment_hidden"],
+            comment_hidden_by=raw["comment_hidden_by"],
+        ),
+        reviewer_username=reviewer,
+        reviewer_avatar_url=None,
+        reviewed_user_avatar_url=None,
+    )
+
+
+def _load(
+    rows: list[bytes], reviewers: list[str], build: Callable[[dict, str], object]
+) -> list[object]:
+    return [
+        build(bson.decode(row, codec_options=_CODEC_OPTIONS), reviewers[i % REVIEWERS])
+        for i, row in enumerate(rows)
+    ]
+
+
+def _retained_mib(load: Callable[[], list[object]]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        items = load()
+        retained = tracemalloc.get_traced_memory()[0]
+        del items
+        return retained / 1024 / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def _median_ms(load: Callable[[], list[object]]) -> tuple[float, float]:
+    """Median time to build the items and to run a full collection over them."""
+    build_samples = []
+    gc_samples = []
+    for _ in range(RUNS):
+        gc.collect()
+        start = time.perf_counter()
+        items = load()
+        build_samples.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        gc.collect()
+        gc_samples.append((time.perf_counter() - start) * 1000)
+        del items
+    return statistics.median(build_samples), statistics.median(gc_samples)
+
+
+def main() -> None:
+    rows = _encoded_rows()
+    reviewers = [f"reviewer{i}" for i in range(REVIEWERS)]
+    layouts = {"__dict__": _with_dicts, "slots": _slotted}
+
+    print(f"{'layout':>10} {'retained':>14} {'build':>12} {'full gc':>12}")
+    for name, build in layouts.items():
+
+        def load(build: Callable[[dict, str], object] = build) -> list[object]:
+            return _load(rows, reviewers, build)
+
+        mib = _retained_mib(load)
+        build_ms, gc_ms = _median_ms(load)
+        print(f"{name:>10} {mib:>10.1f} MiB {build_ms:>9.1f} ms {gc_ms:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Raw PyMongo fast path versus Beanie validation for hot list reads.
+
+Times each review list read through Beanie, which validates a Document (or
+projection model) per row before mapping it, against the ``raw=True`` path,
+which reads rows through the driver and decodes them straight into domain
+entities. Covers the 512-row reviewers list, a 512-review profile page with
+comments and a feed page over a watchlist. Peak Python memory per read is
+reported alongside latency. Requires Docker (Testcontainers).
+
+    uv run python -m benchmarks.repository_reads
+"""
+
+import asyncio
+import random
+import statistics
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from uuid import uuid4
+
+from app.domain.reviews.entities.review import ReviewStatus
+from app.domain.shared.constants import MAX_REVIEWERS
+from app.infrastructure.reviews.database.models.review_model import ReviewDocument
+from app.infrastructure.reviews.database.repositories.mongodb_review_repository import (
+    MongoDBReviewRepository,
+)
+from benchmarks._mongo import benchmark_database
+
+PROFILE_USERNAME = "popular"
+WATCHLIST_SIZE = 200
+REVIEWS_PER_USER = 20
+FEED_PAGE_SIZE = 512
+RUNS = 20
+
+
+async def _seed() -> list[str]:
+    now = datetime.now(timezone.utc)
+    usernames = [f"user{i}" for i in range(WATCHLIST_SIZE)]
+    reviewed = [PROFILE_USERNAME] * MAX_REVIEWERS + [
+        username for username in usernames for _ in range(REVIEWS_PER_USER)
+    ]
+    statuses = list(ReviewStatus)
+    documents = []
+    for username in reviewed:
+        timestamp = now - timedelta(minutes=random.randint(0, 525_600))  # noqa: S311
+        documents.append(
+            ReviewDocument(
+                reviewer_uuid=uuid4(),
+                reviewed_username=username,
+                reviewed_username_lc=username,
+                status=random.choice(statuses),  # noqa: S311
+                comment="Looks good to me, left a few notes on the tests. " * 4,
+                created_at=timestamp,
+                updated_at=timestamp,
+            )
+        )
+    await ReviewDocument.insert_many(documents)
+    return usernames
+
+
+async def _peak_kib(fn: Callable[[], Awaitable[object]]) -> float:
+    tracemalloc.start()
+    try:
+        await fn()
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+async def _median_ms(fn: Callable[[], Awaitable[object]]) -> float:
+    await fn()  # warm-up
+    samples = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+async def main() -> None:
+    async with benchmark_database():
+        usernames = await _seed()
+        repo = MongoDBReviewRepository()
+
+        reads: dict[str, Callable[..., Awaitable[object]]] = {
+            "reviewers list": partial(
+                repo.get_summaries_for_username, PROFILE_USERNAME, MAX_REVIEWERS
+            ),
+            "profile reviews": partial(
+                repo.get_all_for_username, PROFILE_USERNAME, MAX_REVIEWERS
+            ),
+            "feed page": partial(repo.get_feed, usernames, FEED_PAGE_SIZE),
+        }
+        paths = {"beanie": False, "raw": True}
+        print(f"{'read':>16} " + " ".join(f"{name:>26}" for name in paths))
+        for name, read in reads.items():
+            cells = []
+            for raw in paths.values():
+                run = partial(read, raw=raw)
+                ms = await _median_ms(run)
+                kib = await _peak_kib(run)
+                cells.append(f"{ms:>10.2f} ms {kib:>9.0f} KiB")
+            print(f"{name:>16} " + " ".join(cells))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -6,13 +6,16 @@ import pytest
 
 from app.domain.accounts.entities.account import Account
 from app.domain.accounts.services.account_service import AccountService
+from app.domain.following.services.following_service import FollowingService
 from app.domain.reviews.entities.review import Review, ReviewStatus
 from app.domain.reviews.services.review_enrichment_service import ReviewEnrichmentService
 from app.domain.reviews.services.review_service import ReviewService
+from app.domain.timeline.services.timeline_service import TimelineService
 from app.domain.users.entities.user import User
 from app.domain.users.services.user_service import UserService
 from app.domain.watchlist.entities.watch import Watch
 from app.domain.watchlist.services.watchlist_service import WatchlistService
+from app.infrastructure.github.external.github_client import GitHubClient
 
 
 @pytest.fixture
@@ -25,6 +28,11 @@ def mock_review_repository() -> AsyncMock:
     return AsyncMock()
 
 
+@pytest.fixture
+def mock_review_stats_repository() -> AsyncMock:
+    return AsyncMock()
+
+
 @pytest.fixture
 def mock_watchlist_repository() -> AsyncMock:
     return AsyncMock()
@@ -35,6 +43,21 @@ def mock_user_repository() -> AsyncMock:
     return AsyncMock()
 
 
+@pytest.fixture
+def mock_following_repository() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_timeline_repository() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def mock_github_client() -> AsyncMock:
+    return AsyncMock(spec=GitHubClient)
+
+
 @pytest.fixture
 def account_service(mock_account_repository: AsyncMock) -> AccountService:
     return AccountService(mock_account_repository)
@@ -45,9 +68,13 @@ def review_service(
     mock_review_repository: AsyncMock,
     mock_account_repository: AsyncMock,
     mock_user_repository: AsyncMock,
+    mock_review_stats_repository: AsyncMock,
 ) -> ReviewService:
     return ReviewService(
-        mock_review_repository, mock_account_repository, mock_user_repository
+        mock_review_repository,
+        mock_account_repository,
+        mock_user_repository,
+        mock_review_stats_repository,
     )
 
 
@@ -103,6 +130,29 @@ def user_service(mock_user_repository: AsyncMock) -> UserService:
     return UserService(mock_user_repository)
 
 
+@pytest.fixture
+def following_service(mock_following_repository: AsyncMock) -> FollowingService:
+    return FollowingService(mock_following_repository)
+
+
+@pytest.fixture
+def timeline_service(
+    mock_timeline_repository: AsyncMock,
+    mock_watchlist_repository: AsyncMock,
+    mock_account_repository: AsyncMock,
+    mock_review_repository: AsyncMock,
+) -> TimelineService:
+    return TimelineService(
+        mock_timeline_repository,
+        mock_watchlist_repository,
+        mock_account_repository,
+        mock_review_repository,
+        max_entries=100,
+        fanout_max_watchers=3,
+        trim_every=1,
+    )
+
+
 @pytest.fixture
 def enrichment_service(
     account_service: AccountService, user_service: UserService
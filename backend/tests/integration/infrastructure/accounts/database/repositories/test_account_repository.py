@@ -1,12 +1,16 @@
 from datetime import datetime, timezone
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
+from bson import Binary
 
 from app.domain.accounts.entities.account import Account
+from app.infrastructure.accounts.database.models.account_model import AccountDocument
 from app.infrastructure.accounts.database.repositories.mongodb_account_repository import (
     MongoDBAccountRepository,
 )
+from app.infrastructure.shared.config.config import settings
 
 
 @pytest.mark.asyncio
@@ -62,3 +66,71 @@ async def test_account_repository_get_by_usernames():
 
     assert len(fetched) == 1
     assert fetched[0].username == "Charlie"
+
+
+@pytest.mark.asyncio
+async def test_account_repository_username_lookup_uses_normalized_key_index():
+    collection = AccountDocument.get_pymongo_collection()
+    explain = await collection.find({"username_lc": {"$in": ["alice"]}}).explain()
+    plan = str(explain["queryPlanner"]["winningPlan"])
+
+    assert "IXSCAN" in plan
+    assert "username_lc" in plan
+
+
+@pytest.mark.asyncio
+async def test_account_repository_upsert_by_username():
+    repo = MongoDBAccountRepository()
+    first = Account(id=None, uuid=uuid4(), username="Alice", access_token="one")
+
+    created, previous = await repo.upsert_by_username(first, ["access_token"])
+    assert previous is None
+    assert created.uuid == first.uuid
+
+    second = Account(id=None, uuid=uuid4(), username="alice", access_token="two")
+    updated, previous = await repo.upsert_by_username(second, ["access_token"])
+
+    assert previous is not None and previous.access_token == "one"
+    assert (updated.id, updated.uuid) == (created.id, first.uuid)
+    assert (updated.username, updated.access_token) == ("Alice", "two")
+    assert await AccountDocument.find_all().count() == 1
+
+
+@pytest.mark.asyncio
+async def test_account_repository_upsert_matches_account_without_key():
+    collection = AccountDocument.get_pymongo_collection()
+    # Stored by an app version that predates the username_lc key
+    await collection.insert_one(
+        {
+            "uuid": Binary.from_uuid(uuid4()),
+            "username": "Alice",
+            "access_token": "one",
+            "created_at": datetime.now(timezone.utc),
+        }
+    )
+    repo = MongoDBAccountRepository()
+    login = Account(id=None, uuid=uuid4(), username="Alice", access_token="two")
+
+    with patch.object(settings, "USERNAME_KEY_LEGACY_FALLBACK", True):
+        updated, previous = await repo.upsert_by_username(login, ["access_token"])
+
+    assert previous is not None
+    assert (updated.username, updated.access_token) == ("Alice", "two")
+    stored = await collection.find_one({})
+    assert stored is not None and stored["username_lc"] == "alice"
+    assert await collection.count_documents({}) == 1
+
+
+@pytest.mark.asyncio
+async def test_account_repository_summaries_leave_out_credentials():
+    repo = MongoDBAccountRepository()
+    account = await repo.create(
+        Account(id=None, uuid=uuid4(), username="Alice", access_token="secret")
+    )
+
+    by_uuid = await repo.get_summaries_by_uuids([account.uuid])
+    by_username = await repo.get_summaries_by_usernames(["alice"])
+
+    assert by_uuid == by_username
+    assert [(s.uuid, s.username) for s in by_uuid] == [(account.uuid, "Alice")]
+    assert not hasattr(by_uuid[0], "access_token")
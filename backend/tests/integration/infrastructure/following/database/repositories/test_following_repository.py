@@ -0,0 +1,43 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.domain.following.entities.following_graph import (
+    FollowedUser,
+    FollowingGraph,
+    FollowingGraphPage,
+)
+from app.infrastructure.following.database.repositories.mongodb_following_repository import (  # noqa: E501
+    MongoDBFollowingRepository,
+)
+
+
+@pytest.mark.asyncio
+async def test_save_and_load_following_graph():
+    repo = MongoDBFollowingRepository()
+    account_uuid = uuid4()
+    graph = FollowingGraph(
+        id=None,
+        account_uuid=account_uuid,
+        pages=[
+            FollowingGraphPage(
+                users=[FollowedUser(login="alice", avatar_url="a.png", type="User")],
+                etag='"p1"',
+                next_url="https://api.github.com/user/1/following?page=2",
+            ),
+            FollowingGraphPage(users=[FollowedUser(login="bob", type="User")]),
+        ],
+        synced_at=datetime.now(timezone.utc),
+    )
+
+    saved = await repo.save(graph)
+    loaded = await repo.get_by_account_uuid(account_uuid)
+
+    assert loaded is not None
+    assert loaded.id == saved.id
+    assert [u.login for u in loaded.following] == ["alice", "bob"]
+    assert loaded.pages[0].etag == '"p1"'
+
+    await repo.delete_by_account_uuid(account_uuid)
+    assert await repo.get_by_account_uuid(account_uuid) is None
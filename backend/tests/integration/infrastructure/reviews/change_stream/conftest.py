@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+import pytest_asyncio
+from pymongo import AsyncMongoClient, MongoClient
+from testcontainers.core.container import DockerContainer
+from testcontainers.core.waiting_utils import wait_for_logs
+
+
+@pytest.fixture(scope="session")
+def mongodb_replica_set_url() -> str:
+    """Single-node replica set; change streams are unavailable on standalone."""
+    try:
+        container = (
+            DockerContainer("mongo:7.0")
+            .with_command("--replSet rs0 --bind_ip_all")
+            .with_exposed_ports(27017)
+        )
+        with container:
+            wait_for_logs(container, "Waiting for connections")
+            host = container.get_container_host_ip()
+            port = container.get_exposed_port(27017)
+            url = f"mongodb://{host}:{port}/?directConnection=true"
+            with MongoClient(url) as client:
+                client.admin.command(
+                    "replSetInitiate",
+                    {"_id": "rs0", "members": [{"_id": 0, "host": "localhost:27017"}]},
+                )
+                while not client.admin.command("hello").get("isWritablePrimary"):
+                    time.sleep(0.2)
+            yield url
+    except Exception as exc:  # pragma: no cover - environment dependent
+        pytest.skip(f"MongoDB replica set not available: {exc}")
+
+
+@pytest_asyncio.fixture(scope="function")
+async def mongo_client(mongodb_replica_set_url: str) -> AsyncMongoClient:
+    client = AsyncMongoClient(mongodb_replica_set_url)
+    yield client
+    await client.close()
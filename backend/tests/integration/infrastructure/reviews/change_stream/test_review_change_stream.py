@@ -0,0 +1,73 @@
+import asyncio
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.domain.reviews.entities.review import Review, ReviewStatus
+from app.domain.reviews.services.review_change_hub import ReviewChangeHub
+from app.infrastructure.reviews.database.repositories.mongodb_review_change_stream import (  # noqa: E501
+    MongoDBReviewChangeStream,
+)
+from app.infrastructure.reviews.database.repositories.mongodb_review_repository import (
+    MongoDBReviewRepository,
+)
+
+
+def _review(username: str) -> Review:
+    now = datetime.now(timezone.utc)
+    return Review(
+        id=None,
+        reviewer_uuid=uuid4(),
+        reviewed_username=username,
+        status=ReviewStatus.APPROVE,
+        comment=None,
+        anonymous=False,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.mark.asyncio
+async def test_change_stream_delivers_writes_and_resumes_from_tokens():
+    stream = MongoDBReviewChangeStream()
+    repo = MongoDBReviewRepository()
+    changes = stream.watch()
+    first = asyncio.ensure_future(anext(changes))
+    await asyncio.sleep(0.5)
+
+    created = await repo.create(_review("alice"))
+    inserted = await asyncio.wait_for(first, timeout=10)
+    created.comment = "edited"
+    await repo.update(created)
+    updated = await asyncio.wait_for(anext(changes), timeout=10)
+    await changes.aclose()
+
+    assert inserted.review.id == created.id
+    assert updated.review.comment == "edited"
+
+    missed = await stream.changes_since(inserted.token, limit=10)
+    assert missed is not None
+    assert [c.token for c in missed] == [updated.token]
+    assert await stream.changes_since("not-a-token", limit=10) is None
+
+
+@pytest.mark.asyncio
+async def test_hub_routes_change_stream_writes_to_subscribers():
+    stream = MongoDBReviewChangeStream()
+    repo = MongoDBReviewRepository()
+    hub = ReviewChangeHub(stream)
+    subscription = await hub.subscribe(["Alice"], uuid4())
+    consumer = asyncio.create_task(hub.run())
+    await asyncio.sleep(0.5)
+
+    try:
+        await repo.create(_review("bob"))
+        created = await repo.create(_review("alice"))
+        change = await subscription.next(timeout=10)
+    finally:
+        consumer.cancel()
+        await asyncio.gather(consumer, return_exceptions=True)
+
+    assert change is not None
+    assert change.review.id == created.id
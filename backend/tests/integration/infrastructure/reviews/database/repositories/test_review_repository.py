@@ -1,12 +1,20 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
-from uuid import uuid4
+from unittest.mock import patch
+from uuid import UUID, uuid4
 
 import pytest
+from beanie import PydanticObjectId
+from bson import Binary
 
 from app.domain.reviews.entities.review import Review, ReviewStatus
+from app.domain.shared.exceptions import AnonymousFieldImmutableException
+from app.domain.shared.pagination import KeysetCursor
+from app.infrastructure.reviews.database.models.review_model import ReviewDocument
 from app.infrastructure.reviews.database.repositories.mongodb_review_repository import (
     MongoDBReviewRepository,
 )
+from app.infrastructure.shared.config.config import settings
 
 
 @pytest.mark.asyncio
@@ -29,11 +37,8 @@ async def test_review_repository_case_insensitive_username_and_counts():
     fetched = await repo.get_by_reviewer_and_username(reviewer_uuid, "bob")
     assert fetched is not None
 
-    count = await repo.get_review_count_for_username("bob")
-    assert count == 1
-
-    counts = await repo.get_review_counts_for_usernames(["bob"])
-    assert counts["Bob"] == 1
+    counts = await repo.get_status_counts_by_reviewer_uuid(reviewer_uuid)
+    assert counts == {"bob": {ReviewStatus.APPROVE: 1}}
 
 
 @pytest.mark.asyncio
@@ -70,7 +75,464 @@ async def test_review_repository_sort_and_delete():
     assert results[0].id == newer_created.id
     assert results[1].id == older_created.id
 
-    await repo.delete(newer_created.id)
+    assert await repo.delete(newer_created.id) is True
+    assert await repo.delete(newer_created.id) is False
     remaining = await repo.get_all_for_username("alice")
     assert len(remaining) == 1
     assert remaining[0].id == older_created.id
+
+
+@pytest.mark.asyncio
+async def test_review_repository_feed_merges_by_updated_at():
+    repo = MongoDBReviewRepository()
+    viewer_uuid = uuid4()
+    now = datetime.now(timezone.utc)
+
+    def review(reviewer_uuid, username: str, minutes_ago: int) -> Review:
+        timestamp = now - timedelta(minutes=minutes_ago)
+        return Review(
+            id=None,
+            reviewer_uuid=reviewer_uuid,
+            reviewed_username=username,
+            status=ReviewStatus.APPROVE,
+            comment=None,
+            anonymous=False,
+            created_at=timestamp,
+            updated_at=timestamp,
+        )
+
+    await repo.create(review(uuid4(), "Alice", 5))
+    await repo.create(review(uuid4(), "bob", 1))
+    await repo.create(review(uuid4(), "alice", 3))
+    await repo.create(review(uuid4(), "draft", 2))
+    await repo.create(review(viewer_uuid, "draft", 4))
+    await repo.create(review(uuid4(), "carol", 0))
+
+    feed = await repo.get_feed(
+        ["alice", "BOB"], limit=10, draft_usernames=["draft"], viewer_uuid=viewer_uuid
+    )
+    assert [(r.reviewed_username, r.reviewer_uuid == viewer_uuid) for r in feed] == [
+        ("bob", False),
+        ("alice", False),
+        ("draft", True),
+        ("Alice", False),
+    ]
+
+    page = await repo.get_feed(["alice", "bob"], limit=1, offset=1)
+    assert [r.reviewed_username for r in page] == ["alice"]
+
+
+@pytest.mark.asyncio
+async def test_review_repository_feed_keyset_pages_across_equal_timestamps():
+    repo = MongoDBReviewRepository()
+    now = datetime.now(timezone.utc)
+    for _ in range(5):
+        await repo.create(
+            Review(
+                id=None,
+                reviewer_uuid=uuid4(),
+                reviewed_username="tie",
+                status=ReviewStatus.APPROVE,
+                comment=None,
+                anonymous=False,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+
+    seen: list[str] = []
+    after = None
+    while True:
+        page = await repo.get_feed(["tie"], limit=2, after=after)
+        if not page:
+            break
+        seen.extend(r.id for r in page if r.id)
+        last = page[-1]
+        after = KeysetCursor(sort_value=last.updated_at, id=last.id or "")
+
+    assert len(seen) == 5
+    assert len(set(seen)) == 5
+
+
+@pytest.mark.asyncio
+async def test_review_repository_streams_username_feed_in_batches():
+    repo = MongoDBReviewRepository()
+    viewer_uuid = uuid4()
+    now = datetime.now(timezone.utc)
+    for minutes, reviewer in [(1, uuid4()), (2, viewer_uuid), (3, uuid4())]:
+        await repo.create(
+            Review(
+                id=None,
+                reviewer_uuid=reviewer,
+                reviewed_username="Dana",
+                status=ReviewStatus.APPROVE,
+                comment=None,
+                anonymous=False,
+                created_at=now - timedelta(minutes=minutes),
+                updated_at=now - timedelta(minutes=minutes),
+            )
+        )
+
+    streamed = [r async for r in repo.stream_feed_for_username("dana", 10, batch_size=1)]
+    assert [r.updated_at for r in streamed] == sorted(
+        (r.updated_at for r in streamed), reverse=True
+    )
+    assert len(streamed) == 3
+
+    own = [
+        r
+        async for r in repo.stream_feed_for_username(
+            "dana", 10, reviewer_uuid=viewer_uuid
+        )
+    ]
+    assert [r.reviewer_uuid for r in own] == [viewer_uuid]
+
+
+@pytest.mark.asyncio
+async def test_review_repository_feed_version_and_since():
+    repo = MongoDBReviewRepository()
+    now = datetime.now(timezone.utc)
+    reviews = []
+    for minutes in (3, 2):
+        reviews.append(
+            await repo.create(
+                Review(
+                    id=None,
+                    reviewer_uuid=uuid4(),
+                    reviewed_username="Erin",
+                    status=ReviewStatus.APPROVE,
+                    comment=None,
+                    anonymous=False,
+                    created_at=now - timedelta(minutes=minutes),
+                    updated_at=now - timedelta(minutes=minutes),
+                )
+            )
+        )
+
+    version = await repo.get_feed_version(["erin"])
+    assert version.count == 2
+    assert version.newest is not None and version.newest.id == reviews[1].id
+    assert await repo.get_feed(["erin"], limit=10, since=version.newest) == []
+
+    reviews[0].comment = "edited"
+    reviews[0].updated_at = now
+    await repo.update(reviews[0])
+
+    changed = await repo.get_feed(["erin"], limit=10, since=version.newest)
+    assert [r.id for r in changed] == [reviews[0].id]
+    assert await repo.get_all_for_username("erin", since=version.newest) == changed
+    updated = await repo.get_feed_version(["erin"])
+    assert updated.count == 2
+    assert updated.newest != version.newest
+    assert (await repo.get_feed_version(["erin"], status="comment")).count == 0
+
+
+@pytest.mark.asyncio
+async def test_review_repository_feed_uses_updated_at_index():
+    collection = ReviewDocument.get_pymongo_collection()
+    cursor = (
+        collection.find({"reviewed_username_lc": {"$in": ["alice", "bob"]}})
+        .sort([("updated_at", -1), ("_id", -1)])
+        .limit(10)
+    )
+    explain = await cursor.explain()
+    plan = str(explain["queryPlanner"]["winningPlan"])
+
+    assert "reviewed_username_lc_updated_at_id_desc" in plan
+    assert "'stage': 'SORT'" not in plan
+
+
+@pytest.mark.asyncio
+async def test_review_repository_profile_keyset_pages_across_equal_timestamps():
+    repo = MongoDBReviewRepository()
+    now = datetime.now(timezone.utc)
+    for i in range(5):
+        await repo.create(
+            Review(
+                id=None,
+                reviewer_uuid=uuid4(),
+                reviewed_username="Tie",
+                status=ReviewStatus.APPROVE if i % 2 else ReviewStatus.REQUEST_CHANGE,
+                comment=None,
+                anonymous=False,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+
+    seen: list[str] = []
+    after = None
+    while True:
+        page = await repo.get_all_for_username("tie", limit=2, after=after)
+        if not page:
+            break
+        seen.extend(r.id for r in page if r.id)
+        last = page[-1]
+        after = KeysetCursor(sort_value=last.created_at, id=last.id or "")
+
+    assert len(set(seen)) == 5
+    approved = await repo.get_all_for_username("tie", status=ReviewStatus.APPROVE)
+    assert len(approved) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("query", "index"),
+    [
+        ({"reviewed_username_lc": "bob"}, "reviewed_username_lc_created_at_id_desc"),
+        (
+            {"reviewed_username_lc": "bob", "status": "approve"},
+            "reviewed_username_lc_status_created_at_id_desc",
+        ),
+    ],
+)
+async def test_review_repository_profile_pages_use_created_at_index(
+    query: dict, index: str
+):
+    collection = ReviewDocument.get_pymongo_collection()
+    cursor = collection.find(query).sort([("created_at", -1), ("_id", -1)]).limit(10)
+    explain = await cursor.explain()
+    plan = str(explain["queryPlanner"]["winningPlan"])
+
+    assert index in plan
+    assert "'stage': 'SORT'" not in plan
+
+
+@pytest.mark.asyncio
+async def test_review_repository_filters_profile_reviews_by_reviewer():
+    repo = MongoDBReviewRepository()
+    viewer_uuid = uuid4()
+    now = datetime.now(timezone.utc)
+    for reviewer in (uuid4(), viewer_uuid, uuid4()):
+        await repo.create(
+            Review(
+                id=None,
+                reviewer_uuid=reviewer,
+                reviewed_username="Draft",
+                status=ReviewStatus.APPROVE,
+                comment=None,
+                anonymous=False,
+                created_at=now,
+                updated_at=now,
+            )
+        )
+
+    reviews = await repo.get_all_for_username("draft", limit=2, reviewer_uuid=viewer_uuid)
+
+    assert [r.reviewer_uuid for r in reviews] == [viewer_uuid]
+
+    collection = ReviewDocument.get_pymongo_collection()
+    viewer = Binary.from_uuid(viewer_uuid)
+    cursor = (
+        collection.find({"reviewed_username_lc": "draft", "reviewer_uuid": viewer})
+        .sort([("created_at", -1), ("_id", -1)])
+        .limit(2)
+    )
+    explain = await cursor.explain()
+    plan = str(explain["queryPlanner"]["winningPlan"])
+    assert "IXSCAN" in plan and "COLLSCAN" not in plan
+
+
+@pytest.mark.asyncio
+async def test_review_repository_lookups_are_equality_on_the_normalized_key():
+    repo = MongoDBReviewRepository()
+    reviewer_uuid = uuid4()
+    now = datetime.now(timezone.utc)
+    await repo.create(
+        Review(
+            id=None,
+            reviewer_uuid=reviewer_uuid,
+            reviewed_username="MixedCase",
+            status=ReviewStatus.APPROVE,
+            comment=None,
+            anonymous=False,
+            created_at=now,
+            updated_at=now,
+        )
+    )
+
+    stored = await ReviewDocument.get_pymongo_collection().find_one({})
+    assert stored is not None
+    assert stored["reviewed_username"] == "MixedCase"
+    assert stored["reviewed_username_lc"] == "mixedcase"
+    assert await repo.get_by_reviewer_and_username(reviewer_uuid, "MIXEDCASE")
+
+
+def _submission(
+    reviewer_uuid: UUID,
+    username: str,
+    status: ReviewStatus,
+    comment: str | None = None,
+    anonymous: bool = False,
+) -> Review:
+    now = datetime.now(timezone.utc)
+    return Review(
+        id=None,
+        reviewer_uuid=reviewer_uuid,
+        reviewed_username=username,
+        status=status,
+        comment=comment,
+        anonymous=anonymous,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.mark.asyncio
+async def test_review_repository_upsert_creates_then_updates():
+    repo = MongoDBReviewRepository()
+    reviewer_uuid = uuid4()
+
+    created, previous = await repo.upsert(
+        _submission(reviewer_uuid, "Bob", ReviewStatus.APPROVE)
+    )
+    assert previous is None and created.id is not None
+
+    with patch.object(settings, "USERNAME_KEY_LEGACY_FALLBACK", True):
+        updated, previous = await repo.upsert(
+            _submission(reviewer_uuid, "Bob", ReviewStatus.COMMENT, "Hmm")
+        )
+
+    assert previous is not None and previous.status == ReviewStatus.APPROVE
+    assert updated.id == created.id
+    assert updated.reviewed_username == "Bob"
+    assert (updated.status, updated.comment) == (ReviewStatus.COMMENT, "Hmm")
+    assert updated.created_at == previous.created_at
+    assert await ReviewDocument.find_all().count() == 1
+
+    with pytest.raises(AnonymousFieldImmutableException):
+        await repo.upsert(
+            _submission(reviewer_uuid, "BOB", ReviewStatus.APPROVE, anonymous=True)
+        )
+
+
+@pytest.mark.asyncio
+async def test_review_repository_concurrent_upserts_store_one_review():
+    repo = MongoDBReviewRepository()
+    reviewer_uuid = uuid4()
+
+    results = await asyncio.gather(
+        *(
+            repo.upsert(_submission(reviewer_uuid, "bob", ReviewStatus.APPROVE))
+            for _ in range(5)
+        )
+    )
+
+    assert len({saved.id for saved, _ in results}) == 1
+    assert sum(previous is None for _, previous in results) == 1
+    assert await ReviewDocument.find_all().count() == 1
+
+
+@pytest.mark.asyncio
+async def test_review_repository_update_writes_only_changed_fields():
+    repo = MongoDBReviewRepository()
+    created, _ = await repo.upsert(_submission(uuid4(), "bob", ReviewStatus.APPROVE))
+    assert created.id is not None
+    review = await repo.get_by_id(created.id)
+    assert review is not None
+
+    # A concurrent edit of another field survives the hide.
+    collection = ReviewDocument.get_pymongo_collection()
+    await collection.update_one(
+        {"_id": PydanticObjectId(created.id)}, {"$set": {"comment": "edited"}}
+    )
+    review.set_comment_hidden(True, "bob")
+    updated = await repo.update(review)
+
+    assert updated.comment_hidden is True
+    assert updated.comment == "edited"
+
+
+@pytest.mark.asyncio
+async def test_review_repository_failed_update_is_written_again():
+    repo = MongoDBReviewRepository()
+    created, _ = await repo.upsert(_submission(uuid4(), "bob", ReviewStatus.APPROVE))
+    assert created.id is not None
+    review = await repo.get_by_id(created.id)
+    assert review is not None
+
+    review.update_status(ReviewStatus.COMMENT, "first")
+    with patch.object(repo, "find_one_and_update", side_effect=ConnectionError):
+        with pytest.raises(ConnectionError):
+            await repo.update(review)
+    await repo.update(review)
+
+    stored = await repo.get_by_id(created.id)
+    assert stored is not None
+    assert (stored.status, stored.comment) == (ReviewStatus.COMMENT, "first")
+
+
+@pytest.mark.asyncio
+async def test_review_repository_upsert_updates_review_without_key():
+    reviewer_uuid = uuid4()
+    collection = ReviewDocument.get_pymongo_collection()
+    # Stored by an app version that predates the reviewed_username_lc key
+    await collection.insert_one(
+        {
+            "reviewer_uuid": Binary.from_uuid(reviewer_uuid),
+            "reviewed_username": "Bob",
+            "status": "approve",
+            "anonymous": False,
+            "created_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc),
+        }
+    )
+    repo = MongoDBReviewRepository()
+
+    updated, previous = await repo.upsert(
+        _submission(reviewer_uuid, "bob", ReviewStatus.COMMENT, "Hmm")
+    )
+
+    assert previous is not None and previous.status == ReviewStatus.APPROVE
+    assert (updated.reviewed_username, updated.comment) == ("Bob", "Hmm")
+    assert await collection.count_documents({"reviewed_username_lc": "bob"}) == 1
+    with pytest.raises(AnonymousFieldImmutableException):
+        await repo.upsert(
+            _submission(reviewer_uuid, "BOB", ReviewStatus.APPROVE, anonymous=True)
+        )
+
+
+@pytest.mark.asyncio
+async def test_review_repository_summaries_read_only_summary_fields():
+    repo = MongoDBReviewRepository()
+    reviewer_uuid = uuid4()
+    created, _ = await repo.upsert(
+        _submission(reviewer_uuid, "Bob", ReviewStatus.COMMENT, "Secret")
+    )
+    await repo.upsert(_submission(uuid4(), "bob", ReviewStatus.APPROVE))
+
+    summaries = await repo.get_summaries_for_username("BOB", limit=10)
+    assert len(summaries) == 2
+    assert not hasattr(summaries[0], "comment")
+
+    mine = await repo.get_summaries_for_username(
+        "bob", limit=10, reviewer_uuid=reviewer_uuid
+    )
+    assert [(s.id, s.status) for s in mine] == [(created.id, ReviewStatus.COMMENT)]
+
+
+@pytest.mark.asyncio
+async def test_review_repository_raw_reads_match_validated_reads():
+    repo = MongoDBReviewRepository()
+    reviewer_uuid = uuid4()
+    await repo.upsert(_submission(reviewer_uuid, "Bob", ReviewStatus.COMMENT, "Hi"))
+    await repo.upsert(_submission(uuid4(), "bob", ReviewStatus.APPROVE, anonymous=True))
+    # Rows written before the optional fields existed decode with their defaults.
+    await ReviewDocument.get_pymongo_collection().insert_one(
+        {
+            "reviewer_uuid": Binary.from_uuid(uuid4()),
+            "reviewed_username": "bob",
+            "reviewed_username_lc": "bob",
+            "status": "approve",
+            "created_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc),
+        }
+    )
+
+    feed = await repo.get_feed(["BOB"], limit=10, raw=True)
+    assert len(feed) == 3
+    assert feed == await repo.get_feed(["BOB"], limit=10)
+    mine = await repo.get_all_for_username("bob", reviewer_uuid=reviewer_uuid, raw=True)
+    assert mine == await repo.get_all_for_username("bob", reviewer_uuid=reviewer_uuid)
+    summaries = await repo.get_summaries_for_username("bob", raw=True)
+    assert summaries == await repo.get_summaries_for_username("bob")
@@ -0,0 +1,91 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+
+from app.domain.reviews.entities.review import Review, ReviewStatus
+from app.infrastructure.reviews.database.models.review_stats_model import (
+    ReviewStatsDocument,
+)
+from app.infrastructure.reviews.database.repositories.mongodb_review_repository import (
+    MongoDBReviewRepository,
+)
+from app.infrastructure.reviews.database.repositories.mongodb_review_stats_repository import (  # noqa: E501
+    MongoDBReviewStatsRepository,
+)
+
+
+def _review(username: str, status: ReviewStatus) -> Review:
+    now = datetime.now(timezone.utc)
+    return Review(
+        id=None,
+        reviewer_uuid=uuid4(),
+        reviewed_username=username,
+        status=status,
+        comment="note" if status == ReviewStatus.COMMENT else None,
+        anonymous=False,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.mark.asyncio
+async def test_review_stats_increment_is_case_insensitive():
+    repo = MongoDBReviewStatsRepository()
+
+    await repo.increment({"Bob": {ReviewStatus.APPROVE: 1}})
+    await repo.increment({"bob": {ReviewStatus.APPROVE: -1, ReviewStatus.COMMENT: 1}})
+    await repo.increment({"carol": {ReviewStatus.APPROVE: 0}})
+
+    stats = await repo.get_by_usernames(["BOB", "carol"])
+    assert list(stats) == ["bob"]
+    assert stats["bob"].total == 1
+    assert stats["bob"].count_for(ReviewStatus.COMMENT) == 1
+    assert stats["bob"].count_for(ReviewStatus.APPROVE) == 0
+
+
+@pytest.mark.asyncio
+async def test_review_stats_rebuild_recounts_from_reviews(monkeypatch):
+    monkeypatch.setattr(MongoDBReviewStatsRepository, "_built", False)
+    reviews = MongoDBReviewRepository()
+    repo = MongoDBReviewStatsRepository()
+    for username, status in [
+        ("Alice", ReviewStatus.APPROVE),
+        ("alice", ReviewStatus.REQUEST_CHANGE),
+        ("alice", ReviewStatus.APPROVE),
+        ("dave", ReviewStatus.COMMENT),
+    ]:
+        await reviews.create(_review(username, status))
+    # Drifted and orphaned counters are replaced.
+    await repo.increment(
+        {"alice": {ReviewStatus.COMMENT: 5}, "ghost": {ReviewStatus.APPROVE: 1}}
+    )
+
+    # Increments alone don't mark the stats as built
+    assert await repo.is_built() is False
+
+    assert await repo.rebuild() == 2
+    assert await repo.is_built() is True
+
+    stats = await repo.get_by_usernames(["alice", "dave", "ghost"])
+    assert set(stats) == {"alice", "dave"}
+    alice = stats["alice"]
+    assert (alice.total, alice.approve, alice.request_change, alice.comment) == (
+        3,
+        2,
+        1,
+        0,
+    )
+    assert stats["dave"].comment == 1
+    assert await reviews.get_review_counts_for_usernames(["ALICE", "dave"]) == {
+        "alice": 3,
+        "dave": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_review_stats_point_read_uses_username_index():
+    collection = ReviewStatsDocument.get_pymongo_collection()
+    explain = await collection.find({"username": {"$in": ["bob"]}}).explain()
+
+    assert "username_unique" in str(explain["queryPlanner"]["winningPlan"])
@@ -0,0 +1,114 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from bson import Binary, ObjectId
+
+from app.infrastructure.accounts.database.models.account_model import AccountDocument
+from app.infrastructure.accounts.database.repositories.mongodb_account_repository import (
+    MongoDBAccountRepository,
+)
+from app.infrastructure.reviews.database.models.review_model import ReviewDocument
+from app.infrastructure.shared.database.migrations import username_keys
+from app.infrastructure.shared.database.models.migration_model import (
+    MigrationDocument,
+)
+from app.infrastructure.timeline.database.models.timeline_entry_model import (
+    TimelineEntryDocument,
+)
+
+
+async def _insert_legacy_accounts(*usernames: str, **fields: object) -> None:
+    """Insert accounts the way app versions before the *_lc keys stored them."""
+    await AccountDocument.get_pymongo_collection().insert_many(
+        [
+            {
+                "uuid": Binary.from_uuid(uuid4()),
+                "username": username,
+                "access_token": "t",
+                "created_at": datetime.now(timezone.utc),
+                **fields,
+            }
+            for username in usernames
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_backfill_sets_keys_in_batches_and_picks_up_late_documents():
+    repo = MongoDBAccountRepository()
+    await _insert_legacy_accounts("Alice", "BOB", "carol")
+    assert await repo.get_by_username("alice") is None
+
+    key = username_keys.USERNAME_KEYS[0]
+    assert await username_keys.backfill_lowercase_key(key, batch_size=2) == 3
+
+    fetched = await repo.get_by_username("ALICE")
+    assert fetched is not None and fetched.username == "Alice"
+
+    # A document whose _id sorts before the ones already migrated, as one
+    # inserted by another process during a rollout can, is still picked up.
+    await _insert_legacy_accounts("Dave", _id=ObjectId("000000000000000000000001"))
+    assert await username_keys.backfill_lowercase_key(key, batch_size=2) == 1
+    assert await repo.get_by_username("dave") is not None
+    assert await username_keys.backfill_lowercase_key(key) == 0
+
+
+@pytest.mark.asyncio
+async def test_backfill_skips_case_variant_duplicates():
+    await _insert_legacy_accounts("Foo", "bar", "foo")
+
+    key = username_keys.USERNAME_KEYS[0]
+    assert await username_keys.backfill_lowercase_key(key, batch_size=10) == 2
+
+    outcome = await MigrationDocument.get_pymongo_collection().find_one(
+        {"_id": key.migration_id}
+    )
+    assert outcome is not None and outcome["skipped"] == 1
+    assert await AccountDocument.find({"username_lc": {"$exists": False}}).count() == 1
+
+
+@pytest.mark.asyncio
+async def test_backfill_covers_every_username_collection():
+    await ReviewDocument.get_pymongo_collection().insert_one(
+        {
+            "reviewer_uuid": Binary.from_uuid(uuid4()),
+            "reviewed_username": "Erin",
+            "status": "approve",
+            "anonymous": False,
+            "created_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc),
+        }
+    )
+
+    changed = await username_keys.backfill_username_keys()
+
+    assert changed["lowercase_key:reviews.reviewed_username_lc"] == 1
+    stored = await ReviewDocument.get_pymongo_collection().find_one({})
+    assert stored is not None and stored["reviewed_username_lc"] == "erin"
+
+
+@pytest.mark.asyncio
+async def test_backfill_sets_embedded_timeline_key():
+    now = datetime.now(timezone.utc)
+    await TimelineEntryDocument.get_pymongo_collection().insert_one(
+        {
+            "owner_uuid": Binary.from_uuid(uuid4()),
+            "review": {
+                "review_id": ObjectId(),
+                "reviewer_uuid": Binary.from_uuid(uuid4()),
+                "reviewed_username": "Erin",
+                "status": "approve",
+                "created_at": now,
+                "updated_at": now,
+            },
+            "own": False,
+            "draft": False,
+        }
+    )
+
+    changed = await username_keys.backfill_username_keys()
+
+    assert changed["lowercase_key:timeline_entries.review.reviewed_username_lc"] == 1
+    stored = await TimelineEntryDocument.get_pymongo_collection().find_one({})
+    assert stored is not None and stored["review"]["reviewed_username_lc"] == "erin"
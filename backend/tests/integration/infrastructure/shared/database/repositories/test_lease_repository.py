@@ -0,0 +1,30 @@
+import pytest
+
+from app.infrastructure.shared.database.repositories.mongodb_lease_repository import (
+    MongoDBLeaseRepository,
+)
+
+
+@pytest.mark.asyncio
+async def test_lease_is_exclusive_until_released():
+    repo = MongoDBLeaseRepository()
+
+    assert await repo.acquire("github-user:alice", "worker-a", 10) is True
+    assert await repo.acquire("github-user:alice", "worker-b", 10) is False
+    assert await repo.is_held("github-user:alice") is True
+
+    await repo.release("github-user:alice", "worker-b")
+    assert await repo.is_held("github-user:alice") is True
+
+    await repo.release("github-user:alice", "worker-a")
+    assert await repo.is_held("github-user:alice") is False
+    assert await repo.acquire("github-user:alice", "worker-b", 10) is True
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_can_be_taken_over():
+    repo = MongoDBLeaseRepository()
+
+    assert await repo.acquire("github-user:bob", "worker-a", -1) is True
+    assert await repo.is_held("github-user:bob") is False
+    assert await repo.acquire("github-user:bob", "worker-b", 10) is True
@@ -0,0 +1,184 @@
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+import pytest
+from beanie import PydanticObjectId
+
+from app.domain.reviews.entities.review import Review, ReviewStatus
+from app.domain.shared.pagination import KeysetCursor
+from app.domain.timeline.entities.timeline_entry import TimelineEntry
+from app.infrastructure.timeline.database.models.timeline_entry_model import (
+    TimelineEntryDocument,
+)
+from app.infrastructure.timeline.database.repositories.mongodb_timeline_repository import (  # noqa: E501
+    MongoDBTimelineRepository,
+)
+
+
+def _entry(
+    owner_uuid: UUID,
+    username: str,
+    minutes_ago: int,
+    own: bool = False,
+    draft: bool = False,
+    reviewer_uuid: UUID | None = None,
+) -> TimelineEntry:
+    at = datetime.now(timezone.utc) - timedelta(minutes=minutes_ago)
+    review = Review(
+        id=str(PydanticObjectId()),
+        reviewer_uuid=reviewer_uuid or uuid4(),
+        reviewed_username=username,
+        status=ReviewStatus.APPROVE,
+        comment=None,
+        anonymous=False,
+        created_at=at,
+        updated_at=at,
+    )
+    return TimelineEntry(
+        id=None, owner_uuid=owner_uuid, review=review, own=own, draft=draft
+    )
+
+
+@pytest.mark.asyncio
+async def test_timeline_repository_upsert_and_page_in_feed_order():
+    repo = MongoDBTimelineRepository()
+    owner = uuid4()
+    newest = _entry(owner, "bob", 1, own=True)
+    middle = _entry(owner, "alice", 2)
+    oldest = _entry(owner, "alice", 3)
+    await repo.upsert_many([oldest, newest, middle, _entry(uuid4(), "bob", 0)])
+
+    page = await repo.get_page(owner, limit=10)
+    assert [e.review.id for e in page] == [
+        newest.review.id,
+        middle.review.id,
+        oldest.review.id,
+    ]
+
+    after = KeysetCursor(sort_value=page[0].review.updated_at, id=page[0].review.id or "")
+    rest = await repo.get_page(owner, limit=10, after=after, own=False)
+    assert [e.review.id for e in rest] == [middle.review.id, oldest.review.id]
+
+    # Re-publishing the same review replaces its snapshot instead of duplicating it.
+    middle.review.comment = "edited"
+    await repo.upsert_many([middle])
+    entries = await repo.get_page(owner, limit=10)
+    assert len(entries) == 3
+    assert entries[1].review.comment == "edited"
+
+
+@pytest.mark.asyncio
+async def test_timeline_repository_upsert_keeps_newer_snapshots():
+    repo = MongoDBTimelineRepository()
+    owner = uuid4()
+    entry = _entry(owner, "alice", 2)
+    stale = _entry(owner, "alice", 5)
+    stale.review = replace(stale.review, id=entry.review.id)
+    stale.review.comment = "stale"
+    await repo.upsert_many([entry])
+
+    await repo.upsert_many([stale])
+
+    page = await repo.get_page(owner, limit=10)
+    assert [(e.review.id, e.review.comment) for e in page] == [(entry.review.id, None)]
+
+
+@pytest.mark.asyncio
+async def test_timeline_repository_hides_other_peoples_draft_reviews():
+    repo = MongoDBTimelineRepository()
+    owner = uuid4()
+    mine = _entry(owner, "draft", 1, draft=True, reviewer_uuid=owner)
+    theirs = _entry(owner, "draft", 2, draft=True)
+    await repo.upsert_many([mine, theirs])
+
+    page = await repo.get_page(owner, limit=10, include_drafts=False)
+
+    assert [e.review.id for e in page] == [mine.review.id]
+
+
+@pytest.mark.asyncio
+async def test_timeline_repository_version_and_since():
+    repo = MongoDBTimelineRepository()
+    owner = uuid4()
+    older = _entry(owner, "alice", 2)
+    newer = _entry(owner, "bob", 1, own=True)
+    await repo.upsert_many([older, newer])
+
+    version = await repo.get_version(owner)
+    assert version.count == 2
+    assert version.newest is not None and version.newest.id == newer.review.id
+    assert (await repo.get_version(owner, own=False)).count == 1
+    assert await repo.get_page(owner, limit=10, since=version.newest) == []
+
+    older.review.updated_at = datetime.now(timezone.utc)
+    await repo.upsert_many([older])
+
+    changed = await repo.get_page(owner, limit=10, since=version.newest)
+    assert [e.review.id for e in changed] == [older.review.id]
+
+
+@pytest.mark.asyncio
+async def test_timeline_repository_trim_and_deletes():
+    repo = MongoDBTimelineRepository()
+    owner = uuid4()
+    entries = [_entry(owner, "alice" if i % 2 else "Bob", i) for i in range(6)]
+    await repo.upsert_many(entries)
+
+    assert await repo.trim(owner, 4) == 2
+    assert await repo.trim(owner, 4) == 0
+    page = await repo.get_page(owner, limit=10)
+    assert [e.review.id for e in page] == [e.review.id for e in entries[:4]]
+
+    assert await repo.delete_by_owner_and_username(owner, "bob") == 2
+    assert await repo.delete_by_review_id(entries[1].review.id or "") == 1
+    assert await repo.get_page(owner, limit=10) == [
+        e for e in page if e.review.id == entries[3].review.id
+    ]
+
+
+@pytest.mark.asyncio
+async def test_timeline_repository_delete_for_account():
+    repo = MongoDBTimelineRepository()
+    account, other = uuid4(), uuid4()
+    kept = _entry(other, "carol", 1)
+    await repo.upsert_many(
+        [
+            _entry(account, "carol", 2),
+            _entry(other, "carol", 3, reviewer_uuid=account),
+            _entry(other, "Dana", 4),
+            kept,
+        ]
+    )
+
+    assert await repo.delete_for_account(account, "dana") == 3
+    assert [e.review.id for e in await repo.get_page(other, limit=10)] == [kept.review.id]
+
+
+@pytest.mark.asyncio
+async def test_timeline_repository_fanout_skips_are_case_insensitive():
+    repo = MongoDBTimelineRepository()
+
+    await repo.mark_fanout_skipped("Star")
+    await repo.mark_fanout_skipped("star")
+
+    assert await repo.get_fanout_skipped_usernames() == ["Star"]
+
+    assert await repo.clear_fanout_skipped("STAR") is True
+    assert await repo.clear_fanout_skipped("star") is False
+    assert await repo.get_fanout_skipped_usernames() == []
+
+
+@pytest.mark.asyncio
+async def test_timeline_repository_page_uses_owner_index():
+    collection = TimelineEntryDocument.get_pymongo_collection()
+    cursor = (
+        collection.find({"owner_uuid": "x", "own": False})
+        .sort([("review.updated_at", -1), ("review.review_id", -1)])
+        .limit(10)
+    )
+    explain = await cursor.explain()
+    plan = str(explain["queryPlanner"]["winningPlan"])
+
+    assert "owner_uuid_updated_at_review_id_desc" in plan
+    assert "'stage': 'SORT'" not in plan
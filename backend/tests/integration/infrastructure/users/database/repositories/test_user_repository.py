@@ -1,8 +1,9 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
 from app.domain.users.entities.user import User
+from app.infrastructure.users.database.models.user_model import UserDocument
 from app.infrastructure.users.database.repositories.mongodb_user_repository import (
     MongoDBUserRepository,
 )
@@ -26,3 +27,97 @@ async def test_user_repository_case_insensitive_username():
 
     assert fetched is not None
     assert fetched.username == "Alice"
+
+
+@pytest.mark.asyncio
+async def test_user_repository_persists_cache_validators():
+    repo = MongoDBUserRepository()
+    user = User(
+        username="bob",
+        type="User",
+        updated_at=datetime.now(timezone.utc),
+        etag='W/"abc"',
+        last_modified="Mon, 01 Jan 2024 00:00:00 GMT",
+    )
+
+    created = await repo.create(user)
+    fetched = await repo.get_by_username("bob")
+
+    assert created.id is not None
+    assert fetched is not None
+    assert fetched.etag == 'W/"abc"'
+    assert fetched.last_modified == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+@pytest.mark.asyncio
+async def test_user_repository_refresh_candidates_by_views():
+    repo = MongoDBUserRepository()
+    old = datetime.now(timezone.utc) - timedelta(days=10)
+    await repo.create(User(username="quiet", updated_at=old))
+    await repo.create(User(username="popular", updated_at=old))
+    await repo.create(User(username="fresh", updated_at=datetime.now(timezone.utc)))
+    await repo.increment_view_counts({"POPULAR": 1, "quiet": 0})
+    await repo.increment_view_counts({"popular": 1})
+
+    cutoff = datetime.now(timezone.utc) - timedelta(days=1)
+    candidates = await repo.get_refresh_candidates(cutoff, limit=10)
+
+    assert [u.username for u in candidates] == ["popular", "quiet"]
+    assert candidates[0].view_count == 2
+
+
+@pytest.mark.asyncio
+async def test_user_repository_username_lookup_uses_normalized_key_index():
+    collection = UserDocument.get_pymongo_collection()
+    explain = await collection.find({"username_lc": "alice"}).explain()
+    plan = str(explain["queryPlanner"]["winningPlan"])
+
+    assert "IXSCAN" in plan
+    assert "username_lc" in plan
+
+
+@pytest.mark.asyncio
+async def test_user_repository_upsert_replaces_profile_and_keeps_views():
+    repo = MongoDBUserRepository()
+    created = await repo.upsert(User(username="Alice", name="Old"))
+    await repo.increment_view_counts({"alice": 1})
+
+    updated = await repo.upsert(User(username="alice", name="New"))
+
+    assert updated.id == created.id
+    assert (updated.username, updated.name) == ("alice", "New")
+    assert updated.view_count == 1
+    assert await UserDocument.find_all().count() == 1
+
+
+@pytest.mark.asyncio
+async def test_user_repository_bulk_upsert_and_touch():
+    repo = MongoDBUserRepository()
+    old = datetime.now(timezone.utc) - timedelta(days=10)
+    created = await repo.upsert(User(username="Alice", name="Old", updated_at=old))
+    await repo.create(User(username="ghost", updated_at=old))
+    await repo.increment_view_counts({"alice": 1})
+
+    await repo.upsert_many(
+        [User(username="alice", name="New"), User(username="bob", name="Bob")]
+    )
+    now = datetime.now(timezone.utc)
+    await repo.touch_many(["GHOST", "nobody"], now)
+
+    alice = await repo.get_by_username("alice")
+    assert alice is not None
+    assert (alice.id, alice.name, alice.view_count) == (created.id, "New", 1)
+    assert (await repo.get_by_username("bob")) is not None
+    cutoff = now - timedelta(days=1)
+    assert await repo.get_refresh_candidates(cutoff, limit=10) == []
+    assert await UserDocument.find_all().count() == 3
+
+
+@pytest.mark.asyncio
+async def test_user_repository_summaries_by_usernames():
+    repo = MongoDBUserRepository()
+    await repo.upsert(User(username="Alice", bio="Hi", avatar_url="a.png"))
+
+    summaries = await repo.get_summaries_by_usernames(["alice", "missing"])
+
+    assert [(s.username, s.avatar_url) for s in summaries] == [("Alice", "a.png")]
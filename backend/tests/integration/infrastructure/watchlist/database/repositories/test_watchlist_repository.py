@@ -1,17 +1,19 @@
+import asyncio
 from datetime import datetime, timezone
 from uuid import uuid4
 
 import pytest
 
 from app.domain.watchlist.entities.watch import Watch
-from app.infrastructure.watchlist.database.repositories import (
-    mongodb_watchlist_repository,
+from app.infrastructure.watchlist.database.models.watch_model import WatchDocument
+from app.infrastructure.watchlist.database.repositories.mongodb_watchlist_repository import (  # noqa: E501
+    MongoDBWatchlistRepository,
 )
 
 
 @pytest.mark.asyncio
 async def test_watchlist_repository_case_insensitive_username():
-    repo = mongodb_watchlist_repository.MongoDBWatchlistRepository()
+    repo = MongoDBWatchlistRepository()
     watcher_uuid = uuid4()
     watch = Watch(
         id=None,
@@ -29,7 +31,7 @@ async def test_watchlist_repository_case_insensitive_username():
 
 @pytest.mark.asyncio
 async def test_watchlist_repository_get_all_and_delete():
-    repo = mongodb_watchlist_repository.MongoDBWatchlistRepository()
+    repo = MongoDBWatchlistRepository()
     watcher_uuid = uuid4()
     watch = Watch(
         id=None,
@@ -47,3 +49,60 @@ async def test_watchlist_repository_get_all_and_delete():
     await repo.delete(watcher_uuid, "bob")
     results_after = await repo.get_all_by_watcher(watcher_uuid)
     assert results_after == []
+
+
+@pytest.mark.asyncio
+async def test_watchlist_repository_watcher_counts_for_usernames():
+    repo = MongoDBWatchlistRepository()
+    for watched in ["alice", "alice", "bob"]:
+        await repo.create(
+            Watch(
+                id=None,
+                watcher_uuid=uuid4(),
+                watched_username=watched,
+                created_at=datetime.now(timezone.utc),
+            )
+        )
+
+    counts = await repo.get_watcher_counts_for_usernames(["Alice", "bob", "carol"])
+
+    assert counts == {"alice": 2, "bob": 1}
+
+
+@pytest.mark.asyncio
+async def test_watchlist_repository_lookups_use_normalized_key_indexes():
+    collection = WatchDocument.get_pymongo_collection()
+
+    explain = await collection.find({"watched_username_lc": "alice"}).explain()
+    plan = str(explain["queryPlanner"]["winningPlan"])
+    assert "IXSCAN" in plan
+    assert "watched_username_lc" in plan
+
+    explain = await collection.find(
+        {"watcher_uuid": "x", "watched_username_lc": {"$in": ["alice", "bob"]}}
+    ).explain()
+    plan = str(explain["queryPlanner"]["winningPlan"])
+    assert "IXSCAN" in plan and "COLLSCAN" not in plan
+
+
+@pytest.mark.asyncio
+async def test_watchlist_repository_get_or_create_keeps_one_watch():
+    repo = MongoDBWatchlistRepository()
+    watcher_uuid = uuid4()
+
+    watches = await asyncio.gather(
+        *(
+            repo.get_or_create(
+                Watch(
+                    id=None,
+                    watcher_uuid=watcher_uuid,
+                    watched_username=username,
+                    created_at=datetime.now(timezone.utc),
+                )
+            )
+            for username in ["Alice", "alice", "ALICE"]
+        )
+    )
+
+    assert len({watch.id for watch in watches}) == 1
+    assert await WatchDocument.find_all().count() == 1
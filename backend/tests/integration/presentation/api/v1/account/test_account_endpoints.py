@@ -8,6 +8,7 @@ from httpx import ASGITransport, AsyncClient
 from app.application.accounts.use_cases.get_activity_feed import ActivityFeedItem
 from app.domain.accounts.entities.account import Account
 from app.domain.reviews.entities.review import Review, ReviewStatus
+from app.domain.shared.pagination import ListVersion
 from app.main import app
 from app.presentation.api.dependencies import (
     get_activity_feed_use_case,
@@ -90,6 +91,7 @@ async def test_get_activity_feed(async_client: AsyncClient, auth_uuid: UUID):
     )
     mock_use_case = AsyncMock()
     mock_use_case.execute.return_value = [item]
+    mock_use_case.get_version.return_value = ListVersion(count=1, newest=item.cursor)
     app.dependency_overrides[get_activity_feed_use_case] = lambda: mock_use_case
 
     response = await async_client.get("/api/v1/account/feed")
@@ -99,3 +101,14 @@ async def test_get_activity_feed(async_client: AsyncClient, auth_uuid: UUID):
     assert data["has_more"] is False
     assert len(data["items"]) == 1
     assert data["items"][0]["review_id"] == "r1"
+    assert data["since_cursor"] == item.cursor.encode()
+    assert response.headers["ETag"]
+
+
+@pytest.mark.asyncio
+async def test_stream_activity_feed_unavailable_without_change_stream(
+    async_client: AsyncClient,
+):
+    response = await async_client.get("/api/v1/account/feed/stream")
+
+    assert response.status_code == 503
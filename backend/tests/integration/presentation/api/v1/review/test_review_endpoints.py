@@ -11,6 +11,7 @@ from app.application.reviews.use_cases.get_reviews import (
 )
 from app.domain.reviews.entities.review import Review, ReviewStatus
 from app.domain.shared.exceptions import SelfReviewException
+from app.domain.shared.pagination import KeysetCursor, ListVersion
 from app.main import app
 from app.presentation.api.dependencies import (
     get_create_or_update_review_use_case,
@@ -85,6 +86,8 @@ async def test_get_reviews(async_client: AsyncClient, auth_uuid: UUID):
         is_page_owner=False,
         is_moderator=False,
     )
+    newest = KeysetCursor(sort_value=now, id="r1")
+    mock_use_case.get_version.return_value = ListVersion(count=1, newest=newest)
 
     app.dependency_overrides[get_reviews_use_case] = lambda: mock_use_case
 
@@ -95,10 +98,24 @@ async def test_get_reviews(async_client: AsyncClient, auth_uuid: UUID):
     assert len(data["items"]) == 1
     assert data["items"][0]["reviewer_username"] == "alice"
     assert data["has_more"] is False
+    assert data["since_cursor"] == newest.encode()
     mock_use_case.execute.assert_called_once_with(
-        "bob", viewer_uuid=auth_uuid, limit=16, offset=0, status=None
+        "bob",
+        viewer_uuid=auth_uuid,
+        limit=16,
+        offset=0,
+        status=None,
+        since=None,
+        cursor=None,
     )
 
+    cached = await async_client.get(
+        "/api/v1/reviews/bob", headers={"If-None-Match": response.headers["ETag"]}
+    )
+
+    assert cached.status_code == 304
+    assert mock_use_case.execute.call_count == 1
+
 
 @pytest.mark.asyncio
 async def test_delete_review(async_client: AsyncClient, auth_uuid: UUID):
@@ -6,6 +6,8 @@ import pytest
 from app.application.accounts.use_cases.delete_account import DeleteAccountUseCase
 from app.domain.accounts.entities.account import Account
 from app.domain.accounts.services.account_service import AccountService
+from app.domain.following.services.following_service import FollowingService
+from app.domain.reviews.entities.review import ReviewStatus
 from app.domain.reviews.services.review_service import ReviewService
 from app.domain.watchlist.services.watchlist_service import WatchlistService
 
@@ -15,19 +17,27 @@ async def test_delete_account_calls_bulk_deletes(
     account_service: AccountService,
     review_service: ReviewService,
     watchlist_service: WatchlistService,
+    following_service: FollowingService,
     mock_account_repository: AsyncMock,
     mock_review_repository: AsyncMock,
     mock_watchlist_repository: AsyncMock,
+    mock_following_repository: AsyncMock,
+    mock_review_stats_repository: AsyncMock,
 ):
     account_uuid = uuid4()
     account = Account(id="a1", uuid=account_uuid, username="alice", access_token="t")
 
     mock_account_repository.get_by_uuid.return_value = account
+    mock_review_repository.get_status_counts_by_reviewer_uuid.return_value = {
+        "bob": {ReviewStatus.APPROVE: 1, ReviewStatus.COMMENT: 1}
+    }
     mock_review_repository.delete_all_by_reviewer_uuid.return_value = 2
     mock_watchlist_repository.delete_all_by_watcher.return_value = 1
     mock_account_repository.update.side_effect = lambda a: a
 
-    use_case = DeleteAccountUseCase(account_service, review_service, watchlist_service)
+    use_case = DeleteAccountUseCase(
+        account_service, review_service, watchlist_service, following_service
+    )
     result = await use_case.execute(account_uuid)
 
     assert result.deleted_at is not None
@@ -35,7 +45,11 @@ async def test_delete_account_calls_bulk_deletes(
     mock_review_repository.delete_all_by_reviewer_uuid.assert_called_once_with(
         account_uuid
     )
+    mock_review_stats_repository.increment.assert_awaited_once_with(
+        {"bob": {ReviewStatus.APPROVE: -1, ReviewStatus.COMMENT: -1}}
+    )
     mock_watchlist_repository.delete_all_by_watcher.assert_called_once_with(account_uuid)
+    mock_following_repository.delete_by_account_uuid.assert_called_once_with(account_uuid)
 
 
 @pytest.mark.asyncio
@@ -43,21 +57,28 @@ async def test_delete_account_no_reviews_or_watchings(
     account_service: AccountService,
     review_service: ReviewService,
     watchlist_service: WatchlistService,
+    following_service: FollowingService,
     mock_account_repository: AsyncMock,
     mock_review_repository: AsyncMock,
     mock_watchlist_repository: AsyncMock,
+    mock_following_repository: AsyncMock,
+    mock_review_stats_repository: AsyncMock,
 ):
     account_uuid = uuid4()
     account = Account(id="a1", uuid=account_uuid, username="alice", access_token="t")
 
     mock_account_repository.get_by_uuid.return_value = account
+    mock_review_repository.get_status_counts_by_reviewer_uuid.return_value = {}
     mock_review_repository.delete_all_by_reviewer_uuid.return_value = 0
     mock_watchlist_repository.delete_all_by_watcher.return_value = 0
     mock_account_repository.update.side_effect = lambda a: a
 
-    use_case = DeleteAccountUseCase(account_service, review_service, watchlist_service)
+    use_case = DeleteAccountUseCase(
+        account_service, review_service, watchlist_service, following_service
+    )
     result = await use_case.execute(account_uuid)
 
     assert result.deleted_at is not None
     mock_review_repository.delete_all_by_reviewer_uuid.assert_called_once()
+    mock_review_stats_repository.increment.assert_not_called()
     mock_watchlist_repository.delete_all_by_watcher.assert_called_once()
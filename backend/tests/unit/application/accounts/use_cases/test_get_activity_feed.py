@@ -1,18 +1,24 @@
+from collections.abc import AsyncGenerator
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
 
 from app.application.accounts.use_cases.get_activity_feed import (
     GetActivityFeedUseCase,
+    merge_newest_first,
 )
 from app.domain.accounts.entities.account import Account
 from app.domain.accounts.services.account_service import AccountService
 from app.domain.reviews.entities.review import Review, ReviewStatus
 from app.domain.reviews.services.review_service import ReviewService
+from app.domain.shared.pagination import KeysetCursor, ListVersion
+from app.domain.timeline.entities.timeline_entry import TimelineEntry
+from app.domain.timeline.services.timeline_service import TimelineService
 from app.domain.users.entities.user import User
 from app.domain.users.services.user_service import UserService
+from app.domain.watchlist.entities.watch import Watch
 from app.domain.watchlist.services.watchlist_service import WatchlistService
 
 
@@ -48,13 +54,16 @@ async def test_get_activity_feed_mine_filter(
     bob_user = User(username="bob", avatar_url="https://example.com/bob.png")
 
     mock_account_repository.get_by_uuid.return_value = account
-    mock_review_repository.get_all_for_username.return_value = [review]
-    mock_account_repository.get_by_usernames.return_value = [account]
-    mock_account_repository.get_by_uuids.return_value = [reviewer_account]
-    mock_user_repository.get_by_usernames.return_value = [alice_user, bob_user]
+    mock_review_repository.get_feed.return_value = [review]
+    mock_account_repository.get_summaries_by_usernames.return_value = [account]
+    mock_account_repository.get_summaries_by_uuids.return_value = [reviewer_account]
+    mock_user_repository.get_summaries_by_usernames.return_value = [alice_user, bob_user]
 
     use_case = GetActivityFeedUseCase(
-        watchlist_service, review_service, account_service, user_service,
+        watchlist_service,
+        review_service,
+        account_service,
+        user_service,
         open_draft_profiles=False,
     )
     results = await use_case.execute(
@@ -101,13 +110,18 @@ async def test_get_activity_feed_skips_deleted_reviewer(
     )
 
     mock_account_repository.get_by_uuid.return_value = account
-    mock_review_repository.get_all_for_username.return_value = [review]
-    mock_account_repository.get_by_usernames.return_value = [account]
-    mock_account_repository.get_by_uuids.return_value = [deleted_reviewer_account]
-    mock_user_repository.get_by_usernames.return_value = []
+    mock_review_repository.get_feed.return_value = [review]
+    mock_account_repository.get_summaries_by_usernames.return_value = [account]
+    mock_account_repository.get_summaries_by_uuids.return_value = [
+        deleted_reviewer_account
+    ]
+    mock_user_repository.get_summaries_by_usernames.return_value = []
 
     use_case = GetActivityFeedUseCase(
-        watchlist_service, review_service, account_service, user_service,
+        watchlist_service,
+        review_service,
+        account_service,
+        user_service,
         open_draft_profiles=False,
     )
     results = await use_case.execute(
@@ -149,14 +163,17 @@ async def test_get_activity_feed_draft_shows_all_when_open(
     bob_user = User(username="bob", avatar_url="https://example.com/bob.png")
 
     mock_account_repository.get_by_uuid.return_value = account
-    mock_review_repository.get_all_for_username.return_value = [review]
+    mock_review_repository.get_feed.return_value = [review]
     # bob has no account entry (draft profile)
-    mock_account_repository.get_by_usernames.return_value = []
-    mock_account_repository.get_by_uuids.return_value = [other_reviewer_account]
-    mock_user_repository.get_by_usernames.return_value = [alice_user, bob_user]
+    mock_account_repository.get_summaries_by_usernames.return_value = []
+    mock_account_repository.get_summaries_by_uuids.return_value = [other_reviewer_account]
+    mock_user_repository.get_summaries_by_usernames.return_value = [alice_user, bob_user]
 
     use_case = GetActivityFeedUseCase(
-        watchlist_service, review_service, account_service, user_service,
+        watchlist_service,
+        review_service,
+        account_service,
+        user_service,
         open_draft_profiles=True,
     )
     results = await use_case.execute(
@@ -165,3 +182,370 @@ async def test_get_activity_feed_draft_shows_all_when_open(
 
     assert len(results) == 1
     assert results[0].reviewer_username == "alice"
+
+
+@pytest.mark.asyncio
+async def test_get_activity_feed_queries_once_with_draft_and_deleted_filters(
+    watchlist_service: WatchlistService,
+    review_service: ReviewService,
+    account_service: AccountService,
+    user_service: UserService,
+    mock_review_repository: AsyncMock,
+    mock_account_repository: AsyncMock,
+    mock_watchlist_repository: AsyncMock,
+):
+    account_uuid = uuid4()
+    now = datetime.now(timezone.utc)
+
+    account = Account(id="a1", uuid=account_uuid, username="bob", access_token="t")
+    deleted = Account(
+        id="a2", uuid=uuid4(), username="gone", access_token="", deleted_at=now
+    )
+    mock_account_repository.get_by_uuid.return_value = account
+    mock_watchlist_repository.get_all_by_watcher.return_value = [
+        Watch(id=None, watcher_uuid=account_uuid, watched_username=name, created_at=now)
+        for name in ["gone", "draft", "BOB"]
+    ]
+    mock_account_repository.get_summaries_by_usernames.return_value = [account, deleted]
+    mock_review_repository.get_feed.return_value = []
+
+    use_case = GetActivityFeedUseCase(
+        watchlist_service,
+        review_service,
+        account_service,
+        user_service,
+        open_draft_profiles=False,
+    )
+    results = await use_case.execute(
+        account_uuid=account_uuid, filter_type="all", limit=20, offset=40
+    )
+
+    assert results == []
+    mock_review_repository.get_feed.assert_awaited_once_with(
+        ["BOB"],
+        20,
+        40,
+        draft_usernames=["draft"],
+        viewer_uuid=account_uuid,
+        after=None,
+        since=None,
+        raw=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_activity_feed_cursor_overrides_offset(
+    watchlist_service: WatchlistService,
+    review_service: ReviewService,
+    account_service: AccountService,
+    user_service: UserService,
+    mock_review_repository: AsyncMock,
+    mock_account_repository: AsyncMock,
+):
+    account_uuid = uuid4()
+    account = Account(id="a1", uuid=account_uuid, username="bob", access_token="t")
+    mock_account_repository.get_by_uuid.return_value = account
+    mock_account_repository.get_summaries_by_usernames.return_value = [account]
+    mock_review_repository.get_feed.return_value = []
+    cursor = KeysetCursor(sort_value=datetime.now(timezone.utc), id="r9")
+
+    use_case = GetActivityFeedUseCase(
+        watchlist_service,
+        review_service,
+        account_service,
+        user_service,
+        open_draft_profiles=True,
+    )
+    await use_case.execute(account_uuid, "mine", 10, offset=30, cursor=cursor)
+
+    mock_review_repository.get_feed.assert_awaited_once_with(
+        ["bob"],
+        10,
+        0,
+        draft_usernames=[],
+        viewer_uuid=account_uuid,
+        after=cursor,
+        since=None,
+        raw=True,
+    )
+
+
+def _feed_review(review_id: str, username: str, minute: int) -> Review:
+    at = datetime(2024, 5, 1, 12, minute, tzinfo=timezone.utc)
+    return Review(
+        id=review_id,
+        reviewer_uuid=uuid4(),
+        reviewed_username=username,
+        status=ReviewStatus.APPROVE,
+        comment=None,
+        anonymous=False,
+        created_at=at,
+        updated_at=at,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_activity_feed_reads_timeline_and_merges_skipped_profiles(
+    watchlist_service: WatchlistService,
+    review_service: ReviewService,
+    account_service: AccountService,
+    user_service: UserService,
+    timeline_service: TimelineService,
+    mock_review_repository: AsyncMock,
+    mock_account_repository: AsyncMock,
+    mock_watchlist_repository: AsyncMock,
+    mock_timeline_repository: AsyncMock,
+):
+    account_uuid = uuid4()
+    account = Account(id="a1", uuid=account_uuid, username="bob", access_token="t")
+    star = Account(id="a2", uuid=uuid4(), username="star", access_token="t")
+    fanned = _feed_review("0003", "carol", 30)
+    duplicate = _feed_review("0002", "star", 20)
+    merged = _feed_review("0004", "star", 40)
+
+    mock_account_repository.get_by_uuid.return_value = account
+    mock_timeline_repository.get_page.return_value = [
+        TimelineEntry(id="e1", owner_uuid=account_uuid, review=r, own=False, draft=False)
+        for r in (fanned, duplicate)
+    ]
+    mock_timeline_repository.get_fanout_skipped_usernames.return_value = ["star", "x"]
+    mock_watchlist_repository.get_all_by_watcher_and_usernames.return_value = [
+        Watch(
+            id=None,
+            watcher_uuid=account_uuid,
+            watched_username="star",
+            created_at=datetime.now(timezone.utc),
+        )
+    ]
+    mock_account_repository.get_summaries_by_usernames.return_value = [star]
+    mock_review_repository.get_feed.return_value = [merged, duplicate]
+    mock_account_repository.get_summaries_by_uuids.return_value = [
+        Account(id=f"r{i}", uuid=r.reviewer_uuid, username=f"u{i}", access_token="t")
+        for i, r in enumerate((fanned, duplicate, merged))
+    ]
+    mock_watchlist_repository.get_all_by_watcher.side_effect = AssertionError
+
+    use_case = GetActivityFeedUseCase(
+        watchlist_service,
+        review_service,
+        account_service,
+        user_service,
+        open_draft_profiles=False,
+        timeline_service=timeline_service,
+    )
+    results = await use_case.execute(account_uuid, "watching", limit=2, offset=1)
+
+    mock_timeline_repository.get_page.assert_awaited_once_with(
+        account_uuid, 3, 0, after=None, own=False, include_drafts=False, since=None
+    )
+    mock_review_repository.get_feed.assert_awaited_once_with(
+        ["star"],
+        3,
+        0,
+        draft_usernames=[],
+        viewer_uuid=account_uuid,
+        after=None,
+        since=None,
+        raw=True,
+    )
+    assert [item.review.id for item in results] == ["0003", "0002"]
+
+
+@pytest.mark.asyncio
+async def test_get_activity_feed_mine_reads_own_timeline_entries(
+    watchlist_service: WatchlistService,
+    review_service: ReviewService,
+    account_service: AccountService,
+    user_service: UserService,
+    timeline_service: TimelineService,
+    mock_review_repository: AsyncMock,
+    mock_account_repository: AsyncMock,
+    mock_timeline_repository: AsyncMock,
+):
+    account_uuid = uuid4()
+    account = Account(id="a1", uuid=account_uuid, username="bob", access_token="t")
+    mock_account_repository.get_by_uuid.return_value = account
+    mock_timeline_repository.get_page.return_value = []
+    cursor = KeysetCursor(sort_value=datetime.now(timezone.utc), id="r9")
+
+    use_case = GetActivityFeedUseCase(
+        watchlist_service,
+        review_service,
+        account_service,
+        user_service,
+        open_draft_profiles=True,
+        timeline_service=timeline_service,
+    )
+    results = await use_case.execute(account_uuid, "mine", 10, offset=5, cursor=cursor)
+
+    assert results == []
+    mock_timeline_repository.get_page.assert_awaited_once_with(
+        account_uuid, 10, 0, after=cursor, own=True, include_drafts=True, since=None
+    )
+    mock_timeline_repository.get_fanout_skipped_usernames.assert_not_awaited()
+    mock_review_repository.get_feed.assert_not_awaited()
+
+
+async def _stream(
+    reviews: list[Review], pulled: list[str], closed: list[bool] | None = None
+) -> AsyncGenerator[Review, None]:
+    try:
+        for review in reviews:
+            pulled.append(review.id or "")
+            yield review
+    finally:
+        if closed is not None:
+            closed.append(True)
+
+
+@pytest.mark.asyncio
+async def test_merge_newest_first_is_lazy_and_ordered():
+    pulled: list[str] = []
+    closed: list[bool] = []
+    older = [_feed_review(f"a{i}", "a", 9 - i) for i in range(9)]
+    streams = [
+        _stream([_feed_review("z1", "a", 50), *older], pulled, closed),
+        _stream(
+            [_feed_review("b2", "b", 40), _feed_review("b1", "b", 30)], pulled, closed
+        ),
+        _stream([_feed_review("c9", "c", 40)], pulled, closed),
+    ]
+
+    merged = merge_newest_first(streams)
+    taken = [await anext(merged) for _ in range(3)]
+    await merged.aclose()
+
+    assert [r.id for r in taken] == ["z1", "c9", "b2"]
+    assert len(pulled) <= len(taken) + len(streams)
+    assert len(closed) == 3
+
+
+@pytest.mark.asyncio
+async def test_get_activity_feed_merge_streams_stops_after_window(
+    watchlist_service: WatchlistService,
+    review_service: ReviewService,
+    account_service: AccountService,
+    user_service: UserService,
+    mock_review_repository: AsyncMock,
+    mock_account_repository: AsyncMock,
+    mock_watchlist_repository: AsyncMock,
+):
+    account_uuid = uuid4()
+    now = datetime.now(timezone.utc)
+    account = Account(id="a1", uuid=account_uuid, username="bob", access_token="t")
+    mock_account_repository.get_by_uuid.return_value = account
+    mock_watchlist_repository.get_all_by_watcher.return_value = [
+        Watch(id=None, watcher_uuid=account_uuid, watched_username=name, created_at=now)
+        for name in ["carol", "draft"]
+    ]
+    mock_account_repository.get_summaries_by_usernames.return_value = [
+        account,
+        Account(id="a3", uuid=uuid4(), username="carol", access_token="t"),
+    ]
+    streams = {
+        "bob": [
+            _feed_review("0005", "bob", 50),
+            *(_feed_review(f"000{i}", "bob", 9 - i) for i in range(6, 10)),
+        ],
+        "carol": [_feed_review("0004", "carol", 40), _feed_review("0003", "carol", 30)],
+        "draft": [_feed_review("0002", "draft", 20)],
+    }
+    pulled: list[str] = []
+    mock_review_repository.stream_feed_for_username = MagicMock(
+        side_effect=lambda username, *args, **kwargs: _stream(streams[username], pulled)
+    )
+    mock_account_repository.get_summaries_by_uuids.return_value = [
+        Account(id=f"r{i}", uuid=r.reviewer_uuid, username=f"u{i}", access_token="t")
+        for i, r in enumerate(r for reviews in streams.values() for r in reviews)
+    ]
+
+    use_case = GetActivityFeedUseCase(
+        watchlist_service,
+        review_service,
+        account_service,
+        user_service,
+        open_draft_profiles=False,
+        merge_streams=True,
+    )
+    results = await use_case.execute(account_uuid, "all", limit=2, offset=1)
+
+    assert [item.review.id for item in results] == ["0004", "0003"]
+    # One buffered head per stream beyond the window; bob's old reviews stay unread.
+    assert len(pulled) <= 3 + len(streams)
+    draft_call = mock_review_repository.stream_feed_for_username.call_args_list[-1]
+    assert draft_call.args == ("draft", 3)
+    assert draft_call.kwargs["reviewer_uuid"] == account_uuid
+    mock_review_repository.get_feed.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_activity_feed_version_covers_the_feed_scope(
+    watchlist_service: WatchlistService,
+    review_service: ReviewService,
+    account_service: AccountService,
+    user_service: UserService,
+    mock_review_repository: AsyncMock,
+    mock_account_repository: AsyncMock,
+    mock_watchlist_repository: AsyncMock,
+):
+    account_uuid = uuid4()
+    account = Account(id="a1", uuid=account_uuid, username="Bob", access_token="t")
+    mock_account_repository.get_by_uuid.return_value = account
+    mock_account_repository.get_summaries_by_usernames.return_value = [account]
+    mock_watchlist_repository.get_all_by_watcher.return_value = [
+        Watch(
+            id="w1",
+            watcher_uuid=account_uuid,
+            watched_username="draft",
+            created_at=datetime.now(timezone.utc),
+        )
+    ]
+    mock_review_repository.get_feed_version.return_value = ListVersion(4, None)
+
+    use_case = GetActivityFeedUseCase(
+        watchlist_service,
+        review_service,
+        account_service,
+        user_service,
+        open_draft_profiles=False,
+    )
+    version = await use_case.get_version(account_uuid, "all")
+
+    assert version == ListVersion(4, None, scope="bob/draft")
+    mock_review_repository.get_feed_version.assert_awaited_once_with(
+        ["Bob"], draft_usernames=["draft"], viewer_uuid=account_uuid, status=None
+    )
+    mock_review_repository.get_feed.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_activity_feed_resolves_scope_once_for_version_and_page(
+    watchlist_service: WatchlistService,
+    review_service: ReviewService,
+    account_service: AccountService,
+    user_service: UserService,
+    mock_review_repository: AsyncMock,
+    mock_account_repository: AsyncMock,
+    mock_watchlist_repository: AsyncMock,
+):
+    account_uuid = uuid4()
+    account = Account(id="a1", uuid=account_uuid, username="Bob", access_token="t")
+    mock_account_repository.get_by_uuid.return_value = account
+    mock_account_repository.get_summaries_by_usernames.return_value = [account]
+    mock_watchlist_repository.get_all_by_watcher.return_value = []
+    mock_review_repository.get_feed_version.return_value = ListVersion(0, None)
+    mock_review_repository.get_feed.return_value = []
+
+    use_case = GetActivityFeedUseCase(
+        watchlist_service,
+        review_service,
+        account_service,
+        user_service,
+        open_draft_profiles=False,
+    )
+    scope = await use_case.resolve_scope(account_uuid, "all")
+    await use_case.get_version(account_uuid, "all", scope=scope)
+    await use_case.execute(account_uuid, "all", scope=scope)
+
+    assert scope == (["Bob"], [])
+    mock_watchlist_repository.get_all_by_watcher.assert_awaited_once()
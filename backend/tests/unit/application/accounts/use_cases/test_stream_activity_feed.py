@@ -0,0 +1,97 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.application.accounts.use_cases.get_activity_feed import GetActivityFeedUseCase
+from app.application.accounts.use_cases.stream_activity_feed import (
+    StreamActivityFeedUseCase,
+)
+from app.domain.accounts.entities.account import Account
+from app.domain.accounts.services.account_service import AccountService
+from app.domain.reviews.entities.review import Review, ReviewStatus
+from app.domain.reviews.services.review_change_hub import ReviewChangeHub
+from app.domain.reviews.services.review_service import ReviewService
+from app.domain.reviews.value_objects.review_change import ReviewChange
+from app.domain.users.services.user_service import UserService
+from app.domain.watchlist.entities.watch import Watch
+from app.domain.watchlist.services.watchlist_service import WatchlistService
+
+
+@pytest.mark.asyncio
+async def test_stream_activity_feed_subscribes_to_the_feed_scope(
+    watchlist_service: WatchlistService,
+    review_service: ReviewService,
+    account_service: AccountService,
+    user_service: UserService,
+    mock_watchlist_repository: AsyncMock,
+    mock_account_repository: AsyncMock,
+    mock_user_repository: AsyncMock,
+):
+    account_uuid = uuid4()
+    account = Account(id="a1", uuid=account_uuid, username="bob", access_token="t")
+    gone = Account(
+        id="a2",
+        uuid=uuid4(),
+        username="gone",
+        access_token="",
+        deleted_at=datetime.now(timezone.utc),
+    )
+    mock_account_repository.get_by_uuid.return_value = account
+    mock_watchlist_repository.get_all_by_watcher.return_value = [
+        Watch(
+            id=f"w{i}",
+            watcher_uuid=account_uuid,
+            watched_username=username,
+            created_at=datetime.now(timezone.utc),
+        )
+        for i, username in enumerate(["draft", "gone"])
+    ]
+    mock_account_repository.get_summaries_by_usernames.return_value = [account, gone]
+    feed = GetActivityFeedUseCase(
+        watchlist_service,
+        review_service,
+        account_service,
+        user_service,
+        open_draft_profiles=False,
+    )
+    hub = ReviewChangeHub(AsyncMock())
+    use_case = StreamActivityFeedUseCase(feed, hub)
+
+    subscription = await use_case.subscribe(account_uuid, "all")
+
+    assert subscription.usernames == {"bob", "draft"}
+    assert subscription.viewer_only_usernames == {"draft"}
+
+    now = datetime.now(timezone.utc)
+    review = Review(
+        id="65f0c0ffee0000000000abcd",
+        reviewer_uuid=account_uuid,
+        reviewed_username="draft",
+        status=ReviewStatus.APPROVE,
+        comment=None,
+        anonymous=False,
+        created_at=now,
+        updated_at=now,
+    )
+    mock_account_repository.get_summaries_by_uuids.return_value = [account]
+    mock_user_repository.get_summaries_by_usernames.return_value = []
+    hub.dispatch(ReviewChange(token="t1", review=review))
+
+    change = await subscription.next(timeout=0.01)
+    assert change is not None
+    item = await use_case.render(change)
+    assert item is not None and item.reviewer_username == "bob"
+
+    # Each event reads reviewers again, so one deleted meanwhile is not shown.
+    mock_account_repository.get_summaries_by_uuids.return_value = [
+        Account(
+            id="a1", uuid=account_uuid, username="bob", access_token="", deleted_at=now
+        )
+    ]
+    assert await use_case.render(change) is None
+
+    use_case.unsubscribe(subscription)
+    hub.dispatch(ReviewChange(token="t2", review=review))
+    assert await subscription.next(timeout=0.01) is None
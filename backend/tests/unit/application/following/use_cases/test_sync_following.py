@@ -0,0 +1,111 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.application.following.use_cases.sync_following import (
+    SyncFollowingGraphUseCase,
+)
+from app.domain.accounts.entities.account import Account
+from app.domain.accounts.services.account_service import AccountService
+from app.domain.following.entities.following_graph import (
+    FollowedUser,
+    FollowingGraph,
+    FollowingGraphPage,
+)
+from app.domain.following.services.following_service import FollowingService
+from app.domain.shared.exceptions import GitHubRateLimitException
+from app.infrastructure.github.external.github_client import FollowingPage
+
+
+def _account() -> Account:
+    return Account(id="a1", uuid=uuid4(), username="me", access_token="token")
+
+
+@pytest.mark.asyncio
+async def test_sync_walks_link_pagination(
+    account_service: AccountService,
+    following_service: FollowingService,
+    mock_account_repository: AsyncMock,
+    mock_following_repository: AsyncMock,
+    mock_github_client: AsyncMock,
+):
+    account = _account()
+    mock_account_repository.get_by_uuid.return_value = account
+    mock_following_repository.get_by_account_uuid.return_value = None
+    mock_following_repository.save.side_effect = lambda g: g
+    mock_github_client.fetch_following_page.side_effect = [
+        FollowingPage(
+            items=[{"login": "alice", "type": "User"}],
+            etag='"p1"',
+            next_url="https://api.github.com/user/1/following?page=2",
+        ),
+        FollowingPage(
+            items=[{"login": "bob", "type": "User"}], etag='"p2"', next_url=None
+        ),
+    ]
+
+    use_case = SyncFollowingGraphUseCase(
+        account_service, following_service, mock_github_client
+    )
+    graph = await use_case.execute(account.uuid)
+
+    assert graph is not None
+    assert [u.login for u in graph.following] == ["alice", "bob"]
+    assert graph.synced_at is not None
+    second_call = mock_github_client.fetch_following_page.call_args_list[1]
+    assert second_call.kwargs["url"] == "https://api.github.com/user/1/following?page=2"
+
+
+@pytest.mark.asyncio
+async def test_sync_reuses_not_modified_pages(
+    account_service: AccountService,
+    following_service: FollowingService,
+    mock_account_repository: AsyncMock,
+    mock_following_repository: AsyncMock,
+    mock_github_client: AsyncMock,
+):
+    account = _account()
+    mock_account_repository.get_by_uuid.return_value = account
+    stored_page = FollowingGraphPage(
+        users=[FollowedUser(login="alice", type="User")], etag='"p1"', next_url=None
+    )
+    mock_following_repository.get_by_account_uuid.return_value = FollowingGraph(
+        id="g1", account_uuid=account.uuid, pages=[stored_page]
+    )
+    mock_following_repository.save.side_effect = lambda g: g
+    mock_github_client.fetch_following_page.return_value = None
+
+    use_case = SyncFollowingGraphUseCase(
+        account_service, following_service, mock_github_client
+    )
+    graph = await use_case.execute(account.uuid)
+
+    assert graph is not None
+    assert graph.id == "g1"
+    assert graph.pages == [stored_page]
+    mock_github_client.fetch_following_page.assert_awaited_once_with(
+        "me", "token", url=None, etag='"p1"'
+    )
+
+
+@pytest.mark.asyncio
+async def test_sync_keeps_stored_graph_when_rate_limited(
+    account_service: AccountService,
+    following_service: FollowingService,
+    mock_account_repository: AsyncMock,
+    mock_following_repository: AsyncMock,
+    mock_github_client: AsyncMock,
+):
+    account = _account()
+    mock_account_repository.get_by_uuid.return_value = account
+    stored = FollowingGraph(id="g1", account_uuid=account.uuid)
+    mock_following_repository.get_by_account_uuid.return_value = stored
+    mock_github_client.fetch_following_page.side_effect = GitHubRateLimitException("core")
+
+    use_case = SyncFollowingGraphUseCase(
+        account_service, following_service, mock_github_client
+    )
+
+    assert await use_case.execute(account.uuid) is stored
+    mock_following_repository.save.assert_not_called()
@@ -1,4 +1,5 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
@@ -8,6 +9,7 @@ from app.application.github.use_cases.authenticate_with_github import (
 )
 from app.domain.accounts.entities.account import Account
 from app.domain.accounts.services.account_service import AccountService
+from app.domain.timeline.services.timeline_service import TimelineService
 from app.domain.users.services.user_service import UserService
 from app.infrastructure.email.email_service import EmailService
 
@@ -26,30 +28,88 @@ async def test_authenticate_creates_user_record(
     user_service: UserService,
     mock_account_repository: AsyncMock,
     mock_user_repository: AsyncMock,
+    mock_github_client: AsyncMock,
 ):
-    account = Account(
-        id="a1", uuid=uuid4(), username="alice", access_token="token123"
-    )
-    mock_account_repository.get_by_username.return_value = account
-    mock_account_repository.update.return_value = account
-    mock_user_repository.save.side_effect = lambda u: u
+    account = Account(id="a1", uuid=uuid4(), username="alice", access_token="token123")
+    mock_account_repository.upsert_by_username.return_value = (account, account)
+    mock_user_repository.upsert.side_effect = lambda u: u
 
     mock_email_service = MagicMock(spec=EmailService)
     mock_email_service._configured = False
 
-    with patch(
-        "app.application.github.use_cases.authenticate_with_github.GitHubClient.fetch_github_user_data",
-        return_value=(GITHUB_DATA, "token123"),
-    ):
-        use_case = AuthenticateWithGitHubUseCase(
-            account_service, user_service, mock_email_service
-        )
-        result = await use_case.execute("code123")
+    mock_github_client.fetch_github_user_data.return_value = (GITHUB_DATA, "token123")
+
+    use_case = AuthenticateWithGitHubUseCase(
+        account_service, user_service, mock_email_service, mock_github_client
+    )
+    result = await use_case.execute("code123")
+    await asyncio.sleep(0.01)
 
     assert result.username == "alice"
-    mock_user_repository.save.assert_called_once()
-    saved_user = mock_user_repository.save.call_args[0][0]
+    mock_user_repository.upsert.assert_called_once()
+    saved_user = mock_user_repository.upsert.call_args[0][0]
     assert saved_user.username == "alice"
     assert saved_user.name == "Alice"
     assert saved_user.avatar_url == "https://example.com/alice.png"
     assert saved_user.type == "User"
+
+
+@pytest.mark.asyncio
+async def test_authenticate_defers_profile_save_and_new_account_email(
+    account_service: AccountService,
+    user_service: UserService,
+    mock_account_repository: AsyncMock,
+    mock_user_repository: AsyncMock,
+    mock_github_client: AsyncMock,
+):
+    mock_account_repository.upsert_by_username.side_effect = lambda a, fields: (a, None)
+    profile_saved = asyncio.Event()
+
+    async def slow_save(user):
+        await profile_saved.wait()
+        return user
+
+    mock_user_repository.upsert.side_effect = slow_save
+    mock_email_service = MagicMock(spec=EmailService)
+    mock_github_client.fetch_github_user_data.return_value = (GITHUB_DATA, "token123")
+
+    use_case = AuthenticateWithGitHubUseCase(
+        account_service, user_service, mock_email_service, mock_github_client
+    )
+    result = await use_case.execute("code123")
+
+    # The account is returned while the profile save is still pending.
+    assert result.username == "alice"
+    profile_saved.set()
+    await asyncio.sleep(0.01)
+
+    mock_user_repository.upsert.assert_awaited_once()
+    mock_email_service.send_new_account_notification.assert_called_once_with(
+        username="alice"
+    )
+
+
+@pytest.mark.asyncio
+async def test_authenticate_new_account_clears_its_draft_timeline_entries(
+    account_service: AccountService,
+    user_service: UserService,
+    mock_account_repository: AsyncMock,
+    mock_user_repository: AsyncMock,
+    mock_github_client: AsyncMock,
+):
+    mock_account_repository.upsert_by_username.side_effect = lambda a, fields: (a, None)
+    mock_user_repository.upsert.side_effect = lambda u: u
+    mock_github_client.fetch_github_user_data.return_value = (GITHUB_DATA, "token123")
+    timeline_service = AsyncMock(spec=TimelineService)
+
+    use_case = AuthenticateWithGitHubUseCase(
+        account_service,
+        user_service,
+        MagicMock(spec=EmailService),
+        mock_github_client,
+        timeline_service,
+    )
+    await use_case.execute("code123")
+    await asyncio.sleep(0.01)
+
+    timeline_service.clear_drafts.assert_awaited_once_with("alice")
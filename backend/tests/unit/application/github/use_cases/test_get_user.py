@@ -1,5 +1,6 @@
-from datetime import datetime, timezone
-from unittest.mock import AsyncMock, patch
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
@@ -7,8 +8,11 @@ import pytest
 from app.application.github.use_cases.get_user import GetUserUseCase
 from app.domain.accounts.entities.account import Account
 from app.domain.accounts.services.account_service import AccountService
+from app.domain.shared.exceptions import GitHubRateLimitException
 from app.domain.users.entities.user import User
 from app.domain.users.services.user_service import UserService
+from app.infrastructure.github.external.rate_limiter import GitHubCallPriority
+from app.infrastructure.shared.concurrency.counter_buffer import CounterBuffer
 
 
 @pytest.mark.asyncio
@@ -17,6 +21,7 @@ async def test_get_user_persists_user_type(
     user_service: UserService,
     mock_account_repository: AsyncMock,
     mock_user_repository: AsyncMock,
+    mock_github_client: AsyncMock,
 ):
     account_uuid = uuid4()
     mock_account_repository.get_by_uuid.return_value = Account(
@@ -24,7 +29,7 @@ async def test_get_user_persists_user_type(
     )
     mock_account_repository.get_by_username.return_value = None
     mock_user_repository.get_by_username.return_value = None
-    mock_user_repository.save.side_effect = lambda u: u
+    mock_user_repository.upsert.side_effect = lambda u: u
 
     github_data = {
         "username": "alice",
@@ -34,16 +39,14 @@ async def test_get_user_persists_user_type(
         "type": "User",
     }
 
-    with patch(
-        "app.application.github.use_cases.get_user.GitHubClient.fetch_user_by_username",
-        return_value=github_data,
-    ):
-        use_case = GetUserUseCase(account_service, user_service)
-        result = await use_case.execute("alice", account_uuid)
+    mock_github_client.fetch_user_by_username.return_value = github_data
+
+    use_case = GetUserUseCase(account_service, user_service, mock_github_client)
+    result = await use_case.execute("alice", account_uuid)
 
     assert result.type == "User"
-    mock_user_repository.save.assert_called_once()
-    saved_user = mock_user_repository.save.call_args[0][0]
+    mock_user_repository.upsert.assert_called_once()
+    saved_user = mock_user_repository.upsert.call_args[0][0]
     assert saved_user.type == "User"
 
 
@@ -53,6 +56,7 @@ async def test_get_user_persists_organization_type(
     user_service: UserService,
     mock_account_repository: AsyncMock,
     mock_user_repository: AsyncMock,
+    mock_github_client: AsyncMock,
 ):
     account_uuid = uuid4()
     mock_account_repository.get_by_uuid.return_value = Account(
@@ -60,7 +64,7 @@ async def test_get_user_persists_organization_type(
     )
     mock_account_repository.get_by_username.return_value = None
     mock_user_repository.get_by_username.return_value = None
-    mock_user_repository.save.side_effect = lambda u: u
+    mock_user_repository.upsert.side_effect = lambda u: u
 
     github_data = {
         "username": "some-org",
@@ -70,16 +74,14 @@ async def test_get_user_persists_organization_type(
         "type": "Organization",
     }
 
-    with patch(
-        "app.application.github.use_cases.get_user.GitHubClient.fetch_user_by_username",
-        return_value=github_data,
-    ):
-        use_case = GetUserUseCase(account_service, user_service)
-        result = await use_case.execute("some-org", account_uuid)
+    mock_github_client.fetch_user_by_username.return_value = github_data
+
+    use_case = GetUserUseCase(account_service, user_service, mock_github_client)
+    result = await use_case.execute("some-org", account_uuid)
 
     assert result.type == "Organization"
-    mock_user_repository.save.assert_called_once()
-    saved_user = mock_user_repository.save.call_args[0][0]
+    mock_user_repository.upsert.assert_called_once()
+    saved_user = mock_user_repository.upsert.call_args[0][0]
     assert saved_user.type == "Organization"
 
 
@@ -89,6 +91,7 @@ async def test_get_user_returns_cached_with_type(
     user_service: UserService,
     mock_account_repository: AsyncMock,
     mock_user_repository: AsyncMock,
+    mock_github_client: AsyncMock,
 ):
     account_uuid = uuid4()
     cached_user = User(
@@ -101,8 +104,354 @@ async def test_get_user_returns_cached_with_type(
     mock_user_repository.get_by_username.return_value = cached_user
     mock_account_repository.get_by_username.return_value = None
 
-    use_case = GetUserUseCase(account_service, user_service)
+    use_case = GetUserUseCase(account_service, user_service, mock_github_client)
     result = await use_case.execute("alice", account_uuid)
 
     assert result.type == "User"
-    mock_user_repository.save.assert_not_called()
+    mock_user_repository.upsert.assert_not_called()
+    mock_github_client.fetch_user_by_username.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_user_not_modified_only_bumps_updated_at(
+    account_service: AccountService,
+    user_service: UserService,
+    mock_account_repository: AsyncMock,
+    mock_user_repository: AsyncMock,
+    mock_github_client: AsyncMock,
+):
+    account_uuid = uuid4()
+    stale_at = datetime.now(timezone.utc) - timedelta(days=8)
+    cached_user = User(
+        id="u1",
+        username="alice",
+        name="Alice",
+        type="User",
+        updated_at=stale_at,
+        etag='W/"abc"',
+        last_modified="Mon, 01 Jan 2024 00:00:00 GMT",
+    )
+    mock_user_repository.get_by_username.return_value = cached_user
+    mock_user_repository.save.side_effect = lambda u: u
+    mock_account_repository.get_by_uuid.return_value = Account(
+        id="a1", uuid=account_uuid, username="me", access_token="token"
+    )
+    mock_account_repository.get_by_username.return_value = None
+    mock_github_client.fetch_user_by_username.return_value = None
+
+    use_case = GetUserUseCase(account_service, user_service, mock_github_client)
+    result = await use_case.execute("alice", account_uuid)
+
+    mock_github_client.fetch_user_by_username.assert_called_once_with(
+        "alice",
+        "token",
+        etag='W/"abc"',
+        last_modified="Mon, 01 Jan 2024 00:00:00 GMT",
+        priority=GitHubCallPriority.INTERACTIVE,
+    )
+    assert result.name == "Alice"
+    assert result.etag == 'W/"abc"'
+    assert result.updated_at is not None and result.updated_at > stale_at
+    mock_user_repository.save.assert_called_once()
+    saved = mock_user_repository.save.call_args.args[0]
+    assert saved.etag == 'W/"abc"' and saved.updated_at == result.updated_at
+
+
+@pytest.mark.asyncio
+async def test_get_user_stores_validators_from_github(
+    account_service: AccountService,
+    user_service: UserService,
+    mock_account_repository: AsyncMock,
+    mock_user_repository: AsyncMock,
+    mock_github_client: AsyncMock,
+):
+    account_uuid = uuid4()
+    mock_account_repository.get_by_uuid.return_value = Account(
+        id="a1", uuid=account_uuid, username="me", access_token="token"
+    )
+    mock_account_repository.get_by_username.return_value = None
+    mock_user_repository.get_by_username.return_value = None
+    mock_user_repository.upsert.side_effect = lambda u: u
+    mock_github_client.fetch_user_by_username.return_value = {
+        "username": "alice",
+        "name": "Alice",
+        "bio": None,
+        "avatar_url": None,
+        "type": "User",
+        "etag": 'W/"new"',
+        "last_modified": None,
+    }
+
+    use_case = GetUserUseCase(account_service, user_service, mock_github_client)
+    result = await use_case.execute("alice", account_uuid)
+
+    assert result.etag == 'W/"new"'
+    mock_github_client.fetch_user_by_username.assert_called_once_with(
+        "alice",
+        "token",
+        etag=None,
+        last_modified=None,
+        priority=GitHubCallPriority.INTERACTIVE,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_user_serves_stale_cache_when_rate_limited(
+    account_service: AccountService,
+    user_service: UserService,
+    mock_account_repository: AsyncMock,
+    mock_user_repository: AsyncMock,
+    mock_github_client: AsyncMock,
+):
+    account_uuid = uuid4()
+    cached_user = User(
+        id="u1",
+        username="alice",
+        type="User",
+        updated_at=datetime.now(timezone.utc) - timedelta(days=8),
+    )
+    mock_user_repository.get_by_username.return_value = cached_user
+    mock_account_repository.get_by_uuid.return_value = Account(
+        id="a1", uuid=account_uuid, username="me", access_token="token"
+    )
+    mock_account_repository.get_by_username.return_value = None
+    mock_github_client.fetch_user_by_username.side_effect = GitHubRateLimitException(
+        "core"
+    )
+
+    use_case = GetUserUseCase(account_service, user_service, mock_github_client)
+    result = await use_case.execute("alice", account_uuid)
+
+    assert result == cached_user
+    mock_user_repository.upsert.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_user_rate_limited_without_cache_raises(
+    account_service: AccountService,
+    user_service: UserService,
+    mock_account_repository: AsyncMock,
+    mock_user_repository: AsyncMock,
+    mock_github_client: AsyncMock,
+):
+    account_uuid = uuid4()
+    mock_user_repository.get_by_username.return_value = None
+    mock_account_repository.get_by_uuid.return_value = Account(
+        id="a1", uuid=account_uuid, username="me", access_token="token"
+    )
+    mock_github_client.fetch_user_by_username.side_effect = GitHubRateLimitException(
+        "core"
+    )
+
+    use_case = GetUserUseCase(account_service, user_service, mock_github_client)
+    with pytest.raises(GitHubRateLimitException):
+        await use_case.execute("alice", account_uuid)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_cache_misses_share_one_github_fetch(
+    account_service: AccountService,
+    user_service: UserService,
+    mock_account_repository: AsyncMock,
+    mock_user_repository: AsyncMock,
+    mock_github_client: AsyncMock,
+):
+    account_uuid = uuid4()
+    mock_account_repository.get_by_uuid.return_value = Account(
+        id="a1", uuid=account_uuid, username="me", access_token="token"
+    )
+    mock_account_repository.get_by_username.return_value = None
+    mock_user_repository.get_by_username.return_value = None
+    mock_user_repository.upsert.side_effect = lambda u: u
+    release = asyncio.Event()
+
+    async def slow_fetch(*args, **kwargs) -> dict:
+        await release.wait()
+        return {"username": "Alice", "type": "User"}
+
+    mock_github_client.fetch_user_by_username.side_effect = slow_fetch
+
+    use_case = GetUserUseCase(account_service, user_service, mock_github_client)
+    tasks = [
+        asyncio.create_task(use_case.execute(name, account_uuid))
+        for name in ("alice", "ALICE", "Alice")
+    ]
+    await asyncio.sleep(0.01)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert [r.username for r in results] == ["Alice"] * 3
+    assert results[0] is not results[1]
+    mock_github_client.fetch_user_by_username.assert_called_once()
+    mock_user_repository.upsert.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_lease_held_elsewhere_reuses_peer_refresh(
+    account_service: AccountService,
+    user_service: UserService,
+    mock_account_repository: AsyncMock,
+    mock_user_repository: AsyncMock,
+    mock_github_client: AsyncMock,
+):
+    account_uuid = uuid4()
+    refreshed = User(
+        id="u1", username="alice", type="User", updated_at=datetime.now(timezone.utc)
+    )
+    mock_user_repository.get_by_username.side_effect = [None, refreshed]
+    mock_account_repository.get_by_username.return_value = None
+    lease_repository = AsyncMock()
+    lease_repository.acquire.return_value = False
+    lease_repository.is_held.return_value = False
+
+    use_case = GetUserUseCase(
+        account_service,
+        user_service,
+        mock_github_client,
+        lease_repository=lease_repository,
+    )
+    result = await use_case.execute("alice", account_uuid)
+
+    assert result == refreshed
+    mock_github_client.fetch_user_by_username.assert_not_called()
+    lease_repository.release.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_lease_acquired_fetches_and_releases(
+    account_service: AccountService,
+    user_service: UserService,
+    mock_account_repository: AsyncMock,
+    mock_user_repository: AsyncMock,
+    mock_github_client: AsyncMock,
+):
+    account_uuid = uuid4()
+    mock_account_repository.get_by_uuid.return_value = Account(
+        id="a1", uuid=account_uuid, username="me", access_token="token"
+    )
+    mock_account_repository.get_by_username.return_value = None
+    mock_user_repository.get_by_username.return_value = None
+    mock_user_repository.upsert.side_effect = lambda u: u
+    mock_github_client.fetch_user_by_username.return_value = {
+        "username": "alice",
+        "type": "User",
+    }
+    lease_repository = AsyncMock()
+    lease_repository.acquire.return_value = True
+
+    use_case = GetUserUseCase(
+        account_service,
+        user_service,
+        mock_github_client,
+        lease_repository=lease_repository,
+    )
+    result = await use_case.execute("alice", account_uuid)
+
+    assert result.username == "alice"
+    lease_key, owner, _ = lease_repository.acquire.call_args[0]
+    assert lease_key == "github-user:alice"
+    lease_repository.release.assert_called_once_with(lease_key, owner)
+
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate_serves_cache_and_refreshes_in_background(
+    account_service: AccountService,
+    user_service: UserService,
+    mock_account_repository: AsyncMock,
+    mock_user_repository: AsyncMock,
+    mock_github_client: AsyncMock,
+):
+    account_uuid = uuid4()
+    cached_user = User(
+        id="u1",
+        username="alice",
+        name="Old Name",
+        type="User",
+        updated_at=datetime.now(timezone.utc) - timedelta(days=8),
+    )
+    mock_user_repository.get_by_username.return_value = cached_user
+    mock_user_repository.upsert.side_effect = lambda u: u
+    mock_account_repository.get_by_uuid.return_value = Account(
+        id="a1", uuid=account_uuid, username="me", access_token="token"
+    )
+    mock_account_repository.get_by_username.return_value = None
+    mock_github_client.fetch_user_by_username.return_value = {
+        "username": "alice",
+        "name": "New Name",
+        "type": "User",
+    }
+
+    use_case = GetUserUseCase(account_service, user_service, mock_github_client)
+    result = await use_case.execute(
+        "alice", account_uuid, max_staleness=timedelta(days=30)
+    )
+
+    assert result.name == "Old Name"
+    await asyncio.sleep(0.01)
+    mock_github_client.fetch_user_by_username.assert_called_once()
+    assert (
+        mock_github_client.fetch_user_by_username.call_args.kwargs["priority"]
+        == GitHubCallPriority.BACKGROUND
+    )
+    assert mock_user_repository.upsert.call_args[0][0].name == "New Name"
+
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate_blocks_beyond_max_staleness(
+    account_service: AccountService,
+    user_service: UserService,
+    mock_account_repository: AsyncMock,
+    mock_user_repository: AsyncMock,
+    mock_github_client: AsyncMock,
+):
+    account_uuid = uuid4()
+    cached_user = User(
+        id="u1",
+        username="alice",
+        name="Old Name",
+        type="User",
+        updated_at=datetime.now(timezone.utc) - timedelta(days=45),
+    )
+    mock_user_repository.get_by_username.return_value = cached_user
+    mock_user_repository.upsert.side_effect = lambda u: u
+    mock_account_repository.get_by_uuid.return_value = Account(
+        id="a1", uuid=account_uuid, username="me", access_token="token"
+    )
+    mock_account_repository.get_by_username.return_value = None
+    mock_github_client.fetch_user_by_username.return_value = {
+        "username": "alice",
+        "name": "New Name",
+        "type": "User",
+    }
+
+    use_case = GetUserUseCase(account_service, user_service, mock_github_client)
+    result = await use_case.execute(
+        "alice", account_uuid, max_staleness=timedelta(days=30)
+    )
+
+    assert result.name == "New Name"
+
+
+@pytest.mark.asyncio
+async def test_get_user_records_view_for_cached_user(
+    account_service: AccountService,
+    user_service: UserService,
+    mock_account_repository: AsyncMock,
+    mock_user_repository: AsyncMock,
+    mock_github_client: AsyncMock,
+):
+    mock_account_repository.get_by_username.return_value = None
+    mock_user_repository.get_by_username.return_value = User(
+        username="alice", type="User", updated_at=datetime.now(timezone.utc)
+    )
+
+    view_counts: CounterBuffer[str] = CounterBuffer()
+    use_case = GetUserUseCase(
+        account_service, user_service, mock_github_client, view_counts=view_counts
+    )
+    await use_case.execute("Alice", uuid4())
+    await use_case.execute("alice", uuid4())
+
+    assert view_counts.drain() == {"alice": 2}
+    mock_user_repository.increment_view_counts.assert_not_called()
+    mock_github_client.fetch_user_by_username.assert_not_called()
@@ -0,0 +1,90 @@
+from datetime import timedelta
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.application.github.use_cases.refresh_expiring_users import (
+    RefreshExpiringUsersUseCase,
+)
+from app.domain.reviews.entities.review_stats import ReviewStats
+from app.domain.reviews.services.review_service import ReviewService
+from app.domain.shared.exceptions import GitHubRateLimitException
+from app.domain.users.entities.user import User
+from app.domain.users.services.user_service import UserService
+from app.domain.watchlist.services.watchlist_service import WatchlistService
+
+
+def _use_case(
+    user_service: UserService,
+    watchlist_service: WatchlistService,
+    review_service: ReviewService,
+    refresh_users: AsyncMock,
+) -> RefreshExpiringUsersUseCase:
+    return RefreshExpiringUsersUseCase(
+        user_service, watchlist_service, review_service, refresh_users
+    )
+
+
+@pytest.mark.asyncio
+async def test_refreshes_most_popular_users_within_budget(
+    user_service: UserService,
+    watchlist_service: WatchlistService,
+    review_service: ReviewService,
+    mock_user_repository: AsyncMock,
+    mock_watchlist_repository: AsyncMock,
+    mock_review_stats_repository: AsyncMock,
+):
+    mock_user_repository.get_refresh_candidates.return_value = [
+        User(username="viewed", view_count=4),
+        User(username="Watched"),
+        User(username="reviewed"),
+        User(username="ignored"),
+    ]
+    mock_watchlist_repository.get_watcher_counts_for_usernames.return_value = {
+        "watched": 2
+    }
+    mock_review_stats_repository.get_by_usernames.return_value = {
+        "reviewed": ReviewStats(username="reviewed", total=1, approve=1)
+    }
+    refresh_users = AsyncMock()
+    refresh_users.execute.side_effect = lambda batch, uuid: [
+        User(username=u) for u in batch
+    ]
+    account_uuid = uuid4()
+
+    refreshed = await _use_case(
+        user_service, watchlist_service, review_service, refresh_users
+    ).execute(
+        account_uuid, lead_time=timedelta(hours=24), budget=3, batch_size=2, concurrency=2
+    )
+
+    assert refreshed == 3
+    batches = [c.args[0] for c in refresh_users.execute.call_args_list]
+    assert batches == [["Watched", "viewed"], ["reviewed"]]
+    _, limit = mock_user_repository.get_refresh_candidates.call_args[0]
+    assert limit == 12
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_batch_is_deferred(
+    user_service: UserService,
+    watchlist_service: WatchlistService,
+    review_service: ReviewService,
+    mock_user_repository: AsyncMock,
+    mock_watchlist_repository: AsyncMock,
+    mock_review_stats_repository: AsyncMock,
+):
+    mock_user_repository.get_refresh_candidates.return_value = [User(username="alice")]
+    mock_watchlist_repository.get_watcher_counts_for_usernames.return_value = {}
+    mock_review_stats_repository.get_by_usernames.return_value = {}
+    refresh_users = AsyncMock()
+    refresh_users.execute.side_effect = GitHubRateLimitException("graphql")
+
+    refreshed = await _use_case(
+        user_service, watchlist_service, review_service, refresh_users
+    ).execute(
+        uuid4(), lead_time=timedelta(hours=24), budget=10, batch_size=100, concurrency=1
+    )
+
+    assert refreshed == 0
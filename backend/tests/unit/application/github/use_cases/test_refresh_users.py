@@ -0,0 +1,62 @@
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.application.github.use_cases.refresh_users import RefreshUsersUseCase
+from app.domain.accounts.entities.account import Account
+from app.domain.accounts.services.account_service import AccountService
+from app.domain.users.entities.user import User
+from app.domain.users.services.user_service import UserService
+from app.infrastructure.github.external.rate_limiter import GitHubCallPriority
+
+
+@pytest.mark.asyncio
+async def test_refresh_users_upserts_bulk_profiles(
+    account_service: AccountService,
+    user_service: UserService,
+    mock_account_repository: AsyncMock,
+    mock_user_repository: AsyncMock,
+    mock_github_client: AsyncMock,
+):
+    account_uuid = uuid4()
+    mock_account_repository.get_by_uuid.return_value = Account(
+        id="a1", uuid=account_uuid, username="me", access_token="token"
+    )
+    mock_github_client.fetch_users_by_usernames.return_value = {
+        "alice": {"username": "alice", "name": "Alice", "type": "User"},
+        "acme": {"username": "acme", "name": "Acme", "type": "Organization"},
+    }
+    mock_user_repository.get_by_usernames.return_value = [
+        User(id="u1", username="Alice", etag='W/"old"')
+    ]
+
+    use_case = RefreshUsersUseCase(account_service, user_service, mock_github_client)
+    result = await use_case.execute(["alice", "acme", "ghost"], account_uuid)
+
+    mock_github_client.fetch_users_by_usernames.assert_awaited_once_with(
+        ["alice", "acme", "ghost"], "token", priority=GitHubCallPriority.BACKGROUND
+    )
+    by_name = {u.username: u for u in result}
+    assert set(by_name) == {"alice", "acme"}
+    assert by_name["alice"].id == "u1"
+    assert by_name["alice"].etag is None
+    assert by_name["acme"].id is None
+    assert by_name["acme"].type == "Organization"
+    assert all(u.updated_at is not None for u in result)
+    mock_user_repository.upsert_many.assert_awaited_once()
+    mock_user_repository.upsert.assert_not_called()
+    mock_user_repository.touch_many.assert_awaited_once()
+    assert mock_user_repository.touch_many.await_args.args[0] == ["ghost"]
+
+
+@pytest.mark.asyncio
+async def test_refresh_users_empty_input_skips_github(
+    account_service: AccountService,
+    user_service: UserService,
+    mock_github_client: AsyncMock,
+):
+    use_case = RefreshUsersUseCase(account_service, user_service, mock_github_client)
+
+    assert await use_case.execute([], uuid4()) == []
+    mock_github_client.fetch_users_by_usernames.assert_not_called()
@@ -0,0 +1,102 @@
+import asyncio
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from app.application.github.use_cases.search_users import SearchUsersUseCase
+from app.domain.accounts.entities.account import Account
+from app.domain.accounts.services.account_service import AccountService
+from app.infrastructure.github.external.github_client import (
+    GitHubClient,
+    UserSearchPage,
+)
+from app.infrastructure.github.external.search_cache import UserSearchCache
+
+
+def _account() -> Account:
+    return Account(id="a1", uuid=uuid4(), username="me", access_token="token")
+
+
+@pytest.mark.asyncio
+async def test_search_users_caches_across_accounts(
+    account_service: AccountService,
+    mock_account_repository: AsyncMock,
+    mock_github_client: AsyncMock,
+):
+    mock_account_repository.get_by_uuid.return_value = _account()
+    mock_github_client.search_users.return_value = UserSearchPage(
+        items=[{"login": "alice", "avatar_url": None, "type": "User"}],
+        complete=True,
+    )
+    cache = UserSearchCache(ttl_seconds=60, max_entries=10)
+    use_case = SearchUsersUseCase(account_service, mock_github_client, search_cache=cache)
+
+    first = await use_case.execute(" Ali in:login", uuid4())
+    second = await use_case.execute("in:login ali", uuid4())
+    narrowed = await use_case.execute("alic in:login", uuid4())
+
+    assert first == second == narrowed
+    mock_github_client.search_users.assert_awaited_once_with("ali in:login", "token")
+
+
+@pytest.mark.asyncio
+async def test_search_users_coalesces_concurrent_misses(
+    account_service: AccountService,
+    mock_account_repository: AsyncMock,
+    mock_github_client: AsyncMock,
+):
+    mock_account_repository.get_by_uuid.return_value = _account()
+
+    async def slow_search(query: str, token: str) -> UserSearchPage:
+        await asyncio.sleep(0.01)
+        return UserSearchPage(items=[], complete=True)
+
+    mock_github_client.search_users.side_effect = slow_search
+    use_case = SearchUsersUseCase(account_service, mock_github_client)
+    account_uuid = uuid4()
+
+    await asyncio.gather(*(use_case.execute("bob", account_uuid) for _ in range(5)))
+
+    assert mock_github_client.search_users.await_count == 1
+    mock_account_repository.get_by_uuid.assert_awaited_once_with(account_uuid)
+    mock_github_client.search_users.assert_awaited_with("bob in:login", "token")
+
+
+@pytest.mark.asyncio
+async def test_search_users_typeahead_narrows_a_cached_login_prefix(
+    account_service: AccountService,
+    mock_account_repository: AsyncMock,
+):
+    mock_account_repository.get_by_uuid.return_value = _account()
+    searched: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        searched.append(request.url.params["q"])
+        logins = ["alice", "alfred", "bal"]
+        return httpx.Response(
+            200,
+            json={
+                "total_count": len(logins),
+                "incomplete_results": False,
+                "items": [{"login": login, "avatar_url": None} for login in logins],
+            },
+        )
+
+    github_client = GitHubClient(
+        httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    cache = UserSearchCache(ttl_seconds=60, max_entries=10)
+    use_case = SearchUsersUseCase(account_service, github_client, search_cache=cache)
+
+    results = [await use_case.execute(q, uuid4()) for q in ("al", "Ali", "alic")]
+    await github_client.aclose()
+
+    assert searched == ["type:user al in:login"]
+    assert [[user["login"] for user in users] for users in results] == [
+        ["alice", "alfred", "bal"],
+        ["alice"],
+        ["alice"],
+    ]
+    assert cache.prefix_hits == 2
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timezone
 from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
@@ -12,6 +13,7 @@ from app.domain.accounts.services.account_service import AccountService
 from app.domain.reviews.entities.review import Review, ReviewStatus
 from app.domain.reviews.services.review_enrichment_service import ReviewEnrichmentService
 from app.domain.reviews.services.review_service import ReviewService
+from app.domain.timeline.services.timeline_service import TimelineService
 from app.domain.users.entities.user import User
 from app.domain.watchlist.services.watchlist_service import WatchlistService
 from app.infrastructure.email.email_service import EmailService
@@ -48,22 +50,23 @@ async def test_create_or_update_review_happy_path(
     # Validator: check_target_is_user_type calls get_by_username on user_repo
     mock_user_repository.get_by_username.return_value = User(username="bob", type="User")
     # No existing review (new creation) — service now returns (review, is_new)
-    mock_review_repository.get_by_reviewer_and_username.return_value = None
-    mock_review_repository.create.return_value = review
+    mock_review_repository.upsert.return_value = (review, None)
     # Enrichment: get_accounts_by_uuids -> get_by_uuids
-    mock_account_repository.get_by_uuids.return_value = [account]
+    mock_account_repository.get_summaries_by_uuids.return_value = [account]
     # Enrichment: get_users_by_usernames -> get_by_usernames
-    mock_user_repository.get_by_usernames.return_value = [user]
+    mock_user_repository.get_summaries_by_usernames.return_value = [user]
 
     # Watchlist: auto-watch after review
-    mock_watchlist_repository.get_by_watcher_and_username.return_value = None
-    mock_watchlist_repository.create.return_value = AsyncMock()
+    mock_watchlist_repository.get_or_create.return_value = AsyncMock()
 
     mock_email_service = MagicMock(spec=EmailService)
     mock_email_service._configured = False
 
     use_case = CreateOrUpdateReviewUseCase(
-        review_service, account_service, enrichment_service, watchlist_service,
+        review_service,
+        account_service,
+        enrichment_service,
+        watchlist_service,
         mock_email_service,
     )
     result = await use_case.execute(
@@ -108,18 +111,19 @@ async def test_create_or_update_review_auto_watches_user(
 
     mock_account_repository.get_by_uuid.return_value = account
     mock_user_repository.get_by_username.return_value = User(username="bob", type="User")
-    mock_review_repository.get_by_reviewer_and_username.return_value = None
-    mock_review_repository.create.return_value = review
-    mock_account_repository.get_by_uuids.return_value = [account]
-    mock_user_repository.get_by_usernames.return_value = [user]
-    mock_watchlist_repository.get_by_watcher_and_username.return_value = None
-    mock_watchlist_repository.create.return_value = AsyncMock()
+    mock_review_repository.upsert.return_value = (review, None)
+    mock_account_repository.get_summaries_by_uuids.return_value = [account]
+    mock_user_repository.get_summaries_by_usernames.return_value = [user]
+    mock_watchlist_repository.get_or_create.return_value = AsyncMock()
 
     mock_email_service = MagicMock(spec=EmailService)
     mock_email_service._configured = False
 
     use_case = CreateOrUpdateReviewUseCase(
-        review_service, account_service, enrichment_service, watchlist_service,
+        review_service,
+        account_service,
+        enrichment_service,
+        watchlist_service,
         mock_email_service,
     )
     await use_case.execute(
@@ -130,4 +134,56 @@ async def test_create_or_update_review_auto_watches_user(
         anonymous=False,
     )
 
-    mock_watchlist_repository.create.assert_called_once()
+    mock_watchlist_repository.get_or_create.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_create_or_update_review_publishes_to_timelines(
+    review_service: ReviewService,
+    account_service: AccountService,
+    enrichment_service: ReviewEnrichmentService,
+    watchlist_service: WatchlistService,
+    mock_review_repository: AsyncMock,
+    mock_account_repository: AsyncMock,
+    mock_user_repository: AsyncMock,
+    mock_watchlist_repository: AsyncMock,
+):
+    reviewer_uuid = uuid4()
+    now = datetime.now(timezone.utc)
+    review = Review(
+        id="r1",
+        reviewer_uuid=reviewer_uuid,
+        reviewed_username="bob",
+        status=ReviewStatus.APPROVE,
+        comment=None,
+        anonymous=False,
+        created_at=now,
+        updated_at=now,
+    )
+    account = Account(id="a1", uuid=reviewer_uuid, username="alice", access_token="t")
+
+    mock_account_repository.get_by_uuid.return_value = account
+    mock_user_repository.get_by_username.return_value = User(username="bob", type="User")
+    mock_review_repository.upsert.return_value = (review, review)
+    mock_account_repository.get_summaries_by_uuids.return_value = [account]
+    mock_user_repository.get_summaries_by_usernames.return_value = []
+    timeline_service = AsyncMock(spec=TimelineService)
+
+    use_case = CreateOrUpdateReviewUseCase(
+        review_service,
+        account_service,
+        enrichment_service,
+        watchlist_service,
+        MagicMock(spec=EmailService),
+        timeline_service,
+    )
+    await use_case.execute(
+        reviewer_uuid=reviewer_uuid,
+        reviewed_username="bob",
+        status=ReviewStatus.APPROVE,
+        comment=None,
+        anonymous=False,
+    )
+    await asyncio.sleep(0.01)
+
+    timeline_service.publish.assert_awaited_once_with(review)
@@ -36,8 +36,8 @@ async def test_get_my_reviews_happy_path(
     user = User(username="alice", avatar_url="https://example.com/alice.png")
 
     mock_review_repository.get_all_by_reviewer_uuid.return_value = [review]
-    mock_account_repository.get_by_uuids.return_value = [account]
-    mock_user_repository.get_by_usernames.return_value = [user]
+    mock_account_repository.get_summaries_by_uuids.return_value = [account]
+    mock_user_repository.get_summaries_by_usernames.return_value = [user]
 
     use_case = GetMyReviewsUseCase(review_service, enrichment_service)
     results = await use_case.execute(reviewer_uuid, limit=100, offset=0)
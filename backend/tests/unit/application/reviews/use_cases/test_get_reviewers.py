@@ -7,11 +7,14 @@ import pytest
 from app.application.reviews.use_cases.get_reviewers import GetReviewersUseCase
 from app.domain.accounts.entities.account import Account
 from app.domain.accounts.services.account_service import AccountService
-from app.domain.reviews.entities.review import Review, ReviewStatus
+from app.domain.accounts.value_objects.account_summary import AccountSummary
+from app.domain.reviews.entities.review import ReviewStatus
 from app.domain.reviews.services.review_enrichment_service import ReviewEnrichmentService
 from app.domain.reviews.services.review_service import ReviewService
+from app.domain.reviews.value_objects.review_summary import ReviewSummary
 from app.domain.users.entities.user import User
 from app.domain.users.services.user_service import UserService
+from app.domain.users.value_objects.user_summary import UserSummary
 
 
 @pytest.mark.asyncio
@@ -28,45 +31,44 @@ async def test_get_reviewers_resolves_usernames(
     uuid2 = uuid4()
     now = datetime.now(timezone.utc)
     reviews = [
-        Review(
+        ReviewSummary(
             id="r1",
             reviewer_uuid=uuid1,
             reviewed_username="bob",
             status=ReviewStatus.APPROVE,
-            comment=None,
             anonymous=False,
-            created_at=now,
             updated_at=now,
         ),
-        Review(
+        ReviewSummary(
             id="r2",
             reviewer_uuid=uuid2,
             reviewed_username="bob",
             status=ReviewStatus.COMMENT,
-            comment="Nice",
             anonymous=False,
-            created_at=now,
             updated_at=now,
         ),
     ]
-    account1 = Account(id="a1", uuid=uuid1, username="alice", access_token="t")
-    account2 = Account(id="a2", uuid=uuid2, username="charlie", access_token="t")
+    account1 = AccountSummary(uuid=uuid1, username="alice")
+    account2 = AccountSummary(uuid=uuid2, username="charlie")
 
-    mock_review_repository.get_all_for_username.return_value = reviews
-    mock_account_repository.get_by_uuids.return_value = [account1, account2]
+    mock_review_repository.get_summaries_for_username.return_value = reviews
+    mock_account_repository.get_summaries_by_uuids.return_value = [account1, account2]
     mock_account_repository.get_by_username.return_value = Account(
         id="target-1", uuid=uuid4(), username="bob", access_token="t"
     )
     mock_user_repository.get_by_username.return_value = User(
         username="bob", avatar_url=None
     )
-    mock_user_repository.get_by_usernames.return_value = [
-        User(username="alice", avatar_url="https://example.com/alice.png"),
-        User(username="charlie", avatar_url=None),
+    mock_user_repository.get_summaries_by_usernames.return_value = [
+        UserSummary(username="alice", avatar_url="https://example.com/alice.png"),
+        UserSummary(username="charlie", avatar_url=None),
     ]
 
     use_case = GetReviewersUseCase(
-        review_service, account_service, user_service, enrichment_service,
+        review_service,
+        account_service,
+        user_service,
+        enrichment_service,
         open_draft_profiles=False,
     )
     results = await use_case.execute("bob", viewer_uuid=uuid4())
@@ -76,8 +78,8 @@ async def test_get_reviewers_resolves_usernames(
     assert results[0].reviewer_avatar_url == "https://example.com/alice.png"
     assert results[1].reviewer_username == "charlie"
     assert results[1].reviewer_avatar_url is None
-    mock_review_repository.get_all_for_username.assert_called_once_with(
-        "bob", 512, 0, status=None
+    mock_review_repository.get_summaries_for_username.assert_called_once_with(
+        "bob", 512, reviewer_uuid=None, raw=True
     )
 
 
@@ -95,38 +97,28 @@ async def test_get_reviewers_skips_deleted_accounts(
     uuid2 = uuid4()
     now = datetime.now(timezone.utc)
     reviews = [
-        Review(
+        ReviewSummary(
             id="r1",
             reviewer_uuid=uuid1,
             reviewed_username="bob",
             status=ReviewStatus.APPROVE,
-            comment=None,
             anonymous=False,
-            created_at=now,
             updated_at=now,
         ),
-        Review(
+        ReviewSummary(
             id="r2",
             reviewer_uuid=uuid2,
             reviewed_username="bob",
             status=ReviewStatus.COMMENT,
-            comment="Hi",
             anonymous=False,
-            created_at=now,
             updated_at=now,
         ),
     ]
 
-    mock_review_repository.get_all_for_username.return_value = reviews
-    mock_account_repository.get_by_uuids.return_value = [
-        Account(id="a1", uuid=uuid1, username="alice", access_token="t"),
-        Account(
-            id="a2",
-            uuid=uuid2,
-            username="deleted-user",
-            access_token="",
-            deleted_at=now,
-        ),
+    mock_review_repository.get_summaries_for_username.return_value = reviews
+    mock_account_repository.get_summaries_by_uuids.return_value = [
+        AccountSummary(uuid=uuid1, username="alice"),
+        AccountSummary(uuid=uuid2, username="deleted-user", deleted_at=now),
     ]
     mock_account_repository.get_by_username.return_value = Account(
         id="target-1", uuid=uuid4(), username="bob", access_token="t"
@@ -134,12 +126,15 @@ async def test_get_reviewers_skips_deleted_accounts(
     mock_user_repository.get_by_username.return_value = User(
         username="bob", avatar_url=None
     )
-    mock_user_repository.get_by_usernames.return_value = [
-        User(username="alice", avatar_url=None),
+    mock_user_repository.get_summaries_by_usernames.return_value = [
+        UserSummary(username="alice", avatar_url=None),
     ]
 
     use_case = GetReviewersUseCase(
-        review_service, account_service, user_service, enrichment_service,
+        review_service,
+        account_service,
+        user_service,
+        enrichment_service,
         open_draft_profiles=False,
     )
     results = await use_case.execute("bob", viewer_uuid=uuid4())
@@ -164,13 +159,16 @@ async def test_get_reviewers_returns_empty_for_closed_account(
     mock_user_repository.get_by_username.return_value = None
 
     use_case = GetReviewersUseCase(
-        review_service, account_service, user_service, enrichment_service,
+        review_service,
+        account_service,
+        user_service,
+        enrichment_service,
         open_draft_profiles=False,
     )
     results = await use_case.execute("bob", viewer_uuid=uuid4())
 
     assert results == []
-    mock_review_repository.get_all_for_username.assert_not_called()
+    mock_review_repository.get_summaries_for_username.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -187,46 +185,71 @@ async def test_get_reviewers_draft_shows_all_when_open(
     other_uuid = uuid4()
     now = datetime.now(timezone.utc)
     reviews = [
-        Review(
+        ReviewSummary(
             id="r1",
             reviewer_uuid=viewer_uuid,
             reviewed_username="draft-user",
             status=ReviewStatus.APPROVE,
-            comment=None,
             anonymous=False,
-            created_at=now,
             updated_at=now,
         ),
-        Review(
+        ReviewSummary(
             id="r2",
             reviewer_uuid=other_uuid,
             reviewed_username="draft-user",
             status=ReviewStatus.COMMENT,
-            comment="Hi",
             anonymous=False,
-            created_at=now,
             updated_at=now,
         ),
     ]
-    viewer_account = Account(
-        id="viewer-1", uuid=viewer_uuid, username="viewer", access_token="t"
-    )
-    other_account = Account(
-        id="other-1", uuid=other_uuid, username="other", access_token="t"
-    )
+    viewer_account = AccountSummary(uuid=viewer_uuid, username="viewer")
+    other_account = AccountSummary(uuid=other_uuid, username="other")
 
-    mock_review_repository.get_all_for_username.return_value = reviews
-    mock_account_repository.get_by_uuids.return_value = [viewer_account, other_account]
+    mock_review_repository.get_summaries_for_username.return_value = reviews
+    mock_account_repository.get_summaries_by_uuids.return_value = [
+        viewer_account,
+        other_account,
+    ]
     mock_account_repository.get_by_username.return_value = None
-    mock_user_repository.get_by_usernames.return_value = [
-        User(username="viewer", avatar_url=None),
-        User(username="other", avatar_url=None),
+    mock_user_repository.get_summaries_by_usernames.return_value = [
+        UserSummary(username="viewer", avatar_url=None),
+        UserSummary(username="other", avatar_url=None),
     ]
 
     use_case = GetReviewersUseCase(
-        review_service, account_service, user_service, enrichment_service,
+        review_service,
+        account_service,
+        user_service,
+        enrichment_service,
         open_draft_profiles=True,
     )
     results = await use_case.execute("draft-user", viewer_uuid=viewer_uuid)
 
     assert len(results) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_reviewers_draft_reads_only_the_viewers_review(
+    review_service: ReviewService,
+    account_service: AccountService,
+    user_service: UserService,
+    enrichment_service: ReviewEnrichmentService,
+    mock_review_repository: AsyncMock,
+    mock_account_repository: AsyncMock,
+):
+    viewer_uuid = uuid4()
+    mock_account_repository.get_by_username.return_value = None
+    mock_review_repository.get_summaries_for_username.return_value = []
+
+    use_case = GetReviewersUseCase(
+        review_service,
+        account_service,
+        user_service,
+        enrichment_service,
+        open_draft_profiles=False,
+    )
+    await use_case.execute("draft-user", viewer_uuid=viewer_uuid)
+
+    mock_review_repository.get_summaries_for_username.assert_called_once_with(
+        "draft-user", 512, reviewer_uuid=viewer_uuid, raw=True
+    )
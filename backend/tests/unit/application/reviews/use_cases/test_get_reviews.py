@@ -10,6 +10,7 @@ from app.domain.accounts.services.account_service import AccountService
 from app.domain.reviews.entities.review import Review, ReviewStatus
 from app.domain.reviews.services.review_enrichment_service import ReviewEnrichmentService
 from app.domain.reviews.services.review_service import ReviewService
+from app.domain.shared.pagination import KeysetCursor, ListVersion
 from app.domain.users.entities.user import User
 
 
@@ -46,14 +47,16 @@ async def test_get_reviews_resolves_usernames(
 
     mock_review_repository.get_all_for_username.return_value = [review]
     mock_account_repository.get_by_uuid.return_value = viewer_account
-    mock_account_repository.get_by_uuids.return_value = [account]
+    mock_account_repository.get_summaries_by_uuids.return_value = [account]
     mock_account_repository.get_by_username.return_value = Account(
         id="target-1", uuid=uuid4(), username="bob", access_token="t"
     )
-    mock_user_repository.get_by_usernames.return_value = [user]
+    mock_user_repository.get_summaries_by_usernames.return_value = [user]
 
     use_case = GetReviewsUseCase(
-        review_service, account_service, enrichment_service,
+        review_service,
+        account_service,
+        enrichment_service,
         open_draft_profiles=False,
     )
     results = await use_case.execute("bob", viewer_uuid=viewer_uuid)
@@ -98,14 +101,16 @@ async def test_get_reviews_skips_deleted_accounts(
 
     mock_review_repository.get_all_for_username.return_value = [review]
     mock_account_repository.get_by_uuid.return_value = viewer_account
-    mock_account_repository.get_by_uuids.return_value = [deleted_account]
+    mock_account_repository.get_summaries_by_uuids.return_value = [deleted_account]
     mock_account_repository.get_by_username.return_value = Account(
         id="target-1", uuid=uuid4(), username="bob", access_token="t"
     )
-    mock_user_repository.get_by_usernames.return_value = []
+    mock_user_repository.get_summaries_by_usernames.return_value = []
 
     use_case = GetReviewsUseCase(
-        review_service, account_service, enrichment_service,
+        review_service,
+        account_service,
+        enrichment_service,
         open_draft_profiles=False,
     )
     results = await use_case.execute("bob", viewer_uuid=viewer_uuid)
@@ -123,7 +128,6 @@ async def test_get_reviews_draft_only_shows_viewer_reviews(
     mock_user_repository: AsyncMock,
 ):
     viewer_uuid = uuid4()
-    other_uuid = uuid4()
     now = datetime.now(timezone.utc)
     viewer_review = Review(
         id="r1",
@@ -135,34 +139,23 @@ async def test_get_reviews_draft_only_shows_viewer_reviews(
         created_at=now,
         updated_at=now,
     )
-    other_review = Review(
-        id="r2",
-        reviewer_uuid=other_uuid,
-        reviewed_username="draft-user",
-        status=ReviewStatus.COMMENT,
-        comment="Hi",
-        anonymous=False,
-        created_at=now,
-        updated_at=now,
-    )
 
     viewer_account = Account(
         id="viewer-1", uuid=viewer_uuid, username="viewer", access_token="t"
     )
 
-    mock_review_repository.get_all_for_username.return_value = [
-        viewer_review,
-        other_review,
-    ]
+    mock_review_repository.get_all_for_username.return_value = [viewer_review]
     mock_account_repository.get_by_uuid.return_value = viewer_account
-    mock_account_repository.get_by_uuids.return_value = [viewer_account]
+    mock_account_repository.get_summaries_by_uuids.return_value = [viewer_account]
     mock_account_repository.get_by_username.return_value = None
-    mock_user_repository.get_by_usernames.return_value = [
+    mock_user_repository.get_summaries_by_usernames.return_value = [
         User(username="viewer", avatar_url=None)
     ]
 
     use_case = GetReviewsUseCase(
-        review_service, account_service, enrichment_service,
+        review_service,
+        account_service,
+        enrichment_service,
         open_draft_profiles=False,
     )
     results = await use_case.execute("draft-user", viewer_uuid=viewer_uuid)
@@ -170,6 +163,16 @@ async def test_get_reviews_draft_only_shows_viewer_reviews(
     assert len(results.items) == 1
     assert results.items[0].review.id == "r1"
     assert results.items[0].reviewer_username == "viewer"
+    # The reviewer filter and page limit are applied by the query.
+    mock_review_repository.get_all_for_username.assert_awaited_once_with(
+        "draft-user",
+        17,
+        0,
+        status=None,
+        since=None,
+        after=None,
+        reviewer_uuid=viewer_uuid,
+    )
 
 
 @pytest.mark.asyncio
@@ -217,17 +220,119 @@ async def test_get_reviews_draft_shows_all_when_open(
         other_review,
     ]
     mock_account_repository.get_by_uuid.return_value = viewer_account
-    mock_account_repository.get_by_uuids.return_value = [viewer_account, other_account]
+    mock_account_repository.get_summaries_by_uuids.return_value = [
+        viewer_account,
+        other_account,
+    ]
     mock_account_repository.get_by_username.return_value = None
-    mock_user_repository.get_by_usernames.return_value = [
+    mock_user_repository.get_summaries_by_usernames.return_value = [
         User(username="viewer", avatar_url=None),
         User(username="other", avatar_url=None),
     ]
 
     use_case = GetReviewsUseCase(
-        review_service, account_service, enrichment_service,
+        review_service,
+        account_service,
+        enrichment_service,
         open_draft_profiles=True,
     )
     results = await use_case.execute("draft-user", viewer_uuid=viewer_uuid)
 
     assert len(results.items) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_reviews_version_of_draft_profile_covers_viewer_review_only(
+    review_service: ReviewService,
+    account_service: AccountService,
+    enrichment_service: ReviewEnrichmentService,
+    mock_review_repository: AsyncMock,
+    mock_account_repository: AsyncMock,
+):
+    viewer_uuid = uuid4()
+    mock_account_repository.get_by_uuid.return_value = Account(
+        id="a1", uuid=viewer_uuid, username="viewer", access_token="t"
+    )
+    mock_account_repository.get_by_username.return_value = None
+    mock_review_repository.get_feed_version.return_value = ListVersion(1, None)
+
+    use_case = GetReviewsUseCase(
+        review_service, account_service, enrichment_service, open_draft_profiles=False
+    )
+    version = await use_case.get_version("draft", viewer_uuid)
+
+    assert version == ListVersion(1, None, scope=f"{viewer_uuid}:00")
+    mock_review_repository.get_feed_version.assert_awaited_once_with(
+        [], draft_usernames=["draft"], viewer_uuid=viewer_uuid, status=None
+    )
+    mock_review_repository.get_all_for_username.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_reviews_version_differs_per_viewer(
+    review_service: ReviewService,
+    account_service: AccountService,
+    enrichment_service: ReviewEnrichmentService,
+    mock_review_repository: AsyncMock,
+    mock_account_repository: AsyncMock,
+):
+    owner = Account(id="a1", uuid=uuid4(), username="Bob", access_token="t")
+    visitor = Account(id="a2", uuid=uuid4(), username="carol", access_token="t")
+    mock_account_repository.get_by_uuid.side_effect = lambda uuid: (
+        owner if uuid == owner.uuid else visitor
+    )
+    mock_review_repository.get_feed_version.return_value = ListVersion(1, None)
+
+    use_case = GetReviewsUseCase(
+        review_service, account_service, enrichment_service, open_draft_profiles=False
+    )
+    owner_version = await use_case.get_version("bob", owner.uuid)
+    visitor_version = await use_case.get_version("bob", visitor.uuid)
+
+    assert owner_version.scope == f"{owner.uuid}:10"
+    assert visitor_version.tag != owner_version.tag
+
+
+@pytest.mark.asyncio
+async def test_get_reviews_pages_by_cursor(
+    review_service: ReviewService,
+    account_service: AccountService,
+    enrichment_service: ReviewEnrichmentService,
+    mock_review_repository: AsyncMock,
+    mock_account_repository: AsyncMock,
+    mock_user_repository: AsyncMock,
+):
+    viewer_uuid = uuid4()
+    viewer = Account(id="a1", uuid=viewer_uuid, username="viewer", access_token="t")
+    created = datetime(2024, 5, 1, tzinfo=timezone.utc)
+    reviews = [
+        Review(
+            id=f"r{i}",
+            reviewer_uuid=viewer_uuid,
+            reviewed_username="bob",
+            status=ReviewStatus.APPROVE,
+            comment=None,
+            anonymous=False,
+            created_at=created,
+            updated_at=created,
+        )
+        for i in range(3)
+    ]
+    mock_account_repository.get_by_uuid.return_value = viewer
+    mock_account_repository.get_by_username.return_value = viewer
+    mock_account_repository.get_summaries_by_uuids.return_value = [viewer]
+    mock_user_repository.get_summaries_by_usernames.return_value = []
+    mock_review_repository.get_all_for_username.return_value = reviews
+    cursor = KeysetCursor(sort_value=created, id="r0")
+
+    use_case = GetReviewsUseCase(
+        review_service, account_service, enrichment_service, open_draft_profiles=False
+    )
+    result = await use_case.execute("bob", viewer_uuid, limit=2, offset=40, cursor=cursor)
+
+    mock_review_repository.get_all_for_username.assert_awaited_once_with(
+        "bob", 3, 0, status=None, since=None, after=cursor, reviewer_uuid=None
+    )
+    assert [r.review.id for r in result.items] == ["r0", "r1"]
+    assert result.has_more is True
+    assert result.next_cursor == KeysetCursor(sort_value=created, id="r1")
@@ -1,6 +1,25 @@
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import UUID, uuid4
+
+import pytest
+
 from app.application.reviews.use_cases.get_suggestions import (
     GetSuggestionsUseCase,
 )
+from app.domain.accounts.entities.account import Account
+from app.domain.accounts.services.account_service import AccountService
+from app.domain.following.entities.following_graph import (
+    FollowedUser,
+    FollowingGraph,
+    FollowingGraphPage,
+)
+from app.domain.following.services.following_service import FollowingService
+from app.domain.reviews.entities.review_stats import ReviewStats
+from app.domain.reviews.services.review_service import ReviewService
+from app.domain.watchlist.services.watchlist_service import WatchlistService
+from app.infrastructure.shared.config.config import settings
 
 
 class TestBuildCandidates:
@@ -51,3 +70,141 @@ class TestBuildCandidates:
 
         assert len(candidates) == 2
         assert set(candidates.keys()) == {"alice", "bob"}
+
+
+@pytest.mark.asyncio
+async def test_execute_waits_for_first_sync_when_graph_is_missing(
+    account_service: AccountService,
+    watchlist_service: WatchlistService,
+    review_service: ReviewService,
+    following_service: FollowingService,
+    mock_account_repository: AsyncMock,
+    mock_watchlist_repository: AsyncMock,
+    mock_review_repository: AsyncMock,
+    mock_following_repository: AsyncMock,
+    mock_review_stats_repository: AsyncMock,
+):
+    account_uuid = uuid4()
+    mock_account_repository.get_by_uuid.return_value = Account(
+        id="a1", uuid=account_uuid, username="me", access_token="token"
+    )
+    mock_account_repository.get_by_usernames.return_value = []
+    mock_watchlist_repository.get_all_by_watcher.return_value = []
+    mock_review_repository.get_all_by_reviewer_uuid.return_value = []
+    mock_review_stats_repository.get_by_usernames.return_value = {}
+    mock_following_repository.get_by_account_uuid.return_value = None
+    sync_following = Mock()
+    sync_following.execute = AsyncMock(
+        return_value=FollowingGraph(
+            id="g1",
+            account_uuid=account_uuid,
+            pages=[
+                FollowingGraphPage(
+                    users=[FollowedUser(login="bob", avatar_url=None, type="User")]
+                )
+            ],
+            synced_at=datetime.now(timezone.utc),
+        )
+    )
+
+    use_case = GetSuggestionsUseCase(
+        account_service,
+        watchlist_service,
+        review_service,
+        following_service,
+        sync_following,
+    )
+    result = await use_case.execute(account_uuid)
+
+    assert [s["username"] for s in result] == ["bob"]
+    sync_following.execute.assert_awaited_once_with(account_uuid)
+    sync_following.schedule.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_execute_stops_waiting_for_a_slow_first_sync(
+    account_service: AccountService,
+    watchlist_service: WatchlistService,
+    review_service: ReviewService,
+    following_service: FollowingService,
+    mock_account_repository: AsyncMock,
+    mock_watchlist_repository: AsyncMock,
+    mock_review_repository: AsyncMock,
+    mock_following_repository: AsyncMock,
+):
+    account_uuid = uuid4()
+    mock_account_repository.get_by_uuid.return_value = Account(
+        id="a1", uuid=account_uuid, username="me", access_token="token"
+    )
+    mock_watchlist_repository.get_all_by_watcher.return_value = []
+    mock_review_repository.get_all_by_reviewer_uuid.return_value = []
+    mock_following_repository.get_by_account_uuid.return_value = None
+
+    async def slow_sync(account_uuid: UUID) -> None:
+        await asyncio.sleep(1)
+
+    sync_following = Mock()
+    sync_following.execute = AsyncMock(side_effect=slow_sync)
+
+    use_case = GetSuggestionsUseCase(
+        account_service,
+        watchlist_service,
+        review_service,
+        following_service,
+        sync_following,
+    )
+    with patch.object(settings, "FOLLOWING_SYNC_WAIT_SECONDS", 0.01):
+        result = await use_case.execute(account_uuid)
+
+    assert result == []
+
+
+@pytest.mark.asyncio
+async def test_execute_uses_stored_graph_without_resync(
+    account_service: AccountService,
+    watchlist_service: WatchlistService,
+    review_service: ReviewService,
+    following_service: FollowingService,
+    mock_account_repository: AsyncMock,
+    mock_watchlist_repository: AsyncMock,
+    mock_review_repository: AsyncMock,
+    mock_following_repository: AsyncMock,
+    mock_review_stats_repository: AsyncMock,
+):
+    account_uuid = uuid4()
+    mock_account_repository.get_by_uuid.return_value = Account(
+        id="a1", uuid=account_uuid, username="me", access_token="token"
+    )
+    mock_account_repository.get_by_usernames.return_value = []
+    mock_watchlist_repository.get_all_by_watcher.return_value = []
+    mock_review_repository.get_all_by_reviewer_uuid.return_value = []
+    mock_review_stats_repository.get_by_usernames.return_value = {
+        "bob": ReviewStats(username="bob", total=2, approve=2)
+    }
+    mock_following_repository.get_by_account_uuid.return_value = FollowingGraph(
+        id="g1",
+        account_uuid=account_uuid,
+        pages=[
+            FollowingGraphPage(
+                users=[
+                    FollowedUser(login="bob", avatar_url="b.png", type="User"),
+                    FollowedUser(login="acme", avatar_url="o.png", type="Organization"),
+                ]
+            )
+        ],
+        synced_at=datetime.now(timezone.utc),
+    )
+    sync_following = Mock()
+
+    use_case = GetSuggestionsUseCase(
+        account_service,
+        watchlist_service,
+        review_service,
+        following_service,
+        sync_following,
+    )
+    result = await use_case.execute(account_uuid)
+
+    assert [s["username"] for s in result] == ["bob"]
+    assert result[0]["review_count"] == 2
+    sync_following.schedule.assert_not_called()
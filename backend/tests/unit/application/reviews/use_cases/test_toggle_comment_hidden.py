@@ -49,8 +49,8 @@ async def test_toggle_hidden_success(
     mock_review_repository.get_by_id.return_value = review
     mock_account_repository.get_by_uuid.return_value = owner_account
     mock_review_repository.update.side_effect = lambda r: r
-    mock_account_repository.get_by_uuids.return_value = [reviewer_account]
-    mock_user_repository.get_by_usernames.return_value = []
+    mock_account_repository.get_summaries_by_uuids.return_value = [reviewer_account]
+    mock_user_repository.get_summaries_by_usernames.return_value = []
 
     use_case = ToggleCommentHiddenUseCase(
         review_service, account_service, enrichment_service
@@ -157,8 +157,8 @@ async def test_toggle_hidden_moderator_can_hide(
     mock_review_repository.get_by_id.return_value = review
     mock_account_repository.get_by_uuid.return_value = mod_account
     mock_review_repository.update.side_effect = lambda r: r
-    mock_account_repository.get_by_uuids.return_value = [reviewer_account]
-    mock_user_repository.get_by_usernames.return_value = []
+    mock_account_repository.get_summaries_by_uuids.return_value = [reviewer_account]
+    mock_user_repository.get_summaries_by_usernames.return_value = []
 
     use_case = ToggleCommentHiddenUseCase(
         review_service, account_service, enrichment_service
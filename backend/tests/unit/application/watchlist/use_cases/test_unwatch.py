@@ -4,6 +4,7 @@ from uuid import uuid4
 import pytest
 
 from app.application.watchlist.use_cases.unwatch import UnwatchUseCase
+from app.domain.timeline.services.timeline_service import TimelineService
 from app.domain.watchlist.services.watchlist_service import WatchlistService
 
 
@@ -18,3 +19,17 @@ async def test_unwatch_happy_path(
     await use_case.execute(watcher_uuid, "targetuser")
 
     mock_watchlist_repository.delete.assert_called_once_with(watcher_uuid, "targetuser")
+
+
+@pytest.mark.asyncio
+async def test_unwatch_removes_username_from_timeline(
+    watchlist_service: WatchlistService,
+    mock_watchlist_repository: AsyncMock,
+):
+    watcher_uuid = uuid4()
+    timeline_service = AsyncMock(spec=TimelineService)
+
+    use_case = UnwatchUseCase(watchlist_service, timeline_service)
+    await use_case.execute(watcher_uuid, "targetuser")
+
+    timeline_service.forget.assert_awaited_once_with(watcher_uuid, "targetuser")
@@ -35,9 +35,7 @@ async def test_watch_happy_path(
     mock_user_repository.get_by_username.return_value = User(
         username="targetuser", type="User"
     )
-    # No existing watch
-    mock_watchlist_repository.get_by_watcher_and_username.return_value = None
-    mock_watchlist_repository.create.return_value = watch
+    mock_watchlist_repository.get_or_create.return_value = watch
 
     use_case = WatchUseCase(watchlist_service)
     result = await use_case.execute(watcher_uuid, "targetuser")
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock
 from uuid import uuid4
 
@@ -64,11 +65,17 @@ async def test_get_or_create_account_existing(
     mock_account_repository: AsyncMock,
     sample_account: Account,
 ):
-    mock_account_repository.get_by_username.return_value = sample_account
-    mock_account_repository.update.return_value = sample_account
+    sample_account.access_token = "new-token"
+    mock_account_repository.upsert_by_username.return_value = (
+        sample_account,
+        sample_account,
+    )
     result, is_new = await account_service.get_or_create_account("testuser", "new-token")
     assert result.access_token == "new-token"
     assert is_new is False
+    account, update_fields = mock_account_repository.upsert_by_username.call_args[0]
+    assert account.username == "testuser"
+    assert update_fields == ["deleted_at", "access_token"]
 
 
 @pytest.mark.asyncio
@@ -76,15 +83,45 @@ async def test_get_or_create_account_new(
     account_service: AccountService,
     mock_account_repository: AsyncMock,
 ):
-    mock_account_repository.get_by_username.return_value = None
     new_account = Account(
         id="new-id",
         uuid=uuid4(),
         username="newuser",
         access_token="token",
     )
-    mock_account_repository.create.return_value = new_account
+    mock_account_repository.upsert_by_username.return_value = (new_account, None)
     result, is_new = await account_service.get_or_create_account("newuser", "token")
     assert result.username == "newuser"
     assert is_new is True
-    mock_account_repository.create.assert_called_once()
+    mock_account_repository.upsert_by_username.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_account_reads_are_batched_and_memoized_per_service(
+    account_service: AccountService,
+    mock_account_repository: AsyncMock,
+    sample_account: Account,
+):
+    other = Account(id="a2", uuid=uuid4(), username="Other", access_token="token")
+    mock_account_repository.get_by_uuids.return_value = [sample_account, other]
+
+    await asyncio.gather(
+        account_service.get_account_by_uuid(sample_account.uuid),
+        account_service.get_account_by_uuid(other.uuid),
+    )
+    loaded = await account_service.get_account_by_username("OTHER")
+    assert loaded == other
+    summaries = await account_service.get_account_summaries_by_uuids([other.uuid])
+
+    assert summaries[other.uuid].username == "Other"
+    mock_account_repository.get_by_uuids.assert_awaited_once_with(
+        [sample_account.uuid, other.uuid]
+    )
+    mock_account_repository.get_by_username.assert_not_awaited()
+    mock_account_repository.get_summaries_by_uuids.assert_not_awaited()
+
+    # Callers get their own copies: mutating one leaves later reads alone.
+    assert loaded is not other
+    loaded.delete()
+    reloaded = await account_service.get_account_by_uuid(other.uuid)
+    assert reloaded.deleted_at is None
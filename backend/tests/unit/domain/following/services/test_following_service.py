@@ -0,0 +1,44 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.domain.following.entities.following_graph import (
+    FollowedUser,
+    FollowingGraph,
+    FollowingGraphPage,
+)
+from app.domain.following.services.following_service import FollowingService
+
+
+def test_needs_sync_when_graph_missing(following_service: FollowingService):
+    assert following_service.needs_sync(None, timedelta(hours=6)) is True
+
+
+def test_needs_sync_respects_interval(following_service: FollowingService):
+    graph = FollowingGraph(
+        id="g1",
+        account_uuid=uuid4(),
+        synced_at=datetime.now(timezone.utc) - timedelta(hours=1),
+    )
+
+    assert following_service.needs_sync(graph, timedelta(hours=6)) is False
+    assert following_service.needs_sync(graph, timedelta(minutes=30)) is True
+
+
+@pytest.mark.asyncio
+async def test_save_pages_keeps_id_and_stamps_sync_time(
+    following_service: FollowingService,
+    mock_following_repository: AsyncMock,
+):
+    account_uuid = uuid4()
+    existing = FollowingGraph(id="g1", account_uuid=account_uuid)
+    pages = [FollowingGraphPage(users=[FollowedUser(login="alice")])]
+    mock_following_repository.save.side_effect = lambda g: g
+
+    graph = await following_service.save_pages(account_uuid, pages, existing)
+
+    assert graph.id == "g1"
+    assert graph.pages == pages
+    assert graph.synced_at is not None
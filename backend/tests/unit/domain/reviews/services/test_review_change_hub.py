@@ -0,0 +1,156 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.domain.reviews.entities.review import Review, ReviewStatus
+from app.domain.reviews.services.review_change_hub import ReviewChangeHub
+from app.domain.reviews.value_objects.review_change import ReviewChange
+
+
+def _change(token: str, username: str, reviewer_uuid: UUID | None = None) -> ReviewChange:
+    now = datetime.now(timezone.utc)
+    review = Review(
+        id=f"65f0c0ffee00000000000{token:0>3}",
+        reviewer_uuid=reviewer_uuid or uuid4(),
+        reviewed_username=username,
+        status=ReviewStatus.APPROVE,
+        comment=None,
+        anonymous=False,
+        created_at=now,
+        updated_at=now,
+    )
+    return ReviewChange(token=token, review=review)
+
+
+def _hub(change_stream: AsyncMock | None = None, **kwargs: int) -> ReviewChangeHub:
+    return ReviewChangeHub(change_stream or AsyncMock(), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_dispatch_routes_changes_by_username_case_insensitively():
+    hub = _hub()
+    alice = await hub.subscribe(["Alice"], uuid4())
+    bob = await hub.subscribe(["bob"], uuid4())
+
+    hub.dispatch(_change("1", "alice"))
+    hub.dispatch(_change("2", "carol"))
+
+    change = await alice.next(timeout=0.01)
+    assert change is not None and change.token == "1"
+    assert await alice.next(timeout=0.01) is None
+    assert await bob.next(timeout=0.01) is None
+
+
+@pytest.mark.asyncio
+async def test_viewer_only_usernames_deliver_only_the_viewers_reviews():
+    hub = _hub()
+    viewer = uuid4()
+    subscription = await hub.subscribe([], viewer, viewer_only_usernames=["draft"])
+
+    hub.dispatch(_change("1", "draft"))
+    hub.dispatch(_change("2", "draft", reviewer_uuid=viewer))
+
+    change = await subscription.next(timeout=0.01)
+    assert change is not None and change.token == "2"
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe_stops_delivery():
+    hub = _hub()
+    subscription = await hub.subscribe(["alice"], uuid4())
+
+    hub.unsubscribe(subscription)
+    hub.dispatch(_change("1", "alice"))
+
+    assert await subscription.next(timeout=0.01) is None
+
+
+@pytest.mark.asyncio
+async def test_subscribe_replays_recent_changes_after_last_event_id():
+    change_stream = AsyncMock()
+    hub = _hub(change_stream)
+    for token in ("1", "2", "3"):
+        hub.dispatch(_change(token, "alice"))
+
+    subscription = await hub.subscribe(["alice"], uuid4(), last_event_id="1")
+    hub.dispatch(_change("4", "alice"))
+
+    tokens = [(await subscription.next(timeout=0.01)).token for _ in range(3)]
+    assert tokens == ["2", "3", "4"]
+    change_stream.changes_since.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_subscribe_catches_up_from_the_change_stream():
+    change_stream = AsyncMock()
+    change_stream.changes_since.return_value = [_change("2", "alice")]
+    hub = _hub(change_stream, replay_size=10)
+
+    subscription = await hub.subscribe(["alice"], uuid4(), last_event_id="old")
+    # A live change already returned by the catch-up is not delivered twice.
+    hub.dispatch(_change("2", "alice"))
+
+    change = await subscription.next(timeout=0.01)
+    assert change is not None and change.token == "2"
+    assert await subscription.next(timeout=0.01) is None
+    change_stream.changes_since.assert_awaited_once_with("old", 11)
+    assert subscription.take_reset() is False
+
+
+@pytest.mark.asyncio
+async def test_subscribe_resets_when_the_position_cannot_be_resumed():
+    change_stream = AsyncMock()
+    change_stream.changes_since.return_value = None
+    hub = _hub(change_stream)
+
+    subscription = await hub.subscribe(["alice"], uuid4(), last_event_id="gone")
+
+    assert subscription.take_reset() is True
+    assert subscription.take_reset() is False
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_is_reset_instead_of_blocking_dispatch():
+    hub = _hub(queue_size=2)
+    subscription = await hub.subscribe(["alice"], uuid4())
+
+    for token in ("1", "2", "3"):
+        hub.dispatch(_change(token, "alice"))
+
+    assert subscription.take_reset() is True
+    assert await subscription.next(timeout=0.01) is None
+    hub.dispatch(_change("4", "alice"))
+    change = await subscription.next(timeout=0.01)
+    assert change is not None and change.token == "4"
+
+
+@pytest.mark.asyncio
+async def test_run_resumes_after_the_last_dispatched_change():
+    calls: list[str | None] = []
+    resumed = asyncio.Event()
+
+    async def watch(
+        resume_token: str | None = None,
+    ) -> AsyncGenerator[ReviewChange, None]:
+        calls.append(resume_token)
+        if len(calls) == 1:
+            yield _change("1", "alice")
+            raise ConnectionError("stream closed")
+        resumed.set()
+        await asyncio.Event().wait()
+        yield _change("never", "alice")
+
+    change_stream = MagicMock()
+    change_stream.watch.side_effect = watch
+    hub = ReviewChangeHub(change_stream, retry_delay_seconds=0)
+
+    task = asyncio.create_task(hub.run())
+    await asyncio.wait_for(resumed.wait(), timeout=1)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert calls == [None, "1"]
@@ -31,8 +31,8 @@ async def test_enrich_reviews_resolves_usernames(
     account = Account(id="a1", uuid=reviewer_uuid, username="alice", access_token="t")
     user = User(username="alice", avatar_url="https://example.com/alice.png")
 
-    mock_account_repository.get_by_uuids.return_value = [account]
-    mock_user_repository.get_by_usernames.return_value = [user]
+    mock_account_repository.get_summaries_by_uuids.return_value = [account]
+    mock_user_repository.get_summaries_by_usernames.return_value = [user]
 
     result = await enrichment_service.enrich_reviews([review])
 
@@ -67,7 +67,7 @@ async def test_enrich_reviews_filters_deleted_accounts(
         deleted_at=now,
     )
 
-    mock_account_repository.get_by_uuids.return_value = [deleted_account]
+    mock_account_repository.get_summaries_by_uuids.return_value = [deleted_account]
 
     result = await enrichment_service.enrich_reviews([review])
 
@@ -94,8 +94,8 @@ async def test_enrich_reviews_handles_missing_user(
     )
     account = Account(id="a1", uuid=reviewer_uuid, username="alice", access_token="t")
 
-    mock_account_repository.get_by_uuids.return_value = [account]
-    mock_user_repository.get_by_usernames.return_value = []
+    mock_account_repository.get_summaries_by_uuids.return_value = [account]
+    mock_user_repository.get_summaries_by_usernames.return_value = []
 
     result = await enrichment_service.enrich_reviews([review])
 
@@ -130,8 +130,8 @@ async def test_enrich_reviews_skips_unknown_reviewer(
         updated_at=now,
     )
 
-    mock_account_repository.get_by_uuids.return_value = []
-    mock_user_repository.get_by_usernames.return_value = []
+    mock_account_repository.get_summaries_by_uuids.return_value = []
+    mock_user_repository.get_summaries_by_usernames.return_value = []
 
     result = await enrichment_service.enrich_reviews([review])
 
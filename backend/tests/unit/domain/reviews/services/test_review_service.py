@@ -6,6 +6,7 @@ import pytest
 
 from app.domain.accounts.entities.account import Account
 from app.domain.reviews.entities.review import Review, ReviewStatus
+from app.domain.reviews.entities.review_stats import ReviewStats
 from app.domain.reviews.services.review_service import ReviewService
 from app.domain.shared.exceptions import (
     AnonymousFieldImmutableException,
@@ -22,14 +23,14 @@ async def test_create_review_success(
     mock_review_repository: AsyncMock,
     mock_account_repository: AsyncMock,
     mock_user_repository: AsyncMock,
+    mock_review_stats_repository: AsyncMock,
 ):
     reviewer_uuid = uuid4()
     mock_account_repository.get_by_uuid.return_value = Account(
         id="a1", uuid=reviewer_uuid, username="reviewer", access_token="t"
     )
     mock_user_repository.get_by_username.return_value = None
-    mock_review_repository.get_by_reviewer_and_username.return_value = None
-    mock_review_repository.create.side_effect = lambda r: r
+    mock_review_repository.upsert.side_effect = lambda r: (r, None)
 
     result, is_new = await review_service.create_or_update_review(
         reviewer_uuid, "reviewed_user", ReviewStatus.APPROVE, "Nice!", False
@@ -38,7 +39,10 @@ async def test_create_review_success(
     assert result.status == ReviewStatus.APPROVE
     assert result.comment == "Nice!"
     assert is_new is True
-    mock_review_repository.create.assert_called_once()
+    mock_review_repository.upsert.assert_called_once()
+    mock_review_stats_repository.increment.assert_awaited_once_with(
+        {"reviewed_user": {ReviewStatus.APPROVE: 1}}
+    )
 
 
 @pytest.mark.asyncio
@@ -47,6 +51,7 @@ async def test_update_existing_review(
     mock_review_repository: AsyncMock,
     mock_account_repository: AsyncMock,
     mock_user_repository: AsyncMock,
+    mock_review_stats_repository: AsyncMock,
 ):
     reviewer_uuid = uuid4()
     now = datetime.now(timezone.utc)
@@ -64,8 +69,7 @@ async def test_update_existing_review(
         id="a1", uuid=reviewer_uuid, username="reviewer", access_token="t"
     )
     mock_user_repository.get_by_username.return_value = None
-    mock_review_repository.get_by_reviewer_and_username.return_value = existing
-    mock_review_repository.update.side_effect = lambda r: r
+    mock_review_repository.upsert.side_effect = lambda r: (r, existing)
 
     result, is_new = await review_service.create_or_update_review(
         reviewer_uuid, "bob", ReviewStatus.REQUEST_CHANGE, "Fix this", False
@@ -74,7 +78,18 @@ async def test_update_existing_review(
     assert result.status == ReviewStatus.REQUEST_CHANGE
     assert result.comment == "Fix this"
     assert is_new is False
-    mock_review_repository.update.assert_called_once()
+    mock_review_repository.upsert.assert_called_once()
+    mock_review_stats_repository.increment.assert_awaited_once_with(
+        {"bob": {ReviewStatus.APPROVE: -1, ReviewStatus.REQUEST_CHANGE: 1}}
+    )
+
+    # Editing only the comment leaves the counters alone.
+    mock_review_stats_repository.increment.reset_mock()
+    existing.status = ReviewStatus.REQUEST_CHANGE
+    await review_service.create_or_update_review(
+        reviewer_uuid, "bob", ReviewStatus.REQUEST_CHANGE, "Fix that", False
+    )
+    mock_review_stats_repository.increment.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -131,29 +146,20 @@ async def test_anonymous_field_immutable(
     mock_review_repository: AsyncMock,
     mock_account_repository: AsyncMock,
     mock_user_repository: AsyncMock,
+    mock_review_stats_repository: AsyncMock,
 ):
     reviewer_uuid = uuid4()
-    now = datetime.now(timezone.utc)
-    existing = Review(
-        id="r1",
-        reviewer_uuid=reviewer_uuid,
-        reviewed_username="bob",
-        status=ReviewStatus.APPROVE,
-        comment="Good",
-        anonymous=False,
-        created_at=now,
-        updated_at=now,
-    )
     mock_account_repository.get_by_uuid.return_value = Account(
         id="a1", uuid=reviewer_uuid, username="reviewer", access_token="t"
     )
     mock_user_repository.get_by_username.return_value = None
-    mock_review_repository.get_by_reviewer_and_username.return_value = existing
+    mock_review_repository.upsert.side_effect = AnonymousFieldImmutableException()
 
     with pytest.raises(AnonymousFieldImmutableException):
         await review_service.create_or_update_review(
             reviewer_uuid, "bob", ReviewStatus.APPROVE, "Good", True
         )
+    mock_review_stats_repository.increment.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -169,7 +175,13 @@ async def test_get_reviews_for_user(
     assert len(result) == 1
     assert result[0].id == sample_review.id
     mock_review_repository.get_all_for_username.assert_called_once_with(
-        "revieweduser", 100, 0, status=None
+        "revieweduser",
+        100,
+        0,
+        status=None,
+        since=None,
+        after=None,
+        reviewer_uuid=None,
     )
 
 
@@ -193,15 +205,68 @@ async def test_get_reviews_by_reviewer(
 async def test_delete_review_existing(
     review_service: ReviewService,
     mock_review_repository: AsyncMock,
+    mock_review_stats_repository: AsyncMock,
     sample_review: Review,
 ):
     mock_review_repository.get_by_reviewer_and_username.return_value = sample_review
+    mock_review_repository.delete.return_value = True
 
     await review_service.delete_review(
         sample_review.reviewer_uuid, sample_review.reviewed_username
     )
 
     mock_review_repository.delete.assert_called_once_with(sample_review.id)
+    mock_review_stats_repository.increment.assert_awaited_once_with(
+        {"revieweduser": {ReviewStatus.APPROVE: -1}}
+    )
+
+
+@pytest.mark.asyncio
+async def test_delete_review_lost_race_does_not_decrement(
+    review_service: ReviewService,
+    mock_review_repository: AsyncMock,
+    mock_review_stats_repository: AsyncMock,
+    sample_review: Review,
+):
+    mock_review_repository.get_by_reviewer_and_username.return_value = sample_review
+    mock_review_repository.delete.return_value = False
+
+    await review_service.delete_review(
+        sample_review.reviewer_uuid, sample_review.reviewed_username
+    )
+
+    mock_review_stats_repository.increment.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_review_counts_are_read_from_stats(
+    review_service: ReviewService,
+    mock_review_stats_repository: AsyncMock,
+):
+    mock_review_stats_repository.is_built.return_value = True
+    mock_review_stats_repository.get_by_usernames.return_value = {
+        "bob": ReviewStats(username="bob", total=3, approve=2, comment=1)
+    }
+
+    assert await review_service.get_review_counts_for_usernames(["Bob"]) == {"bob": 3}
+    assert await review_service.get_review_count_for_username("Bob") == 3
+    mock_review_stats_repository.get_by_usernames.assert_awaited_with(["Bob"])
+
+
+@pytest.mark.asyncio
+async def test_review_counts_fall_back_to_reviews_until_stats_are_built(
+    review_service: ReviewService,
+    mock_review_repository: AsyncMock,
+    mock_review_stats_repository: AsyncMock,
+):
+    mock_review_stats_repository.is_built.return_value = False
+    mock_review_repository.get_review_counts_for_usernames.return_value = {"bob": 2}
+
+    assert await review_service.get_review_counts_for_usernames(["Bob"]) == {"bob": 2}
+    mock_review_repository.get_review_counts_for_usernames.assert_awaited_once_with(
+        ["Bob"]
+    )
+    mock_review_stats_repository.get_by_usernames.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -248,8 +313,7 @@ async def test_review_user_type_allowed(
         id="a1", uuid=reviewer_uuid, username="reviewer", access_token="t"
     )
     mock_user_repository.get_by_username.return_value = User(username="bob", type="User")
-    mock_review_repository.get_by_reviewer_and_username.return_value = None
-    mock_review_repository.create.side_effect = lambda r: r
+    mock_review_repository.upsert.side_effect = lambda r: (r, None)
 
     result, is_new = await review_service.create_or_update_review(
         reviewer_uuid, "bob", ReviewStatus.APPROVE, "Great!", False
@@ -257,4 +321,4 @@ async def test_review_user_type_allowed(
 
     assert result.status == ReviewStatus.APPROVE
     assert is_new is True
-    mock_review_repository.create.assert_called_once()
+    mock_review_repository.upsert.assert_called_once()
@@ -0,0 +1,82 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.domain.shared.batch_loader import BatchLoader
+
+
+def _loader(
+    load_many: AsyncMock, load_one: AsyncMock | None = None
+) -> BatchLoader[str, str]:
+    return BatchLoader(
+        load_many, key_of=lambda value: value, load_one=load_one, normalize=str.lower
+    )
+
+
+@pytest.mark.asyncio
+async def test_keys_loaded_in_the_same_tick_share_one_query():
+    load_many = AsyncMock(return_value=["alice", "bob"])
+    loader = _loader(load_many)
+
+    alice, bob, missing = await asyncio.gather(
+        loader.load("Alice"), loader.load("bob"), loader.load("carol")
+    )
+
+    assert (alice, bob, missing) == ("alice", "bob", None)
+    load_many.assert_awaited_once_with(["alice", "bob", "carol"])
+
+
+@pytest.mark.asyncio
+async def test_results_and_misses_are_memoized():
+    load_many = AsyncMock(return_value=["alice"])
+    loader = _loader(load_many)
+
+    assert await loader.load_many(["alice", "ALICE", "carol"]) == {"alice": "alice"}
+    assert await loader.load("Alice") == "alice"
+    assert await loader.load("carol") is None
+
+    load_many.assert_awaited_once_with(["alice", "carol"])
+
+
+@pytest.mark.asyncio
+async def test_single_pending_key_uses_load_one():
+    load_many = AsyncMock()
+    load_one = AsyncMock(return_value="alice")
+    loader = _loader(load_many, load_one)
+
+    assert await loader.load("alice") == "alice"
+
+    load_one.assert_awaited_once_with("alice")
+    load_many.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_prime_and_clear():
+    load_many = AsyncMock(return_value=["alice"])
+    loader = _loader(load_many)
+
+    loader.prime("bob")
+    assert await loader.load("BOB") == "bob"
+    load_many.assert_not_awaited()
+
+    loader.clear("bob")
+    assert await loader.load("bob") is None
+    load_many.assert_awaited_once_with(["bob"])
+
+    loader.clear_all()
+    assert await loader.load("alice") == "alice"
+    assert load_many.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_is_shared_and_not_memoized():
+    load_many = AsyncMock(side_effect=[RuntimeError("boom"), ["alice"]])
+    loader = _loader(load_many)
+
+    results = await asyncio.gather(
+        loader.load("alice"), loader.load("bob"), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert await loader.load_many(["alice", "bob"]) == {"alice": "alice"}
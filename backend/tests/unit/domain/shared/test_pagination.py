@@ -0,0 +1,35 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.domain.shared.exceptions import InvalidCursorException
+from app.domain.shared.pagination import KeysetCursor, ListVersion
+
+
+def test_keyset_cursor_round_trip():
+    cursor = KeysetCursor(
+        sort_value=datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc),
+        id="65f0c0ffee0000000000abcd",
+    )
+
+    token = cursor.encode()
+
+    assert "=" not in token
+    assert KeysetCursor.decode(token) == cursor
+
+
+@pytest.mark.parametrize("token", ["not-a-cursor", "", "e30", "!!!"])
+def test_keyset_cursor_decode_rejects_invalid_tokens(token: str):
+    with pytest.raises(InvalidCursorException):
+        KeysetCursor.decode(token)
+
+
+def test_list_version_merge_keeps_newest_position_and_sums_counts():
+    older = KeysetCursor(sort_value=datetime(2024, 5, 1, tzinfo=timezone.utc), id="a")
+    newer = KeysetCursor(sort_value=datetime(2024, 5, 2, tzinfo=timezone.utc), id="b")
+
+    merged = ListVersion(2, older, "x").merge(ListVersion(1, newer))
+
+    assert merged == ListVersion(3, newer, "x")
+    assert ListVersion(0, None).merge(ListVersion(0, None)).newest is None
+    assert merged.tag != ListVersion(3, older, "x").tag
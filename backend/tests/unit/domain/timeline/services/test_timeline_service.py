@@ -0,0 +1,203 @@
+from dataclasses import replace
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from app.domain.accounts.entities.account import Account
+from app.domain.reviews.entities.review import Review, ReviewStatus
+from app.domain.timeline.services.timeline_service import BACKFILL_LIMIT, TimelineService
+
+
+def _review(reviewed_username: str = "bob") -> Review:
+    now = datetime.now(timezone.utc)
+    return Review(
+        id="65f0c0ffee0000000000abcd",
+        reviewer_uuid=uuid4(),
+        reviewed_username=reviewed_username,
+        status=ReviewStatus.APPROVE,
+        comment=None,
+        anonymous=False,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+@pytest.mark.asyncio
+async def test_publish_fans_out_to_reviewed_account_and_watchers(
+    timeline_service: TimelineService,
+    mock_timeline_repository: AsyncMock,
+    mock_watchlist_repository: AsyncMock,
+    mock_account_repository: AsyncMock,
+):
+    bob = Account(id="a1", uuid=uuid4(), username="bob", access_token="t")
+    watchers = [uuid4(), uuid4()]
+    mock_account_repository.get_by_username.return_value = bob
+    mock_watchlist_repository.get_watcher_uuids.return_value = watchers
+    mock_timeline_repository.clear_fanout_skipped.return_value = False
+
+    written = await timeline_service.publish(_review())
+
+    assert written == 3
+    mock_watchlist_repository.get_watcher_uuids.assert_awaited_once_with("bob", limit=4)
+    entries = mock_timeline_repository.upsert_many.await_args.args[0]
+    assert [(e.owner_uuid, e.own, e.draft) for e in entries] == [
+        (bob.uuid, True, False),
+        (watchers[0], False, False),
+        (watchers[1], False, False),
+    ]
+    assert mock_timeline_repository.trim.await_count == 3
+    mock_timeline_repository.mark_fanout_skipped.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_publish_marks_draft_profile_entries(
+    timeline_service: TimelineService,
+    mock_timeline_repository: AsyncMock,
+    mock_watchlist_repository: AsyncMock,
+    mock_account_repository: AsyncMock,
+):
+    mock_account_repository.get_by_username.return_value = None
+    mock_watchlist_repository.get_watcher_uuids.return_value = [uuid4()]
+
+    assert await timeline_service.publish(_review("draft")) == 1
+
+    entries = mock_timeline_repository.upsert_many.await_args.args[0]
+    assert entries[0].draft is True
+    assert entries[0].own is False
+    mock_timeline_repository.clear_drafts.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_publish_clears_drafts_of_an_account_created_while_publishing(
+    timeline_service: TimelineService,
+    mock_timeline_repository: AsyncMock,
+    mock_watchlist_repository: AsyncMock,
+    mock_account_repository: AsyncMock,
+):
+    created = Account(id="a1", uuid=uuid4(), username="draft", access_token="t")
+    mock_account_repository.get_by_username.side_effect = [None, created]
+    mock_watchlist_repository.get_watcher_uuids.return_value = [uuid4()]
+    mock_timeline_repository.clear_fanout_skipped.return_value = False
+
+    assert await timeline_service.publish(_review("draft")) == 1
+
+    assert mock_timeline_repository.upsert_many.await_args.args[0][0].draft is True
+    mock_timeline_repository.clear_drafts.assert_awaited_once_with("draft")
+
+
+@pytest.mark.asyncio
+async def test_publish_skips_watchers_of_profiles_over_the_limit(
+    timeline_service: TimelineService,
+    mock_timeline_repository: AsyncMock,
+    mock_watchlist_repository: AsyncMock,
+    mock_account_repository: AsyncMock,
+):
+    star = Account(id="a1", uuid=uuid4(), username="star", access_token="t")
+    mock_account_repository.get_by_username.return_value = star
+    mock_watchlist_repository.get_watcher_uuids.return_value = [uuid4() for _ in range(4)]
+
+    written = await timeline_service.publish(_review("star"))
+
+    assert written == 1
+    mock_timeline_repository.mark_fanout_skipped.assert_awaited_once_with("star")
+    entries = mock_timeline_repository.upsert_many.await_args.args[0]
+    assert [e.owner_uuid for e in entries] == [star.uuid]
+
+
+@pytest.mark.asyncio
+async def test_publish_backfills_watchers_when_profile_drops_under_the_limit(
+    timeline_service: TimelineService,
+    mock_timeline_repository: AsyncMock,
+    mock_watchlist_repository: AsyncMock,
+    mock_account_repository: AsyncMock,
+    mock_review_repository: AsyncMock,
+):
+    review = _review("star")
+    earlier = replace(review, id="65f0c0ffee0000000000abce")
+    watcher = uuid4()
+    mock_account_repository.get_by_username.return_value = None
+    mock_watchlist_repository.get_watcher_uuids.return_value = [watcher]
+    mock_timeline_repository.clear_fanout_skipped.return_value = True
+    mock_review_repository.get_feed.return_value = [review, earlier]
+
+    assert await timeline_service.publish(review) == 2
+
+    mock_timeline_repository.clear_fanout_skipped.assert_awaited_once_with("star")
+    mock_review_repository.get_feed.assert_awaited_once_with(["star"], BACKFILL_LIMIT)
+    entries = mock_timeline_repository.upsert_many.await_args.args[0]
+    assert [(e.owner_uuid, e.review.id) for e in entries] == [
+        (watcher, review.id),
+        (watcher, earlier.id),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_publish_retracts_a_review_deleted_while_publishing(
+    timeline_service: TimelineService,
+    mock_timeline_repository: AsyncMock,
+    mock_watchlist_repository: AsyncMock,
+    mock_account_repository: AsyncMock,
+    mock_review_repository: AsyncMock,
+):
+    review = _review()
+    mock_account_repository.get_by_username.return_value = None
+    mock_watchlist_repository.get_watcher_uuids.return_value = [uuid4()]
+    mock_timeline_repository.clear_fanout_skipped.return_value = False
+    mock_review_repository.get_by_id.return_value = None
+
+    assert await timeline_service.publish(review) == 0
+
+    mock_timeline_repository.upsert_many.assert_awaited_once()
+    mock_timeline_repository.delete_by_review_id.assert_awaited_once_with(review.id)
+
+
+@pytest.mark.asyncio
+async def test_publish_ignores_deleted_profiles(
+    timeline_service: TimelineService,
+    mock_timeline_repository: AsyncMock,
+    mock_account_repository: AsyncMock,
+):
+    mock_account_repository.get_by_username.return_value = Account(
+        id="a1",
+        uuid=uuid4(),
+        username="gone",
+        access_token="",
+        deleted_at=datetime.now(timezone.utc),
+    )
+
+    assert await timeline_service.publish(_review("gone")) == 0
+    mock_timeline_repository.upsert_many.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_backfill_copies_recent_reviews(
+    timeline_service: TimelineService,
+    mock_timeline_repository: AsyncMock,
+    mock_account_repository: AsyncMock,
+    mock_review_repository: AsyncMock,
+):
+    owner_uuid = uuid4()
+    mock_timeline_repository.get_fanout_skipped_usernames.return_value = []
+    mock_account_repository.get_by_username.return_value = None
+    mock_review_repository.get_feed.return_value = [_review("draft")]
+
+    assert await timeline_service.backfill(owner_uuid, "draft") == 1
+
+    mock_review_repository.get_feed.assert_awaited_once_with(["draft"], BACKFILL_LIMIT)
+    entries = mock_timeline_repository.upsert_many.await_args.args[0]
+    assert entries[0].owner_uuid == owner_uuid
+    assert entries[0].draft is True
+
+
+@pytest.mark.asyncio
+async def test_backfill_skips_profiles_merged_on_read(
+    timeline_service: TimelineService,
+    mock_timeline_repository: AsyncMock,
+    mock_review_repository: AsyncMock,
+):
+    mock_timeline_repository.get_fanout_skipped_usernames.return_value = ["Star"]
+
+    assert await timeline_service.backfill(uuid4(), "star") == 0
+    mock_review_repository.get_feed.assert_not_awaited()
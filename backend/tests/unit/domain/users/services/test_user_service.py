@@ -2,6 +2,7 @@ from datetime import datetime, timedelta, timezone
 
 import pytest
 
+from app.domain.shared.constants import CACHE_EXPIRY_DAYS
 from app.domain.users.entities.user import User
 from app.domain.users.services.user_service import UserService
 
@@ -27,12 +28,12 @@ async def test_save_user(
     mock_user_repository,
     sample_user: User,
 ):
-    mock_user_repository.save.return_value = sample_user
+    mock_user_repository.upsert.return_value = sample_user
 
     result = await user_service.save_user(sample_user)
 
     assert result.username == "testuser"
-    mock_user_repository.save.assert_called_once_with(sample_user)
+    mock_user_repository.upsert.assert_called_once_with(sample_user)
 
 
 def test_cache_expired_no_updated_at(user_service: UserService):
@@ -54,3 +55,43 @@ def test_cache_not_expired(user_service: UserService):
         updated_at=datetime.now(timezone.utc) - timedelta(days=1),
     )
     assert user_service.is_cache_expired(user) is False
+
+
+@pytest.mark.asyncio
+async def test_mark_user_fresh_bumps_updated_at(
+    user_service: UserService,
+    mock_user_repository,
+):
+    stale_at = datetime.now(timezone.utc) - timedelta(days=8)
+    user = User(username="alice", updated_at=stale_at, etag='W/"abc"')
+    mock_user_repository.save.side_effect = lambda u: u
+
+    result = await user_service.mark_user_fresh(user)
+
+    assert result.updated_at is not None and result.updated_at > stale_at
+    assert result.etag == 'W/"abc"'
+    assert user_service.is_cache_expired(result) is False
+
+
+def test_stale_beyond_bound(user_service: UserService):
+    user = User(
+        username="alice",
+        updated_at=datetime.now(timezone.utc) - timedelta(days=31),
+    )
+    assert user_service.is_stale_beyond(user, timedelta(days=30)) is True
+    assert user_service.is_stale_beyond(user, timedelta(days=60)) is False
+
+
+@pytest.mark.asyncio
+async def test_get_users_expiring_within_uses_cache_expiry_cutoff(
+    user_service: UserService,
+    mock_user_repository,
+):
+    mock_user_repository.get_refresh_candidates.return_value = []
+
+    await user_service.get_users_expiring_within(timedelta(days=1), limit=20)
+
+    cutoff, limit = mock_user_repository.get_refresh_candidates.call_args[0]
+    expected = datetime.now(timezone.utc) - timedelta(days=CACHE_EXPIRY_DAYS - 1)
+    assert abs((cutoff - expected).total_seconds()) < 5
+    assert limit == 20
@@ -23,13 +23,12 @@ async def test_watch_new(
         id="a1", uuid=watcher_uuid, username="alice", access_token="t"
     )
     mock_user_repository.get_by_username.return_value = None
-    mock_watchlist_repository.get_by_watcher_and_username.return_value = None
-    mock_watchlist_repository.create.side_effect = lambda s: s
+    mock_watchlist_repository.get_or_create.side_effect = lambda s: s
 
     result = await watchlist_service.watch(watcher_uuid, "bob")
 
     assert result.watched_username == "bob"
-    mock_watchlist_repository.create.assert_called_once()
+    mock_watchlist_repository.get_or_create.assert_called_once()
 
 
 @pytest.mark.asyncio
@@ -50,7 +49,7 @@ async def test_watch_existing(
         id="a1", uuid=watcher_uuid, username="alice", access_token="t"
     )
     mock_user_repository.get_by_username.return_value = None
-    mock_watchlist_repository.get_by_watcher_and_username.return_value = existing
+    mock_watchlist_repository.get_or_create.return_value = existing
 
     result = await watchlist_service.watch(watcher_uuid, "bob")
 
@@ -155,10 +154,9 @@ async def test_watch_user_type_allowed(
         id="a1", uuid=watcher_uuid, username="alice", access_token="t"
     )
     mock_user_repository.get_by_username.return_value = User(username="bob", type="User")
-    mock_watchlist_repository.get_by_watcher_and_username.return_value = None
-    mock_watchlist_repository.create.side_effect = lambda s: s
+    mock_watchlist_repository.get_or_create.side_effect = lambda s: s
 
     result = await watchlist_service.watch(watcher_uuid, "bob")
 
     assert result.watched_username == "bob"
-    mock_watchlist_repository.create.assert_called_once()
+    mock_watchlist_repository.get_or_create.assert_called_once()
@@ -0,0 +1,263 @@
+import json
+
+import httpx
+import pytest
+
+from app.domain.shared.exceptions import GitHubAPIException, UserNotFoundException
+from app.infrastructure.github.external.github_client import (
+    GRAPHQL_USERS_BATCH_SIZE,
+    GitHubClient,
+)
+
+
+def _client(handler) -> GitHubClient:
+    return GitHubClient(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+
+@pytest.mark.asyncio
+async def test_fetch_user_by_username_reuses_shared_http_client():
+    seen_paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_paths.append(request.url.path)
+        assert request.headers["Authorization"] == "Bearer token"
+        return httpx.Response(
+            200,
+            json={
+                "login": "alice",
+                "name": "Alice",
+                "bio": None,
+                "avatar_url": "https://example.com/a.png",
+                "type": "User",
+            },
+        )
+
+    client = _client(handler)
+    first = await client.fetch_user_by_username("alice", "token")
+    second = await client.fetch_user_by_username("alice", "token")
+    await client.aclose()
+
+    assert first == second
+    assert first is not None
+    assert first["username"] == "alice"
+    assert seen_paths == ["/users/alice", "/users/alice"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_user_by_username_not_found():
+    client = _client(lambda request: httpx.Response(404))
+
+    with pytest.raises(UserNotFoundException):
+        await client.fetch_user_by_username("ghost", "token")
+
+
+@pytest.mark.asyncio
+async def test_fetch_user_by_username_returns_validators():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json={"login": "alice", "type": "User"},
+            headers={"ETag": 'W/"abc"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+        )
+
+    client = _client(handler)
+    data = await client.fetch_user_by_username("alice", "token")
+
+    assert data is not None
+    assert data["etag"] == 'W/"abc"'
+    assert data["last_modified"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+@pytest.mark.asyncio
+async def test_fetch_user_by_username_conditional_not_modified():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["If-None-Match"] == 'W/"abc"'
+        return httpx.Response(304)
+
+    client = _client(handler)
+    data = await client.fetch_user_by_username("alice", "token", etag='W/"abc"')
+
+    assert data is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_github_user_data_fetches_user_and_emails():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "github.com":
+            return httpx.Response(200, json={"access_token": "token"})
+        if request.url.path == "/user/emails":
+            return httpx.Response(
+                200,
+                json=[
+                    {"email": "old@example.com", "primary": False, "verified": True},
+                    {"email": "alice@example.com", "primary": True, "verified": True},
+                ],
+            )
+        return httpx.Response(200, json={"login": "alice", "type": "User"})
+
+    client = _client(handler)
+    data, token = await client.fetch_github_user_data("code")
+
+    assert token == "token"
+    assert data["username"] == "alice"
+    assert data["email"] == "alice@example.com"
+
+
+@pytest.mark.asyncio
+async def test_fetch_users_by_usernames_maps_graphql_owners():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.method == "POST"
+        assert request.url.path == "/graphql"
+        body = json.loads(request.content)
+        assert body["variables"] == {"l0": "Alice", "l1": "acme", "l2": "ghost"}
+        return httpx.Response(
+            200,
+            json={
+                "data": {
+                    "u0": {
+                        "__typename": "User",
+                        "login": "alice",
+                        "avatarUrl": "https://example.com/a.png",
+                        "name": "Alice",
+                        "bio": "dev",
+                    },
+                    "u1": {
+                        "__typename": "Organization",
+                        "login": "acme",
+                        "avatarUrl": "https://example.com/o.png",
+                        "name": "Acme",
+                        "description": "We build things",
+                    },
+                    "u2": None,
+                },
+                "errors": [{"type": "NOT_FOUND", "path": ["u2"]}],
+            },
+        )
+
+    client = _client(handler)
+    users = await client.fetch_users_by_usernames(["Alice", "acme", "ghost"], "token")
+
+    assert users == {
+        "alice": {
+            "username": "alice",
+            "name": "Alice",
+            "bio": "dev",
+            "avatar_url": "https://example.com/a.png",
+            "type": "User",
+        },
+        "acme": {
+            "username": "acme",
+            "name": "Acme",
+            "bio": "We build things",
+            "avatar_url": "https://example.com/o.png",
+            "type": "Organization",
+        },
+    }
+
+
+@pytest.mark.asyncio
+async def test_fetch_users_by_usernames_batches_requests():
+    batch_sizes: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        variables = json.loads(request.content)["variables"]
+        batch_sizes.append(len(variables))
+        return httpx.Response(
+            200,
+            json={
+                "data": {
+                    f"u{i}": {"__typename": "User", "login": login}
+                    for i, login in enumerate(variables.values())
+                }
+            },
+        )
+
+    client = _client(handler)
+    usernames = [f"user{i}" for i in range(GRAPHQL_USERS_BATCH_SIZE + 5)]
+    users = await client.fetch_users_by_usernames(usernames + ["user0"], "token")
+
+    assert batch_sizes == [GRAPHQL_USERS_BATCH_SIZE, 5]
+    assert len(users) == GRAPHQL_USERS_BATCH_SIZE + 5
+
+
+@pytest.mark.asyncio
+async def test_fetch_users_by_usernames_error_raises():
+    client = _client(lambda request: httpx.Response(502))
+
+    with pytest.raises(GitHubAPIException):
+        await client.fetch_users_by_usernames(["alice"], "token")
+
+
+@pytest.mark.asyncio
+async def test_fetch_following_page_follows_link_header():
+    next_url = "https://api.github.com/user/1/following?per_page=100&page=2"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["per_page"] == "100"
+        return httpx.Response(
+            200,
+            json=[{"login": "alice", "avatar_url": "a.png", "type": "User"}],
+            headers={"ETag": '"p1"', "Link": f'<{next_url}>; rel="next"'},
+        )
+
+    client = _client(handler)
+    page = await client.fetch_following_page("me", "token")
+
+    assert page is not None
+    assert page.items == [{"login": "alice", "avatar_url": "a.png", "type": "User"}]
+    assert page.etag == '"p1"'
+    assert page.next_url == next_url
+
+
+@pytest.mark.asyncio
+async def test_fetch_following_page_not_modified():
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(304)
+
+    client = _client(handler)
+    url = "https://api.github.com/user/1/following?per_page=100&page=2"
+    page = await client.fetch_following_page("me", "token", url=url, etag='"p2"')
+
+    assert page is None
+    assert str(seen[0].url) == url
+    assert seen[0].headers["If-None-Match"] == '"p2"'
+
+
+@pytest.mark.asyncio
+async def test_search_users_reports_completeness():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.params["q"] == "type:user ali"
+        return httpx.Response(
+            200,
+            json={
+                "total_count": 2,
+                "incomplete_results": False,
+                "items": [{"login": "alice", "avatar_url": "a.png", "type": "User"}],
+            },
+        )
+
+    client = _client(handler)
+    page = await client.search_users("ali", "token")
+
+    assert page.items == [{"login": "alice", "avatar_url": "a.png", "type": "User"}]
+    assert page.complete is False
+
+
+@pytest.mark.asyncio
+async def test_search_users_error_raises():
+    client = _client(lambda request: httpx.Response(500))
+
+    with pytest.raises(GitHubAPIException):
+        await client.search_users("ali", "token")
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_pool():
+    client = GitHubClient.from_settings()
+
+    await client.aclose()
+
+    assert client._http.is_closed
@@ -0,0 +1,108 @@
+import asyncio
+import time
+
+import pytest
+
+from app.domain.shared.exceptions import GitHubRateLimitException
+from app.infrastructure.github.external.rate_limiter import (
+    CORE_BUCKET,
+    SEARCH_BUCKET,
+    GitHubCallPriority,
+    GitHubRateLimiter,
+)
+
+
+def _headers(remaining: int, limit: int = 5000, reset_in: int = 600) -> dict[str, str]:
+    return {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(int(time.time()) + reset_in),
+    }
+
+
+def test_record_tracks_buckets_per_token_separately():
+    limiter = GitHubRateLimiter()
+
+    limiter.record("token-a", CORE_BUCKET, 200, _headers(4000))
+    limiter.record("token-a", SEARCH_BUCKET, 200, _headers(25, limit=30))
+    limiter.record("token-b", CORE_BUCKET, 200, _headers(10))
+
+    assert limiter.budget("token-a", CORE_BUCKET).remaining == 4000
+    assert limiter.budget("token-a", SEARCH_BUCKET).remaining == 25
+    assert limiter.budget("token-b", CORE_BUCKET).remaining == 10
+
+
+def test_record_prefers_resource_header_for_bucket():
+    limiter = GitHubRateLimiter()
+
+    headers = {**_headers(12, limit=30), "X-RateLimit-Resource": "search"}
+
+    limiter.record("token", CORE_BUCKET, 200, headers)
+
+    assert limiter.budget("token", SEARCH_BUCKET).remaining == 12
+    assert limiter.budget("token", CORE_BUCKET).remaining is None
+
+
+@pytest.mark.asyncio
+async def test_exhausted_budget_refuses_all_calls():
+    limiter = GitHubRateLimiter()
+    limiter.record("token", CORE_BUCKET, 200, _headers(0))
+
+    with pytest.raises(GitHubRateLimitException):
+        async with limiter.slot("token", CORE_BUCKET, GitHubCallPriority.INTERACTIVE):
+            pass
+
+    assert limiter.throttled_count == 1
+
+
+@pytest.mark.asyncio
+async def test_low_budget_sheds_background_but_allows_interactive():
+    limiter = GitHubRateLimiter(background_reserve_ratio=0.2)
+    limiter.record("token", CORE_BUCKET, 200, _headers(500))
+
+    with pytest.raises(GitHubRateLimitException):
+        async with limiter.slot("token", CORE_BUCKET, GitHubCallPriority.BACKGROUND):
+            pass
+
+    async with limiter.slot("token", CORE_BUCKET, GitHubCallPriority.INTERACTIVE):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_retry_after_blocks_token_until_elapsed():
+    limiter = GitHubRateLimiter()
+    limiter.record("token", CORE_BUCKET, 403, {**_headers(100), "Retry-After": "60"})
+
+    with pytest.raises(GitHubRateLimitException) as exc_info:
+        async with limiter.slot("token", CORE_BUCKET):
+            pass
+
+    assert exc_info.value.retry_at is not None
+    assert exc_info.value.retry_at > time.time()
+
+
+@pytest.mark.asyncio
+async def test_queued_interactive_calls_run_before_background():
+    limiter = GitHubRateLimiter(max_concurrency_per_token=1)
+    order: list[str] = []
+    release_first = asyncio.Event()
+
+    async def call(name: str, priority: GitHubCallPriority) -> None:
+        async with limiter.slot("token", CORE_BUCKET, priority):
+            order.append(name)
+            if name == "first":
+                await release_first.wait()
+
+    first = asyncio.create_task(call("first", GitHubCallPriority.INTERACTIVE))
+    await asyncio.sleep(0)
+    background = asyncio.create_task(call("background", GitHubCallPriority.BACKGROUND))
+    interactive = asyncio.create_task(call("interactive", GitHubCallPriority.INTERACTIVE))
+    await asyncio.sleep(0)
+
+    assert limiter.queue_depth == 2
+
+    release_first.set()
+    await asyncio.gather(first, background, interactive)
+
+    assert order == ["first", "interactive", "background"]
+    assert limiter.queue_depth == 0
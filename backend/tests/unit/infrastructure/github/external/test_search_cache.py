@@ -0,0 +1,76 @@
+from app.infrastructure.github.external.github_client import UserSearchPage
+from app.infrastructure.github.external.search_cache import UserSearchCache
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _page(*logins: str, complete: bool = True) -> UserSearchPage:
+    return UserSearchPage(
+        items=[{"login": login, "avatar_url": None, "type": "User"} for login in logins],
+        complete=complete,
+    )
+
+
+def test_normalize_collapses_case_and_whitespace():
+    assert UserSearchCache.normalize("  Alice   Smith ") == "alice smith"
+    assert UserSearchCache.normalize("in:login  Alice") == "alice in:login"
+
+
+def test_get_returns_exact_hit_until_ttl_expires():
+    clock = _Clock()
+    cache = UserSearchCache(ttl_seconds=60, max_entries=10, clock=clock)
+    cache.put("ali", _page("alice", "alina"))
+
+    assert [u["login"] for u in cache.get("ali") or []] == ["alice", "alina"]
+
+    clock.now = 61
+    assert cache.get("ali") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_get_filters_complete_prefix_result_of_login_queries():
+    cache = UserSearchCache(ttl_seconds=60, max_entries=10)
+    cache.put("al in:login", _page("Alice", "alina", "albert"))
+
+    assert [u["login"] for u in cache.get("alic in:login") or []] == ["Alice"]
+    assert cache.prefix_hits == 1
+
+
+def test_get_skips_prefix_reuse_for_bare_terms():
+    # GitHub matches a bare term against names and emails too.
+    cache = UserSearchCache(ttl_seconds=60, max_entries=10)
+    cache.put("al", _page("Alice", "alina", "albert"))
+
+    assert cache.get("alic") is None
+    assert cache.prefix_hits == 0
+
+
+def test_get_ignores_incomplete_prefix_result():
+    cache = UserSearchCache(ttl_seconds=60, max_entries=10)
+    cache.put("a in:login", _page("alice", complete=False))
+
+    assert cache.get("al in:login") is None
+
+
+def test_get_skips_prefix_reuse_for_multi_word_queries():
+    cache = UserSearchCache(ttl_seconds=60, max_entries=10)
+    cache.put("alice in:login", _page("alice"))
+
+    assert cache.get("alice s in:login") is None
+
+
+def test_put_evicts_least_recently_used():
+    cache = UserSearchCache(ttl_seconds=60, max_entries=2)
+    cache.put("one", _page("one"))
+    cache.put("two", _page("two"))
+    cache.get("one")
+    cache.put("three", _page("three"))
+
+    assert cache.get("two") is None
+    assert cache.get("one") is not None
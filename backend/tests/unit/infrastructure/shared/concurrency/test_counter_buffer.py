@@ -0,0 +1,12 @@
+from app.infrastructure.shared.concurrency.counter_buffer import CounterBuffer
+
+
+def test_drain_returns_totals_and_resets():
+    buffer: CounterBuffer[str] = CounterBuffer()
+    buffer.add("alice")
+    buffer.add("alice")
+    buffer.add("bob", 3)
+
+    assert len(buffer) == 2
+    assert buffer.drain() == {"alice": 2, "bob": 3}
+    assert buffer.drain() == {}
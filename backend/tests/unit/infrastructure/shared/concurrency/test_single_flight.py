@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from app.infrastructure.shared.concurrency.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution():
+    flight: SingleFlight[str] = SingleFlight()
+    calls = 0
+    release = asyncio.Event()
+
+    async def work() -> str:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return "done"
+
+    tasks = [asyncio.create_task(flight.do("alice", work)) for _ in range(10)]
+    await asyncio.sleep(0)
+    assert flight.in_flight == 1
+
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert results == ["done"] * 10
+    assert calls == 1
+    assert flight.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_exception_is_shared_and_key_is_released():
+    flight: SingleFlight[str] = SingleFlight()
+
+    async def fail() -> str:
+        await asyncio.sleep(0)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(
+        flight.do("alice", fail), flight.do("alice", fail), return_exceptions=True
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert flight.in_flight == 0
+    assert await flight.do("alice", _ok) == "ok"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_work():
+    flight: SingleFlight[str] = SingleFlight()
+    release = asyncio.Event()
+
+    async def work() -> str:
+        await release.wait()
+        return "done"
+
+    leader = asyncio.create_task(flight.do("alice", work))
+    follower = asyncio.create_task(flight.do("alice", work))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    release.set()
+
+    assert await follower == "done"
+
+
+async def _ok() -> str:
+    return "ok"
@@ -0,0 +1,39 @@
+from datetime import datetime, timezone
+
+from starlette.requests import Request
+
+from app.domain.shared.pagination import KeysetCursor, ListVersion
+from app.presentation.api.v1.shared.etag import etag_matches, make_etag
+
+
+def _request(query: str) -> Request:
+    return Request(
+        {
+            "type": "http",
+            "scheme": "http",
+            "server": ("test", 80),
+            "path": "/api/v1/account/feed",
+            "query_string": query.encode(),
+            "headers": [],
+        }
+    )
+
+
+def test_make_etag_changes_with_version_and_query():
+    newest = KeysetCursor(sort_value=datetime(2024, 5, 1, tzinfo=timezone.utc), id="a")
+    version = ListVersion(count=2, newest=newest)
+
+    etag = make_etag(version, _request("limit=16"))
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == make_etag(ListVersion(count=2, newest=newest), _request("limit=16"))
+    assert etag != make_etag(ListVersion(count=3, newest=newest), _request("limit=16"))
+    assert etag != make_etag(version, _request("limit=32"))
+
+
+def test_etag_matches_if_none_match_lists():
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('"abc"', 'W/"zzz", W/"abc"')
+    assert etag_matches('"abc"', "*")
+    assert not etag_matches('"abc"', '"zzz"')
+    assert not etag_matches('"abc"', None)